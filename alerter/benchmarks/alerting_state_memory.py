@@ -0,0 +1,155 @@
+"""
+Compares the memory taken by the alerting state of many systems when it is
+stored as nested dicts with dict-backed timers (the original layout) and when
+it is stored as MonitorableAlertingState records (the compact layout), and
+the time taken to classify a metric against each layout.
+
+Run from the alerter directory:
+    python -m benchmarks.alerting_state_memory [--monitorables N]
+"""
+import argparse
+import gc
+import logging
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict
+
+from src.alerter.factory.alerting_state import MetricFlags
+from src.alerter.factory.system_alerting_factory import SystemAlertingFactory
+from src.alerter.grouped_alerts_metric_code.system import \
+    GroupedSystemAlertsMetricCode as AlertsMetricCode
+from src.configs.alerts.rule import AlertRule
+from src.configs.alerts.system import SystemAlertsConfig
+from src.utils.timing import TimedTaskLimiter, TimedTaskTracker
+from src.utils.types import (IncreasedAboveThresholdAlert,
+                             DecreasedBelowThresholdAlert)
+
+_PARENT_ID = 'benchmark_parent_id'
+
+
+def _without_slots(cls: type) -> type:
+    namespace = {name: value for name, value in vars(cls).items()
+                 if name not in cls.__slots__ and name != '__slots__'}
+    return type(cls.__name__, (), namespace)
+
+
+# The timers as they were before they were slotted, with their fields stored in
+# a per-instance __dict__
+_DICT_BACKED_TIMERS = {
+    TimedTaskTracker: _without_slots(TimedTaskTracker),
+    TimedTaskLimiter: _without_slots(TimedTaskLimiter),
+}
+
+
+def _to_dict_backed_timer(timer: Any) -> Any:
+    timer_class = next(timer_class for timer_class in _DICT_BACKED_TIMERS
+                       if isinstance(timer, timer_class))
+    dict_backed = object.__new__(_DICT_BACKED_TIMERS[timer_class])
+    for slot in timer_class.__slots__:
+        setattr(dict_backed, slot, getattr(timer, slot))
+    # Every timer was created with its own interval
+    dict_backed._time_interval = timedelta(
+        seconds=timer.time_interval.total_seconds())
+    return dict_backed
+
+
+def _create_alerts_config() -> SystemAlertsConfig:
+    metric_config = {
+        'parent_id': _PARENT_ID, 'enabled': 'true',
+        'warning_enabled': 'true', 'warning_threshold': '85',
+        'critical_enabled': 'true', 'critical_threshold': '95',
+        'critical_repeat_enabled': 'true', 'critical_repeat': '300',
+    }
+    configs = {
+        metric: AlertRule({**metric_config, 'name': metric})
+        for metric in ['open_file_descriptors', 'system_cpu_usage',
+                       'system_storage_usage', 'system_ram_usage',
+                       'system_is_down']
+    }
+    return SystemAlertsConfig(parent_id=_PARENT_ID, **configs)
+
+
+def _to_original_layout(state: Any) -> Dict:
+    original = {}
+    for field, values in state.items():
+        if isinstance(values, MetricFlags):
+            original[field] = dict(values)
+        else:
+            original[field] = {
+                metric: _to_dict_backed_timer(value)
+                for metric, value in values.items()
+            }
+    return original
+
+
+def _create_compact_states(monitorables: int) -> Dict:
+    factory = SystemAlertingFactory(logging.getLogger('benchmark'))
+    alerts_config = _create_alerts_config()
+    for i in range(monitorables):
+        factory.create_alerting_state(_PARENT_ID, 'system_{}'.format(i),
+                                      alerts_config)
+    return factory.alerting_state
+
+
+def _measure(create: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    created = create()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del created
+    return size
+
+
+def _time_classification(alerting_state: Dict, repetitions: int) -> float:
+    factory = SystemAlertingFactory(logging.getLogger('benchmark'))
+    factory._alerting_state = alerting_state
+    config = _create_alerts_config().system_cpu_usage
+    timestamp = datetime.now().timestamp()
+
+    def classify() -> None:
+        factory.classify_thresholded_time_window_alert(
+            50, config, IncreasedAboveThresholdAlert,
+            DecreasedBelowThresholdAlert, [], _PARENT_ID, 'system_0',
+            AlertsMetricCode.SystemCPUUsageThreshold.value, 'system_0',
+            timestamp)
+
+    return timeit.timeit(classify, number=repetitions) / repetitions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--monitorables', type=int, default=10000)
+    parser.add_argument('--repetitions', type=int, default=100000)
+    args = parser.parse_args()
+
+    compact_size = _measure(
+        lambda: _create_compact_states(args.monitorables))
+    compact_states = _create_compact_states(args.monitorables)
+    original_size = _measure(lambda: {
+        _PARENT_ID: {
+            monitorable_id: _to_original_layout(state)
+            for monitorable_id, state in compact_states[_PARENT_ID].items()
+        }
+    })
+    original_states = {_PARENT_ID: {
+        'system_0': _to_original_layout(compact_states[_PARENT_ID]['system_0'])
+    }}
+
+    print("Alerting state of {} systems:".format(args.monitorables))
+    print("  original layout: {:10.1f} KiB ({:.0f} B per system)".format(
+        original_size / 1024, original_size / args.monitorables))
+    print("  compact layout:  {:10.1f} KiB ({:.0f} B per system)".format(
+        compact_size / 1024, compact_size / args.monitorables))
+    print("  reduction:       {:10.1f}%".format(
+        100 * (1 - compact_size / original_size)))
+    print("Time to classify a thresholded time window alert:")
+    print("  original layout: {:.2f} us".format(
+        _time_classification(original_states, args.repetitions) * 1e6))
+    print("  compact layout:  {:.2f} us".format(
+        _time_classification(compact_states, args.repetitions) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
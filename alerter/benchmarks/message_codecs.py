@@ -0,0 +1,306 @@
+"""
+Compares the size of the messages published on RabbitMQ, and the time taken to
+encode and decode them, when they are serialized with each message codec.
+
+The payloads have the shape of the messages published on each routing key,
+with the lists and maps which grow with the chain (missed heights, slashed
+amounts, historical rounds, referendums) filled to a realistic size.
+
+Run from the alerter directory:
+    python -m benchmarks.message_codecs [--repetitions N] [--history N]
+"""
+import argparse
+import random
+import timeit
+from typing import Callable, Dict
+
+from src.message_broker.rabbitmq.message_codecs import (
+    MessageCodec, JSON_MESSAGE_CODEC, MSGPACK_MESSAGE_CODEC)
+from src.utils.constants.rabbitmq import (
+    SYSTEM_RAW_DATA_ROUTING_KEY, SYSTEM_TRANSFORMED_DATA_ROUTING_KEY,
+    COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+    CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY,
+    SUBSTRATE_NETWORK_TRANSFORMED_DATA_ROUTING_KEY,
+    COSMOS_NODE_ALERT_ROUTING_KEY, HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
+    ALERTS_CONFIGS_ROUTING_KEY_GEN)
+
+_LAST_MONITORED = 1643109283.9231
+_CODECS = [JSON_MESSAGE_CODEC, MSGPACK_MESSAGE_CODEC]
+
+
+def _system_meta_data() -> Dict:
+    return {
+        'monitor_name': 'System monitor (test_system)',
+        'system_name': 'test_system',
+        'system_id': 'system_6bd8b2d4-33f7-4e9b-8d61-7a2a9b0e1c6f',
+        'system_parent_id': 'chain_name_9d8e2c51-1b8a-4fd1-9f0e-2a7c4b3d5e61',
+        'time': _LAST_MONITORED,
+    }
+
+
+def _system_raw_data(history: int) -> Dict:
+    return {
+        'result': {
+            'meta_data': _system_meta_data(),
+            'data': {
+                'process_cpu_seconds_total': 2786.82,
+                'process_memory_usage': 56.0,
+                'virtual_memory_usage': 118513664.0,
+                'open_file_descriptors': 0.78125,
+                'system_cpu_usage': 7.85,
+                'system_ram_usage': 34.09,
+                'system_storage_usage': 44.37,
+                'network_transmit_bytes_total': 1011572205557.0,
+                'network_receive_bytes_total': 722359147027.0,
+                'disk_io_time_seconds_total': 76647.0,
+            },
+        }
+    }
+
+
+def _system_transformed_data(history: int) -> Dict:
+    data = _system_raw_data(history)
+    meta_data = data['result']['meta_data']
+    meta_data['last_monitored'] = meta_data.pop('time')
+    data['result']['data'].update({
+        'went_down_at': None,
+        'network_transmit_bytes_per_second': 16103476165.4,
+        'network_receive_bytes_per_second': 12039243041.0,
+        'disk_io_time_seconds_in_interval': 70300.0,
+    })
+    return data
+
+
+def _cosmos_node_meta_data() -> Dict:
+    return {
+        'node_name': 'cosmos_validator_1',
+        'node_id': 'node_4b8a3e1d-77c2-4d3a-a1e6-0c9f2b5d8e71',
+        'node_parent_id': 'chain_name_9d8e2c51-1b8a-4fd1-9f0e-2a7c4b3d5e61',
+        'last_monitored': _LAST_MONITORED,
+        'is_validator': True,
+        'operator_address': 'cosmosvaloper1clpqr4nrk4khgkxj78fcwwh6dl3uw4ep'
+                            'sluxc',
+    }
+
+
+def _cosmos_node_transformed_data(history: int) -> Dict:
+    current_height = 9530000
+    missed_heights = sorted(random.sample(
+        range(current_height - 10 * history, current_height), history))
+    return {
+        'prometheus': {
+            'result': {
+                'meta_data': _cosmos_node_meta_data(),
+                'data': {
+                    'current_height': current_height,
+                    'voting_power': 345456,
+                    'went_down_at': None,
+                },
+            }
+        },
+        'cosmos_rest': {
+            'result': {
+                'meta_data': _cosmos_node_meta_data(),
+                'data': {
+                    'bond_status': 'bonded',
+                    'jailed': False,
+                    'went_down_at': None,
+                },
+            }
+        },
+        'tendermint_rpc': {
+            'result': {
+                'meta_data': _cosmos_node_meta_data(),
+                'data': {
+                    'slashed': {
+                        'slashed': True,
+                        'amount_map': {
+                            str(height): round(random.uniform(0, 100), 2)
+                            for height in missed_heights[:history // 10]
+                        },
+                    },
+                    'missed_blocks': {
+                        'total_count': len(missed_heights),
+                        'missed_heights': missed_heights,
+                    },
+                    'is_syncing': False,
+                    'went_down_at': None,
+                },
+            }
+        },
+    }
+
+
+def _chainlink_contract_transformed_data(history: int) -> Dict:
+    def contract_data(latest_round: int) -> Dict:
+        return {
+            'contractVersion': 4,
+            'aggregatorAddress': '0x' + '%040x' % random.getrandbits(160),
+            'description': 'ETH / USD',
+            'latestRound': latest_round,
+            'latestAnswer': 317852000000,
+            'latestTimestamp': _LAST_MONITORED,
+            'answeredInRound': latest_round,
+            'owedPayment': 3458347,
+            'historicalRounds': [{
+                'roundId': round_id,
+                'roundAnswer': random.randint(300000000000, 330000000000),
+                'roundTimestamp': int(_LAST_MONITORED) - 60 * offset,
+                'answeredInRound': round_id,
+                'nodeSubmission': random.randint(300000000000, 330000000000),
+                'deviation': round(random.uniform(0, 2), 4),
+            } for offset, round_id in enumerate(
+                range(latest_round, latest_round - history // 10, -1))],
+            'lastRoundObserved': latest_round,
+        }
+
+    return {
+        'result': {
+            'meta_data': {
+                'node_name': 'chainlink_node_1',
+                'node_id': 'node_1f2e3d4c-5b6a-4798-8a7b-6c5d4e3f2a10',
+                'node_parent_id': 'chain_name_3c2b1a09-8f7e-4d6c-9b5a-4f3e2d1c0b9a',
+                'last_monitored': _LAST_MONITORED,
+            },
+            'data': {
+                '0x' + '%040x' % random.getrandbits(160):
+                    contract_data(random.randint(10000, 50000))
+                for _ in range(10)
+            },
+        }
+    }
+
+
+def _substrate_network_transformed_data(history: int) -> Dict:
+    def referendum(index: int) -> Dict:
+        return {
+            'index': index,
+            'status': 'finished',
+            'proposal_hash': '0x' + '%064x' % random.getrandbits(256),
+            'approved': random.choice([True, False]),
+            'end': 9000000 + 100800 * index,
+            'data': {
+                'threshold': 'SuperMajorityApprove',
+                'delay': 28800,
+                'ayes': float(random.getrandbits(70)),
+                'nays': float(random.getrandbits(60)),
+                'turnout': float(random.getrandbits(72)),
+            },
+        }
+
+    return {
+        'websocket': {
+            'result': {
+                'meta_data': {
+                    'network_name': 'polkadot',
+                    'parent_id': 'chain_name_7a6b5c4d-3e2f-4a1b-8c9d-0e1f2a3b4c5d',
+                    'last_monitored': _LAST_MONITORED,
+                },
+                'data': {
+                    'grandpa_stalled': False,
+                    'public_prop_count': 120,
+                    'active_proposals': [],
+                    'referendum_count': history,
+                    'referendums': [referendum(index)
+                                    for index in range(history)],
+                },
+            }
+        }
+    }
+
+
+def _alert(history: int) -> Dict:
+    return {
+        'alert_code': {
+            'name': 'NoOfBlocksMissedIncreasedAboveThresholdAlert',
+            'code': 'cosmos_node_alert_8',
+        },
+        'message': 'cosmos_validator_1 missed 20 blocks in the last 1h. '
+                   'Previous value: 5 blocks.',
+        'severity': 'WARNING',
+        'parent_id': 'chain_name_9d8e2c51-1b8a-4fd1-9f0e-2a7c4b3d5e61',
+        'origin_id': 'node_4b8a3e1d-77c2-4d3a-a1e6-0c9f2b5d8e71',
+        'timestamp': _LAST_MONITORED,
+        'metric': 'cosmos_node_blocks_missed',
+    }
+
+
+def _heartbeat(history: int) -> Dict:
+    return {
+        'component_name': 'Cosmos Node Alerter',
+        'is_alive': True,
+        'timestamp': _LAST_MONITORED,
+    }
+
+
+def _alerts_config(history: int) -> Dict:
+    metric_config = {
+        'parent_id': 'GENERAL', 'enabled': 'true',
+        'warning_enabled': 'true', 'warning_threshold': '85',
+        'critical_enabled': 'true', 'critical_threshold': '95',
+        'critical_repeat_enabled': 'true', 'critical_repeat': '300',
+    }
+    return {
+        str(index): {**metric_config, 'name': name}
+        for index, name in enumerate([
+            'open_file_descriptors', 'system_cpu_usage',
+            'system_storage_usage', 'system_ram_usage', 'system_is_down'])
+    }
+
+
+_PAYLOADS: Dict[str, Callable[[int], Dict]] = {
+    SYSTEM_RAW_DATA_ROUTING_KEY: _system_raw_data,
+    SYSTEM_TRANSFORMED_DATA_ROUTING_KEY: _system_transformed_data,
+    COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY: _cosmos_node_transformed_data,
+    CL_CONTRACT_TRANSFORMED_DATA_ROUTING_KEY:
+        _chainlink_contract_transformed_data,
+    SUBSTRATE_NETWORK_TRANSFORMED_DATA_ROUTING_KEY:
+        _substrate_network_transformed_data,
+    COSMOS_NODE_ALERT_ROUTING_KEY: _alert,
+    HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY: _heartbeat,
+    ALERTS_CONFIGS_ROUTING_KEY_GEN: _alerts_config,
+}
+
+
+def _time_per_call(call: Callable[[], object], repetitions: int) -> float:
+    return timeit.timeit(call, number=repetitions) / repetitions
+
+
+def _measure(codec: MessageCodec, payload: Dict, repetitions: int) \
+        -> Dict[str, float]:
+    body = codec.encode(payload)
+    assert codec.decode(body) == payload
+    return {
+        'size': len(body),
+        'encode': _time_per_call(lambda: codec.encode(payload), repetitions),
+        'decode': _time_per_call(lambda: codec.decode(body), repetitions),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repetitions', type=int, default=2000)
+    parser.add_argument('--history', type=int, default=500,
+                        help="The number of missed heights, historical "
+                             "rounds and referendums in the payloads")
+    args = parser.parse_args()
+    random.seed(0)
+
+    print("Per message ({}):".format(
+        ' -> '.join(codec.name for codec in _CODECS)))
+    for routing_key, create_payload in _PAYLOADS.items():
+        payload = create_payload(args.history)
+        before, after = [_measure(codec, payload, args.repetitions)
+                         for codec in _CODECS]
+        print("  {}".format(routing_key))
+        print("    size: {} B -> {} B ({:.0f}%)".format(
+            before['size'], after['size'],
+            100 * after['size'] / before['size']))
+        for operation in ['encode', 'decode']:
+            print("    {}: {:.2f} us -> {:.2f} us ({:.1f}x)".format(
+                operation, before[operation] * 1e6, after[operation] * 1e6,
+                before[operation] / after[operation]))
+
+
+if __name__ == '__main__':
+    main()
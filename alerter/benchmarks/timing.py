@@ -0,0 +1,162 @@
+"""
+Compares the per-call cost of the timing primitives in src.utils.timing with
+the Queue-based implementations they replaced.
+
+Run from the alerter directory:
+    python -m benchmarks.timing [--repetitions N]
+"""
+import argparse
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+from itertools import count
+from queue import Queue
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+from src.utils.timing import (OccurrencesInTimePeriodTracker,
+                              TimedOccurrenceTracker, TimedTaskTracker)
+
+_TIME_PERIOD = timedelta(seconds=60)
+_START = datetime(2012, 1, 1)
+
+
+def _times() -> Iterator[datetime]:
+    # Occurrences one second apart, so that a tracker of the last minute holds
+    # 60 of them once it is warmed up
+    return (_START + timedelta(seconds=second) for second in count())
+
+
+class _QueueOccurrencesInTimePeriodTracker:
+    # The implementation replaced by OccurrencesInTimePeriodTracker
+    def __init__(self, time_period: timedelta) -> None:
+        self._time_period = time_period
+        self._occurrences_queue = Queue()
+
+    @property
+    def time_period(self) -> timedelta:
+        return self._time_period
+
+    def add_occurrence(self, time: datetime = None) -> None:
+        self.remove_old_occurrences(time)
+        self._occurrences_queue.put(time)
+
+    def remove_old_occurrences(self, time: datetime = None) -> None:
+        while not self._occurrences_queue.empty():
+            oldest_occurrence = self._occurrences_queue.queue[0]
+            if (time - oldest_occurrence) > self.time_period:
+                self._occurrences_queue.get()
+            else:
+                break
+
+    def no_of_occurrences(self) -> int:
+        return self._occurrences_queue.qsize()
+
+
+class _QueueTimedOccurrenceTracker:
+    # The implementation replaced by TimedOccurrenceTracker
+    def __init__(self, max_occurrences: int, time_interval: timedelta) -> None:
+        self._max_occurrences = max_occurrences
+        self._time_interval = time_interval
+        self._last_occurrences = Queue(maxsize=max_occurrences)
+        for _ in range(max_occurrences):
+            self._last_occurrences.put(datetime.min)
+
+    def action_happened(self, at_time: datetime = None) -> None:
+        self._last_occurrences.get()
+        self._last_occurrences.put(at_time)
+
+    def too_many_occurrences(self, from_time: datetime = None) -> bool:
+        oldest_occurrence = self._last_occurrences.queue[0]
+        return (from_time - oldest_occurrence) < self._time_interval
+
+
+class _PropertiesTimedTaskTracker(TimedTaskTracker):
+    # The can_do_task replaced by one which reads the fields directly
+    __slots__ = ()
+
+    def can_do_task(self, time: datetime = None) -> bool:
+        if not self.timer_started or self.did_task:
+            return False
+        else:
+            return (time - self.start_time) >= self.time_interval
+
+
+def _occurrences_in_time_period(tracker_class: type) -> Callable[[], Any]:
+    tracker = tracker_class(_TIME_PERIOD)
+    times = _times()
+
+    def add_and_count() -> int:
+        tracker.add_occurrence(next(times))
+        return tracker.no_of_occurrences()
+
+    return add_and_count
+
+
+def _timed_occurrences(tracker_class: type) -> Callable[[], Any]:
+    tracker = tracker_class(10, _TIME_PERIOD)
+    times = _times()
+
+    def happened_and_check() -> bool:
+        time = next(times)
+        tracker.action_happened(time)
+        return tracker.too_many_occurrences(time)
+
+    return happened_and_check
+
+
+def _timed_task_tracker(tracker_class: type) -> Callable[[], Any]:
+    tracker = tracker_class(_TIME_PERIOD)
+    tracker.start_timer(_START)
+    time = _START + _TIME_PERIOD
+
+    return lambda: tracker.can_do_task(time)
+
+
+def _measure_size(create: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    created = [create() for _ in range(1000)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del created
+    return size / 1000
+
+
+def _time_per_call(call: Callable[[], Any], repetitions: int) -> float:
+    return timeit.timeit(call, number=repetitions) / repetitions
+
+
+_BENCHMARKS: Dict[str, Tuple[Callable[[], Any], Callable[[], Any]]] = {
+    'OccurrencesInTimePeriodTracker add + count': (
+        lambda: _occurrences_in_time_period(
+            _QueueOccurrencesInTimePeriodTracker),
+        lambda: _occurrences_in_time_period(OccurrencesInTimePeriodTracker)),
+    'TimedOccurrenceTracker happened + check': (
+        lambda: _timed_occurrences(_QueueTimedOccurrenceTracker),
+        lambda: _timed_occurrences(TimedOccurrenceTracker)),
+    'TimedTaskTracker can_do_task': (
+        lambda: _timed_task_tracker(_PropertiesTimedTaskTracker),
+        lambda: _timed_task_tracker(TimedTaskTracker)),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repetitions', type=int, default=200000)
+    args = parser.parse_args()
+
+    print("Time per call:")
+    for name, (create_before, create_after) in _BENCHMARKS.items():
+        before = _time_per_call(create_before(), args.repetitions)
+        after = _time_per_call(create_after(), args.repetitions)
+        print("  {}: {:.2f} us -> {:.2f} us ({:.1f}x)".format(
+            name, before * 1e6, after * 1e6, before / after))
+
+    print("Memory per empty tracker:")
+    print("  OccurrencesInTimePeriodTracker: {:.0f} B -> {:.0f} B".format(
+        _measure_size(
+            lambda: _QueueOccurrencesInTimePeriodTracker(_TIME_PERIOD)),
+        _measure_size(lambda: OccurrencesInTimePeriodTracker(_TIME_PERIOD))))
+
+
+if __name__ == '__main__':
+    main()
@@ -118,7 +118,7 @@ def _initialise_system_alerters_manager() -> SystemAlertersManager:
                     RabbitMQApi.__name__), host=env.RABBIT_IP)
             system_alerters_manager = SystemAlertersManager(
                 system_alerters_manager_logger, manager_display_name,
-                rabbitmq)
+                rabbitmq, env.ALERTER_PARTITIONS)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -204,7 +204,7 @@ def _initialise_chainlink_alerters_manager() -> ChainlinkAlertersManager:
                     RabbitMQApi.__name__), host=env.RABBIT_IP)
             chainlink_alerters_manager = ChainlinkAlertersManager(
                 chainlink_alerters_manager_logger, manager_display_name,
-                rabbitmq)
+                rabbitmq, env.ALERTER_PARTITIONS)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -261,7 +261,7 @@ def _initialise_cosmos_alerters_manager() -> CosmosAlertersManager:
                     RabbitMQApi.__name__), host=env.RABBIT_IP)
             cosmos_alerters_manager = CosmosAlertersManager(
                 cosmos_alerters_manager_logger, manager_display_name,
-                rabbitmq)
+                rabbitmq, env.ALERTER_PARTITIONS)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -290,7 +290,7 @@ def _initialise_substrate_alerters_manager() -> SubstrateAlertersManager:
                     RabbitMQApi.__name__), host=env.RABBIT_IP)
             substrate_alerters_manager = SubstrateAlertersManager(
                 substrate_alerters_manager_logger, manager_display_name,
-                rabbitmq)
+                rabbitmq, env.ALERTER_PARTITIONS)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -496,7 +496,7 @@ def _initialise_data_transformers_manager() -> DataTransformersManager:
                     RabbitMQApi.__name__), host=env.RABBIT_IP)
             data_transformers_manager = DataTransformersManager(
                 data_transformers_manager_logger, manager_display_name,
-                rabbitmq)
+                rabbitmq, env.DATA_TRANSFORMER_PARTITIONS)
             break
         except Exception as e:
             log_and_print(get_initialisation_error_message(
@@ -2,12 +2,13 @@ import copy
 import logging
 from abc import ABC, abstractmethod
 from queue import Queue
-from typing import Dict
+from typing import Dict, List
 
 from pika import BasicProperties
 
 from src.abstract import Component
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils.exceptions import MessageWasNotDeliveredException
 
 
 class PublisherSubscriberComponent(Component, ABC):
@@ -82,7 +83,8 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
 
     def _push_to_queue(self, data: Dict, exchange: str, routing_key: str,
                        properties: BasicProperties = BasicProperties(
-                           delivery_mode=2), mandatory: bool = True) -> None:
+                           delivery_mode=2), mandatory: bool = True,
+                       copy_data: bool = True) -> None:
         """
         Method that takes the data to save and puts the data in their respective
         queues
@@ -93,6 +95,9 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
         (defaults to delivery_mode = 2)
         :param mandatory: Whether the message must be delivered or not
         (defaults to True)
+        :param copy_data: Whether the data must be copied before it is queued.
+        Callers which hand over data that they will not modify again may pass
+        False to avoid the copy (defaults to True)
         """
         self._logger.debug("Adding data to the publishing queue ...")
 
@@ -102,8 +107,8 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
             self._logger.debug("The queue is full, clearing the first item.")
             self._publishing_queue.get()
         data_dict = {'exchange': exchange, 'routing_key': routing_key,
-                     'data': copy.deepcopy(data), 'properties': properties,
-                     'mandatory': mandatory}
+                     'data': copy.deepcopy(data) if copy_data else data,
+                     'properties': properties, 'mandatory': mandatory}
         self._logger.debug("Adding %s to the queue", data_dict)
         self._publishing_queue.put(data_dict)
 
@@ -116,6 +121,13 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
             self._logger.debug("Attempting to send all data waiting in the "
                                "publishing queue ...")
 
+        if self._rabbitmq.publisher_confirm_window > 1:
+            self._send_data_windowed()
+            if not empty:
+                self._logger.debug("Successfully sent all data from the "
+                                   "publishing queue")
+            return
+
         # Try sending the data in the publishing queue one by one. Important,
         # remove an item from the queue only if the sending was successful, so
         # that if an exception is raised, that message is not popped
@@ -141,3 +153,91 @@ class QueuingPublisherSubscriberComponent(PublisherSubscriberComponent, ABC):
         if not empty:
             self._logger.debug("Successfully sent all data from the publishing "
                                "queue")
+
+    def _send_data_windowed(self) -> None:
+        """
+        Sends the data in the publishing queue while keeping up to
+        publisher_confirm_window messages awaiting a delivery confirmation at
+        the same time. As when sending one by one, a datum is removed from the
+        queue only once its delivery is confirmed, and the data which was not
+        delivered is kept at the front of the queue in its original order.
+        :raises MessageWasNotDeliveredException: If the broker nacked or
+        returned some of the data
+        """
+        window = self._rabbitmq.publisher_confirm_window
+        to_send = list(self._publishing_queue.queue)
+        # Whether each datum in to_send was delivered or discarded
+        is_sent = [False] * len(to_send)
+        in_flight: Dict[int, int] = {}
+        n_published = 0
+        n_not_delivered = 0
+        can_publish = True
+        try:
+            while (can_publish and n_published < len(to_send)) or in_flight:
+                while can_publish and n_published < len(to_send) and len(
+                        in_flight) < window:
+                    data = to_send[n_published]
+                    try:
+                        delivery_tag = self._rabbitmq.basic_publish_async(
+                            exchange=data['exchange'],
+                            routing_key=data['routing_key'],
+                            body=data['data'], is_body_dict=True,
+                            properties=data['properties'],
+                            mandatory=data['mandatory'])
+                    except KeyError as ke:
+                        self._logger.error("Enqueued datum %s was incomplete",
+                                           data)
+                        self._logger.exception(ke)
+                        self._logger.warning("Discarding this datum")
+                        is_sent[n_published] = True
+                        n_published += 1
+                        continue
+
+                    if delivery_tag == -1:
+                        # RabbitMQ is temporarily unusable, so the rest of the
+                        # data is sent later
+                        can_publish = False
+                        break
+
+                    in_flight[delivery_tag] = n_published
+                    n_published += 1
+
+                if not in_flight:
+                    break
+
+                confirmations = self._rabbitmq.wait_for_delivery_confirmations(
+                    list(in_flight))
+                if confirmations == -1 or not confirmations:
+                    # The confirmations can no longer be received, so the data
+                    # awaiting them is sent again later
+                    break
+
+                for delivery_tag, delivered in confirmations.items():
+                    index = in_flight.pop(delivery_tag)
+                    if delivered:
+                        self._logger.debug("Sent %s to '%s' exchange",
+                                           to_send[index]['data'],
+                                           to_send[index]['exchange'])
+                        is_sent[index] = True
+                    else:
+                        n_not_delivered += 1
+        finally:
+            self._remove_sent_data(is_sent)
+
+        if n_not_delivered > 0:
+            raise MessageWasNotDeliveredException(
+                "{} messages were nacked or returned by the broker".format(
+                    n_not_delivered))
+
+    def _remove_sent_data(self, is_sent: List[bool]) -> None:
+        # Removes the data which was sent from the front of the publishing
+        # queue. The data which was not sent is put back in its original order.
+        not_sent = []
+        for sent in is_sent:
+            data = self._publishing_queue.get()
+            if sent:
+                self._publishing_queue.task_done()
+            else:
+                not_sent.append(data)
+
+        self._publishing_queue.queue.extendleft(reversed(not_sent))
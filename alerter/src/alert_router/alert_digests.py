@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.alerter.alert_severities import Severity
+
+# The number of merged alert messages listed in a digest's message. The
+# messages of the remaining alerts are only counted.
+_MAX_DIGEST_MESSAGES = 10
+
+
+class _PendingDigest:
+    def __init__(self, started: datetime) -> None:
+        self.started = started
+        self.alerts: List[Dict] = []
+
+
+class AlertDigests:
+    """
+    Coalesces the alerts routed to each channel during an alert storm. Alerts
+    sent to the same channel with the same parent_id, alert code and severity
+    within window of the first one are merged into a single digest alert, so
+    that the channel is not flooded by alerts sharing a root cause. Critical
+    alerts are never delayed.
+    """
+
+    def __init__(self, window: timedelta) -> None:
+        self._window = window
+
+        # The alerts waiting to be sent, keyed by channel id and then by
+        # (parent_id, alert code, severity). Dicts keep the insertion order, so
+        # digests are sent in the order their first alert was received.
+        self._pending: Dict[str, Dict[Tuple[str, int, str],
+                                      _PendingDigest]] = {}
+
+        # The number of alerts which were merged into another alert's digest
+        # instead of being sent on their own, and the number of digests sent,
+        # per channel
+        self._merged_alerts_count: Dict[str, int] = {}
+        self._digests_count: Dict[str, int] = {}
+
+    @property
+    def window(self) -> timedelta:
+        return self._window
+
+    @property
+    def merged_alerts_count(self) -> Dict[str, int]:
+        return self._merged_alerts_count
+
+    @property
+    def digests_count(self) -> Dict[str, int]:
+        return self._digests_count
+
+    def is_empty(self) -> bool:
+        return len(self._pending) == 0
+
+    def add(self, channel_id: str, alert: Dict) -> bool:
+        """
+        Adds the alert to the digest of its group for the given channel.
+        :param channel_id: The channel the alert is routed to
+        :param alert: The routed alert
+        :return: True if the alert was held back to be sent in a digest, or
+               : False if it must be sent immediately
+        """
+        if alert['severity'] == Severity.CRITICAL.value:
+            return False
+
+        group = (alert['parent_id'], alert['alert_code']['code'],
+                 alert['severity'])
+        channel_digests = self._pending.setdefault(channel_id, {})
+        if group not in channel_digests:
+            channel_digests[group] = _PendingDigest(datetime.now())
+        channel_digests[group].alerts.append(alert)
+        return True
+
+    def pop_alert_code(self, channel_id: str, alert: Dict) -> List[Dict]:
+        """
+        Removes the digests held for the given channel which have the same
+        parent_id and alert code as the alert, whatever their severity. These
+        must be sent before an alert which is not held back, so that they do
+        not arrive after it.
+        :param channel_id: The channel the alert is routed to
+        :param alert: The routed alert
+        :return: A list of alerts to send, in the order they were held back
+        """
+        channel_digests = self._pending.get(channel_id, {})
+        popped = []
+        for group in list(channel_digests):
+            parent_id, code, _ = group
+            if parent_id == alert['parent_id'] and \
+                    code == alert['alert_code']['code']:
+                popped.append(self._create_digest(
+                    channel_id, channel_digests.pop(group).alerts))
+
+        if channel_id in self._pending and len(channel_digests) == 0:
+            del self._pending[channel_id]
+
+        return popped
+
+    def next_due_in(self) -> Optional[float]:
+        """
+        :return: The number of seconds until the oldest digest is due to be
+               : sent, or None if no alert is waiting
+        """
+        oldest = None
+        for channel_digests in self._pending.values():
+            for digest in channel_digests.values():
+                if oldest is None or digest.started < oldest:
+                    oldest = digest.started
+
+        if oldest is None:
+            return None
+
+        due_in = oldest + self.window - datetime.now()
+        return max(due_in.total_seconds(), 0)
+
+    def pop_due(self, flush_all: bool = False) -> List[Tuple[str, Dict]]:
+        """
+        Removes the digests whose window has elapsed.
+        :param flush_all: If True, all the digests are removed even if their
+                        : window has not elapsed yet
+        :return: A list of (channel_id, alert) pairs to send. A group holding a
+               : single alert is sent as that alert.
+        """
+        now = datetime.now()
+        due = []
+        for channel_id in list(self._pending):
+            channel_digests = self._pending[channel_id]
+            for group in list(channel_digests):
+                digest = channel_digests[group]
+                if not flush_all and now - digest.started < self.window:
+                    continue
+
+                del channel_digests[group]
+                due.append((channel_id, self._create_digest(channel_id,
+                                                            digest.alerts)))
+
+            if len(channel_digests) == 0:
+                del self._pending[channel_id]
+
+        return due
+
+    def _create_digest(self, channel_id: str, alerts: List[Dict]) -> Dict:
+        if len(alerts) == 1:
+            return alerts[0]
+
+        self._merged_alerts_count[channel_id] = \
+            self._merged_alerts_count.get(channel_id, 0) + len(alerts) - 1
+        self._digests_count[channel_id] = \
+            self._digests_count.get(channel_id, 0) + 1
+
+        # The digest carries the fields of the latest alert so that channel
+        # handlers process it like any other alert.
+        latest = max(alerts, key=lambda alert: alert['timestamp'])
+        lines = ["{} {} alerts were raised:".format(
+            len(alerts), latest['alert_code']['name'])]
+        lines.extend("- {}".format(alert['message'])
+                     for alert in alerts[:_MAX_DIGEST_MESSAGES])
+        if len(alerts) > _MAX_DIGEST_MESSAGES:
+            lines.append("... and {} more".format(
+                len(alerts) - _MAX_DIGEST_MESSAGES))
+
+        return {**latest, 'message': "\n".join(lines),
+                'digest_size': len(alerts)}
@@ -2,11 +2,11 @@ import json
 import sys
 from configparser import (ConfigParser, NoOptionError, NoSectionError,
                           SectionProxy)
-from datetime import datetime
+from datetime import datetime, timedelta
 from json import JSONDecodeError
 from logging import Logger
 from types import FrameType
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -15,9 +15,11 @@ from pika.exceptions import AMQPConnectionError
 from src.abstract.publisher_subscriber import (
     QueuingPublisherSubscriberComponent
 )
+from src.alert_router.alert_digests import AlertDigests
 from src.alerter.alert_severities import Severity
 from src.data_store.redis import Keys, RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils import env
 from src.utils.constants.rabbitmq import (
     ALERT_ROUTER_CONFIGS_QUEUE_NAME, ALERT_ROUTER_CONFIGS_ROUTING_KEY,
@@ -31,6 +33,7 @@ from src.utils.exceptions import (
     MessageWasNotDeliveredException, MissingKeyInConfigException
 )
 from src.utils.logging import log_and_print
+from src.utils.timing import TimedTaskLimiter
 
 _ROUTED_ALERT_QUEUED_LOG_MESSAGE = "Routed Alert queued"
 
@@ -49,8 +52,31 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
 
         self._config = {}
 
+        # Maps (parent_id, lower-case severity) to the ids of the channels to
+        # which such alerts are routed. It is rebuilt whenever a channels
+        # configuration is received, so routing an alert is a single lookup.
+        self._routing_table: Dict[Tuple[str, str], List[str]] = {}
+
+        # The mute state read from Redis is cached, and the cache is cleared
+        # every ALERT_ROUTER_MUTE_CACHE_TTL_SECONDS. If the TTL is 0 the mute
+        # state is read from Redis for every alert.
+        self._mute_cache_limiter = TimedTaskLimiter(
+            timedelta(seconds=env.ALERT_ROUTER_MUTE_CACHE_TTL_SECONDS))
+        self._all_muted_severities: Optional[Dict] = None
+        self._chain_muted_severities: Dict[str, Dict] = {}
+
+        # If a digest window is set, non-critical alerts routed to a channel
+        # are held back and merged with similar alerts into digests, which are
+        # sent by a timer once their window elapses.
+        self._alert_digests: Optional[AlertDigests] = None
+        if env.ALERT_ROUTER_DIGEST_WINDOW_SECONDS > 0:
+            self._alert_digests = AlertDigests(
+                timedelta(seconds=env.ALERT_ROUTER_DIGEST_WINDOW_SECONDS))
+        self._digests_timer_id = None
+
         super().__init__(logger, RabbitMQApi(
-            logger=logger.getChild(RabbitMQApi.__name__), host=rabbit_ip),
+            logger=logger.getChild(RabbitMQApi.__name__), host=rabbit_ip,
+            publisher_confirm_window=env.ALERT_ROUTER_PUBLISHER_CONFIRM_WINDOW),
                          env.ALERT_ROUTER_PUBLISHING_QUEUE_SIZE)
 
     def __str__(self) -> str:
@@ -66,6 +92,8 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
         :return: None
         """
         self._rabbitmq.connect_till_successful()
+        # Timers do not survive a new connection
+        self._digests_timer_id = None
         self._logger.info(
             "Setting delivery confirmation on RabbitMQ channel")
         self._rabbitmq.confirm_delivery()
@@ -109,6 +137,10 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
         self._rabbitmq.basic_consume(ALERT_ROUTER_HEARTBEAT_QUEUE_NAME,
                                      self._process_ping, True, False, None)
 
+        # The digests held before the connection was lost are sent by a timer
+        # on the new connection
+        self._schedule_digests_timer()
+
     def _declare_exchange_and_bind_queue(self, queue_name: str,
                                          exchange_name: str, exchange_type: str,
                                          routing_key: str) -> None:
@@ -138,7 +170,7 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
                          body: bytes) -> None:
 
         recv_config = ConfigParser()
-        recv_config.read_dict(json.loads(body))
+        recv_config.read_dict(decode_message(properties, body))
         config_filename = method.routing_key
 
         self._logger.info("Received a new configuration from %s",
@@ -174,8 +206,31 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
                 self._config[config_filename] = previous_config
             self._logger.debug(self._config)
 
+        self._build_routing_table()
+
         self._rabbitmq.basic_ack(method.delivery_tag, False)
 
+    def _build_routing_table(self) -> None:
+        routing_table = {}
+        for channel_type in self._config.values():
+            # The configuration is None if the first configuration received
+            # for this channel type was invalid
+            if channel_type is None:
+                continue
+
+            for channel in channel_type.values():
+                for severity in Severity:
+                    if not channel.get(severity.value.lower()):
+                        continue
+
+                    for parent_id in dict.fromkeys(channel.get('parent_ids')):
+                        routing_table.setdefault(
+                            (parent_id, severity.value.lower()), []).append(
+                            channel.get('id'))
+
+        self._routing_table = routing_table
+        self._logger.debug("routing_table = %s", self._routing_table)
+
     def _process_alert(self, ch: BlockingChannel,
                        method: pika.spec.Basic.Deliver,
                        properties: pika.spec.BasicProperties,
@@ -185,7 +240,7 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
         send_to_ids: List[str] = []
         try:
             # Placed in try-except in case of malformed JSON
-            recv_alert = json.loads(body)
+            recv_alert = decode_message(properties, body)
 
             if recv_alert and 'severity' in recv_alert:
                 self._logger.debug("Received an alert to route")
@@ -204,19 +259,9 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
                         is_all_muted, is_chain_severity_muted)
                 else:
                     self._logger.info("Obtaining list of channels to alert")
-                    self._logger.info([
-                        channel.get('id') for channel_type in
-                        self._config.values() for channel in
-                        channel_type.values()
-                    ])
-                    send_to_ids = [
-                        channel.get('id') for channel_type in
-                        self._config.values()
-                        for channel in channel_type.values()
-                        if channel.get(recv_alert.get('severity').lower()) and
-                           recv_alert.get('parent_id') in channel.get(
-                            'parent_ids')
-                    ]
+                    send_to_ids = self._routing_table.get(
+                        (recv_alert.get('parent_id'),
+                         recv_alert.get('severity').lower()), [])
 
                     self._logger.debug("send_to_ids = %s", send_to_ids)
         except JSONDecodeError as json_e:
@@ -236,14 +281,20 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
                 send_alert: Dict = {**recv_alert,
                                     'destination_id': channel_id}
 
-                self._logger.debug("Queuing %s to be sent to %s",
-                                   send_alert, channel_id)
+                if self._alert_digests is not None:
+                    if self._alert_digests.add(channel_id, send_alert):
+                        self._logger.debug(
+                            "Holding %s back to be sent to %s in a digest",
+                            send_alert, channel_id)
+                        continue
 
-                self._push_to_queue(
-                    send_alert, ALERT_EXCHANGE,
-                    CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE.format(
-                        channel_id), mandatory=False)
-                self._logger.debug(_ROUTED_ALERT_QUEUED_LOG_MESSAGE)
+                    # The alerts held back with the same code must not arrive
+                    # after this alert
+                    for held_alert in self._alert_digests.pop_alert_code(
+                            channel_id, send_alert):
+                        self._push_digest_to_channel(held_alert, channel_id)
+
+                self._push_alert_to_channel(send_alert, channel_id)
 
             # Enqueue once to the console
             if self._enable_console_alerts:
@@ -269,6 +320,8 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
 
             self._logger.debug("Alert routed successfully")
 
+        self._push_due_digests()
+
         # Send any data waiting in the publisher queue, if any
         try:
             self._send_data()
@@ -277,6 +330,62 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
             # publisher queue.
             self._logger.exception(e)
 
+    def _push_alert_to_channel(self, send_alert: Dict, channel_id: str) -> None:
+        self._logger.debug("Queuing %s to be sent to %s", send_alert,
+                           channel_id)
+
+        self._push_to_queue(
+            send_alert, ALERT_EXCHANGE,
+            CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE.format(channel_id),
+            mandatory=False)
+        self._logger.debug(_ROUTED_ALERT_QUEUED_LOG_MESSAGE)
+
+    def _push_due_digests(self) -> None:
+        """
+        Queues the digests whose window elapsed to be sent to their channels,
+        and makes sure that a timer sends the remaining digests once they are
+        due even if no other alert is received.
+        :return: None
+        """
+        if self._alert_digests is None:
+            return
+
+        for channel_id, send_alert in self._alert_digests.pop_due():
+            self._push_digest_to_channel(send_alert, channel_id)
+
+        self._schedule_digests_timer()
+
+    def _push_digest_to_channel(self, send_alert: Dict,
+                                channel_id: str) -> None:
+        self._push_alert_to_channel(send_alert, channel_id)
+        if 'digest_size' in send_alert:
+            self._logger.info(
+                "Sent a digest of %s alerts to %s. Alerts merged into digests "
+                "so far: %s", send_alert['digest_size'], channel_id,
+                self._alert_digests.merged_alerts_count[channel_id])
+
+    def _schedule_digests_timer(self) -> None:
+        """
+        Makes sure that a timer sends the held digests once they are due, if
+        no timer is set yet.
+        :return: None
+        """
+        if self._alert_digests is None:
+            return
+
+        due_in = self._alert_digests.next_due_in()
+        if due_in is not None and self._digests_timer_id is None:
+            self._digests_timer_id = self._rabbitmq.connection.call_later(
+                due_in, self._on_digests_timer)
+
+    def _on_digests_timer(self) -> None:
+        self._digests_timer_id = None
+        self._push_due_digests()
+        try:
+            self._send_data()
+        except MessageWasNotDeliveredException as e:
+            self._logger.exception(e)
+
     def _send_heartbeat(self, data_to_send: dict) -> None:
         self._rabbitmq.basic_publish_confirm(
             exchange=HEALTH_CHECK_EXCHANGE,
@@ -342,33 +451,45 @@ class AlertRouter(QueuingPublisherSubscriberComponent):
         log_and_print("{} terminated.".format(self), self._logger)
         sys.exit()
 
+    def _clear_mute_cache_if_expired(self) -> None:
+        if self._mute_cache_limiter.can_do_task():
+            self._all_muted_severities = None
+            self._chain_muted_severities = {}
+            self._mute_cache_limiter.did_task()
+
     def is_all_muted(self, severity: str) -> bool:
-        self._logger.debug("Getting mute_all key")
-        alerter_mute_key = Keys.get_alerter_mute()
+        self._clear_mute_cache_if_expired()
+        if self._all_muted_severities is None:
+            self._logger.debug("Getting mute_all key")
+            alerter_mute_key = Keys.get_alerter_mute()
 
-        self._logger.debug("Getting severities mute status")
-        severities_muted = json.loads(
-            self._redis.get(alerter_mute_key, default=b"{}")
-        )
-        return bool(severities_muted.get(severity, False))
+            self._logger.debug("Getting severities mute status")
+            self._all_muted_severities = json.loads(
+                self._redis.get(alerter_mute_key, default=b"{}")
+            )
+
+        return bool(self._all_muted_severities.get(severity, False))
 
     def is_chain_severity_muted(self, parent_id: str, severity: str) -> bool:
         # INTERNAL Severities cannot be muted
         if severity == Severity.INTERNAL.value:
             return False
 
-        self._logger.debug("Getting chain mute key")
-        mute_alerts_key = Keys.get_chain_mute_alerts()
+        self._clear_mute_cache_if_expired()
+        if parent_id not in self._chain_muted_severities:
+            self._logger.debug("Getting chain mute key")
+            mute_alerts_key = Keys.get_chain_mute_alerts()
 
-        self._logger.debug("Getting chain hashes")
-        chain_hash = Keys.get_hash_parent(parent_id)
+            self._logger.debug("Getting chain hashes")
+            chain_hash = Keys.get_hash_parent(parent_id)
 
-        self._logger.debug("Getting severities mute status")
-        severities_muted = json.loads(
-            self._redis.hget(chain_hash, mute_alerts_key, default=b"{}")
-        )
+            self._logger.debug("Getting severities mute status")
+            self._chain_muted_severities[parent_id] = json.loads(
+                self._redis.hget(chain_hash, mute_alerts_key, default=b"{}")
+            )
 
-        return bool(severities_muted.get(severity, False))
+        return bool(
+            self._chain_muted_severities[parent_id].get(severity, False))
 
     @staticmethod
     def extract_config(section: SectionProxy, config_filename: str) -> Dict[
@@ -1,5 +1,7 @@
 import logging
 import time
+from datetime import timedelta
+from typing import Optional
 
 import pika.exceptions
 
@@ -14,6 +16,8 @@ from src.alerter.alerters.node.cosmos import CosmosNodeAlerter
 from src.alerter.alerters.node.evm import EVMNodeAlerter
 from src.alerter.alerters.node.substrate import SubstrateNodeAlerter
 from src.alerter.alerters.system import SystemAlerter
+from src.alerter.factory.alerting_state_snapshots import (
+    AlertingStateSnapshots)
 from src.configs.factory.alerts.chainlink_alerts import (
     ChainlinkNodeAlertsConfigsFactory, ChainlinkContractAlertsConfigsFactory)
 from src.configs.factory.alerts.cosmos_alerts import (
@@ -22,6 +26,7 @@ from src.configs.factory.alerts.evm_alerts import EVMNodeAlertsConfigsFactory
 from src.configs.factory.alerts.substrate_alerts import (
     SubstrateNodeAlertsConfigsFactory, SubstrateNetworkAlertsConfigsFactory)
 from src.configs.factory.alerts.system_alerts import SystemAlertsConfigsFactory
+from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils.constants.names import (
     SYSTEM_ALERTER_NAME, GITHUB_ALERTER_NAME, DOCKERHUB_ALERTER_NAME,
@@ -33,8 +38,11 @@ from src.utils.constants.starters import (
     RE_INITIALISE_SLEEPING_PERIOD, RESTART_SLEEPING_PERIOD)
 from src.utils.env import (
     ALERTERS_LOG_FILE_TEMPLATE, LOGGING_LEVEL, RABBIT_IP,
-    ALERTER_PUBLISHING_QUEUE_SIZE)
+    ALERTER_PUBLISHING_QUEUE_SIZE, REDIS_IP, REDIS_DB, REDIS_PORT,
+    UNIQUE_ALERTER_IDENTIFIER, ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS,
+    ALERTERS_STATE_SNAPSHOT_MAX_AGE_SECONDS)
 from src.utils.logging import create_logger, log_and_print
+from src.utils.partitioning import get_partition_component_name
 from src.utils.starters import (
     get_initialisation_error_message, get_stopped_message)
 
@@ -61,15 +69,48 @@ def _initialise_alerter_logger(alerter_display_name: str,
     return alerter_logger
 
 
+def _initialise_alerting_state_snapshots(
+        alerter_display_name: str, alerter_logger: logging.Logger
+) -> Optional[AlertingStateSnapshots]:
+    if ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS <= 0:
+        return None
+
+    # Try initialising the Redis API until successful. This had to be done
+    # separately to avoid instances when Redis creation failed and we
+    # attempt to use it.
+    while True:
+        try:
+            redis = RedisApi(
+                logger=alerter_logger.getChild(RedisApi.__name__),
+                db=REDIS_DB, host=REDIS_IP, port=REDIS_PORT,
+                namespace=UNIQUE_ALERTER_IDENTIFIER)
+            break
+        except Exception as e:
+            msg = get_initialisation_error_message(alerter_display_name, e)
+            log_and_print(msg, alerter_logger)
+            # sleep before trying again
+            time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
+
+    return AlertingStateSnapshots(
+        alerter_display_name, redis,
+        alerter_logger.getChild(AlertingStateSnapshots.__name__),
+        timedelta(seconds=ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS),
+        timedelta(seconds=ALERTERS_STATE_SNAPSHOT_MAX_AGE_SECONDS))
+
+
 def _initialise_system_alerter(
-        system_alerts_configs_factory: SystemAlertsConfigsFactory
-) -> SystemAlerter:
+        system_alerts_configs_factory: SystemAlertsConfigsFactory,
+        partition: Optional[int] = None) -> SystemAlerter:
     # Alerter display name based on system
-    alerter_display_name = SYSTEM_ALERTER_NAME
+    alerter_display_name = get_partition_component_name(SYSTEM_ALERTER_NAME,
+                                                        partition)
 
     system_alerter_logger = _initialise_alerter_logger(alerter_display_name,
                                                        SystemAlerter.__name__)
 
+    alerting_state_snapshots = _initialise_alerting_state_snapshots(
+        alerter_display_name, system_alerter_logger)
+
     # Try initialising an alerter until successful
     while True:
         try:
@@ -79,7 +120,8 @@ def _initialise_system_alerter(
             system_alerter = SystemAlerter(
                 alerter_display_name, system_alerter_logger,
                 system_alerts_configs_factory, rabbitmq,
-                ALERTER_PUBLISHING_QUEUE_SIZE
+                ALERTER_PUBLISHING_QUEUE_SIZE, alerting_state_snapshots,
+                partition
             )
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), system_alerter_logger)
@@ -150,13 +192,17 @@ def _initialise_dockerhub_alerter() -> DockerhubAlerter:
 
 
 def _initialise_chainlink_node_alerter(
-        chainlink_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory
-) -> ChainlinkNodeAlerter:
-    alerter_display_name = CHAINLINK_NODE_ALERTER_NAME
+        chainlink_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory,
+        partition: Optional[int] = None) -> ChainlinkNodeAlerter:
+    alerter_display_name = get_partition_component_name(
+        CHAINLINK_NODE_ALERTER_NAME, partition)
 
     chainlink_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, ChainlinkNodeAlerter.__name__)
 
+    alerting_state_snapshots = _initialise_alerting_state_snapshots(
+        alerter_display_name, chainlink_alerter_logger)
+
     # Try initialising an alerter until successful
     while True:
         try:
@@ -166,7 +212,8 @@ def _initialise_chainlink_node_alerter(
             chainlink_alerter = ChainlinkNodeAlerter(
                 alerter_display_name, chainlink_alerter_logger,
                 rabbitmq, chainlink_alerts_configs_factory,
-                ALERTER_PUBLISHING_QUEUE_SIZE
+                ALERTER_PUBLISHING_QUEUE_SIZE, alerting_state_snapshots,
+                partition
             )
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), chainlink_alerter_logger)
@@ -188,6 +235,9 @@ def _initialise_chainlink_contract_alerter(
     chainlink_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, ChainlinkContractAlerter.__name__)
 
+    alerting_state_snapshots = _initialise_alerting_state_snapshots(
+        alerter_display_name, chainlink_alerter_logger)
+
     # Try initialising an alerter until successful
     while True:
         try:
@@ -196,7 +246,8 @@ def _initialise_chainlink_contract_alerter(
                 host=RABBIT_IP)
             chainlink_alerter = ChainlinkContractAlerter(
                 alerter_display_name, chainlink_alerter_logger, rabbitmq,
-                chainlink_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE
+                chainlink_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE,
+                alerting_state_snapshots
             )
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), chainlink_alerter_logger)
@@ -218,6 +269,9 @@ def _initialise_evm_node_alerter(
     evm_node_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, EVMNodeAlerter.__name__)
 
+    alerting_state_snapshots = _initialise_alerting_state_snapshots(
+        alerter_display_name, evm_node_alerter_logger)
+
     # Try initialising an alerter until successful
     while True:
         try:
@@ -227,7 +281,7 @@ def _initialise_evm_node_alerter(
             evm_node_alerter = EVMNodeAlerter(
                 alerter_display_name, evm_node_alerter_logger,
                 evm_alerts_configs_factory, rabbitmq,
-                ALERTER_PUBLISHING_QUEUE_SIZE
+                ALERTER_PUBLISHING_QUEUE_SIZE, alerting_state_snapshots
             )
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), evm_node_alerter_logger)
@@ -242,13 +296,17 @@ def _initialise_evm_node_alerter(
 
 
 def _initialise_cosmos_node_alerter(
-        cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory
-) -> CosmosNodeAlerter:
-    alerter_display_name = COSMOS_NODE_ALERTER_NAME
+        cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory,
+        partition: Optional[int] = None) -> CosmosNodeAlerter:
+    alerter_display_name = get_partition_component_name(
+        COSMOS_NODE_ALERTER_NAME, partition)
 
     cosmos_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, CosmosNodeAlerter.__name__)
 
+    alerting_state_snapshots = _initialise_alerting_state_snapshots(
+        alerter_display_name, cosmos_alerter_logger)
+
     # Try initialising an alerter until successful
     while True:
         try:
@@ -257,7 +315,8 @@ def _initialise_cosmos_node_alerter(
                 host=RABBIT_IP)
             cosmos_alerter = CosmosNodeAlerter(
                 alerter_display_name, cosmos_alerter_logger, rabbitmq,
-                cosmos_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE
+                cosmos_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE,
+                alerting_state_snapshots, partition
             )
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), cosmos_alerter_logger)
@@ -279,6 +338,9 @@ def _initialise_cosmos_network_alerter(
     cosmos_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, CosmosNetworkAlerter.__name__)
 
+    alerting_state_snapshots = _initialise_alerting_state_snapshots(
+        alerter_display_name, cosmos_alerter_logger)
+
     # Try initialising an alerter until successful
     while True:
         try:
@@ -287,7 +349,8 @@ def _initialise_cosmos_network_alerter(
                 host=RABBIT_IP)
             cosmos_alerter = CosmosNetworkAlerter(
                 alerter_display_name, cosmos_alerter_logger, rabbitmq,
-                cosmos_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE
+                cosmos_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE,
+                alerting_state_snapshots
             )
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), cosmos_alerter_logger)
@@ -302,13 +365,17 @@ def _initialise_cosmos_network_alerter(
 
 
 def _initialise_substrate_node_alerter(
-        substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory
-) -> SubstrateNodeAlerter:
-    alerter_display_name = SUBSTRATE_NODE_ALERTER_NAME
+        substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory,
+        partition: Optional[int] = None) -> SubstrateNodeAlerter:
+    alerter_display_name = get_partition_component_name(
+        SUBSTRATE_NODE_ALERTER_NAME, partition)
 
     substrate_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, SubstrateNodeAlerter.__name__)
 
+    alerting_state_snapshots = _initialise_alerting_state_snapshots(
+        alerter_display_name, substrate_alerter_logger)
+
     # Try initialising an alerter until successful
     while True:
         try:
@@ -317,7 +384,8 @@ def _initialise_substrate_node_alerter(
                 host=RABBIT_IP)
             substrate_alerter = SubstrateNodeAlerter(
                 alerter_display_name, substrate_alerter_logger, rabbitmq,
-                substrate_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE
+                substrate_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE,
+                alerting_state_snapshots, partition
             )
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), substrate_alerter_logger)
@@ -339,6 +407,9 @@ def _initialise_substrate_network_alerter(
     substrate_alerter_logger = _initialise_alerter_logger(
         alerter_display_name, SubstrateNetworkAlerter.__name__)
 
+    alerting_state_snapshots = _initialise_alerting_state_snapshots(
+        alerter_display_name, substrate_alerter_logger)
+
     # Try initialising an alerter until successful
     while True:
         try:
@@ -347,7 +418,8 @@ def _initialise_substrate_network_alerter(
                 host=RABBIT_IP)
             substrate_alerter = SubstrateNetworkAlerter(
                 alerter_display_name, substrate_alerter_logger, rabbitmq,
-                substrate_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE
+                substrate_alerts_configs_factory, ALERTER_PUBLISHING_QUEUE_SIZE,
+                alerting_state_snapshots
             )
             log_and_print("Successfully initialised {}".format(
                 alerter_display_name), substrate_alerter_logger)
@@ -362,8 +434,10 @@ def _initialise_substrate_network_alerter(
 
 
 def start_system_alerter(
-        system_alerts_configs_factory: SystemAlertsConfigsFactory) -> None:
-    system_alerter = _initialise_system_alerter(system_alerts_configs_factory)
+        system_alerts_configs_factory: SystemAlertsConfigsFactory,
+        partition: Optional[int] = None) -> None:
+    system_alerter = _initialise_system_alerter(system_alerts_configs_factory,
+                                                partition)
     start_alerter(system_alerter)
 
 
@@ -378,10 +452,10 @@ def start_dockerhub_alerter() -> None:
 
 
 def start_chainlink_node_alerter(
-        chainlink_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory
-) -> None:
+        chainlink_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory,
+        partition: Optional[int] = None) -> None:
     chainlink_alerter = _initialise_chainlink_node_alerter(
-        chainlink_alerts_configs_factory)
+        chainlink_alerts_configs_factory, partition)
     start_alerter(chainlink_alerter)
 
 
@@ -400,9 +474,10 @@ def start_evm_node_alerter(
 
 
 def start_cosmos_node_alerter(
-        cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory) -> None:
+        cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory,
+        partition: Optional[int] = None) -> None:
     cosmos_alerter = _initialise_cosmos_node_alerter(
-        cosmos_alerts_configs_factory)
+        cosmos_alerts_configs_factory, partition)
     start_alerter(cosmos_alerter)
 
 
@@ -415,10 +490,10 @@ def start_cosmos_network_alerter(
 
 
 def start_substrate_node_alerter(
-        substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory
-) -> None:
+        substrate_alerts_configs_factory: SubstrateNodeAlertsConfigsFactory,
+        partition: Optional[int] = None) -> None:
     substrate_alerter = _initialise_substrate_node_alerter(
-        substrate_alerts_configs_factory)
+        substrate_alerts_configs_factory, partition)
     start_alerter(substrate_alerter)
 
 
@@ -1,27 +1,45 @@
 import logging
 import sys
 from abc import abstractmethod
+from datetime import datetime, timedelta
 from types import FrameType
-from typing import Any
+from typing import Any, Dict, Optional
 
 import pika.exceptions
 
 from src.abstract.publisher_subscriber import (
     QueuingPublisherSubscriberComponent)
+from src.alerter.alerts.internal_alerts import ComponentResetAlert
+from src.alerter.factory.alerting_factory import AlertingFactory
+from src.alerter.factory.alerting_state_snapshots import (
+    AlertingStateSnapshots, get_configs_digest)
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
-from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
-                                          HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
+from src.utils import env
 from src.utils.exceptions import MessageWasNotDeliveredException
+from src.utils.heartbeat import HeartbeatBatcher
 from src.utils.logging import log_and_print
+from src.utils.partitioning import (get_partition, get_partition_queue_name,
+                                    get_partition_routing_key)
 
 
 class Alerter(QueuingPublisherSubscriberComponent):
 
     def __init__(self, alerter_name: str, logger: logging.Logger,
-                 rabbitmq: RabbitMQApi, max_queue_size: int = 0) -> None:
+                 rabbitmq: RabbitMQApi, max_queue_size: int = 0,
+                 alerting_state_snapshots: Optional[
+                     AlertingStateSnapshots] = None,
+                 partition: Optional[int] = None) -> None:
         super().__init__(logger, rabbitmq, max_queue_size)
 
         self._alerter_name = alerter_name
+        self._heartbeat_batcher = HeartbeatBatcher(
+            timedelta(seconds=env.WORKER_HEARTBEAT_INTERVAL_SECONDS))
+        self._alerting_state_snapshots = alerting_state_snapshots
+        self._alerting_state_restored = False
+        # The digest of the configs each chain's alerting state was built
+        # with, keyed by parent_id. These are saved with the snapshots.
+        self._configs_digests: Dict[str, str] = {}
+        self._partition = partition
 
     def __str__(self) -> str:
         return self.alerter_name
@@ -30,6 +48,23 @@ class Alerter(QueuingPublisherSubscriberComponent):
     def alerter_name(self) -> str:
         return self._alerter_name
 
+    @property
+    def heartbeat_batcher(self) -> HeartbeatBatcher:
+        return self._heartbeat_batcher
+
+    @property
+    def alerting_state_snapshots(self) -> Optional[AlertingStateSnapshots]:
+        return self._alerting_state_snapshots
+
+    @property
+    def partition(self) -> Optional[int]:
+        return self._partition
+
+    @property
+    def alerting_factory(self) -> Optional[AlertingFactory]:
+        # Alerters which keep an alerting state return their alerting factory
+        return None
+
     @staticmethod
     def _greater_than_condition_function(current: Any, previous: Any) -> bool:
         return current > previous
@@ -50,6 +85,16 @@ class Alerter(QueuingPublisherSubscriberComponent):
     def _true_fn() -> bool:
         return True
 
+    def _get_input_queue_name(self, queue_name: str) -> str:
+        return get_partition_queue_name(queue_name, self.partition)
+
+    def _get_input_routing_key(self, routing_key: str) -> str:
+        return get_partition_routing_key(routing_key, self.partition)
+
+    def _in_partition(self, monitorable_id: str) -> bool:
+        return self.partition is None or get_partition(
+            monitorable_id, env.ALERTER_PARTITIONS) == self.partition
+
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
 
@@ -62,16 +107,94 @@ class Alerter(QueuingPublisherSubscriberComponent):
         pass
 
     def _send_heartbeat(self, data_to_send: dict) -> None:
-        self.rabbitmq.basic_publish_confirm(
-            exchange=HEALTH_CHECK_EXCHANGE,
-            routing_key=HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, body=data_to_send,
-            is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
-            mandatory=True)
-        self.logger.debug("Sent heartbeat to '%s' exchange",
-                          HEALTH_CHECK_EXCHANGE)
+        self.heartbeat_batcher.send(self.rabbitmq, data_to_send, self.logger)
+
+    def _restore_alerting_state(self) -> None:
+        """
+        Restores the alerting state from the latest snapshot, if there is a
+        recent one. Otherwise the alerter starts from a fresh state, therefore
+        the alerts it stored in Redis are reset. When alerting state snapshots
+        are used the managers leave this reset to the alerters, as only they
+        know whether their state was restored.
+        """
+        if self.alerting_state_snapshots is None or \
+                self._alerting_state_restored:
+            return
+
+        snapshot = self.alerting_state_snapshots.restore()
+        alerting_state = None
+        if snapshot is not None:
+            alerting_state, configs_digests = snapshot
+            self._configs_digests.update(configs_digests)
+        if alerting_state is not None and self.partition is not None:
+            # The partitions may have changed since the snapshot was taken,
+            # in which case the state of the monitorables which moved to
+            # another partition is dropped.
+            alerting_state = {
+                parent_id: {
+                    monitorable_id: state
+                    for monitorable_id, state in chain_state.items()
+                    if self._in_partition(monitorable_id)
+                }
+                for parent_id, chain_state in alerting_state.items()
+            }
+        if alerting_state is not None:
+            self.alerting_factory.alerting_state.update(alerting_state)
+            log_and_print("{} restored its alerting state for {} chain(s)."
+                          .format(self, len(alerting_state)), self.logger)
+        else:
+            alert = ComponentResetAlert(
+                self.alerter_name, datetime.now().timestamp(),
+                type(self).__name__, partition=self.partition,
+                partitions=env.ALERTER_PARTITIONS)
+            self._place_latest_data_on_queue([alert.alert_data])
+        self._alerting_state_restored = True
+
+    def _save_alerting_state(self, force: bool = False) -> None:
+        if self.alerting_state_snapshots is not None:
+            self.alerting_state_snapshots.save(
+                self.alerting_factory.alerting_state, self._configs_digests,
+                force)
+
+    def _reset_chain_alerting_state(self, parent_id: str, chain: str,
+                                    configs: Optional[Dict] = None) -> None:
+        """
+        Resets the alerting state of a chain whose configs were received or
+        removed, since some thresholds might have changed. When alerting state
+        snapshots are used the state is kept if the configs are those it was
+        built with, as is the case for the configs re-sent when PANIC starts.
+        Otherwise the alerter resets the chain's alerts stored in Redis, as
+        the managers leave this reset to the alerters.
+        :param parent_id: The id of the chain
+        :param chain: The name of the chain
+        :param configs: The received configs, or None if they were removed
+        """
+        if self.alerting_state_snapshots is None:
+            self.alerting_factory.remove_chain_alerting_state(parent_id)
+            return
+
+        if configs is None:
+            self.alerting_factory.remove_chain_alerting_state(parent_id)
+            self._configs_digests.pop(parent_id, None)
+            return
+
+        configs_digest = get_configs_digest(configs)
+        if self._configs_digests.get(parent_id) == configs_digest:
+            self.logger.debug("The configs of %s did not change, keeping its "
+                              "alerting state.", chain)
+            return
+
+        self.alerting_factory.remove_chain_alerting_state(parent_id)
+        self._configs_digests[parent_id] = configs_digest
+        alert = ComponentResetAlert(
+            self.alerter_name, datetime.now().timestamp(),
+            type(self).__name__, parent_id, chain, partition=self.partition,
+            partitions=env.ALERTER_PARTITIONS)
+        self._place_latest_data_on_queue([alert.alert_data])
 
     def start(self) -> None:
         self._initialise_rabbitmq()
+        self._restore_alerting_state()
         while True:
             try:
                 # Before listening for new data send the data waiting to be sent
@@ -98,6 +221,7 @@ class Alerter(QueuingPublisherSubscriberComponent):
         log_and_print("{} is terminating. Connections with RabbitMQ will be "
                       "closed, and afterwards the process will exit."
                       .format(self), self.logger)
+        self._save_alerting_state(force=True)
         self.disconnect_from_rabbit()
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
@@ -1,5 +1,4 @@
 import copy
-import json
 import logging
 from datetime import datetime
 from typing import List
@@ -16,6 +15,7 @@ from src.alerter.alerts.dockerhub_alerts import (
     DockerHubPageNowAccessibleAlert, DockerHubTagsAPICallErrorAlert,
     DockerHubTagsAPICallErrorResolvedAlert)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     DOCKERHUB_ALERTER_INPUT_QUEUE_NAME,
@@ -86,7 +86,7 @@ class DockerhubAlerter(Alerter):
                       method: pika.spec.Basic.Deliver,
                       properties: pika.spec.BasicProperties,
                       body: bytes) -> None:
-        data_received = json.loads(body)
+        data_received = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.",
                           data_received)
 
@@ -269,6 +269,9 @@ class DockerhubAlerter(Alerter):
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.alerter_name,
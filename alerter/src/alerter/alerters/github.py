@@ -1,5 +1,4 @@
 import copy
-import json
 import logging
 from datetime import datetime
 from typing import List
@@ -14,6 +13,7 @@ from src.alerter.alerts.github_alerts import (CannotAccessGitHubPageAlert,
                                               GitHubAPICallErrorAlert,
                                               GitHubAPICallErrorResolvedAlert)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils.constants.rabbitmq import (ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
                                           GITHUB_ALERTER_INPUT_QUEUE_NAME,
                                           GITHUB_TRANSFORMED_DATA_ROUTING_KEY,
@@ -80,7 +80,7 @@ class GithubAlerter(Alerter):
                       method: pika.spec.Basic.Deliver,
                       properties: pika.spec.BasicProperties,
                       body: bytes) -> None:
-        data_received = json.loads(body)
+        data_received = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.",
                           data_received)
 
@@ -210,6 +210,9 @@ class GithubAlerter(Alerter):
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.alerter_name,
@@ -1,8 +1,7 @@
 import copy
-import json
 import logging
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -10,6 +9,8 @@ from pika.adapters.blocking_connection import BlockingChannel
 import src.alerter.alerts.network.substrate as substrate_alerts
 from src.alerter.alert_severities import Severity
 from src.alerter.alerters.alerter import Alerter
+from src.alerter.factory.alerting_state_snapshots import (
+    AlertingStateSnapshots)
 from src.alerter.factory.substrate_network_alerting_factory import (
     SubstrateNetworkAlertingFactory)
 from src.alerter.grouped_alerts_metric_code.network \
@@ -19,6 +20,7 @@ from src.configs.alerts.network.substrate import SubstrateNetworkAlertsConfig
 from src.configs.factory.alerts.substrate_alerts import (
     SubstrateNetworkAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, TOPIC, CONFIG_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     SUBSTRATE_ALERTS_CONFIGS_ROUTING_KEY,
@@ -45,8 +47,11 @@ class SubstrateNetworkAlerter(Alerter):
             rabbitmq: RabbitMQApi,
             substrate_alerts_configs_factory:
             SubstrateNetworkAlertsConfigsFactory,
-            max_queue_size: int = 0) -> None:
-        super().__init__(alerter_name, logger, rabbitmq, max_queue_size)
+            max_queue_size: int = 0,
+            alerting_state_snapshots: Optional[
+                AlertingStateSnapshots] = None) -> None:
+        super().__init__(alerter_name, logger, rabbitmq, max_queue_size,
+                         alerting_state_snapshots)
 
         self._alerts_configs_factory = substrate_alerts_configs_factory
         self._alerting_factory = SubstrateNetworkAlertingFactory(logger)
@@ -125,9 +130,9 @@ class SubstrateNetworkAlerter(Alerter):
         :return:
         """
         if method.routing_key == SUBSTRATE_NETWORK_TRANSFORMED_DATA_ROUTING_KEY:
-            self._process_transformed_data(method, body)
+            self._process_transformed_data(method, body, properties)
         elif 'alerts_config' in method.routing_key:
-            self._process_configs(method, body)
+            self._process_configs(method, body, properties)
         else:
             self.logger.debug("Received unexpected data %s with routing key %s",
                               body, method.routing_key)
@@ -391,9 +396,10 @@ class SubstrateNetworkAlerter(Alerter):
                 "data again.".format(sub_chain_name), err_code
             )
 
-    def _process_transformed_data(self, method: pika.spec.Basic.Deliver,
-                                  body: bytes) -> None:
-        data_received = json.loads(body)
+    def _process_transformed_data(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        data_received = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.",
                           data_received)
 
@@ -421,10 +427,16 @@ class SubstrateNetworkAlerter(Alerter):
         # If the data is processed, it can be acknowledged.
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
+        # Take a snapshot of the alerting state if one is due
+        self._save_alerting_state()
+
         # Send any data waiting in the publisher queue, if any
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.alerter_name,
@@ -443,9 +455,10 @@ class SubstrateNetworkAlerter(Alerter):
             # reside in the publisher queue
             raise e
 
-    def _process_configs(self, method: pika.spec.Basic.Deliver,
-                         body: bytes) -> None:
-        sent_configs = json.loads(body)
+    def _process_configs(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        sent_configs = decode_message(properties, body)
 
         self.logger.debug("Received configs %s", sent_configs)
 
@@ -470,7 +483,8 @@ class SubstrateNetworkAlerter(Alerter):
                 #     : by the manager.
                 parent_id = self.alerts_configs_factory.get_parent_id(
                     chain, SubstrateNetworkAlertsConfig)
-                self.alerting_factory.remove_chain_alerting_state(parent_id)
+                self._reset_chain_alerting_state(parent_id, chain,
+                                                 sent_configs)
             else:
                 # We must reset the state since a configuration is to be
                 # removed. Note that first we need to compute the parent_id, as
@@ -480,7 +494,7 @@ class SubstrateNetworkAlerter(Alerter):
                 parent_id = self.alerts_configs_factory.get_parent_id(
                     chain, SubstrateNetworkAlertsConfig)
                 if parent_id:
-                    self.alerting_factory.remove_chain_alerting_state(parent_id)
+                    self._reset_chain_alerting_state(parent_id, chain)
                     self.alerts_configs_factory.remove_config(chain)
         except Exception as e:
             # Otherwise, log and reject the message
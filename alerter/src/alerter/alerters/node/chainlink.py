@@ -1,5 +1,4 @@
 import copy
-import json
 import logging
 import sys
 from datetime import datetime
@@ -11,6 +10,8 @@ from pika.adapters.blocking_connection import BlockingChannel
 import src.alerter.alerts.node.chainlink as cl_alerts
 from src.alerter.alert_severities import Severity
 from src.alerter.alerters.alerter import Alerter
+from src.alerter.factory.alerting_state_snapshots import (
+    AlertingStateSnapshots)
 from src.alerter.factory.chainlink_node_alerting_factory import (
     ChainlinkNodeAlertingFactory)
 from src.alerter.grouped_alerts_metric_code.node.chainlink_node_metric_code \
@@ -19,6 +20,7 @@ from src.configs.alerts.node.chainlink import ChainlinkNodeAlertsConfig
 from src.configs.factory.alerts.chainlink_alerts import (
     ChainlinkNodeAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils.constants.data import VALID_CHAINLINK_SOURCES
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, TOPIC, CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
@@ -42,8 +44,12 @@ class ChainlinkNodeAlerter(Alerter):
             self, alerter_name: str, logger: logging.Logger,
             rabbitmq: RabbitMQApi,
             cl_alerts_configs_factory: ChainlinkNodeAlertsConfigsFactory,
-            max_queue_size: int = 0) -> None:
-        super().__init__(alerter_name, logger, rabbitmq, max_queue_size)
+            max_queue_size: int = 0,
+            alerting_state_snapshots: Optional[
+                AlertingStateSnapshots] = None,
+            partition: Optional[int] = None) -> None:
+        super().__init__(alerter_name, logger, rabbitmq, max_queue_size,
+                         alerting_state_snapshots, partition)
 
         self._alerts_configs_factory = cl_alerts_configs_factory
         self._alerting_factory = ChainlinkNodeAlertingFactory(logger)
@@ -61,40 +67,41 @@ class ChainlinkNodeAlerter(Alerter):
         # initialise both the consuming and producing configurations.
         self.rabbitmq.connect_till_successful()
 
-        # Set alerts consuming configuration
+        # Set alerts consuming configuration. A partitioned alerter consumes
+        # the data of its partition only, but the configs of all chains.
+        input_queue = self._get_input_queue_name(
+            CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
+        input_routing_key = self._get_input_routing_key(
+            CL_NODE_TRANSFORMED_DATA_ROUTING_KEY)
         self.logger.info("Creating '%s' exchange", ALERT_EXCHANGE)
         self.rabbitmq.exchange_declare(
             exchange=ALERT_EXCHANGE, exchange_type=TOPIC, passive=False,
             durable=True, auto_delete=False, internal=False)
-        self.logger.info("Creating queue '%s'",
-                         CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
-        self.rabbitmq.queue_declare(CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-                                    passive=False, durable=True,
+        self.logger.info("Creating queue '%s'", input_queue)
+        self.rabbitmq.queue_declare(input_queue, passive=False, durable=True,
                                     exclusive=False, auto_delete=False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-                         ALERT_EXCHANGE, CL_NODE_TRANSFORMED_DATA_ROUTING_KEY)
-        self.rabbitmq.queue_bind(
-            queue=CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-            exchange=ALERT_EXCHANGE,
-            routing_key=CL_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+                         "key '%s'", input_queue, ALERT_EXCHANGE,
+                         input_routing_key)
+        self.rabbitmq.queue_bind(queue=input_queue, exchange=ALERT_EXCHANGE,
+                                 routing_key=input_routing_key)
 
         # Set configs consuming configuration
         self.logger.info("Creating exchange '%s'", CONFIG_EXCHANGE)
         self.rabbitmq.exchange_declare(CONFIG_EXCHANGE, TOPIC, False, True,
                                        False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing key "
-                         "%s'", CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-                         CONFIG_EXCHANGE, CL_ALERTS_CONFIGS_ROUTING_KEY)
-        self.rabbitmq.queue_bind(CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-                                 CONFIG_EXCHANGE, CL_ALERTS_CONFIGS_ROUTING_KEY)
+                         "%s'", input_queue, CONFIG_EXCHANGE,
+                         CL_ALERTS_CONFIGS_ROUTING_KEY)
+        self.rabbitmq.queue_bind(input_queue, CONFIG_EXCHANGE,
+                                 CL_ALERTS_CONFIGS_ROUTING_KEY)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
         self.rabbitmq.basic_consume(
-            queue=CL_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+            queue=input_queue,
             on_message_callback=self._process_data, auto_ack=False,
             exclusive=False, consumer_tag=None)
 
@@ -118,10 +125,11 @@ class ChainlinkNodeAlerter(Alerter):
         :param body: The message
         :return:
         """
-        if method.routing_key == CL_NODE_TRANSFORMED_DATA_ROUTING_KEY:
-            self._process_transformed_data(method, body)
+        if method.routing_key == self._get_input_routing_key(
+                CL_NODE_TRANSFORMED_DATA_ROUTING_KEY):
+            self._process_transformed_data(method, body, properties)
         elif 'alerts_config' in method.routing_key:
-            self._process_configs(method, body)
+            self._process_configs(method, body, properties)
         else:
             self.logger.debug("Received unexpected data %s with routing key %s",
                               body, method.routing_key)
@@ -489,9 +497,10 @@ class ChainlinkNodeAlerter(Alerter):
                         ]
                     )
 
-    def _process_transformed_data(self, method: pika.spec.Basic.Deliver,
-                                  body: bytes) -> None:
-        data_received = json.loads(body)
+    def _process_transformed_data(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        data_received = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.",
                           data_received)
 
@@ -520,10 +529,16 @@ class ChainlinkNodeAlerter(Alerter):
         # If the data is processed, it can be acknowledged.
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
+        # Take a snapshot of the alerting state if one is due
+        self._save_alerting_state()
+
         # Send any data waiting in the publisher queue, if any
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.alerter_name,
@@ -542,9 +557,10 @@ class ChainlinkNodeAlerter(Alerter):
             # reside in the publisher queue
             raise e
 
-    def _process_configs(self, method: pika.spec.Basic.Deliver,
-                         body: bytes) -> None:
-        sent_configs = json.loads(body)
+    def _process_configs(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        sent_configs = decode_message(properties, body)
 
         self.logger.debug("Received configs %s", sent_configs)
 
@@ -567,7 +583,8 @@ class ChainlinkNodeAlerter(Alerter):
                 # parent_id is to be returned, as we have just added the config
                 parent_id = self.alerts_configs_factory.get_parent_id(
                     chain, ChainlinkNodeAlertsConfig)
-                self.alerting_factory.remove_chain_alerting_state(parent_id)
+                self._reset_chain_alerting_state(parent_id, chain,
+                                                 sent_configs)
             else:
                 # We must reset the state since a configuration is to be
                 # removed. Note that first we need to compute the parent_id, as
@@ -577,8 +594,7 @@ class ChainlinkNodeAlerter(Alerter):
                 parent_id = self.alerts_configs_factory.get_parent_id(
                     chain, ChainlinkNodeAlertsConfig)
                 if parent_id:
-                    self.alerting_factory.remove_chain_alerting_state(
-                        parent_id)
+                    self._reset_chain_alerting_state(parent_id, chain)
                     self.alerts_configs_factory.remove_config(chain)
         except Exception as e:
             # Otherwise log and reject the message
@@ -1,8 +1,7 @@
 import copy
-import json
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -10,6 +9,8 @@ from pika.adapters.blocking_connection import BlockingChannel
 import src.alerter.alerts.node.cosmos as cosmos_alerts
 from src.alerter.alert_severities import Severity
 from src.alerter.alerters.alerter import Alerter
+from src.alerter.factory.alerting_state_snapshots import (
+    AlertingStateSnapshots)
 from src.alerter.factory.cosmos_node_alerting_factory import (
     CosmosNodeAlertingFactory)
 from src.alerter.grouped_alerts_metric_code.node.cosmos_node_metric_code \
@@ -18,6 +19,7 @@ from src.configs.alerts.node.cosmos import CosmosNodeAlertsConfig
 from src.configs.factory.alerts.cosmos_alerts import (
     CosmosNodeAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils.constants.cosmos import BOND_STATUS_BONDED
 from src.utils.constants.data import VALID_COSMOS_NODE_SOURCES
 from src.utils.constants.rabbitmq import (
@@ -45,8 +47,12 @@ class CosmosNodeAlerter(Alerter):
             self, alerter_name: str, logger: logging.Logger,
             rabbitmq: RabbitMQApi,
             cosmos_alerts_configs_factory: CosmosNodeAlertsConfigsFactory,
-            max_queue_size: int = 0) -> None:
-        super().__init__(alerter_name, logger, rabbitmq, max_queue_size)
+            max_queue_size: int = 0,
+            alerting_state_snapshots: Optional[
+                AlertingStateSnapshots] = None,
+            partition: Optional[int] = None) -> None:
+        super().__init__(alerter_name, logger, rabbitmq, max_queue_size,
+                         alerting_state_snapshots, partition)
 
         self._alerts_configs_factory = cosmos_alerts_configs_factory
         self._alerting_factory = CosmosNodeAlertingFactory(logger)
@@ -64,42 +70,41 @@ class CosmosNodeAlerter(Alerter):
         # initialise both the consuming and producing configurations.
         self.rabbitmq.connect_till_successful()
 
-        # Set alerts consuming configuration
+        # Set alerts consuming configuration. A partitioned alerter consumes
+        # the data of its partition only, but the configs of all chains.
+        input_queue = self._get_input_queue_name(
+            COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
+        input_routing_key = self._get_input_routing_key(
+            COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY)
         self.logger.info("Creating '%s' exchange", ALERT_EXCHANGE)
         self.rabbitmq.exchange_declare(
             exchange=ALERT_EXCHANGE, exchange_type=TOPIC, passive=False,
             durable=True, auto_delete=False, internal=False)
-        self.logger.info("Creating queue '%s'",
-                         COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
-        self.rabbitmq.queue_declare(
-            COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, passive=False,
-            durable=True, exclusive=False, auto_delete=False)
+        self.logger.info("Creating queue '%s'", input_queue)
+        self.rabbitmq.queue_declare(input_queue, passive=False, durable=True,
+                                    exclusive=False, auto_delete=False)
         self.logger.info(
             "Binding queue '%s' to exchange '%s' with routing key '%s'",
-            COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, ALERT_EXCHANGE,
-            COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY)
-        self.rabbitmq.queue_bind(
-            queue=COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-            exchange=ALERT_EXCHANGE,
-            routing_key=COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY)
+            input_queue, ALERT_EXCHANGE, input_routing_key)
+        self.rabbitmq.queue_bind(queue=input_queue, exchange=ALERT_EXCHANGE,
+                                 routing_key=input_routing_key)
 
         # Set configs consuming configuration
         self.logger.info("Creating exchange '%s'", CONFIG_EXCHANGE)
         self.rabbitmq.exchange_declare(CONFIG_EXCHANGE, TOPIC, False, True,
                                        False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing key "
-                         "%s'", COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
-                         CONFIG_EXCHANGE, COSMOS_ALERTS_CONFIGS_ROUTING_KEY)
+                         "%s'", input_queue, CONFIG_EXCHANGE,
+                         COSMOS_ALERTS_CONFIGS_ROUTING_KEY)
         self.rabbitmq.queue_bind(
-            COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME, CONFIG_EXCHANGE,
-            COSMOS_ALERTS_CONFIGS_ROUTING_KEY)
+            input_queue, CONFIG_EXCHANGE, COSMOS_ALERTS_CONFIGS_ROUTING_KEY)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
         self.rabbitmq.basic_consume(
-            queue=COSMOS_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
+            queue=input_queue,
             on_message_callback=self._process_data, auto_ack=False,
             exclusive=False, consumer_tag=None)
 
@@ -123,10 +128,11 @@ class CosmosNodeAlerter(Alerter):
         :param body: The message
         :return:
         """
-        if method.routing_key == COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY:
-            self._process_transformed_data(method, body)
+        if method.routing_key == self._get_input_routing_key(
+                COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY):
+            self._process_transformed_data(method, body, properties)
         elif 'alerts_config' in method.routing_key:
-            self._process_configs(method, body)
+            self._process_configs(method, body, properties)
         else:
             self.logger.debug("Received unexpected data %s with routing key %s",
                               body, method.routing_key)
@@ -753,9 +759,10 @@ class CosmosNodeAlerter(Alerter):
                     monitoring_timestamp
                 )
 
-    def _process_transformed_data(self, method: pika.spec.Basic.Deliver,
-                                  body: bytes) -> None:
-        data_received = json.loads(body)
+    def _process_transformed_data(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        data_received = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.",
                           data_received)
 
@@ -792,10 +799,16 @@ class CosmosNodeAlerter(Alerter):
         # If the data is processed, it can be acknowledged.
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
+        # Take a snapshot of the alerting state if one is due
+        self._save_alerting_state()
+
         # Send any data waiting in the publisher queue, if any
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.alerter_name,
@@ -814,9 +827,10 @@ class CosmosNodeAlerter(Alerter):
             # reside in the publisher queue
             raise e
 
-    def _process_configs(self, method: pika.spec.Basic.Deliver,
-                         body: bytes) -> None:
-        sent_configs = json.loads(body)
+    def _process_configs(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        sent_configs = decode_message(properties, body)
 
         self.logger.debug("Received configs %s", sent_configs)
 
@@ -841,7 +855,8 @@ class CosmosNodeAlerter(Alerter):
                 #     : by the manager.
                 parent_id = self.alerts_configs_factory.get_parent_id(
                     chain, CosmosNodeAlertsConfig)
-                self.alerting_factory.remove_chain_alerting_state(parent_id)
+                self._reset_chain_alerting_state(parent_id, chain,
+                                                 sent_configs)
             else:
                 # We must reset the state since a configuration is to be
                 # removed. Note that first we need to compute the parent_id, as
@@ -851,7 +866,7 @@ class CosmosNodeAlerter(Alerter):
                 parent_id = self.alerts_configs_factory.get_parent_id(
                     chain, CosmosNodeAlertsConfig)
                 if parent_id:
-                    self.alerting_factory.remove_chain_alerting_state(parent_id)
+                    self._reset_chain_alerting_state(parent_id, chain)
                     self.alerts_configs_factory.remove_config(chain)
         except Exception as e:
             # Otherwise log and reject the message
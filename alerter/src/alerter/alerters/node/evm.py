@@ -1,19 +1,21 @@
 import copy
-import json
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
 import src.alerter.alerts.node.evm as evm_alerts
 from src.alerter.alerters.alerter import Alerter
+from src.alerter.factory.alerting_state_snapshots import (
+    AlertingStateSnapshots)
 from src.alerter.factory.evm_node_alerting_factory import EVMNodeAlertingFactory
 from src.alerter.grouped_alerts_metric_code.node.evm_node_metric_code \
     import GroupedEVMNodeAlertsMetricCode as MetricCode
 from src.configs.factory.alerts.evm_alerts import EVMNodeAlertsConfigsFactory
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, TOPIC, EVM_NODE_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
     EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY, HEALTH_CHECK_EXCHANGE,
@@ -35,8 +37,11 @@ class EVMNodeAlerter(Alerter):
     def __init__(
             self, alerter_name: str, logger: logging.Logger,
             evm_alerts_configs_factory: EVMNodeAlertsConfigsFactory,
-            rabbitmq: RabbitMQApi, max_queue_size: int = 0) -> None:
-        super().__init__(alerter_name, logger, rabbitmq, max_queue_size)
+            rabbitmq: RabbitMQApi, max_queue_size: int = 0,
+            alerting_state_snapshots: Optional[
+                AlertingStateSnapshots] = None) -> None:
+        super().__init__(alerter_name, logger, rabbitmq, max_queue_size,
+                         alerting_state_snapshots)
 
         self._alerts_configs_factory = evm_alerts_configs_factory
         self._alerting_factory = EVMNodeAlertingFactory(logger)
@@ -113,9 +118,9 @@ class EVMNodeAlerter(Alerter):
         :return:
         """
         if method.routing_key == EVM_NODE_TRANSFORMED_DATA_ROUTING_KEY:
-            self._process_transformed_data(method, body)
+            self._process_transformed_data(method, body, properties)
         elif 'alerts_config' in method.routing_key:
-            self._process_configs(method, body)
+            self._process_configs(method, body, properties)
         else:
             self.logger.debug("Received unexpected data %s with routing key %s",
                               body, method.routing_key)
@@ -247,9 +252,10 @@ class EVMNodeAlerter(Alerter):
                         meta_data['node_name'], meta_data['time']
                     )
 
-    def _process_transformed_data(self, method: pika.spec.Basic.Deliver,
-                                  body: bytes) -> None:
-        data_received = json.loads(body)
+    def _process_transformed_data(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        data_received = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.",
                           data_received)
 
@@ -277,10 +283,16 @@ class EVMNodeAlerter(Alerter):
         # If the data is processed, it can be acknowledged.
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
+        # Take a snapshot of the alerting state if one is due
+        self._save_alerting_state()
+
         # Send any data waiting in the publisher queue, if any
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.alerter_name,
@@ -299,9 +311,10 @@ class EVMNodeAlerter(Alerter):
             # reside in the publisher queue
             raise e
 
-    def _process_configs(self, method: pika.spec.Basic.Deliver,
-                         body: bytes) -> None:
-        sent_configs = json.loads(body)
+    def _process_configs(
+            self, method: pika.spec.Basic.Deliver, body: bytes,
+            properties: pika.spec.BasicProperties = None) -> None:
+        sent_configs = decode_message(properties, body)
 
         self.logger.debug("Received configs %s", sent_configs)
 
@@ -323,7 +336,8 @@ class EVMNodeAlerter(Alerter):
                 # monitoring round automatically. Note we are sure that a
                 # parent_id is to be returned, as we have just added the config.
                 parent_id = self.alerts_configs_factory.get_parent_id(chain)
-                self.alerting_factory.remove_chain_alerting_state(parent_id)
+                self._reset_chain_alerting_state(parent_id, chain,
+                                                 sent_configs)
             else:
                 # We must reset the state since a configuration is to be
                 # removed. Note that first we need to compute the parent_id, as
@@ -332,7 +346,7 @@ class EVMNodeAlerter(Alerter):
                 # no storing took place, therefore in that case do nothing.
                 parent_id = self.alerts_configs_factory.get_parent_id(chain)
                 if parent_id:
-                    self.alerting_factory.remove_chain_alerting_state(parent_id)
+                    self._reset_chain_alerting_state(parent_id, chain)
                     self.alerts_configs_factory.remove_config(chain)
         except Exception as e:
             # Otherwise log and reject the message
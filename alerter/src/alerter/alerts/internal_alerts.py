@@ -1,3 +1,5 @@
+from typing import Dict, Optional
+
 from src.alerter.alert_code import InternalAlertCode
 from src.alerter.alert_severities import Severity
 from src.alerter.alerts.alert import Alert
@@ -21,10 +23,18 @@ class ComponentResetAlert(Alert):
     chain_name: The name of the chain associated with the component being reset
     origin_id: The type of the component which was reset
     timestamp: Time of the resetting.
+    partition: If the component is partitioned, the partition of the
+               component which was reset, out of `partitions` partitions. In
+               this case only the metrics of the monitorables in the partition
+               are reset.
     """
 
     def __init__(self, origin_name: str, timestamp: float, origin_id: str,
-                 parent_id: str = None, chain_name: str = None) -> None:
+                 parent_id: str = None, chain_name: str = None,
+                 partition: Optional[int] = None,
+                 partitions: int = 1) -> None:
+        self._partition = partition
+        self._partitions = partitions
         if parent_id and chain_name:
             msg = "Component: {} has been reset for {}.".format(origin_name,
                                                                 chain_name)
@@ -36,3 +46,19 @@ class ComponentResetAlert(Alert):
             InternalAlertCode.ComponentResetAlert, msg, Severity.INTERNAL.value,
             timestamp, parent_id, origin_id,
             GroupedInternalAlertsMetricCode.ComponentReset, [])
+
+    @property
+    def partition(self) -> Optional[int]:
+        return self._partition
+
+    @property
+    def partitions(self) -> int:
+        return self._partitions
+
+    @property
+    def alert_data(self) -> Dict:
+        alert_data = super().alert_data
+        if self.partition is not None:
+            alert_data['partition'] = self.partition
+            alert_data['partitions'] = self.partitions
+        return alert_data
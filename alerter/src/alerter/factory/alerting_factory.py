@@ -4,9 +4,10 @@ from datetime import datetime, timezone
 from typing import Dict, List, Any, Type, Callable, Optional
 
 from src.alerter.alert_severities import Severity
-from src.utils.types import (NoChangeInAlert, ChangeInAlert, str_to_bool,
+from src.configs.alerts.rule import AlertRule
+from src.utils.types import (NoChangeInAlert, ChangeInAlert,
                              IncreasedAboveThresholdAlert,
-                             DecreasedBelowThresholdAlert, convert_to_float,
+                             DecreasedBelowThresholdAlert,
                              ErrorAlert, ErrorSolvedAlert,
                              ConditionalAlert, DownAlert,
                              StillDownAlert, BackUpAlert)
@@ -52,6 +53,9 @@ class AlertingFactory(ABC):
                 },
             }
         }}
+        A monitorable's state may be stored as a MonitorableAlertingState
+        rather than a dict. It is subscripted in the same way but takes much
+        less memory, which matters when alerting on thousands of nodes.
         """
         self._alerting_state = {}
         self._component_logger = component_logger
@@ -94,22 +98,22 @@ class AlertingFactory(ABC):
         :param monitoring_timestamp: The data timestamp
         :return: None
         """
+        # The thresholds are parsed once, when the configuration is received
+        config = AlertRule.compile(config)
+
+        state = self.alerting_state[parent_id][monitorable_id]
+
         # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'warning_window_timer'][metric_name]
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        warning_enabled = config.warning_enabled
+        warning_window_timer = state['warning_window_timer'][metric_name]
+        warning_sent = state['warning_sent']
 
         # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'critical_window_timer'][metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
+        critical_enabled = config.critical_enabled
+        critical_repeat_enabled = config.critical_repeat_enabled
+        critical_repeat_limiter = state['critical_repeat_timer'][metric_name]
+        critical_window_timer = state['critical_window_timer'][metric_name]
+        critical_sent = state['critical_sent']
 
         monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
 
@@ -131,8 +135,7 @@ class AlertingFactory(ABC):
                     data_for_alerting.append(alert.alert_data)
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
-                    self.alerting_state[parent_id][monitorable_id][
-                        'critical_sent'][metric_name] = True
+                    state['critical_sent'][metric_name] = True
                     critical_window_timer.do_task()
                     critical_repeat_limiter.set_last_time_that_did_task(
                         monitoring_datetime)
@@ -170,8 +173,7 @@ class AlertingFactory(ABC):
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
                     warning_window_timer.do_task()
-                    self.alerting_state[parent_id][monitorable_id][
-                        'warning_sent'][metric_name] = True
+                    state['warning_sent'][metric_name] = True
         else:
             warning_window_timer.reset()
             critical_window_timer.reset()
@@ -183,10 +185,8 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug(
                     "Successfully classified alert %s", alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'warning_sent'][metric_name] = False
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = False
+                state['warning_sent'][metric_name] = False
+                state['critical_sent'][metric_name] = False
 
     def classify_thresholded_time_window_alert(
             self, current: Any, config: Dict,
@@ -219,25 +219,24 @@ class AlertingFactory(ABC):
         :param monitoring_timestamp: The data timestamp
         :return: None
         """
+        # The thresholds are parsed once, when the configuration is received
+        config = AlertRule.compile(config)
+
+        state = self.alerting_state[parent_id][monitorable_id]
+
         # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_threshold = convert_to_float(config['warning_threshold'], None)
-        warning_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'warning_window_timer'][metric_name]
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        warning_enabled = config.warning_enabled
+        warning_threshold = config.warning_threshold
+        warning_window_timer = state['warning_window_timer'][metric_name]
+        warning_sent = state['warning_sent']
 
         # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_threshold = convert_to_float(config['critical_threshold'],
-                                              None)
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'critical_window_timer'][metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
+        critical_enabled = config.critical_enabled
+        critical_threshold = config.critical_threshold
+        critical_repeat_enabled = config.critical_repeat_enabled
+        critical_repeat_limiter = state['critical_repeat_timer'][metric_name]
+        critical_window_timer = state['critical_window_timer'][metric_name]
+        critical_sent = state['critical_sent']
 
         monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
 
@@ -256,16 +255,14 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug(
                     "Successfully classified alert %s", alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = False
+                state['critical_sent'][metric_name] = False
 
                 # If this is the case we still need to raise a warning alert to
                 # show the correct metric state in the UI.
                 if warning_sent[metric_name] and current >= warning_threshold:
                     warning_window_timer.start_timer(
                         warning_window_timer.start_time)
-                    self.alerting_state[parent_id][monitorable_id][
-                        'warning_sent'][metric_name] = False
+                    state['warning_sent'][metric_name] = False
 
         if current < warning_threshold:
             warning_window_timer.reset()
@@ -277,8 +274,7 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug(
                     "Successfully classified alert %s", alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                    metric_name] = False
+                state['warning_sent'][metric_name] = False
 
         # Now check if any of the thresholds are surpassed. We will not generate
         # a warning alert if we are immediately in critical state.
@@ -296,8 +292,7 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug(
                     "Successfully classified alert %s", alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = True
+                state['critical_sent'][metric_name] = True
                 critical_window_timer.do_task()
                 critical_repeat_limiter.set_last_time_that_did_task(
                     monitoring_datetime)
@@ -333,8 +328,7 @@ class AlertingFactory(ABC):
                 self.component_logger.debug(
                     "Successfully classified alert %s", alert.alert_data)
                 warning_window_timer.do_task()
-                self.alerting_state[parent_id][monitorable_id][
-                    'warning_sent'][metric_name] = True
+                state['warning_sent'][metric_name] = True
 
     def classify_thresholded_in_time_period_alert(
             self, current: Any, previous: Any, config: Dict,
@@ -368,29 +362,28 @@ class AlertingFactory(ABC):
         :param monitoring_timestamp: The data timestamp
         :return: None
         """
+        # The thresholds are parsed once, when the configuration is received
+        config = AlertRule.compile(config)
+
+        state = self.alerting_state[parent_id][monitorable_id]
+
         # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_threshold = convert_to_float(config['warning_threshold'], None)
-        warning_occurrences_tracker = self.alerting_state[parent_id][
-            monitorable_id]['warning_occurrences_in_period_tracker'][
-            metric_name]
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
-        warning_period = convert_to_float(config['warning_time_window'], None)
+        warning_enabled = config.warning_enabled
+        warning_threshold = config.warning_threshold
+        warning_occurrences_tracker = state[
+            'warning_occurrences_in_period_tracker'][metric_name]
+        warning_sent = state['warning_sent']
+        warning_period = config.warning_time_window
 
         # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_threshold = convert_to_float(config['critical_threshold'],
-                                              None)
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_occurrences_tracker = self.alerting_state[parent_id][
-            monitorable_id]['critical_occurrences_in_period_tracker'][
-            metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
-        critical_period = convert_to_float(config['critical_time_window'], None)
+        critical_enabled = config.critical_enabled
+        critical_threshold = config.critical_threshold
+        critical_repeat_enabled = config.critical_repeat_enabled
+        critical_repeat_limiter = state['critical_repeat_timer'][metric_name]
+        critical_occurrences_tracker = state[
+            'critical_occurrences_in_period_tracker'][metric_name]
+        critical_sent = state['critical_sent']
+        critical_period = config.critical_time_window
 
         monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
 
@@ -425,15 +418,13 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = False
+                state['critical_sent'][metric_name] = False
 
                 # If this is the case we still need to raise a warning alert to
                 # show the correct metric state in the UI.
                 if (warning_sent[metric_name]
                         and warning_occurrences >= warning_threshold):
-                    self.alerting_state[parent_id][monitorable_id][
-                        'warning_sent'][metric_name] = False
+                    state['warning_sent'][metric_name] = False
 
         if (warning_sent[metric_name]
                 and warning_occurrences < warning_threshold):
@@ -444,8 +435,7 @@ class AlertingFactory(ABC):
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                metric_name] = False
+            state['warning_sent'][metric_name] = False
 
         # Now check if any of the thresholds are surpassed within the time
         # period. First check for critical and do not raise a warning alert if
@@ -461,8 +451,7 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = True
+                state['critical_sent'][metric_name] = True
                 critical_repeat_limiter.set_last_time_that_did_task(
                     monitoring_datetime)
             elif (critical_repeat_enabled
@@ -489,8 +478,7 @@ class AlertingFactory(ABC):
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'warning_sent'][metric_name] = True
+            state['warning_sent'][metric_name] = True
 
     def classify_conditional_alert(
             self, condition_true_alert: Type[ConditionalAlert],
@@ -519,24 +507,23 @@ class AlertingFactory(ABC):
             true_alert_args: List[Any], data_for_alerting: List,
             solved_alert: Type[ConditionalAlert], solved_alert_args: List[Any]
     ) -> None:
-        alert_sent = self.alerting_state[parent_id][monitorable_id][
-            'any_severity_sent']
+        state = self.alerting_state[parent_id][monitorable_id]
+
+        alert_sent = state['any_severity_sent']
         if condition_function(*condition_fn_args):
             if not alert_sent[metric_name]:
                 alert = condition_true_alert(*true_alert_args)
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'any_severity_sent'][metric_name] = True
+                state['any_severity_sent'][metric_name] = True
         else:
             if alert_sent[metric_name]:
                 alert = solved_alert(*solved_alert_args)
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'any_severity_sent'][metric_name] = False
+                state['any_severity_sent'][metric_name] = False
 
     def classify_thresholded_alert(
             self, current: Any, config: Dict,
@@ -569,21 +556,22 @@ class AlertingFactory(ABC):
         :param monitoring_timestamp: The data timestamp
         :return: None
         """
+        # The thresholds are parsed once, when the configuration is received
+        config = AlertRule.compile(config)
+
+        state = self.alerting_state[parent_id][monitorable_id]
+
         # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_threshold = convert_to_float(config['warning_threshold'], None)
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        warning_enabled = config.warning_enabled
+        warning_threshold = config.warning_threshold
+        warning_sent = state['warning_sent']
 
         # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_threshold = convert_to_float(config['critical_threshold'],
-                                              None)
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
+        critical_enabled = config.critical_enabled
+        critical_threshold = config.critical_threshold
+        critical_repeat_enabled = config.critical_repeat_enabled
+        critical_repeat_limiter = state['critical_repeat_timer'][metric_name]
+        critical_sent = state['critical_sent']
 
         monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
 
@@ -600,14 +588,12 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = False
+                state['critical_sent'][metric_name] = False
 
                 # If this is the case we still need to raise a warning alert to
                 # show the correct metric state in the UI.
                 if warning_sent[metric_name] and current >= warning_threshold:
-                    self.alerting_state[parent_id][monitorable_id][
-                        'warning_sent'][metric_name] = False
+                    state['warning_sent'][metric_name] = False
 
         if warning_sent[metric_name] and current < warning_threshold:
             alert = decreased_below_threshold_alert(
@@ -617,8 +603,7 @@ class AlertingFactory(ABC):
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                metric_name] = False
+            state['warning_sent'][metric_name] = False
 
         # Now check if the current value is smaller than any of the thresholds.
         # First check for critical and do not raise a warning alert if we are
@@ -632,8 +617,7 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = True
+                state['critical_sent'][metric_name] = True
                 critical_repeat_limiter.set_last_time_that_did_task(
                     monitoring_datetime)
             elif (critical_repeat_enabled
@@ -659,8 +643,7 @@ class AlertingFactory(ABC):
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'warning_sent'][metric_name] = True
+            state['warning_sent'][metric_name] = True
 
     def classify_thresholded_alert_reverse(
             self, current: Any, config: Dict,
@@ -693,21 +676,22 @@ class AlertingFactory(ABC):
         :param monitoring_timestamp: The data timestamp
         :return: None
         """
+        # The thresholds are parsed once, when the configuration is received
+        config = AlertRule.compile(config)
+
+        state = self.alerting_state[parent_id][monitorable_id]
+
         # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_threshold = convert_to_float(config['warning_threshold'], None)
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        warning_enabled = config.warning_enabled
+        warning_threshold = config.warning_threshold
+        warning_sent = state['warning_sent']
 
         # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_threshold = convert_to_float(config['critical_threshold'],
-                                              None)
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
+        critical_enabled = config.critical_enabled
+        critical_threshold = config.critical_threshold
+        critical_repeat_enabled = config.critical_repeat_enabled
+        critical_repeat_limiter = state['critical_repeat_timer'][metric_name]
+        critical_sent = state['critical_sent']
 
         monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
 
@@ -723,15 +707,13 @@ class AlertingFactory(ABC):
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'critical_sent'][metric_name] = False
+            state['critical_sent'][metric_name] = False
             critical_repeat_limiter.reset()
 
             # If this is the case we still need to raise a warning alert to
             # show the correct metric state in the UI.
             if warning_sent[metric_name] and current <= warning_threshold:
-                self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                    metric_name] = False
+                state['warning_sent'][metric_name] = False
 
         if warning_sent[metric_name] and current > warning_threshold:
             alert = increased_above_threshold_alert(
@@ -741,8 +723,7 @@ class AlertingFactory(ABC):
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id]['warning_sent'][
-                metric_name] = False
+            state['warning_sent'][metric_name] = False
 
         # Now check if the current value is greater than any of the thresholds.
         # First check for critical and do not raise a warning alert if we are
@@ -757,8 +738,7 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = True
+                state['critical_sent'][metric_name] = True
                 critical_repeat_limiter.set_last_time_that_did_task(
                     monitoring_datetime)
             elif (critical_repeat_enabled
@@ -784,8 +764,7 @@ class AlertingFactory(ABC):
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'warning_sent'][metric_name] = True
+            state['warning_sent'][metric_name] = True
 
     def classify_error_alert(
             self, error_code_to_detect: int,
@@ -818,8 +797,9 @@ class AlertingFactory(ABC):
         :return: None
         """
 
-        error_sent = self.alerting_state[parent_id][monitorable_id][
-            'error_sent'][metric_name]
+        state = self.alerting_state[parent_id][monitorable_id]
+
+        error_sent = state['error_sent'][metric_name]
 
         if error_sent and received_error_code != error_code_to_detect:
             alert = error_solved_alert(
@@ -829,8 +809,7 @@ class AlertingFactory(ABC):
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'error_sent'][metric_name] = False
+            state['error_sent'][metric_name] = False
         elif received_error_code == error_code_to_detect:
             alert = error_alert(
                 monitorable_name, error_message, Severity.ERROR.value,
@@ -839,8 +818,7 @@ class AlertingFactory(ABC):
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'error_sent'][metric_name] = True
+            state['error_sent'][metric_name] = True
 
     def classify_downtime_alert(
             self, current_went_down: Optional[float], config: Dict,
@@ -850,22 +828,22 @@ class AlertingFactory(ABC):
             parent_id: str, monitorable_id: str, metric_name: str,
             monitorable_name: str, monitoring_timestamp: float,
     ) -> None:
+        # The thresholds are parsed once, when the configuration is received
+        config = AlertRule.compile(config)
+
+        state = self.alerting_state[parent_id][monitorable_id]
+
         # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'warning_window_timer'][metric_name]
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        warning_enabled = config.warning_enabled
+        warning_window_timer = state['warning_window_timer'][metric_name]
+        warning_sent = state['warning_sent']
 
         # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_repeat_enabled = str_to_bool(config['critical_repeat_enabled'])
-        critical_repeat_limiter = self.alerting_state[parent_id][
-            monitorable_id]['critical_repeat_timer'][metric_name]
-        critical_window_timer = self.alerting_state[parent_id][monitorable_id][
-            'critical_window_timer'][metric_name]
-        critical_sent = self.alerting_state[parent_id][monitorable_id][
-            'critical_sent']
+        critical_enabled = config.critical_enabled
+        critical_repeat_enabled = config.critical_repeat_enabled
+        critical_repeat_limiter = state['critical_repeat_timer'][metric_name]
+        critical_window_timer = state['critical_window_timer'][metric_name]
+        critical_sent = state['critical_sent']
 
         monitoring_datetime = datetime.fromtimestamp(monitoring_timestamp)
 
@@ -881,10 +859,8 @@ class AlertingFactory(ABC):
                 data_for_alerting.append(alert.alert_data)
                 self.component_logger.debug("Successfully classified alert %s",
                                             alert.alert_data)
-                self.alerting_state[parent_id][monitorable_id][
-                    'warning_sent'][metric_name] = False
-                self.alerting_state[parent_id][monitorable_id][
-                    'critical_sent'][metric_name] = False
+                state['warning_sent'][metric_name] = False
+                state['critical_sent'][metric_name] = False
         else:
             went_down_datetime = datetime.fromtimestamp(current_went_down)
             if critical_enabled:
@@ -897,8 +873,7 @@ class AlertingFactory(ABC):
                     data_for_alerting.append(alert.alert_data)
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
-                    self.alerting_state[parent_id][monitorable_id][
-                        'critical_sent'][metric_name] = True
+                    state['critical_sent'][metric_name] = True
                     critical_window_timer.do_task()
                     critical_repeat_limiter.set_last_time_that_did_task(
                         monitoring_datetime)
@@ -928,8 +903,7 @@ class AlertingFactory(ABC):
                     self.component_logger.debug(
                         "Successfully classified alert %s", alert.alert_data)
                     warning_window_timer.do_task()
-                    self.alerting_state[parent_id][monitorable_id][
-                        'warning_sent'][metric_name] = True
+                    state['warning_sent'][metric_name] = True
 
     def classify_source_downtime_alert(
             self, condition_true_alert: Type[ConditionalAlert],
@@ -945,15 +919,15 @@ class AlertingFactory(ABC):
         condition no longer is true. In the case of source downtime, this
         prevents BackUpAgain alerts from being re-raised again.
         """
-        warning_sent = self.alerting_state[parent_id][monitorable_id][
-            'warning_sent']
+        state = self.alerting_state[parent_id][monitorable_id]
+
+        warning_sent = state['warning_sent']
         if condition_function(*condition_fn_args):
             alert = condition_true_alert(*true_alert_args)
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'warning_sent'][metric_name] = True
+            state['warning_sent'][metric_name] = True
         elif condition_false_alert is not None and warning_sent[metric_name]:
             if false_alert_args is None:
                 false_alert_args = []
@@ -961,5 +935,4 @@ class AlertingFactory(ABC):
             data_for_alerting.append(alert.alert_data)
             self.component_logger.debug("Successfully classified alert %s",
                                         alert.alert_data)
-            self.alerting_state[parent_id][monitorable_id][
-                'warning_sent'][metric_name] = False
+            state['warning_sent'][metric_name] = False
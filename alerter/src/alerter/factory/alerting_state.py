@@ -0,0 +1,260 @@
+from collections.abc import MutableMapping
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from src.utils.timing import TimedTaskLimiter, TimedTaskTracker
+
+# The metric layouts shared by the per-metric containers, keyed by the ordered
+# metric codes. Every monitorable of a factory is created with the same
+# metrics, so they all share one metric code -> index dict.
+_layouts: Dict[Tuple[str, ...], Dict[str, int]] = {}
+
+# The time intervals of the timers. Most monitorables are alerted on with the
+# same thresholds, so equal intervals are stored once.
+_intervals: Dict[timedelta, timedelta] = {}
+
+
+def _get_layout(metrics: Tuple[str, ...]) -> Dict[str, int]:
+    layout = _layouts.get(metrics)
+    if layout is None:
+        layout = {metric: index for index, metric in enumerate(metrics)}
+        _layouts[metrics] = layout
+    return layout
+
+
+def _intern(value: Any) -> Any:
+    if isinstance(value, timedelta):
+        return _intervals.setdefault(value, value)
+    return value
+
+
+class MetricValues(MutableMapping):
+    """
+    A compact GroupedAlertsMetricCode.value -> value mapping. The values are
+    stored in a list ordered as in a layout which is shared with all the other
+    containers created for the same metrics.
+    """
+    __slots__ = ('_layout', '_values')
+
+    def __init__(self, values: Dict[str, Any]) -> None:
+        self._layout = _get_layout(tuple(values))
+        self._values = self._create_values(values.values())
+
+    def _create_values(self, values: Iterable[Any]) -> Any:
+        return list(values)
+
+    def _append(self, value: Any) -> None:
+        self._values.append(value)
+
+    def __getitem__(self, metric: str) -> Any:
+        return self._values[self._layout[metric]]
+
+    def __setitem__(self, metric: str, value: Any) -> None:
+        index = self._layout.get(metric)
+        if index is not None:
+            self._values[index] = value
+        else:
+            # An unexpected metric stops this container sharing its layout
+            self._layout = {**self._layout, metric: len(self._layout)}
+            self._append(value)
+
+    def __delitem__(self, metric: str) -> None:
+        values = {key: value for key, value in self.items() if key != metric}
+        if len(values) == len(self):
+            raise KeyError(metric)
+        self._layout = _get_layout(tuple(values))
+        self._values = self._create_values(values.values())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout)
+
+    def __len__(self) -> int:
+        return len(self._layout)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __getstate__(self) -> Tuple[Tuple[str, ...], Any]:
+        return tuple(self._layout), self._values
+
+    def __setstate__(self, state: Tuple[Tuple[str, ...], Any]) -> None:
+        # Restored containers share their layout with the ones created anew
+        metrics, values = state
+        self._layout = _get_layout(metrics)
+        self._values = values
+
+
+class MetricFlags(MetricValues):
+    """
+    A compact GroupedAlertsMetricCode.value -> bool mapping storing one byte
+    per metric.
+    """
+    __slots__ = ()
+
+    def _create_values(self, values: Iterable[Any]) -> bytearray:
+        return bytearray(bool(value) for value in values)
+
+    def __getitem__(self, metric: str) -> bool:
+        return self._values[self._layout[metric]] == 1
+
+
+def _create_timer_view(timer_class: type) -> type:
+    """
+    Creates a sub-class of timer_class whose fields are read from and written
+    to the flattened fields of a _MetricTimers container instead of its own
+    slots, so that the timer's logic is not duplicated.
+    """
+
+    def column(offset: int, interned: bool) -> property:
+        def get(view: Any) -> Any:
+            return view._timer_values[view._index + offset]
+
+        def set(view: Any, value: Any) -> None:
+            view._timer_values[view._index + offset] = value
+
+        def set_interned(view: Any, value: Any) -> None:
+            view._timer_values[view._index + offset] = _intern(value)
+
+        return property(get, set_interned if interned else set)
+
+    namespace = {'__slots__': ('_timer_values', '_index')}
+    for offset, field in enumerate(timer_class.__slots__):
+        namespace[field] = column(offset, field == '_time_interval')
+    return type(timer_class.__name__ + 'View', (timer_class,), namespace)
+
+
+class _MetricTimers(MetricValues):
+    """
+    A compact GroupedAlertsMetricCode.value -> timer mapping. The fields of the
+    timers are flattened into a single list, so no timer object is kept per
+    metric. Indexing returns a view of the metric's timer, which can be used
+    like the timer itself.
+    """
+    __slots__ = ()
+    _TIMER_CLASS: type
+    _VIEW_CLASS: type
+    _TIMER_FIELDS: int
+
+    def _create_values(self, timers: Iterable[Any]) -> List[Any]:
+        values = []
+        for timer in timers:
+            values.extend(_intern(getattr(timer, field))
+                          for field in self._TIMER_CLASS.__slots__)
+        return values
+
+    def _append(self, timer: Any) -> None:
+        self._values.extend(self._create_values([timer]))
+
+    def __getitem__(self, metric: str) -> Any:
+        view = self._VIEW_CLASS.__new__(self._VIEW_CLASS)
+        view._timer_values = self._values
+        view._index = self._layout[metric] * self._TIMER_FIELDS
+        return view
+
+    def __setitem__(self, metric: str, timer: Any) -> None:
+        index = self._layout.get(metric)
+        if index is None:
+            super().__setitem__(metric, timer)
+        else:
+            start = index * self._TIMER_FIELDS
+            self._values[start:start + self._TIMER_FIELDS] = \
+                self._create_values([timer])
+
+    def __setstate__(self, state: Tuple[Tuple[str, ...], Any]) -> None:
+        super().__setstate__(state)
+        self._values = [_intern(value) for value in self._values]
+
+
+class MetricTrackers(_MetricTimers):
+    """
+    A compact GroupedAlertsMetricCode.value -> TimedTaskTracker mapping
+    """
+    __slots__ = ()
+    _TIMER_CLASS = TimedTaskTracker
+    _VIEW_CLASS = _create_timer_view(TimedTaskTracker)
+    _TIMER_FIELDS = len(TimedTaskTracker.__slots__)
+
+
+class MetricLimiters(_MetricTimers):
+    """
+    A compact GroupedAlertsMetricCode.value -> TimedTaskLimiter mapping
+    """
+    __slots__ = ()
+    _TIMER_CLASS = TimedTaskLimiter
+    _VIEW_CLASS = _create_timer_view(TimedTaskLimiter)
+    _TIMER_FIELDS = len(TimedTaskLimiter.__slots__)
+
+
+def _to_metric_container(field: str, values: Dict[str, Any]) -> MetricValues:
+    if field.endswith('_sent'):
+        return MetricFlags(values)
+
+    value_types = set(type(value) for value in values.values())
+    if value_types == {TimedTaskTracker}:
+        return MetricTrackers(values)
+    elif value_types == {TimedTaskLimiter}:
+        return MetricLimiters(values)
+    return MetricValues(values)
+
+
+class MonitorableAlertingState(MutableMapping):
+    """
+    The alerting state of a single monitorable, replacing the
+    {warning_sent: {...}, critical_sent: {...}, ...} dict. It supports the
+    same subscripting so that the alerting factories can use either, but the
+    fields are slotted and the per-metric dicts are stored in compact
+    MetricValues containers. Fields which are not given are missing, like
+    omitted keys. Sub-classes declare any additional fields in their own
+    __slots__.
+    """
+    __slots__ = ('warning_sent', 'critical_sent', 'error_sent',
+                 'any_severity_sent', 'warning_window_timer',
+                 'critical_window_timer', 'critical_repeat_timer',
+                 'warning_occurrences_in_period_tracker',
+                 'critical_occurrences_in_period_tracker')
+
+    # The fields holding a GroupedAlertsMetricCode.value -> value dict
+    _METRIC_FIELDS = frozenset(__slots__)
+    _fields = frozenset(__slots__)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls._fields.union(cls.__dict__.get('__slots__', ()))
+
+    def __init__(self, **fields: Any) -> None:
+        for field, value in fields.items():
+            self[field] = value
+
+    def __getitem__(self, field: str) -> Any:
+        if field in self._fields:
+            try:
+                return getattr(self, field)
+            except AttributeError:
+                pass
+        raise KeyError(field)
+
+    def __setitem__(self, field: str, value: Any) -> None:
+        if field not in self._fields:
+            raise KeyError("{} is not a field of {}".format(
+                field, type(self).__name__))
+
+        if field in self._METRIC_FIELDS and isinstance(value, dict):
+            value = _to_metric_container(field, value)
+        setattr(self, field, value)
+
+    def __delitem__(self, field: str) -> None:
+        if field not in self:
+            raise KeyError(field)
+        delattr(self, field)
+
+    def __iter__(self) -> Iterator[str]:
+        for cls in reversed(type(self).__mro__):
+            for field in cls.__dict__.get('__slots__', ()):
+                if field in self._fields and hasattr(self, field):
+                    yield field
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
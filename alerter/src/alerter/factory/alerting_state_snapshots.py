@@ -0,0 +1,141 @@
+import hashlib
+import io
+import json
+import logging
+import pickle
+import zlib
+from datetime import timedelta
+from typing import Dict, Optional, Tuple
+
+from src.data_store.redis import Keys, RedisApi
+from src.utils.timing import TimedTaskLimiter
+
+# The classes which may be found in a snapshot. Any other global is refused
+# when loading a snapshot, so that loading one cannot execute arbitrary code.
+_SNAPSHOT_CLASSES = frozenset({
+    ('collections', 'deque'),
+    ('datetime', 'datetime'),
+    ('datetime', 'timedelta'),
+    ('datetime', 'timezone'),
+    ('src.alerter.factory.alerting_state', 'MetricValues'),
+    ('src.alerter.factory.alerting_state', 'MetricFlags'),
+    ('src.alerter.factory.alerting_state', 'MetricTrackers'),
+    ('src.alerter.factory.alerting_state', 'MetricLimiters'),
+    ('src.alerter.factory.alerting_state', 'MonitorableAlertingState'),
+    ('src.alerter.factory.cosmos_node_alerting_factory',
+     'CosmosNodeAlertingState'),
+    ('src.alerter.factory.evm_node_alerting_factory', 'EVMNodeAlertingState'),
+    ('src.alerter.factory.substrate_node_alerting_factory',
+     'SubstrateNodeAlertingState'),
+    ('src.utils.timing', 'TimedTaskLimiter'),
+    ('src.utils.timing', 'TimedTaskTracker'),
+    ('src.utils.timing', 'TimedOccurrenceTracker'),
+    ('src.utils.timing', 'OccurrencesInTimePeriodTracker'),
+})
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> type:
+        # From protocol 4 pickle resolves a dotted name attribute by
+        # attribute, so a dotted name could reach anything a module imports.
+        if '.' not in name and (module, name) in _SNAPSHOT_CLASSES:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(
+            "{}.{} is not allowed in an alerting state snapshot".format(
+                module, name))
+
+
+def dump_alerting_state(alerting_state: Dict) -> bytes:
+    return zlib.compress(
+        pickle.dumps(alerting_state, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def load_alerting_state(snapshot: bytes) -> Dict:
+    return _SnapshotUnpickler(io.BytesIO(zlib.decompress(snapshot))).load()
+
+
+def get_configs_digest(configs: Dict) -> str:
+    """
+    :param configs: The alerts configs of a chain, as received by an alerter
+    :return: A digest which changes whenever the configs change
+    """
+    return hashlib.sha256(json.dumps(
+        configs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class AlertingStateSnapshots:
+    """
+    Saves the alerting state of an alerter to Redis, and restores it when the
+    alerter is restarted so that its time windows, repeat timers and sent
+    alerts carry on from where they were. A snapshot expires from Redis once
+    it is older than max_age, so that an alerter which was stopped for longer
+    starts from a fresh state. The digest of the configs each chain's state
+    was built with is saved with the state, so that the alerter only resets a
+    chain's state if the configs it receives after restarting changed.
+    """
+
+    def __init__(self, alerter_name: str, redis: RedisApi,
+                 logger: logging.Logger, snapshot_interval: timedelta,
+                 max_age: timedelta) -> None:
+        self._redis = redis
+        self._logger = logger
+        self._key = Keys.get_component_alerting_state(alerter_name)
+        self._max_age = max_age
+        self._snapshot_limiter = TimedTaskLimiter(snapshot_interval)
+
+    @property
+    def redis(self) -> RedisApi:
+        return self._redis
+
+    @property
+    def max_age(self) -> timedelta:
+        return self._max_age
+
+    def save(self, alerting_state: Dict, configs_digests: Dict[str, str],
+             force: bool = False) -> None:
+        """
+        Saves the alerting state if the snapshot interval has elapsed since
+        the last snapshot, or regardless if force is True.
+        :param alerting_state: The alerting state of the alerting factory
+        :param configs_digests: The digest of the configs each chain's state
+                              : was built with, keyed by parent_id
+        :param force: Whether to save the state before the interval elapses
+        """
+        if not force and not self._snapshot_limiter.can_do_task():
+            return
+
+        try:
+            snapshot = dump_alerting_state({
+                'alerting_state': alerting_state,
+                'configs_digests': configs_digests,
+            })
+        except Exception as e:
+            self._logger.error("Could not take a snapshot of the alerting "
+                               "state.")
+            self._logger.exception(e)
+            return
+
+        self.redis.set_for(self._key, snapshot, self.max_age)
+        self._snapshot_limiter.did_task()
+        self._logger.debug("Saved a %s byte alerting state snapshot.",
+                           len(snapshot))
+
+    def restore(self) -> Optional[Tuple[Dict, Dict[str, str]]]:
+        """
+        :return: The alerting state and the configs digests of the latest
+               : snapshot, or None if there is no snapshot younger than
+               : max_age or it cannot be loaded
+        """
+        snapshot = self.redis.get(self._key)
+        if snapshot is None:
+            return None
+
+        try:
+            loaded_snapshot = load_alerting_state(snapshot)
+            return (loaded_snapshot['alerting_state'],
+                    loaded_snapshot['configs_digests'])
+        except Exception as e:
+            self._logger.error("Could not restore the alerting state "
+                               "snapshot.")
+            self._logger.exception(e)
+            return None
@@ -4,15 +4,16 @@ from typing import Dict, List, Any, Type, Callable
 
 from src.alerter.alert_severities import Severity
 from src.alerter.factory.alerting_factory import AlertingFactory
+from src.alerter.factory.alerting_state import MonitorableAlertingState
 from src.alerter.grouped_alerts_metric_code.contract. \
     chainlink_contract_metric_code import \
     GroupedChainlinkContractAlertsMetricCode as AlertsMetricCode
 from src.configs.alerts.contract.chainlink import ChainlinkContractAlertsConfig
+from src.configs.alerts.rule import AlertRule
 from src.utils.configs import parse_alert_time_thresholds
 from src.utils.timing import (TimedTaskLimiter)
-from src.utils.types import (str_to_bool,
-                             IncreasedAboveThresholdAlert,
-                             DecreasedBelowThresholdAlert, convert_to_float,
+from src.utils.types import (IncreasedAboveThresholdAlert,
+                             DecreasedBelowThresholdAlert,
                              ErrorAlert, ErrorSolvedAlert,
                              ConditionalAlert)
 
@@ -71,9 +72,9 @@ class ChainlinkContractAlertingFactory(AlertingFactory):
                 AlertsMetricCode.ErrorNoSyncedDataSources.value: False,
             }
 
-            self.alerting_state[parent_id]['chain_errors'] = {
-                'error_sent': error_sent
-            }
+            chain_errors_state = MonitorableAlertingState(
+                error_sent=error_sent)
+            self.alerting_state[parent_id]['chain_errors'] = chain_errors_state
 
     def create_alerting_state(
             self, parent_id: str, node_id: str, contract_proxy_address: str,
@@ -120,11 +121,12 @@ class ChainlinkContractAlertingFactory(AlertingFactory):
                         timedelta(seconds=price_feed_deviation_thresholds[
                             'critical_repeat']))
             }
-            self.alerting_state[parent_id][node_id][contract_proxy_address] = {
-                'warning_sent': warning_sent,
-                'critical_sent': critical_sent,
-                'critical_repeat_timer': critical_repeat_timer
-            }
+            contract_state = MonitorableAlertingState(
+                warning_sent=warning_sent,
+                critical_sent=critical_sent,
+                critical_repeat_timer=critical_repeat_timer)
+            self.alerting_state[parent_id][node_id][
+                contract_proxy_address] = contract_state
 
     def remove_chain_alerting_state(self, parent_id: str) -> None:
         """
@@ -176,18 +178,19 @@ class ChainlinkContractAlertingFactory(AlertingFactory):
         :param contract_description: The contract's description
         :return: None
         """
+        # The thresholds are parsed once, when the configuration is received
+        config = AlertRule.compile(config)
+
         # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_threshold = convert_to_float(config['warning_threshold'], None)
+        warning_enabled = config.warning_enabled
+        warning_threshold = config.warning_threshold
         warning_sent = self.alerting_state[parent_id][monitorable_id][
             contract_proxy_address]['warning_sent']
 
         # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_threshold = convert_to_float(config['critical_threshold'],
-                                              None)
-        critical_repeat_enabled = str_to_bool(
-            config['critical_repeat_enabled'])
+        critical_enabled = config.critical_enabled
+        critical_threshold = config.critical_threshold
+        critical_repeat_enabled = config.critical_repeat_enabled
         critical_repeat_limiter = self.alerting_state[parent_id][
             monitorable_id][contract_proxy_address][
             'critical_repeat_timer'][metric_name]
@@ -289,18 +292,19 @@ class ChainlinkContractAlertingFactory(AlertingFactory):
         :param contract_description: The contract's description
         :return: None
         """
+        # The thresholds are parsed once, when the configuration is received
+        config = AlertRule.compile(config)
+
         # Parse warning thresholds and limiters
-        warning_enabled = str_to_bool(config['warning_enabled'])
-        warning_threshold = convert_to_float(config['warning_threshold'], None)
+        warning_enabled = config.warning_enabled
+        warning_threshold = config.warning_threshold
         warning_sent = self.alerting_state[parent_id][monitorable_id][
             contract_proxy_address]['warning_sent']
 
         # Parse critical thresholds and limiters
-        critical_enabled = str_to_bool(config['critical_enabled'])
-        critical_threshold = convert_to_float(config['critical_threshold'],
-                                              None)
-        critical_repeat_enabled = str_to_bool(
-            config['critical_repeat_enabled'])
+        critical_enabled = config.critical_enabled
+        critical_threshold = config.critical_threshold
+        critical_repeat_enabled = config.critical_repeat_enabled
         critical_repeat_limiter = self.alerting_state[parent_id][
             monitorable_id][contract_proxy_address][
             'critical_repeat_timer'][metric_name]
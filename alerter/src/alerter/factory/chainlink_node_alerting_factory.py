@@ -4,6 +4,7 @@ from typing import Any, Dict, Type, List
 
 from src.alerter.alert_severities import Severity
 from src.alerter.factory.alerting_factory import AlertingFactory
+from src.alerter.factory.alerting_state import MonitorableAlertingState
 from src.alerter.grouped_alerts_metric_code.node.chainlink_node_metric_code \
     import GroupedChainlinkNodeAlertsMetricCode as AlertsMetricCode
 from src.configs.alerts.node.chainlink import ChainlinkNodeAlertsConfig
@@ -195,18 +196,17 @@ class ChainlinkNodeAlertingFactory(AlertingFactory):
                         seconds=error_jobs_thresholds['critical_time_window'])),
             }
 
-            self.alerting_state[parent_id][node_id] = {
-                'warning_sent': warning_sent,
-                'critical_sent': critical_sent,
-                'error_sent': error_sent,
-                'warning_window_timer': warning_window_timer,
-                'critical_window_timer': critical_window_timer,
-                'critical_repeat_timer': critical_repeat_timer,
-                'warning_occurrences_in_period_tracker':
+            self.alerting_state[parent_id][node_id] = MonitorableAlertingState(
+                warning_sent=warning_sent,
+                critical_sent=critical_sent,
+                error_sent=error_sent,
+                warning_window_timer=warning_window_timer,
+                critical_window_timer=critical_window_timer,
+                critical_repeat_timer=critical_repeat_timer,
+                warning_occurrences_in_period_tracker=
                     warning_occurrences_in_period_tracker,
-                'critical_occurrences_in_period_tracker':
-                    critical_occurrences_in_period_tracker,
-            }
+                critical_occurrences_in_period_tracker=
+                    critical_occurrences_in_period_tracker)
 
     def remove_chain_alerting_state(self, parent_id: str) -> None:
         """
@@ -2,6 +2,7 @@ import logging
 from datetime import timedelta
 
 from src.alerter.factory.alerting_factory import AlertingFactory
+from src.alerter.factory.alerting_state import MonitorableAlertingState
 from src.alerter.grouped_alerts_metric_code.node. \
     cosmos_node_metric_code import \
     GroupedCosmosNodeAlertsMetricCode as AlertsMetricCode
@@ -11,6 +12,13 @@ from src.utils.timing import (TimedTaskTracker, TimedTaskLimiter,
                               OccurrencesInTimePeriodTracker)
 
 
+class CosmosNodeAlertingState(MonitorableAlertingState):
+    """
+    The alerting state of a cosmos node
+    """
+    __slots__ = ('is_validator', 'current_height')
+
+
 class CosmosNodeAlertingFactory(AlertingFactory):
     """
     This class is in charge of alerting and managing the alerting state for the
@@ -220,21 +228,20 @@ class CosmosNodeAlertingFactory(AlertingFactory):
                         seconds=blocks_missed_thresholds[
                             'critical_time_window'])),
             }
-            self.alerting_state[parent_id][node_id] = {
-                'warning_sent': warning_sent,
-                'critical_sent': critical_sent,
-                'error_sent': error_sent,
-                'any_severity_sent': any_severity_sent,
-                'warning_window_timer': warning_window_timer,
-                'critical_window_timer': critical_window_timer,
-                'critical_repeat_timer': critical_repeat_timer,
-                'warning_occurrences_in_period_tracker':
+            self.alerting_state[parent_id][node_id] = CosmosNodeAlertingState(
+                warning_sent=warning_sent,
+                critical_sent=critical_sent,
+                error_sent=error_sent,
+                any_severity_sent=any_severity_sent,
+                warning_window_timer=warning_window_timer,
+                critical_window_timer=critical_window_timer,
+                critical_repeat_timer=critical_repeat_timer,
+                warning_occurrences_in_period_tracker=
                     warning_occurrences_in_period_tracker,
-                'critical_occurrences_in_period_tracker':
+                critical_occurrences_in_period_tracker=
                     critical_occurrences_in_period_tracker,
-                'is_validator': is_validator,
-                'current_height': None,
-            }
+                is_validator=is_validator,
+                current_height=None)
         elif (self.alerting_state[parent_id][node_id][
                   'is_validator'] != is_validator):
             node_is_down_thresholds = parse_alert_time_thresholds(
@@ -2,6 +2,7 @@ import logging
 from datetime import timedelta
 
 from src.alerter.factory.alerting_factory import AlertingFactory
+from src.alerter.factory.alerting_state import MonitorableAlertingState
 from src.alerter.grouped_alerts_metric_code.node.evm_node_metric_code \
     import GroupedEVMNodeAlertsMetricCode as AlertsMetricCode
 from src.configs.alerts.node.evm import EVMNodeAlertsConfig
@@ -9,6 +10,13 @@ from src.utils.configs import parse_alert_time_thresholds
 from src.utils.timing import (TimedTaskTracker, TimedTaskLimiter)
 
 
+class EVMNodeAlertingState(MonitorableAlertingState):
+    """
+    The alerting state of an EVM node
+    """
+    __slots__ = ('current_height',)
+
+
 class EVMNodeAlertingFactory(AlertingFactory):
     """
     This class is in charge of alerting and managing the alerting state for the
@@ -120,15 +128,14 @@ class EVMNodeAlertingFactory(AlertingFactory):
                             'critical_repeat']))
             }
 
-            self.alerting_state[parent_id][node_id] = {
-                'warning_sent': warning_sent,
-                'critical_sent': critical_sent,
-                'error_sent': error_sent,
-                'warning_window_timer': warning_window_timer,
-                'critical_window_timer': critical_window_timer,
-                'critical_repeat_timer': critical_repeat_timer,
-                'current_height': None,
-            }
+            self.alerting_state[parent_id][node_id] = EVMNodeAlertingState(
+                warning_sent=warning_sent,
+                critical_sent=critical_sent,
+                error_sent=error_sent,
+                warning_window_timer=warning_window_timer,
+                critical_window_timer=critical_window_timer,
+                critical_repeat_timer=critical_repeat_timer,
+                current_height=None)
 
     def remove_chain_alerting_state(self, parent_id: str) -> None:
         """
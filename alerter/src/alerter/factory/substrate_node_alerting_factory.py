@@ -4,6 +4,7 @@ from typing import Dict, List, Type, Callable, Any, Optional
 
 from src.alerter.alert_severities import Severity
 from src.alerter.factory.alerting_factory import AlertingFactory
+from src.alerter.factory.alerting_state import MonitorableAlertingState
 from src.alerter.grouped_alerts_metric_code.node. \
     substrate_node_metric_code import \
     GroupedSubstrateNodeAlertsMetricCode as AlertsMetricCode
@@ -18,6 +19,13 @@ from src.utils.types import (
     SolvedSubstrateEraAlert)
 
 
+class SubstrateNodeAlertingState(MonitorableAlertingState):
+    """
+    The alerting state of a substrate node
+    """
+    __slots__ = ('is_validator', 'eras_state')
+
+
 class SubstrateNodeAlertingFactory(AlertingFactory):
     """
     This class is in charge of alerting and managing the alerting state for the
@@ -205,16 +213,16 @@ class SubstrateNodeAlertingFactory(AlertingFactory):
                     seconds=send_heartbeat_author_block_thresholds[
                         'critical_repeat'])),
             }
-            self.alerting_state[parent_id][node_id] = {
-                'warning_sent': warning_sent,
-                'critical_sent': critical_sent,
-                'error_sent': error_sent,
-                'any_severity_sent': any_severity_sent,
-                'warning_window_timer': warning_window_timer,
-                'critical_window_timer': critical_window_timer,
-                'critical_repeat_timer': critical_repeat_timer,
-                'is_validator': is_validator
-            }
+            node_state = SubstrateNodeAlertingState(
+                warning_sent=warning_sent,
+                critical_sent=critical_sent,
+                error_sent=error_sent,
+                any_severity_sent=any_severity_sent,
+                warning_window_timer=warning_window_timer,
+                critical_window_timer=critical_window_timer,
+                critical_repeat_timer=critical_repeat_timer,
+                is_validator=is_validator)
+            self.alerting_state[parent_id][node_id] = node_state
             if is_validator:
                 self.alerting_state[parent_id][node_id]['eras_state'] = {}
         elif (self.alerting_state[parent_id][node_id][
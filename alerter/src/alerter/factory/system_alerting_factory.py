@@ -2,6 +2,7 @@ import logging
 from datetime import timedelta
 
 from src.alerter.factory.alerting_factory import AlertingFactory
+from src.alerter.factory.alerting_state import MonitorableAlertingState
 from src.alerter.grouped_alerts_metric_code.system \
     import GroupedSystemAlertsMetricCode as AlertsMetricCode
 from src.configs.alerts.system import SystemAlertsConfig
@@ -156,14 +157,14 @@ class SystemAlertingFactory(AlertingFactory):
                     seconds=system_is_down_thresholds['critical_repeat']))
             }
 
-            self.alerting_state[parent_id][system_id] = {
-                'warning_sent': warning_sent,
-                'critical_sent': critical_sent,
-                'error_sent': error_sent,
-                'warning_window_timer': warning_window_timer,
-                'critical_window_timer': critical_window_timer,
-                'critical_repeat_timer': critical_repeat_timer
-            }
+            system_state = MonitorableAlertingState(
+                warning_sent=warning_sent,
+                critical_sent=critical_sent,
+                error_sent=error_sent,
+                warning_window_timer=warning_window_timer,
+                critical_window_timer=critical_window_timer,
+                critical_repeat_timer=critical_repeat_timer)
+            self.alerting_state[parent_id][system_id] = system_state
 
     def remove_chain_alerting_state(self, parent_id: str) -> None:
         """
@@ -1,5 +1,4 @@
 import copy
-import json
 import logging
 import sys
 from datetime import datetime
@@ -22,6 +21,8 @@ from src.configs.alerts.node.cosmos import CosmosNodeAlertsConfig
 from src.configs.factory.alerts.cosmos_alerts import (
     CosmosNodeAlertsConfigsFactory, CosmosNetworkAlertsConfigsFactory)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
+from src.utils import env
 from src.utils.constants.names import (
     COSMOS_NODE_ALERTER_NAME, COSMOS_NETWORK_ALERTER_NAME)
 from src.utils.constants.rabbitmq import (
@@ -35,8 +36,8 @@ from src.utils.logging import log_and_print
 
 class CosmosAlertersManager(AlertersManager):
     def __init__(self, logger: logging.Logger, manager_name: str,
-                 rabbitmq: RabbitMQApi) -> None:
-        super().__init__(logger, manager_name, rabbitmq)
+                 rabbitmq: RabbitMQApi, partitions: int = 1) -> None:
+        super().__init__(logger, manager_name, rabbitmq, partitions)
         self._node_alerts_config_factory = CosmosNodeAlertsConfigsFactory()
         self._network_alerts_config_factory = \
             CosmosNetworkAlertsConfigsFactory()
@@ -48,6 +49,7 @@ class CosmosAlertersManager(AlertersManager):
                 'factory': self.node_alerts_config_factory,
                 'routing_key': COSMOS_NODE_ALERT_ROUTING_KEY,
                 'starter': start_cosmos_node_alerter,
+                'partitioned': True,
             },
             COSMOS_NETWORK_ALERTER_NAME: {
                 'alerterClass': CosmosNetworkAlerter,
@@ -174,21 +176,25 @@ class CosmosAlertersManager(AlertersManager):
         started, or they are not alive. This must be done in case of a restart
         of the manager.
         """
-        for alerter_name, alerter_details in \
-                self.configs_processor_helper.items():
-            if (alerter_name not in self.alerter_process_dict or
-                    not self.alerter_process_dict[alerter_name].is_alive()):
+        for process_name, alerter_details, partition in \
+                self._get_alerter_processes(self.configs_processor_helper):
+            if (process_name not in self.alerter_process_dict or
+                    not self.alerter_process_dict[process_name].is_alive()):
                 """
                 We must clear out all the metrics which are found in Redis.
                 Sending this alert to the alert router and then the data store
                 will achieve this. This is sent on startup of the manager and if
                 the alerter process is deemed to be dead.
                 """
-                alert = ComponentResetAlert(
-                    alerter_name, datetime.now().timestamp(),
-                    alerter_details['alerterClass'].__name__)
-                self._push_latest_data_to_queue_and_send(
-                    alert.alert_data, alerter_details['routing_key'])
+                # Alerters which take alerting state snapshots reset their
+                # metrics themselves, only if they could not restore their state
+                if env.ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS <= 0:
+                    alert = ComponentResetAlert(
+                        process_name, datetime.now().timestamp(),
+                        alerter_details['alerterClass'].__name__,
+                        partition=partition, partitions=self.partitions)
+                    self._push_latest_data_to_queue_and_send(
+                        alert.alert_data, alerter_details['routing_key'])
 
                 """
                 Start the Alerter process with the factory being updated by this
@@ -196,18 +202,21 @@ class CosmosAlertersManager(AlertersManager):
                 any.
                 """
                 log_and_print("Attempting to start the {}.".format(
-                    alerter_name), self.logger)
+                    process_name), self.logger)
+                alerter_args = (alerter_details['factory'],)
+                if partition is not None:
+                    alerter_args += (partition,)
                 alerter_process = Process(target=alerter_details['starter'],
-                                          args=(alerter_details['factory'],))
+                                          args=alerter_args)
                 alerter_process.daemon = True
                 alerter_process.start()
 
-                self._alerter_process_dict[alerter_name] = alerter_process
+                self._alerter_process_dict[process_name] = alerter_process
 
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(properties, body)
 
         self.logger.debug("Received configs %s", sent_configs)
 
@@ -236,12 +245,15 @@ class CosmosAlertersManager(AlertersManager):
                     configs_factory.add_new_config(chain_name, sent_configs)
                     parent_id = configs_factory.get_parent_id(chain_name,
                                                               configs_class)
-                    alert = ComponentResetAlert(
-                        alerter_name, datetime.now().timestamp(),
-                        alerter_class.__name__, parent_id, chain_name
-                    )
-                    self._push_latest_data_to_queue_and_send(
-                        alert.alert_data, alerter_details['routing_key'])
+                    # Alerters taking alerting state snapshots reset a chain's
+                    # metrics themselves, only if its configs changed
+                    if env.ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS <= 0:
+                        alert = ComponentResetAlert(
+                            alerter_name, datetime.now().timestamp(),
+                            alerter_class.__name__, parent_id, chain_name
+                        )
+                        self._push_latest_data_to_queue_and_send(
+                            alert.alert_data, alerter_details['routing_key'])
             else:
                 for _, alerter_details in self.configs_processor_helper.items():
                     configs_factory = alerter_details['factory']
@@ -1,5 +1,4 @@
 import copy
-import json
 import logging
 import sys
 from datetime import datetime
@@ -16,6 +15,8 @@ from src.alerter.alerts.internal_alerts import ComponentResetAlert
 from src.alerter.managers.manager import AlertersManager
 from src.configs.factory.alerts.evm_alerts import EVMNodeAlertsConfigsFactory
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
+from src.utils import env
 from src.utils.constants.names import EVM_NODE_ALERTER_NAME
 from src.utils.constants.rabbitmq import (
     HEALTH_CHECK_EXCHANGE, CONFIG_EXCHANGE, PING_ROUTING_KEY,
@@ -148,10 +149,13 @@ class EVMNodeAlerterManager(AlertersManager):
             achieve this. This is sent on startup of the manager and if the
             alerter process is deemed to be dead.
             """
-            alert = ComponentResetAlert(EVM_NODE_ALERTER_NAME,
-                                        datetime.now().timestamp(),
-                                        EVMNodeAlerter.__name__)
-            self._push_latest_data_to_queue_and_send(alert.alert_data)
+            # The alerter resets its metrics itself if it takes alerting state
+            # snapshots, only if it could not restore its state
+            if env.ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS <= 0:
+                alert = ComponentResetAlert(EVM_NODE_ALERTER_NAME,
+                                            datetime.now().timestamp(),
+                                            EVMNodeAlerter.__name__)
+                self._push_latest_data_to_queue_and_send(alert.alert_data)
 
             """
             Start the EVM Node Alerter process with the factory being updated by
@@ -171,7 +175,7 @@ class EVMNodeAlerterManager(AlertersManager):
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(properties, body)
 
         self.logger.debug("Received configs %s", sent_configs)
 
@@ -196,11 +200,14 @@ class EVMNodeAlerterManager(AlertersManager):
                                                           sent_configs)
                 parent_id = self.alerts_config_factory.get_parent_id(
                     chain_name)
-                alert = ComponentResetAlert(
-                    EVM_NODE_ALERTER_NAME, datetime.now().timestamp(),
-                    EVMNodeAlerter.__name__, parent_id, chain_name
-                )
-                self._push_latest_data_to_queue_and_send(alert.alert_data)
+                # Alerters taking alerting state snapshots reset a chain's
+                # metrics themselves, only if its configs changed
+                if env.ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS <= 0:
+                    alert = ComponentResetAlert(
+                        EVM_NODE_ALERTER_NAME, datetime.now().timestamp(),
+                        EVMNodeAlerter.__name__, parent_id, chain_name
+                    )
+                    self._push_latest_data_to_queue_and_send(alert.alert_data)
             else:
                 self.alerts_config_factory.remove_config(chain_name)
 
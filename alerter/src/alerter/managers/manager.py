@@ -1,7 +1,7 @@
 import logging
 from abc import abstractmethod
 from types import FrameType
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -11,13 +11,15 @@ from src.abstract.publisher_subscriber import (
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY)
+from src.utils.partitioning import get_partition_component_name
 
 
 class AlertersManager(QueuingPublisherSubscriberComponent):
     def __init__(self, logger: logging.Logger, name: str,
-                 rabbitmq: RabbitMQApi) -> None:
+                 rabbitmq: RabbitMQApi, partitions: int = 1) -> None:
         super().__init__(logger, rabbitmq)
         self._name = name
+        self._partitions = partitions
 
     def __str__(self) -> str:
         return self.name
@@ -26,6 +28,34 @@ class AlertersManager(QueuingPublisherSubscriberComponent):
     def name(self) -> str:
         return self._name
 
+    @property
+    def partitions(self) -> int:
+        return self._partitions
+
+    def _get_alerter_processes(self, configs_processor_helper: Dict) \
+            -> List[Tuple[str, Dict, Optional[int]]]:
+        """
+        The alerters marked as partitioned are started once per partition,
+        and the other alerters once. With one partition the alerters are not
+        partitioned, so they keep consuming from the un-partitioned queues.
+        :param configs_processor_helper: The details of the alerters managed
+        :return: A (process name, alerter details, partition) tuple for every
+               : alerter process to be run
+        """
+        alerter_processes = []
+        for alerter_name, alerter_details in configs_processor_helper.items():
+            if alerter_details.get('partitioned', False) and \
+                    self.partitions > 1:
+                partitions = list(range(self.partitions))
+            else:
+                partitions = [None]
+            for partition in partitions:
+                alerter_processes.append((
+                    get_partition_component_name(alerter_name, partition),
+                    alerter_details, partition))
+
+        return alerter_processes
+
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
 
@@ -232,6 +232,28 @@ class TendermintRpcApiWrapper(ApiWrapper):
                                verify=self.verify, timeout=self.timeout,
                                params=params)
 
+    def get_blockchain(self, tendermint_rpc_url: str,
+                       params: Dict = None) -> Dict:
+        """
+        This function retrieves data from the
+        tendermint_rpc_url/blockchain?minHeight=<min>&maxHeight=<max> endpoint
+        if a combination of minHeight and maxHeight is included in the params
+        Dict. Otherwise, it retrieves data from the
+        tendermint_rpc_url/blockchain endpoint. This endpoint returns the block
+        headers only, of at most 20 blocks.
+        :param tendermint_rpc_url: The tendermint RPC url of the data source
+        :param params: Parameters that need to be added to the endpoint
+        :return: Data from
+                 tendermint_rpc_url/blockchain?minHeight=<min>&maxHeight=<max>
+                 if a combination of minHeight and maxHeight is included in the
+                 params Dict. Otherwise it retrieves data from the
+                 tendermint_rpc_url/blockchain endpoint
+        """
+        endpoint = tendermint_rpc_url + '/blockchain'
+        return get_cosmos_json(endpoint=endpoint, logger=self.logger,
+                               verify=self.verify, timeout=self.timeout,
+                               params=params)
+
     def get_block_results(self, tendermint_rpc_url: str,
                           params: Dict = None) -> Dict:
         """
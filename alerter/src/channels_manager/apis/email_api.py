@@ -1,15 +1,138 @@
 import smtplib
+import threading
 from datetime import datetime
 from email.message import EmailMessage, Message
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Optional
+from typing import List, Optional, Tuple, Union
+
+
+def _connect_smtp(smtp: str, port: int, username: Optional[str],
+                  password: Optional[str]) -> smtplib.SMTP:
+    s = smtplib.SMTP(smtp, port)
+    if None not in [username, password] and len(username) != 0:
+        s.starttls()
+        s.login(username, password)
+    return s
+
+
+class SmtpConnectionPool:
+    """
+    Keeps authenticated SMTP connections open so that consecutive e-mails are
+    sent without paying for a new TCP connection, STARTTLS handshake and login
+    every time. A connection which was idle for longer than idle_timeout
+    seconds is closed rather than re-used, as SMTP servers drop idle clients.
+    If a re-used connection turns out to have been dropped by the server, the
+    message is sent once more through a new connection.
+    """
+
+    def __init__(self, smtp: str, port: int, username: Optional[str],
+                 password: Optional[str], max_size: int = 1,
+                 idle_timeout: float = 60) -> None:
+        self._smtp = smtp
+        self._port = port
+        self._username = username
+        self._password = password
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+
+        # The idle connections together with the time they were last used,
+        # the most recently used connection being the last.
+        self._idle_connections: List[Tuple[smtplib.SMTP, float]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def idle_timeout(self) -> float:
+        return self._idle_timeout
+
+    @property
+    def size(self) -> int:
+        """
+        :return: The number of idle connections kept open
+        """
+        return len(self._idle_connections)
+
+    def _connect(self) -> smtplib.SMTP:
+        return _connect_smtp(self._smtp, self._port, self._username,
+                             self._password)
+
+    @staticmethod
+    def _close(connection: smtplib.SMTP) -> None:
+        # The connection may have already been dropped by the server, in which
+        # case it only needs to be closed on our side.
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+    def _acquire(self) -> Tuple[smtplib.SMTP, bool]:
+        """
+        :return: An open connection, and whether it was re-used from the pool
+        """
+        with self._lock:
+            while len(self._idle_connections) != 0:
+                connection, last_used = self._idle_connections.pop()
+                if datetime.now().timestamp() - last_used <= self.idle_timeout:
+                    return connection, True
+                self._close(connection)
+
+        return self._connect(), False
+
+    def _release(self, connection: smtplib.SMTP) -> None:
+        with self._lock:
+            if len(self._idle_connections) < self.max_size:
+                self._idle_connections.append(
+                    (connection, datetime.now().timestamp()))
+                return
+
+        self._close(connection)
+
+    def send_message(self, msg: Message,
+                     to_addrs: Optional[List[str]] = None) -> None:
+        """
+        Sends the message to all its recipients in a single SMTP transaction.
+        :param msg: The message to send
+        :param to_addrs: The envelope recipients, or None to send the message
+                       : to the recipients in its headers
+        """
+        connection, reused = self._acquire()
+        try:
+            connection.send_message(msg, to_addrs=to_addrs)
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            connection.close()
+            if not reused:
+                raise
+
+            connection = self._connect()
+            try:
+                connection.send_message(msg, to_addrs=to_addrs)
+            except Exception:
+                self._close(connection)
+                raise
+        except Exception:
+            self._close(connection)
+            raise
+
+        self._release(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            idle_connections = self._idle_connections
+            self._idle_connections = []
+
+        for connection, _ in idle_connections:
+            self._close(connection)
 
 
 class EmailApi:
 
     def __init__(self, smtp: str, sender: str, username: Optional[str],
-                 password: Optional[str], port: int = 0) -> None:
+                 password: Optional[str], port: int = 0,
+                 connection_pool: Optional[SmtpConnectionPool] = None) -> None:
         super().__init__()
 
         # If blank/None username or None password, EmailSender assumes
@@ -21,21 +144,33 @@ class EmailApi:
         self._password = password
         self._port = port
 
-    def send_email(self, subject: str, message: str, to: str) -> None:
+        # If a connection pool is given, e-mails are sent through its
+        # connections instead of opening a new connection for every e-mail.
+        self._connection_pool = connection_pool
+
+    @property
+    def connection_pool(self) -> Optional[SmtpConnectionPool]:
+        return self._connection_pool
+
+    def send_email(self, subject: str, message: str,
+                   to: Union[str, List[str]]) -> None:
         msg = EmailMessage()
         msg.set_content("{}\nDate - {}".format(message, datetime.now()))
 
         msg['Subject'] = subject
         msg['From'] = self._sender
-        msg['To'] = to
+        msg['To'] = self._format_recipients(to)
 
         # Send the message via the specified SMTP server.
-        self._send_smtp(msg)
+        self._send_smtp(msg, self._get_envelope_recipients(to))
 
     def send_email_with_html(self, subject: str, html_message: str,
-                             plain_message: str, to: str) -> None:
+                             plain_message: str,
+                             to: Union[str, List[str]]) -> None:
         """
-        <head> and <body> tags will be included here
+        <head> and <body> tags will be included here. If a list of recipients
+        is given, a single e-mail is sent to all of them without disclosing
+        their addresses to each other.
         """
         html_wrapper = """\
         <html>
@@ -50,7 +185,7 @@ class EmailApi:
 
         msg['Subject'] = subject
         msg['From'] = self._sender
-        msg['To'] = to
+        msg['To'] = self._format_recipients(to)
 
         # Record the MIME types of both parts - text/plain and text/html.
         part1 = MIMEText("{}\nDate - {}".format(plain_message, datetime.now()),
@@ -65,14 +200,33 @@ class EmailApi:
         msg.attach(part1)
         msg.attach(part2)
 
-        self._send_smtp(msg)
+        self._send_smtp(msg, self._get_envelope_recipients(to))
+
+    @staticmethod
+    def _format_recipients(to: Union[str, List[str]]) -> str:
+        if isinstance(to, str):
+            return to
+
+        # The recipients of a batched e-mail are only given in the envelope,
+        # so that they do not see each other's addresses.
+        return 'undisclosed-recipients:;'
+
+    @staticmethod
+    def _get_envelope_recipients(
+            to: Union[str, List[str]]) -> Optional[List[str]]:
+        if isinstance(to, str):
+            return None
+
+        return list(to)
+
+    def _send_smtp(self, msg: Message,
+                   to_addrs: Optional[List[str]] = None) -> None:
+        if self.connection_pool is not None:
+            self.connection_pool.send_message(msg, to_addrs)
+            return
 
-    def _send_smtp(self, msg: Message) -> None:
         # Send the message via the specified SMTP server.
-        s = smtplib.SMTP(self._smtp, self._port)
-        if None not in [self._username, self._password] \
-                and len(self._username) != 0:
-            s.starttls()
-            s.login(self._username, self._password)
-        s.send_message(msg)
+        s = _connect_smtp(self._smtp, self._port, self._username,
+                          self._password)
+        s.send_message(msg, to_addrs=to_addrs)
         s.quit()
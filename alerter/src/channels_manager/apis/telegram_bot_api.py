@@ -1,6 +1,6 @@
 from typing import Optional, Dict
 
-import requests
+from src.utils.data import get_http_session_pool
 
 
 class TelegramBotApi:
@@ -24,13 +24,13 @@ class TelegramBotApi:
             'text': message,
             'parse_mode': "Markdown"
         }
-        return requests.get(self._base_url + "/sendMessage", data=data,
-                            timeout=10, headers={'Connection': 'close'}).json()
+        return get_http_session_pool().get(
+            self._base_url + "/sendMessage", data=data, timeout=10).json()
 
     def get_updates(self) -> Dict:
-        return requests.get(self._base_url + "/getUpdates", timeout=10,
-                            headers={'Connection': 'close'}).json()
+        return get_http_session_pool().get(self._base_url + "/getUpdates",
+                                           timeout=10).json()
 
     def get_me(self) -> Dict:
-        return requests.get(self._base_url + "/getMe", timeout=10,
-                            headers={'Connection': 'close'}).json()
+        return get_http_session_pool().get(self._base_url + "/getMe",
+                                           timeout=10).json()
@@ -13,12 +13,17 @@ from src.utils.data import RequestStatus
 class EmailChannel(Channel):
     def __init__(self, channel_name: str, channel_id: str,
                  logger: logging.Logger, emails_to: List[str],
-                 email_api: EmailApi):
+                 email_api: EmailApi, batch_recipients: bool = False):
         super().__init__(channel_name, channel_id, logger)
 
         self._emails_to = emails_to
         self._email_api = email_api
 
+        # If batch_recipients is True, one e-mail is sent to all the
+        # destination emails in a single SMTP transaction, rather than one
+        # e-mail per destination email.
+        self._batch_recipients = batch_recipients
+
     def alert(self, alert: Alert) -> RequestStatus:
         subject = "PANIC {}".format(alert.severity)
         html_email_message = EMAIL_HTML_TEMPLATE.format(
@@ -38,6 +43,14 @@ class EmailChannel(Channel):
         self._logger.debug("Destination Emails: %s",
                            self._emails_to)
         try:
+            if self._batch_recipients:
+                self._email_api.send_email_with_html(
+                    subject, html_email_message, plain_email_message,
+                    self._emails_to)
+                self._logger.debug("Sent alert to all the emails in the "
+                                   "channel")
+                return RequestStatus.SUCCESS
+
             for to_address in self._emails_to:
                 self._logger.debug("Sending alert to %s", to_address)
                 self._email_api.send_email_with_html(
@@ -0,0 +1,141 @@
+import random
+from datetime import datetime
+from queue import Queue
+from typing import Callable, Dict, Optional
+
+from src.alerter.alerts.alert import Alert
+from src.utils.data import RequestStatus
+
+
+class AlertsRetryScheduler:
+    """
+    Decides which of the alerts waiting in the alerts queue of a channel
+    handler are sent, without ever blocking the handler. An alert which could
+    not be sent is re-tried after an exponentially increasing delay with
+    random jitter, and the alerts behind it are sent in the meantime. To
+    respect the rate limits of the channel's provider, alerts are sent at
+    least min_send_interval seconds apart. Alerts which were raised more than
+    alert_validity_threshold seconds ago are discarded, as are alerts which
+    could not be sent after max_attempts attempts if max_attempts is given.
+    The queue may also hold other items carrying the timestamp of an alert,
+    such as the calls which the Twilio alerts handler could not make.
+    """
+
+    def __init__(self, alert_validity_threshold: int,
+                 initial_retry_delay: float = 10,
+                 max_retry_delay: float = 300,
+                 min_send_interval: float = 0,
+                 max_attempts: Optional[int] = None) -> None:
+        self._alert_validity_threshold = alert_validity_threshold
+        self._initial_retry_delay = initial_retry_delay
+        self._max_retry_delay = max_retry_delay
+        self._min_send_interval = min_send_interval
+        self._max_attempts = max_attempts
+
+        # The number of failed attempts and the time of the next attempt of
+        # each alert which could not be sent, and the earliest time at which
+        # the next alert may be sent
+        self._failed_attempts: Dict[Alert, int] = {}
+        self._next_attempt_times: Dict[Alert, float] = {}
+        self._next_send_time = 0.0
+
+    @property
+    def alert_validity_threshold(self) -> int:
+        return self._alert_validity_threshold
+
+    @property
+    def initial_retry_delay(self) -> float:
+        return self._initial_retry_delay
+
+    @property
+    def max_retry_delay(self) -> float:
+        return self._max_retry_delay
+
+    @property
+    def min_send_interval(self) -> float:
+        return self._min_send_interval
+
+    @property
+    def max_attempts(self) -> Optional[int]:
+        return self._max_attempts
+
+    def get_retry_delay(self, failed_attempts: int) -> float:
+        """
+        :param failed_attempts: The number of times sending has failed so far
+        :return: The number of seconds to wait before the next attempt. The
+        delay doubles with every failed attempt up to max_retry_delay, and a
+        random jitter of up to half of it is subtracted so that retries do not
+        all happen at once.
+        """
+        delay = min(self.initial_retry_delay * 2 ** (failed_attempts - 1),
+                    self.max_retry_delay)
+        return random.uniform(delay / 2, delay)
+
+    def send_alerts(self, alerts_queue: Queue,
+                    send_alert: Callable[[Alert], RequestStatus]) \
+            -> Optional[float]:
+        """
+        Sends the alerts in the queue whose attempt is due, in order. An alert
+        is removed from the queue once it is sent or discarded, and the alerts
+        which are still waiting are kept in their original order.
+        :param alerts_queue: The alerts queue of the channel handler
+        :param send_alert: The function which sends an alert through the
+        channel
+        :return: The number of seconds until the next alert in the queue is due
+        to be sent, or None if the queue is empty
+        """
+        waiting = []
+        next_due_time = None
+        while not alerts_queue.empty():
+            # Every alert is taken out of the queue, and the alerts which are
+            # still waiting are put back at the end.
+            alert = alerts_queue.get()
+            alerts_queue.task_done()
+            now = datetime.now().timestamp()
+
+            # Discard alert if alert_validity_threshold seconds passed since it
+            # was last raised
+            if now - alert.timestamp > self.alert_validity_threshold:
+                self._forget(alert)
+                continue
+
+            due_time = max(self._next_attempt_times.get(alert, now),
+                           self._next_send_time)
+            if due_time <= now:
+                self._next_send_time = now + self.min_send_interval
+                if send_alert(alert) == RequestStatus.SUCCESS:
+                    self._forget(alert)
+                    continue
+
+                failed_attempts = self._failed_attempts.get(alert, 0) + 1
+                if self.max_attempts is not None and \
+                        failed_attempts >= self.max_attempts:
+                    self._forget(alert)
+                    continue
+
+                self._failed_attempts[alert] = failed_attempts
+                due_time = now + self.get_retry_delay(failed_attempts)
+                self._next_attempt_times[alert] = due_time
+
+            waiting.append(alert)
+            if next_due_time is None or due_time < next_due_time:
+                next_due_time = due_time
+
+        # The retry state of alerts which were removed from the queue by the
+        # handler because the queue was full is no longer needed.
+        waiting_alerts = set(waiting)
+        for alert in list(self._failed_attempts):
+            if alert not in waiting_alerts:
+                self._forget(alert)
+
+        for alert in waiting:
+            alerts_queue.put_nowait(alert)
+
+        if next_due_time is None:
+            return None
+
+        return max(next_due_time - datetime.now().timestamp(), 0)
+
+    def _forget(self, alert: Alert) -> None:
+        self._failed_attempts.pop(alert, None)
+        self._next_attempt_times.pop(alert, None)
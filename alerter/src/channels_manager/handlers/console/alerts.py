@@ -1,4 +1,3 @@
-import json
 import logging
 import sys
 from datetime import datetime
@@ -13,6 +12,7 @@ from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
 from src.channels_manager.channels.console import ConsoleChannel
 from src.channels_manager.handlers.handler import ChannelHandler
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE,
@@ -80,7 +80,7 @@ class ConsoleAlertsHandler(ChannelHandler):
     def _process_alert(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        alert_json = json.loads(body)
+        alert_json = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this alert.", alert_json)
 
         processing_error = False
@@ -1,5 +1,7 @@
 import logging
 from abc import ABC
+from datetime import datetime
+from typing import Optional
 
 from src.abstract.publisher_subscriber import PublisherSubscriberComponent
 from src.message_broker.rabbitmq import RabbitMQApi
@@ -12,6 +14,11 @@ class ChannelHandler(PublisherSubscriberComponent, ABC):
 
         self._handler_name = handler_name
 
+        # The timer which sends the alerts waiting to be re-tried by a retry
+        # scheduler, and the time at which it fires
+        self._send_alerts_timer_id = None
+        self._send_alerts_timer_due_time: Optional[float] = None
+
     def __str__(self) -> str:
         return self.handler_name
 
@@ -21,3 +28,36 @@ class ChannelHandler(PublisherSubscriberComponent, ABC):
 
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
+
+    def _schedule_send_alerts(self, delay: Optional[float]) -> None:
+        """
+        Makes sure that self._send_alerts is called within delay seconds even
+        if no other alert is received, so that the alerts waiting to be
+        re-tried by a retry scheduler are sent once they are due.
+        :param delay: The number of seconds after which the next alert is due,
+        or None if no alert is waiting
+        """
+        if delay is None:
+            return
+
+        due_time = datetime.now().timestamp() + delay
+        if self._send_alerts_timer_due_time is not None:
+            if self._send_alerts_timer_due_time <= due_time:
+                return
+            self.rabbitmq.connection.remove_timeout(self._send_alerts_timer_id)
+
+        self._send_alerts_timer_id = self.rabbitmq.connection.call_later(
+            delay, self._on_send_alerts_timer)
+        self._send_alerts_timer_due_time = due_time
+
+    def _reset_send_alerts_timer(self) -> None:
+        """
+        Forgets the timer which sends the waiting alerts. This must be called
+        whenever a new connection is opened, as timers do not survive it.
+        """
+        self._send_alerts_timer_id = None
+        self._send_alerts_timer_due_time = None
+
+    def _on_send_alerts_timer(self) -> None:
+        self._reset_send_alerts_timer()
+        self._send_alerts()
@@ -1,9 +1,9 @@
-import json
 import logging
 import sys
 from datetime import datetime
 from queue import Queue
 from types import FrameType
+from typing import Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -12,8 +12,12 @@ from src.alerter.alert_code import AlertCode
 from src.alerter.alerts.alert import Alert
 from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
 from src.channels_manager.channels.slack import SlackChannel
+from src.channels_manager.handlers.alerts_retry_scheduler import (
+    AlertsRetryScheduler)
 from src.channels_manager.handlers.handler import ChannelHandler
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
+from src.utils.constants.channels import SLACK_MIN_SEND_INTERVAL_SECONDS
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
     CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE,
@@ -28,13 +32,19 @@ class SlackAlertsHandler(ChannelHandler):
     def __init__(self, handler_name: str, logger: logging.Logger,
                  rabbitmq: RabbitMQApi, slack_channel: SlackChannel,
                  queue_size: int = 0, max_attempts: int = 6,
-                 alert_validity_threshold: int = 600) -> None:
+                 alert_validity_threshold: int = 600,
+                 non_blocking_retries: bool = False) -> None:
         super().__init__(handler_name, logger, rabbitmq)
 
         self._slack_channel = slack_channel
         self._alerts_queue = Queue(queue_size)
         self._max_attempts = max_attempts
         self._alert_validity_threshold = alert_validity_threshold
+        self._retry_scheduler = None
+        if non_blocking_retries:
+            self._retry_scheduler = AlertsRetryScheduler(
+                alert_validity_threshold,
+                min_send_interval=SLACK_MIN_SEND_INTERVAL_SECONDS)
         self._slack_alerts_handler_queue = \
             CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE.format(
                 self.slack_channel.channel_id)
@@ -50,8 +60,14 @@ class SlackAlertsHandler(ChannelHandler):
     def alerts_queue(self) -> Queue:
         return self._alerts_queue
 
+    @property
+    def retry_scheduler(self) -> Optional[AlertsRetryScheduler]:
+        return self._retry_scheduler
+
     def _initialise_rabbitmq(self) -> None:
         self.rabbitmq.connect_till_successful()
+        # Timers do not survive a new connection
+        self._reset_send_alerts_timer()
 
         # Set consuming configuration
         self.logger.info("Creating '%s' exchange", ALERT_EXCHANGE)
@@ -94,7 +110,7 @@ class SlackAlertsHandler(ChannelHandler):
     def _process_alert(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        alert_json = json.loads(body)
+        alert_json = decode_message(properties, body)
         self.logger.debug(
             "Received %s. Now processing this alert.", alert_json)
 
@@ -169,6 +185,14 @@ class SlackAlertsHandler(ChannelHandler):
             self.logger.debug("Attempting to send all alerts waiting in the "
                               "alerts queue ...")
 
+        if self.retry_scheduler is not None:
+            # Alerts which could not be sent wait for their retry without
+            # blocking the handler, and are sent by a timer if no other alert
+            # is received in the meantime.
+            self._schedule_send_alerts(self.retry_scheduler.send_alerts(
+                self.alerts_queue, self.slack_channel.alert))
+            return
+
         # Try sending the alerts in the alerts queue one by one. If sending
         # fails, try re-sending max_attempts - 1 times with 10 seconds sleep in
         # between. If this still fails, stop sending alerts until the next alert
@@ -4,7 +4,7 @@ from typing import List, Dict, Optional
 
 import pika.exceptions
 
-from src.channels_manager.apis.email_api import EmailApi
+from src.channels_manager.apis.email_api import EmailApi, SmtpConnectionPool
 from src.channels_manager.apis.opsgenie_api import OpsgenieApi
 from src.channels_manager.apis.pagerduty_api import PagerDutyApi
 from src.channels_manager.apis.slack_bot_api import SlackBotApi
@@ -126,7 +126,8 @@ def _initialise_telegram_alerts_handler(
 
             telegram_alerts_handler = TelegramAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                telegram_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                telegram_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                non_blocking_retries=env.CHANNEL_HANDLERS_NON_BLOCKING_RETRIES)
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -234,7 +235,8 @@ def _initialise_slack_alerts_handler(
 
             slack_alerts_handler = SlackAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                slack_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                slack_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                non_blocking_retries=env.CHANNEL_HANDLERS_NON_BLOCKING_RETRIES)
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -347,7 +349,8 @@ def _initialise_twilio_alerts_handler(
 
             twilio_alerts_handler = TwilioAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                twilio_channel, call_from, call_to, twiml, twiml_is_url)
+                twilio_channel, call_from, call_to, twiml, twiml_is_url,
+                non_blocking_retries=env.CHANNEL_HANDLERS_NON_BLOCKING_RETRIES)
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -394,7 +397,8 @@ def _initialise_pagerduty_alerts_handler(
 
             pagerduty_alerts_handler = PagerDutyAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                pagerduty_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                pagerduty_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                non_blocking_retries=env.CHANNEL_HANDLERS_NON_BLOCKING_RETRIES)
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -427,11 +431,18 @@ def _initialise_email_alerts_handler(
     # Try initialising handler until successful
     while True:
         try:
-            email_api = EmailApi(smtp, email_from, username, password, port)
+            connection_pool = None
+            if env.EMAIL_SMTP_CONNECTION_POOLING:
+                connection_pool = SmtpConnectionPool(
+                    smtp, port, username, password,
+                    idle_timeout=env.EMAIL_SMTP_IDLE_TIMEOUT_SECONDS)
+            email_api = EmailApi(smtp, email_from, username, password, port,
+                                 connection_pool)
 
             email_channel = EmailChannel(
                 channel_name, channel_id, handler_logger.getChild(
-                    EmailChannel.__name__), emails_to, email_api)
+                    EmailChannel.__name__), emails_to, email_api,
+                env.EMAIL_BATCH_RECIPIENTS)
 
             rabbitmq = RabbitMQApi(
                 logger=handler_logger.getChild(RabbitMQApi.__name__),
@@ -439,7 +450,8 @@ def _initialise_email_alerts_handler(
 
             email_alerts_handler = EmailAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq, email_channel,
-                env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                non_blocking_retries=env.CHANNEL_HANDLERS_NON_BLOCKING_RETRIES)
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
@@ -486,7 +498,8 @@ def _initialise_opsgenie_alerts_handler(
 
             opsgenie_alerts_handler = OpsgenieAlertsHandler(
                 handler_display_name, handler_logger, rabbitmq,
-                opsgenie_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+                opsgenie_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+                non_blocking_retries=env.CHANNEL_HANDLERS_NON_BLOCKING_RETRIES)
             log_and_print("Successfully initialised {}".format(
                 handler_display_name), handler_logger)
             break
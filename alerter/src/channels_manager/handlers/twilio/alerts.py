@@ -1,9 +1,9 @@
-import json
 import logging
 import sys
 from datetime import datetime
+from queue import Queue
 from types import FrameType
-from typing import List
+from typing import List, Optional
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -12,8 +12,11 @@ from src.alerter.alert_code import AlertCode
 from src.alerter.alerts.alert import Alert
 from src.alerter.grouped_alerts_metric_code import GroupedAlertsMetricCode
 from src.channels_manager.channels.twilio import TwilioChannel
+from src.channels_manager.handlers.alerts_retry_scheduler import (
+    AlertsRetryScheduler)
 from src.channels_manager.handlers.handler import ChannelHandler
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE, HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
     CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE,
@@ -23,12 +26,36 @@ from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
 
 
+class PendingCall:
+    """
+    A call to a number for an alert, which is made and re-tried if need be by
+    the retry scheduler of the Twilio alerts handler.
+    """
+
+    def __init__(self, alert: Alert, number: str) -> None:
+        self._alert = alert
+        self._number = number
+
+    @property
+    def alert(self) -> Alert:
+        return self._alert
+
+    @property
+    def number(self) -> str:
+        return self._number
+
+    @property
+    def timestamp(self) -> float:
+        return self.alert.timestamp
+
+
 class TwilioAlertsHandler(ChannelHandler):
     def __init__(self, handler_name: str, logger: logging.Logger,
                  rabbitmq: RabbitMQApi, twilio_channel: TwilioChannel,
                  call_from: str, call_to: List[str], twiml: str,
                  twiml_is_url: bool, max_attempts: int = 3,
-                 alert_validity_threshold: int = 300) -> None:
+                 alert_validity_threshold: int = 300,
+                 non_blocking_retries: bool = False) -> None:
         super().__init__(handler_name, logger, rabbitmq)
 
         self._twilio_channel = twilio_channel
@@ -38,6 +65,16 @@ class TwilioAlertsHandler(ChannelHandler):
         self._twiml_is_url = twiml_is_url
         self._max_attempts = max_attempts
         self._alert_validity_threshold = alert_validity_threshold
+        self._retry_scheduler = None
+        if non_blocking_retries:
+            self._retry_scheduler = AlertsRetryScheduler(
+                alert_validity_threshold, initial_retry_delay=5,
+                max_attempts=max_attempts)
+
+        # The calls waiting to be made by the retry scheduler. These are kept
+        # here rather than in connection timers, so that they are not lost if
+        # the connection with RabbitMQ is re-opened.
+        self._pending_calls = Queue()
         self._twilio_alerts_handler_queue = \
             CHAN_ALERTS_HAN_INPUT_QUEUE_NAME_TEMPLATE.format(
                 self.twilio_channel.channel_id)
@@ -49,8 +86,21 @@ class TwilioAlertsHandler(ChannelHandler):
     def twilio_channel(self) -> TwilioChannel:
         return self._twilio_channel
 
+    @property
+    def retry_scheduler(self) -> Optional[AlertsRetryScheduler]:
+        return self._retry_scheduler
+
+    @property
+    def pending_calls(self) -> Queue:
+        return self._pending_calls
+
     def _initialise_rabbitmq(self) -> None:
         self.rabbitmq.connect_till_successful()
+        # Timers do not survive a new connection, therefore the timer which
+        # re-tries the pending calls is re-armed.
+        self._reset_send_alerts_timer()
+        if not self.pending_calls.empty():
+            self._schedule_send_alerts(0)
 
         # Set consuming configuration
         self.logger.info("Creating '%s' exchange", ALERT_EXCHANGE)
@@ -91,7 +141,7 @@ class TwilioAlertsHandler(ChannelHandler):
     def _process_alert(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        alert_json = json.loads(body)
+        alert_json = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this alert.", alert_json)
 
         processing_error = False
@@ -148,6 +198,23 @@ class TwilioAlertsHandler(ChannelHandler):
                               "ago")
             return RequestStatus.FAILED
 
+        # If a retry scheduler is used, the calls are placed on the pending
+        # calls queue and made by the scheduler, which re-tries the failed
+        # calls with a timer so that the handler is not blocked in the
+        # meantime.
+        if self.retry_scheduler is not None:
+            for number in self._call_to:
+                self.pending_calls.put(PendingCall(alert, number))
+            self._send_alerts()
+            if self.pending_calls.empty():
+                self.logger.debug(
+                    "Successfully sent all calling requests to Twilio")
+                return RequestStatus.SUCCESS
+
+            self.logger.error("Could not succesfully send all calling requests "
+                              "to Twilio, these will be re-tried")
+            return RequestStatus.FAILED
+
         # For each number try calling max_attempts times with 5 seconds sleep in
         # between until the call is successful. If this threshold is reached,
         # we move on to the next number.
@@ -163,10 +230,9 @@ class TwilioAlertsHandler(ChannelHandler):
                                   "Attempts left: %s",
                                   self._max_attempts - attempts)
                 self.rabbitmq.connection.sleep(5)
-                ret = self.twilio_channel.alert(call_from=self._call_from,
-                                                call_to=number,
-                                                twiml=self._twiml,
-                                                twiml_is_url=self._twiml_is_url)
+                ret = self.twilio_channel.alert(
+                    call_from=self._call_from, call_to=number,
+                    twiml=self._twiml, twiml_is_url=self._twiml_is_url)
                 attempts += 1
 
             if ret == RequestStatus.FAILED:
@@ -181,6 +247,28 @@ class TwilioAlertsHandler(ChannelHandler):
 
         return calling_status
 
+    def _send_alerts(self) -> None:
+        """
+        Makes the pending calls whose attempt is due, and makes sure that the
+        rest are made by a timer once they are due. Calls which still fail
+        after max_attempts attempts, or whose alert was raised more than
+        alert_validity_threshold seconds ago, are dropped.
+        """
+        self._schedule_send_alerts(self.retry_scheduler.send_alerts(
+            self.pending_calls, self._make_pending_call))
+
+    def _make_pending_call(self, pending_call: PendingCall) -> RequestStatus:
+        ret = self.twilio_channel.alert(
+            call_from=self._call_from, call_to=pending_call.number,
+            twiml=self._twiml, twiml_is_url=self._twiml_is_url)
+        if ret == RequestStatus.SUCCESS:
+            self.logger.debug("Successfully sent calling request for %s to "
+                              "Twilio", pending_call.number)
+        else:
+            self.logger.error("Could not send calling request for %s to "
+                              "Twilio", pending_call.number)
+        return ret
+
     def start(self) -> None:
         self._initialise_rabbitmq()
         while True:
@@ -1,5 +1,4 @@
 import copy
-import json
 import logging
 import multiprocessing
 import sys
@@ -18,6 +17,7 @@ from src.channels_manager.handlers.starters import (
     start_log_alerts_handler, start_email_alerts_handler,
     start_pagerduty_alerts_handler, start_opsgenie_alerts_handler)
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils import env
 from src.utils.configs import (get_newly_added_configs, get_modified_configs,
                                get_removed_configs)
@@ -1064,7 +1064,7 @@ class ChannelsManager(PublisherSubscriberComponent):
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(properties, body)
 
         self.logger.debug("Received configs %s. Now processing.", sent_configs)
 
@@ -0,0 +1,92 @@
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils.types import convert_to_float, str_to_bool
+
+
+def _parse_bool(value: Any) -> bool:
+    return value is not None and str_to_bool(str(value))
+
+
+class AlertRule(dict):
+    """
+    A metric's alerts configuration, compiled once when the configuration is
+    received. It is still the raw configuration dict, but the enabled flags,
+    thresholds and time windows are also parsed into typed slots so that the
+    alerting factories do not parse the raw strings for every metric of every
+    message. Missing or malformed thresholds and time windows are None.
+    """
+    __slots__ = ('enabled', 'warning_enabled', 'warning_threshold',
+                 'warning_time_window', 'critical_enabled',
+                 'critical_threshold', 'critical_time_window',
+                 'critical_repeat_enabled', 'critical_repeat')
+
+    def __init__(self, config: Dict) -> None:
+        super().__init__(config)
+        self._compile()
+
+    # Every method which mutates the raw configuration re-compiles the rule,
+    # so that the typed slots never go stale.
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._compile()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._compile()
+
+    def __ior__(self, other: Dict) -> 'AlertRule':
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._compile()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        value = super().setdefault(key, default)
+        self._compile()
+        return value
+
+    def pop(self, key: str, *args) -> Any:
+        value = super().pop(key, *args)
+        self._compile()
+        return value
+
+    def popitem(self) -> Tuple[str, Any]:
+        item = super().popitem()
+        self._compile()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._compile()
+
+    def _compile(self) -> None:
+        self.enabled: bool = _parse_bool(self.get('enabled'))
+        self.warning_enabled: bool = _parse_bool(self.get('warning_enabled'))
+        self.warning_threshold: Optional[float] = convert_to_float(
+            self.get('warning_threshold'), None)
+        self.warning_time_window: Optional[float] = convert_to_float(
+            self.get('warning_time_window'), None)
+        self.critical_enabled: bool = _parse_bool(self.get('critical_enabled'))
+        self.critical_threshold: Optional[float] = convert_to_float(
+            self.get('critical_threshold'), None)
+        self.critical_time_window: Optional[float] = convert_to_float(
+            self.get('critical_time_window'), None)
+        self.critical_repeat_enabled: bool = _parse_bool(
+            self.get('critical_repeat_enabled'))
+        self.critical_repeat: Optional[float] = convert_to_float(
+            self.get('critical_repeat'), None)
+
+    @staticmethod
+    def compile(config: Dict) -> 'AlertRule':
+        """
+        :param config: A metric's alerts configuration
+        :return: The configuration itself if it was already compiled, otherwise
+               : the compiled configuration
+        """
+        if isinstance(config, AlertRule):
+            return config
+
+        return AlertRule(config)
@@ -5,6 +5,7 @@ from typing import Dict, Optional
 from src.configs.alerts.contract.chainlink import (
     ChainlinkContractAlertsConfig)
 from src.configs.alerts.node.chainlink import ChainlinkNodeAlertsConfig
+from src.configs.alerts.rule import AlertRule
 from src.configs.factory.configs_factory import ConfigsFactory
 from src.utils.exceptions import ParentIdsMissMatchInAlertsConfiguration
 from src.utils.types import ChainlinkAlertsConfigs
@@ -88,7 +89,7 @@ class ChainlinkNodeAlertsConfigsFactory(ChainlinkAlertsConfigsFactory):
                 "{}: add_new_config".format(self))
 
         filtered = {
-            config['name']: copy.deepcopy(config)
+            config['name']: AlertRule(copy.deepcopy(config))
             for config in sent_configs.values()
         }
 
@@ -130,7 +131,7 @@ class ChainlinkContractAlertsConfigsFactory(ChainlinkAlertsConfigsFactory):
                 "{}: add_new_config".format(self))
 
         filtered = {
-            config['name']: copy.deepcopy(config)
+            config['name']: AlertRule(copy.deepcopy(config))
             for config in sent_configs.values()
         }
 
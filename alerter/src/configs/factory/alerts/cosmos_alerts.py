@@ -4,6 +4,7 @@ from typing import Dict, Optional
 
 from src.configs.alerts.network.cosmos import CosmosNetworkAlertsConfig
 from src.configs.alerts.node.cosmos import CosmosNodeAlertsConfig
+from src.configs.alerts.rule import AlertRule
 from src.configs.factory.configs_factory import ConfigsFactory
 from src.utils.exceptions import ParentIdsMissMatchInAlertsConfiguration
 from src.utils.types import CosmosAlertsConfigs
@@ -94,7 +95,7 @@ class CosmosNodeAlertsConfigsFactory(CosmosAlertsConfigsFactory):
                 "{}: add_new_config".format(self))
 
         filtered = {
-            config['name']: copy.deepcopy(config)
+            config['name']: AlertRule(copy.deepcopy(config))
             for config in sent_configs.values()
         }
 
@@ -155,7 +156,7 @@ class CosmosNetworkAlertsConfigsFactory(CosmosAlertsConfigsFactory):
                 "{}: add_new_config".format(self))
 
         filtered = {
-            config['name']: copy.deepcopy(config)
+            config['name']: AlertRule(copy.deepcopy(config))
             for config in sent_configs.values()
         }
 
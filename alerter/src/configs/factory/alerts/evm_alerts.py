@@ -2,6 +2,7 @@ import copy
 from typing import Dict, Optional
 
 from src.configs.alerts.node.evm import EVMNodeAlertsConfig
+from src.configs.alerts.rule import AlertRule
 from src.configs.factory.configs_factory import ConfigsFactory
 from src.utils.exceptions import ParentIdsMissMatchInAlertsConfiguration
 
@@ -29,7 +30,7 @@ class EVMNodeAlertsConfigsFactory(ConfigsFactory):
                 "{}: add_new_config".format(self))
 
         filtered = {
-            config['name']: copy.deepcopy(config)
+            config['name']: AlertRule(copy.deepcopy(config))
             for config in sent_configs.values()
         }
 
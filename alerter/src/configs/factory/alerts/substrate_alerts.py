@@ -4,6 +4,7 @@ from typing import Dict, Optional
 
 from src.configs.alerts.network.substrate import SubstrateNetworkAlertsConfig
 from src.configs.alerts.node.substrate import SubstrateNodeAlertsConfig
+from src.configs.alerts.rule import AlertRule
 from src.configs.factory.configs_factory import ConfigsFactory
 from src.utils.exceptions import ParentIdsMissMatchInAlertsConfiguration
 from src.utils.types import SubstrateAlertsConfigs
@@ -94,7 +95,7 @@ class SubstrateNodeAlertsConfigsFactory(SubstrateAlertsConfigsFactory):
                 "{}: add_new_config".format(self))
 
         filtered = {
-            config['name']: copy.deepcopy(config)
+            config['name']: AlertRule(copy.deepcopy(config))
             for config in sent_configs.values()
         }
 
@@ -151,7 +152,7 @@ class SubstrateNetworkAlertsConfigsFactory(SubstrateAlertsConfigsFactory):
                 "{}: add_new_config".format(self))
 
         filtered = {
-            config['name']: copy.deepcopy(config)
+            config['name']: AlertRule(copy.deepcopy(config))
             for config in sent_configs.values()
         }
 
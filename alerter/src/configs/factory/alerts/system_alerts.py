@@ -2,6 +2,7 @@ import copy
 from typing import Optional, Dict
 
 from src.configs.alerts.system import SystemAlertsConfig
+from src.configs.alerts.rule import AlertRule
 from src.configs.factory.configs_factory import ConfigsFactory
 from src.utils.exceptions import ParentIdsMissMatchInAlertsConfiguration
 
@@ -28,7 +29,7 @@ class SystemAlertsConfigsFactory(ConfigsFactory):
                 "{}: add_new_config".format(self))
 
         filtered = {
-            config['name']: copy.deepcopy(config)
+            config['name']: AlertRule(copy.deepcopy(config))
             for config in sent_configs.values()
         }
 
@@ -1 +1,2 @@
 from src.data_store.mongo.mongo_api import MongoApi
+from src.data_store.mongo.mongo_write_buffer import MongoWriteBuffer
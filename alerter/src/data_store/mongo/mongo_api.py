@@ -1,10 +1,12 @@
 import logging
 from datetime import timedelta
-from typing import Dict, List, Mapping, Optional, Any
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Type
 
 from pymongo import MongoClient
 from pymongo.collection import CollectionChangeStream
-from pymongo.results import InsertOneResult, InsertManyResult, UpdateResult
+from pymongo.errors import BulkWriteError
+from pymongo.results import (BulkWriteResult, InsertOneResult,
+                             InsertManyResult, UpdateResult)
 
 from src.utils.timing import TimedTaskLimiter
 
@@ -101,16 +103,21 @@ class MongoApi:
         # If Mongo is not live and cannot check if it is live return true
         return not self._is_live and not self._live_check_limiter.can_do_task()
 
-    def _safe(self, function, args: List[Any], default_return: Any):
+    def _safe(self, function, args: List[Any], default_return: Any,
+              raised_errors: Tuple[Type[Exception], ...] = ()):
         # Calls the function with the provided arguments and performs exception
         # logging as well as returns a specified default if mongo is running
-        # into difficulties.
+        # into difficulties. The raised errors are errors of the operation
+        # itself rather than of mongo, so they are passed on to the caller.
         try:
             if self._do_not_use_if_recently_went_down():
                 return default_return
             ret = function(*args)
             self._set_as_live()
             return ret
+        except raised_errors:
+            self._set_as_live()
+            raise
         except Exception as e:
             self._logger.error("Mongo error in %s: %s", function.__name__, e)
             self._set_as_down()
@@ -140,6 +147,15 @@ class MongoApi:
             lambda col, q, doc: self._db[col].replace_one(q, doc, upsert=True),
             [collection, query, document], None)
 
+    def bulk_write(self, collection: str, operations: List) \
+            -> Optional[BulkWriteResult]:
+        # The operations are unordered, therefore if some of them fail the
+        # others are still applied. A BulkWriteError listing the failed
+        # operations is raised in that case.
+        return self._safe(
+            lambda col, ops: self._db[col].bulk_write(ops, ordered=False),
+            [collection, operations], None, (BulkWriteError,))
+
     def get_one(self, collection: str, query: Dict) -> Optional[Dict]:
         return self._safe(
             lambda col, q: self._db[col].find_one(q),
@@ -0,0 +1,166 @@
+import json
+import logging
+from datetime import timedelta
+from typing import Any, Dict, List, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from src.data_store.mongo.mongo_api import MongoApi
+from src.utils.timing import TimedTaskLimiter
+
+# The number of flushes in which an update may be rejected by Mongo before it
+# is dropped, so that it does not hold back the updates written after it
+MAX_UPDATE_WRITE_ATTEMPTS = 3
+
+
+class MongoWriteBuffer:
+    """
+    Buffers the upserts of a data store so that they are written to Mongo in
+    one bulk write per collection rather than one round trip per update.
+    Updates having the same collection and query (for example the time-based
+    document of a monitorable for the current hour) are merged into a single
+    update: `$push` values are pushed together using `$each`, `$inc` values are
+    summed, `$min` and `$max` keep the minimum and maximum respectively, and
+    for any other operator the last value is kept.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: timedelta,
+                 logger: logging.Logger) -> None:
+        self._batch_size = batch_size
+        self._flush_limiter = TimedTaskLimiter(flush_interval)
+        self._logger = logger
+
+        # The merged updates which still need to be written to Mongo, keyed by
+        # collection and serialized query. The original query is stored with
+        # the update as it is needed by the bulk write.
+        self._pending_updates: Dict[Tuple[str, str], Tuple[Dict, Dict]] = {}
+        # The number of updates merged into each pending update, and the
+        # number of times Mongo rejected each pending update
+        self._merged_counts: Dict[Tuple[str, str], int] = {}
+        self._failed_attempts: Dict[Tuple[str, str], int] = {}
+        self._size = 0
+
+    def __eq__(self, other: Any) -> bool:
+        return self.__dict__ == other.__dict__
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def flush_interval(self) -> timedelta:
+        return self._flush_limiter.time_interval
+
+    @property
+    def size(self) -> int:
+        """
+        :return: The number of buffered updates, counted before merging
+        """
+        return self._size
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def is_flush_due(self) -> bool:
+        return self._size >= self._batch_size \
+               or self._flush_limiter.can_do_task()
+
+    @staticmethod
+    def _merge_update(merged_update: Dict, document: Dict) -> None:
+        for operator, fields in document.items():
+            merged_fields = merged_update.setdefault(operator, {})
+            for field, value in fields.items():
+                if operator == '$push':
+                    values = value['$each'] \
+                        if isinstance(value, dict) and '$each' in value \
+                        else [value]
+                    merged_fields.setdefault(field, {'$each': []})[
+                        '$each'].extend(values)
+                elif field not in merged_fields:
+                    merged_fields[field] = value
+                elif operator == '$inc':
+                    merged_fields[field] += value
+                elif operator == '$min':
+                    merged_fields[field] = min(merged_fields[field], value)
+                elif operator == '$max':
+                    merged_fields[field] = max(merged_fields[field], value)
+                else:
+                    merged_fields[field] = value
+
+    def update_one(self, collection: str, query: Dict, document: Dict) \
+            -> None:
+        """
+        Buffers an upsert having the same semantics as MongoApi.update_one
+        """
+        key = (collection, json.dumps(query, sort_keys=True, default=str))
+        _, merged_update = self._pending_updates.setdefault(key, (query, {}))
+        self._merge_update(merged_update, document)
+        self._merged_counts[key] = self._merged_counts.get(key, 0) + 1
+        self._size += 1
+
+    def clear(self) -> None:
+        """
+        Discards the buffered updates without writing them.
+        """
+        self._pending_updates = {}
+        self._merged_counts = {}
+        self._failed_attempts = {}
+        self._size = 0
+
+    def _remove_update(self, key: Tuple[str, str]) -> None:
+        del self._pending_updates[key]
+        self._failed_attempts.pop(key, None)
+        self._size -= self._merged_counts.pop(key)
+
+    def _get_failed_keys(self, keys: List[Tuple[str, str]],
+                         error: BulkWriteError) -> List[Tuple[str, str]]:
+        failed_keys = []
+        for write_error in error.details['writeErrors']:
+            key = keys[write_error['index']]
+            self._failed_attempts[key] = self._failed_attempts.get(key, 0) + 1
+            if self._failed_attempts[key] < MAX_UPDATE_WRITE_ATTEMPTS:
+                failed_keys.append(key)
+                continue
+
+            query, update = self._pending_updates[key]
+            self._logger.error(
+                "Dropping the update %s of %s in %s, as Mongo rejected it %s "
+                "times: %s", update, query, key[0], MAX_UPDATE_WRITE_ATTEMPTS,
+                write_error['errmsg'])
+        return failed_keys
+
+    def flush(self, mongo: MongoApi) -> bool:
+        """
+        Writes the buffered updates to Mongo using one unordered bulk write per
+        collection. The updates of collections which could not be written are
+        kept in the buffer so that they are written by a later flush. If Mongo
+        rejects only some of the updates of a collection, the others are
+        applied, therefore only the rejected updates are kept. An update which
+        is rejected MAX_UPDATE_WRITE_ATTEMPTS times is dropped.
+        :param mongo: The MongoApi to write with
+        :return: True if all buffered updates were written, False otherwise
+        """
+        self._flush_limiter.did_task()
+
+        collections_keys: Dict[str, List[Tuple[str, str]]] = {}
+        for key in self._pending_updates.keys():
+            collections_keys.setdefault(key[0], []).append(key)
+
+        all_written = True
+        for collection, keys in collections_keys.items():
+            operations = [UpdateOne(*self._pending_updates[key], upsert=True)
+                          for key in keys]
+            try:
+                if mongo.bulk_write(collection, operations) is None:
+                    all_written = False
+                    continue
+                failed_keys = []
+            except BulkWriteError as e:
+                failed_keys = self._get_failed_keys(keys, e)
+                all_written = all_written and not failed_keys
+
+            for key in set(keys).difference(failed_keys):
+                self._remove_update(key)
+
+        return all_written
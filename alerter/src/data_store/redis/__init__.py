@@ -1,2 +1,3 @@
 from src.data_store.redis.redis_api import RedisApi
 from src.data_store.redis.store_keys import Keys
+from src.data_store.redis.redis_write_buffer import RedisWriteBuffer
@@ -1,4 +1,3 @@
-import distutils.util
 import logging
 from datetime import timedelta
 from typing import Dict, Optional, List, Any
@@ -119,6 +118,17 @@ class RedisApi:
         exec_ret = pipe.execute()
         return exec_ret
 
+    def hset_multiple_hashes_unsafe(
+            self, hash_key_values: Dict[str, Dict[str, RedisType]]):
+        # The fields of all hashes are set in a single pipeline
+        pipe = self._redis.pipeline(transaction=False)
+        for name, key_values in hash_key_values.items():
+            name = self._add_namespace(name)
+            for key, value in key_values.items():
+                pipe.hset(name, key, value if value is not None else 'None')
+        exec_ret = pipe.execute()
+        return exec_ret
+
     def set_for_unsafe(self, key: str, value: RedisType, time: timedelta):
         key = self._add_namespace(key)
 
@@ -139,77 +149,131 @@ class RedisApi:
         else:
             return time_to_live
 
+    @staticmethod
+    def _process_get_ret(get_ret: Optional[bytes],
+                         default: Optional[bytes]) -> Optional[bytes]:
+        # Missing keys are returned as nil, therefore a read needs no
+        # EXISTS/HEXISTS round trip. Values of None are stored as b'None'.
+        if get_ret is None:
+            return default
+        return None if get_ret == b'None' else get_ret
+
+    def _process_get_int_ret(self, get_ret: Optional[bytes], key: str,
+                             default: Optional[int]) -> Optional[int]:
+        if get_ret is None or get_ret == b'None':
+            return default
+        try:
+            return int(get_ret)
+        except ValueError:
+            self._logger.error("Could not convert value %s of key %s to an "
+                               "integer. Defaulting to value %s.", get_ret, key,
+                               default)
+            return default
+
+    @staticmethod
+    def _process_get_bool_ret(get_ret: Optional[bytes],
+                              default: Optional[bool]) -> Optional[bool]:
+        if get_ret == b'True':
+            return True
+        elif get_ret == b'False':
+            return False
+        return default
+
     def get_unsafe(self, key: str, default: Optional[bytes] = None) \
             -> Optional[bytes]:
         key = self._add_namespace(key)
-
-        if self.exists_unsafe(key):
-            get_ret = self._redis.get(key)
-            if get_ret.decode('UTF-8') == 'None':
-                return None
-            else:
-                return get_ret
-        else:
-            return default
+        return self._process_get_ret(self._redis.get(key), default)
 
     def hget_unsafe(self, name: str, key: str,
                     default: Optional[bytes] = None) -> Optional[bytes]:
         name = self._add_namespace(name)
-
-        if self.hexists_unsafe(name, key):
-            get_ret = self._redis.hget(name, key)
-            if get_ret.decode('UTF-8') == 'None':
-                return None
-            else:
-                return get_ret
-        else:
-            return default
+        return self._process_get_ret(self._redis.hget(name, key), default)
 
     def get_int_unsafe(self, key: str, default: Optional[int] = None) \
             -> Optional[int]:
         key = self._add_namespace(key)
-
-        get_ret = self.get_unsafe(key, None)
-        try:
-            return int(get_ret) if get_ret is not None else default
-        except ValueError:
-            self._logger.error("Could not convert value %s of key %s to an "
-                               "integer. Defaulting to value %s.", get_ret, key,
-                               default)
-            return default
+        return self._process_get_int_ret(self._redis.get(key), key, default)
 
     def hget_int_unsafe(self, name: str, key: str,
                         default: Optional[int] = None) -> Optional[int]:
         name = self._add_namespace(name)
-
-        get_ret = self.hget_unsafe(name, key, None)
-        try:
-            return int(get_ret) if get_ret is not None else default
-        except ValueError:
-            self._logger.error("Could not convert value %s of key %s to an "
-                               "integer. Defaulting to value %s.", get_ret, key,
-                               default)
-            return default
+        return self._process_get_int_ret(self._redis.hget(name, key), key,
+                                         default)
 
     def get_bool_unsafe(self, key: str, default: Optional[bool] = None) \
             -> Optional[bool]:
         key = self._add_namespace(key)
-        get_ret = self.get_unsafe(key, None)
-
-        if get_ret is not None and get_ret.decode() in ['True', 'False']:
-            return bool(distutils.util.strtobool(get_ret.decode()))
-
-        return default
+        return self._process_get_bool_ret(self._redis.get(key), default)
 
     def hget_bool_unsafe(self, name: str, key: str,
                          default: Optional[bool] = None) -> Optional[bool]:
         name = self._add_namespace(name)
-        get_ret = self.hget_unsafe(name, key, None)
-
-        if get_ret is not None and get_ret.decode() in ['True', 'False']:
-            return bool(distutils.util.strtobool(get_ret.decode()))
-
-        return default
+        return self._process_get_bool_ret(self._redis.hget(name, key), default)
+
+    def _mget_unsafe(self, keys: List[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        return self._redis.mget([self._add_namespace(k) for k in keys])
+
+    def _hmget_unsafe(self, name: str,
+                      keys: List[str]) -> List[Optional[bytes]]:
+        if not keys:
+            return []
+        return self._redis.hmget(self._add_namespace(name), keys)
+
+    def mget_unsafe(self, keys: List[str], default: Optional[bytes] = None) \
+            -> List[Optional[bytes]]:
+        return [self._process_get_ret(get_ret, default)
+                for get_ret in self._mget_unsafe(keys)]
+
+    def hmget_unsafe(self, name: str, keys: List[str],
+                     default: Optional[bytes] = None) -> List[Optional[bytes]]:
+        return [self._process_get_ret(get_ret, default)
+                for get_ret in self._hmget_unsafe(name, keys)]
+
+    def mget_int_unsafe(self, keys: List[str], default: Optional[int] = None) \
+            -> List[Optional[int]]:
+        return [self._process_get_int_ret(get_ret, key, default)
+                for key, get_ret in zip(keys, self._mget_unsafe(keys))]
+
+    def hmget_int_unsafe(self, name: str, keys: List[str],
+                         default: Optional[int] = None) -> List[Optional[int]]:
+        return [self._process_get_int_ret(get_ret, key, default)
+                for key, get_ret in zip(keys, self._hmget_unsafe(name, keys))]
+
+    def mget_bool_unsafe(self, keys: List[str],
+                         default: Optional[bool] = None) \
+            -> List[Optional[bool]]:
+        return [self._process_get_bool_ret(get_ret, default)
+                for get_ret in self._mget_unsafe(keys)]
+
+    def hmget_bool_unsafe(self, name: str, keys: List[str],
+                          default: Optional[bool] = None) \
+            -> List[Optional[bool]]:
+        return [self._process_get_bool_ret(get_ret, default)
+                for get_ret in self._hmget_unsafe(name, keys)]
+
+    def hmget_multiple_hashes_unsafe(
+            self, hash_keys: Dict[str, List[str]]) \
+            -> Dict[str, Dict[str, Optional[bytes]]]:
+        # One HMGET per hash, all sent in a single pipeline. Fields which do
+        # not exist are left out of the result so that callers can fall back
+        # to their own per-field defaults.
+        hash_keys = {name: list(keys) for name, keys in hash_keys.items()
+                     if keys}
+        pipe = self._redis.pipeline(transaction=False)
+        for name, keys in hash_keys.items():
+            pipe.hmget(self._add_namespace(name), keys)
+        exec_ret = pipe.execute() if hash_keys else []
+
+        hash_values = {}
+        for (name, keys), get_rets in zip(hash_keys.items(), exec_ret):
+            hash_values[name] = {
+                key: self._process_get_ret(get_ret, None)
+                for key, get_ret in zip(keys, get_rets)
+                if get_ret is not None
+            }
+        return hash_values
 
     def exists_unsafe(self, key: str) -> bool:
         key = self._add_namespace(key)
@@ -267,6 +331,11 @@ class RedisApi:
     def hset_multiple(self, name: str, key_values: Dict[str, RedisType]):
         return self._safe(self.hset_multiple_unsafe, [name, key_values], None)
 
+    def hset_multiple_hashes(
+            self, hash_key_values: Dict[str, Dict[str, RedisType]]):
+        return self._safe(self.hset_multiple_hashes_unsafe, [hash_key_values],
+                          None)
+
     def set_for(self, key: str, value: RedisType, time: timedelta):
         return self._safe(self.set_for_unsafe, [key, value, time], None)
 
@@ -295,6 +364,40 @@ class RedisApi:
             -> Optional[bool]:
         return self._safe(self.hget_bool_unsafe, [name, key, default], default)
 
+    def mget(self, keys: List[str], default: Optional[bytes] = None) \
+            -> List[Optional[bytes]]:
+        return self._safe(self.mget_unsafe, [keys, default],
+                          [default] * len(keys))
+
+    def hmget(self, name: str, keys: List[str],
+              default: Optional[bytes] = None) -> List[Optional[bytes]]:
+        return self._safe(self.hmget_unsafe, [name, keys, default],
+                          [default] * len(keys))
+
+    def mget_int(self, keys: List[str], default: Optional[int] = None) \
+            -> List[Optional[int]]:
+        return self._safe(self.mget_int_unsafe, [keys, default],
+                          [default] * len(keys))
+
+    def hmget_int(self, name: str, keys: List[str],
+                  default: Optional[int] = None) -> List[Optional[int]]:
+        return self._safe(self.hmget_int_unsafe, [name, keys, default],
+                          [default] * len(keys))
+
+    def mget_bool(self, keys: List[str], default: Optional[bool] = None) \
+            -> List[Optional[bool]]:
+        return self._safe(self.mget_bool_unsafe, [keys, default],
+                          [default] * len(keys))
+
+    def hmget_bool(self, name: str, keys: List[str],
+                   default: Optional[bool] = None) -> List[Optional[bool]]:
+        return self._safe(self.hmget_bool_unsafe, [name, keys, default],
+                          [default] * len(keys))
+
+    def hmget_multiple_hashes(self, hash_keys: Dict[str, List[str]]) \
+            -> Dict[str, Dict[str, Optional[bytes]]]:
+        return self._safe(self.hmget_multiple_hashes_unsafe, [hash_keys], {})
+
     def exists(self, key: str) -> bool:
         return self._safe(self.exists_unsafe, [key], False)
 
@@ -0,0 +1,80 @@
+from typing import Any, Dict
+
+from src.data_store.redis.redis_api import RedisApi
+from src.utils.types import RedisType
+
+
+class RedisWriteBuffer:
+    """
+    Buffers the hash writes of a data store so that the writes of a batch of
+    messages are sent to Redis in a single pipeline. Writes to the same field
+    of the same hash are merged, keeping the last value. If buffering is
+    disabled, writes are sent to Redis as soon as they are made.
+    """
+
+    def __init__(self, redis: RedisApi, buffered: bool) -> None:
+        self._redis = redis
+        self._buffered = buffered
+
+        # The hash fields which still need to be written to Redis, keyed by
+        # hash name
+        self._pending_hashes: Dict[str, Dict[str, RedisType]] = {}
+
+    def __eq__(self, other: Any) -> bool:
+        return self.__dict__ == other.__dict__
+
+    @property
+    def redis(self) -> RedisApi:
+        return self._redis
+
+    @property
+    def buffered(self) -> bool:
+        return self._buffered
+
+    @property
+    def size(self) -> int:
+        """
+        :return: The number of buffered hash fields
+        """
+        return sum(len(key_values)
+                   for key_values in self._pending_hashes.values())
+
+    def is_empty(self) -> bool:
+        return len(self._pending_hashes) == 0
+
+    def hset(self, name: str, key: str, value: RedisType) -> None:
+        if not self.buffered:
+            self.redis.hset(name, key, value)
+            return
+
+        self._pending_hashes.setdefault(name, {})[key] = value
+
+    def hset_multiple(self, name: str,
+                      key_values: Dict[str, RedisType]) -> None:
+        if not self.buffered:
+            self.redis.hset_multiple(name, key_values)
+            return
+
+        self._pending_hashes.setdefault(name, {}).update(key_values)
+
+    def flush(self) -> bool:
+        """
+        Writes the buffered hash fields to Redis in a single pipeline. If the
+        write fails, the fields are kept so that they are written by a later
+        flush.
+        :return: True if the buffered fields were written, False otherwise
+        """
+        if self.is_empty():
+            return True
+
+        if self.redis.hset_multiple_hashes(self._pending_hashes) is None:
+            return False
+
+        self._pending_hashes = {}
+        return True
+
+    def clear(self) -> None:
+        """
+        Discards the buffered hash fields without writing them.
+        """
+        self._pending_hashes = {}
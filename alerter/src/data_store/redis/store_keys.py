@@ -1,3 +1,6 @@
+import re
+from typing import Optional
+
 # Hashes
 _hash_parent = 'hash_p1'
 
@@ -60,6 +63,7 @@ _key_cosmos_node_last_monitored_tendermint_rpc = 'CosmosNode13'
 # CosmosNetworkX_<cosmos_network_id>
 _key_cosmos_network_proposals = 'CosmosNetwork1'
 _key_cosmos_network_last_monitored_cosmos_rest = 'CosmosNetwork2'
+_key_cosmos_network_monitored_proposals = 'CosmosNetwork3'
 
 # SubstrateNodeX_<substrate_node_id>
 _key_substrate_node_best_height = 'SubstrateNode1'
@@ -90,6 +94,7 @@ _key_substrate_network_active_proposals = 'SubstrateNetwork3'
 _key_substrate_network_referendum_count = 'SubstrateNetwork4'
 _key_substrate_network_referendums = 'SubstrateNetwork5'
 _key_substrate_network_last_monitored_websocket = 'SubstrateNetwork6'
+_key_substrate_network_monitored_referendums = 'SubstrateNetwork7'
 
 # ChainlinkContractX_<cl_node_id>_<contract_proxy_address>
 _key_cl_contract_version = 'ChainlinkContract1'
@@ -114,6 +119,7 @@ _key_dockerhub_last_monitored = 'dh2'
 
 # cX_<component_name>
 _key_component_heartbeat = 'c1'
+_key_component_alerting_state = 'c2'
 
 # chX_<parent_id>
 _key_chain_mute_alerts = 'ch1'
@@ -234,6 +240,13 @@ _key_alert_substrate_network_proposal_submitted = 'alert_substrate_network5'
 # alert_substrate_networkX_<referendum_id>
 _key_alert_substrate_network_referendum_info = 'alert_substrate_network6'
 
+# The alert keys of a monitorable which are suffixed by a further argument
+_keys_alert_with_argument = {
+    _key_alert_substrate_node_no_heartbeat_and_block_authored_yet,
+    _key_alert_substrate_node_offline, _key_alert_substrate_node_slashed,
+    _key_alert_substrate_node_payout_not_claimed,
+}
+
 
 class Keys:
 
@@ -241,6 +254,23 @@ class Keys:
     def _as_prefix(key: str) -> str:
         return key + '_'
 
+    @staticmethod
+    def get_alert_origin_id(alert_key: str) -> Optional[str]:
+        """
+        :param alert_key: The key of an alert metric, i.e.
+                        : alert_<type>X_<origin_id>[_<argument>]
+        :return: The id of the monitorable the alert metric is about, or None
+               : if the alert metric is not about a single monitorable
+        """
+        match = re.match(r'^(alert_[a-z_]+?[0-9]+)_(.+)$', alert_key)
+        if match is None:
+            return None
+
+        alert_key_index, origin_id = match.groups()
+        if alert_key_index in _keys_alert_with_argument:
+            origin_id = origin_id.rsplit('_', 1)[0]
+        return origin_id
+
     @staticmethod
     def get_hash_parent(parent_id: str) -> str:
         return Keys._as_prefix(_hash_parent) + parent_id
@@ -463,6 +493,11 @@ class Keys:
         return Keys._as_prefix(
             _key_cosmos_network_last_monitored_cosmos_rest) + parent_id
 
+    @staticmethod
+    def get_cosmos_network_monitored_proposals(parent_id: str) -> str:
+        return Keys._as_prefix(
+            _key_cosmos_network_monitored_proposals) + parent_id
+
     @staticmethod
     def get_substrate_node_went_down_at_websocket(
             substrate_node_id: str) -> str:
@@ -592,6 +627,11 @@ class Keys:
         return Keys._as_prefix(
             _key_substrate_network_last_monitored_websocket) + parent_id
 
+    @staticmethod
+    def get_substrate_network_monitored_referendums(parent_id: str) -> str:
+        return Keys._as_prefix(
+            _key_substrate_network_monitored_referendums) + parent_id
+
     @staticmethod
     def get_cl_contract_version(cl_node_id: str,
                                 contract_proxy_address: str) -> str:
@@ -680,6 +720,10 @@ class Keys:
     def get_component_heartbeat(component_name: str) -> str:
         return Keys._as_prefix(_key_component_heartbeat) + component_name
 
+    @staticmethod
+    def get_component_alerting_state(component_name: str) -> str:
+        return Keys._as_prefix(_key_component_alerting_state) + component_name
+
     @staticmethod
     def get_chain_mute_alerts() -> str:
         return _key_chain_mute_alerts
@@ -20,6 +20,7 @@ from src.alerter.alerters.system import SystemAlerter
 from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis.store_keys import Keys
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.data import EXPIRE_METRICS
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME, DB_USERNAME, DB_PASSWORD
@@ -27,6 +28,7 @@ from src.utils.constants.rabbitmq import (STORE_EXCHANGE, HEALTH_CHECK_EXCHANGE,
                                           ALERT_STORE_INPUT_QUEUE_NAME,
                                           ALERT_STORE_INPUT_ROUTING_KEY, TOPIC)
 from src.utils.exceptions import (MessageWasNotDeliveredException)
+from src.utils.partitioning import get_partition
 
 _LIST_OF_ALERTERS = [SystemAlerter.__name__,
                      ChainlinkNodeAlerter.__name__,
@@ -95,7 +97,7 @@ class AlertStore(Store):
         alerts will be stored in mongo, there isn't a need to store them in
         redis. If successful, a heartbeat will be sent.
         """
-        alert_data = json.loads(body)
+        alert_data = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.", alert_data)
 
         processing_error = False
@@ -112,6 +114,9 @@ class AlertStore(Store):
 
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
+        if processing_error:
+            self.heartbeat_batcher.record_failed()
+
         # Send a heartbeat only if there were no errors
         if not processing_error:
             try:
@@ -171,6 +176,24 @@ class AlertStore(Store):
                 }
             )
 
+    @staticmethod
+    def _alert_key_in_partition(alert_key: str, alert: Dict) -> bool:
+        """
+        When a partitioned alerter is reset, only the metrics of the
+        monitorables in its partition are reset, as the monitorables of the
+        other partitions are still being alerted on by the other partitions.
+        :param alert_key: The key of the alert metric
+        :param alert: The ComponentResetAlert
+        :return: True if the alert metric is reset by the alert, False
+               : otherwise
+        """
+        if alert.get('partition') is None:
+            return True
+
+        origin_id = Keys.get_alert_origin_id(alert_key)
+        return origin_id is not None and get_partition(
+            origin_id, alert['partitions']) == alert['partition']
+
     def _process_redis_store(self, alert: Dict) -> None:
         if alert['severity'] == Severity.INTERNAL.value:
             if (alert['alert_code']['code'] ==
@@ -260,7 +283,9 @@ class AlertStore(Store):
                                     ignore_metric = True
                                     break
                             # We only want to delete alert keys
-                            if redis_key_index in key and not ignore_metric:
+                            if (redis_key_index in key and
+                                    not ignore_metric and
+                                    self._alert_key_in_partition(key, alert)):
                                 self.redis.hremove(chain, key)
                 else:
                     self.logger.debug("Resetting %s metrics for chain %s.",
@@ -280,7 +305,8 @@ class AlertStore(Store):
                                 ignore_metric = True
                                 break
                         # We only want to delete alert keys
-                        if redis_key_index in key and not ignore_metric:
+                        if (redis_key_index in key and not ignore_metric and
+                                self._alert_key_in_partition(key, alert)):
                             self.redis.hremove(chain_hash, key)
         else:
             """
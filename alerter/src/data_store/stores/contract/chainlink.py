@@ -8,6 +8,7 @@ import pika
 from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis import Keys
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME, DB_USERNAME, DB_PASSWORD
 from src.utils.constants.rabbitmq import (
@@ -77,7 +78,7 @@ class ChainlinkContractStore(Store):
         saved in Mongo and Redis as required. If successful, a heartbeat will be
         sent.
         """
-        node_data = json.loads(body)
+        node_data = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.", node_data)
 
         processing_error = False
@@ -89,7 +90,10 @@ class ChainlinkContractStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_when_stored(method.delivery_tag)
+
+        if processing_error:
+            self.heartbeat_batcher.record_failed()
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -133,7 +137,7 @@ class ChainlinkContractStore(Store):
                 'withdrawablePayment'] if version == 3 \
                 else contract_data['owedPayment']
 
-            self.redis.hset_multiple(redis_hash, {
+            self.redis_write_buffer.hset_multiple(redis_hash, {
                 Keys.get_cl_contract_version(node_id, proxy_address):
                     str(contract_data['contractVersion']),
                 Keys.get_cl_contract_aggregator_address(
@@ -202,7 +206,7 @@ class ChainlinkContractStore(Store):
             payment_key = ('withdrawablePayment' if version == 3
                            else 'owedPayment')
 
-            self.mongo.update_one(
+            self.mongo_write_buffer.update_one(
                 parent_id,
                 {'doc_type': 'contract', 'd': time_now.hour},
                 {
@@ -7,6 +7,7 @@ import pika.exceptions
 
 from src.data_store.redis.store_keys import Keys
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.rabbitmq import (
     STORE_EXCHANGE, HEALTH_CHECK_EXCHANGE, DOCKERHUB_STORE_INPUT_QUEUE_NAME,
@@ -69,7 +70,7 @@ class DockerhubStore(Store):
         Processes the data being received, from the queue. This data will be
         stored in Redis as required. If successful, a heartbeat will be sent.
         """
-        dockerhub_data = json.loads(body)
+        dockerhub_data = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.",
                           dockerhub_data)
 
@@ -88,7 +89,10 @@ class DockerhubStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_when_stored(method.delivery_tag)
+
+        if processing_error:
+            self.heartbeat_batcher.record_failed()
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -129,9 +133,10 @@ class DockerhubStore(Store):
             str(meta_data['last_monitored'])
         )
 
-        self.redis.hset_multiple(Keys.get_hash_parent(parent_id), {
-            Keys.get_dockerhub_last_monitored(repo_id):
-                str(meta_data['last_monitored']),
-            Keys.get_dockerhub_last_tags(repo_id):
-                json.dumps(metrics['tags']),
-        })
+        self.redis_write_buffer.hset_multiple(
+            Keys.get_hash_parent(parent_id), {
+                Keys.get_dockerhub_last_monitored(repo_id):
+                    str(meta_data['last_monitored']),
+                Keys.get_dockerhub_last_tags(repo_id):
+                    json.dumps(metrics['tags']),
+            })
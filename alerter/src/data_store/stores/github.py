@@ -1,4 +1,3 @@
-import json
 import logging
 from datetime import datetime
 from typing import Dict
@@ -7,6 +6,7 @@ import pika.exceptions
 
 from src.data_store.redis.store_keys import Keys
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.rabbitmq import (STORE_EXCHANGE, HEALTH_CHECK_EXCHANGE,
                                           GITHUB_STORE_INPUT_QUEUE_NAME,
@@ -70,7 +70,7 @@ class GithubStore(Store):
         Processes the data being received, from the queue. This data will be
         stored in Redis as required. If successful, a heartbeat will be sent.
         """
-        github_data = json.loads(body)
+        github_data = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.", github_data)
 
         processing_error = False
@@ -88,7 +88,10 @@ class GithubStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_when_stored(method.delivery_tag)
+
+        if processing_error:
+            self.heartbeat_batcher.record_failed()
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -127,9 +130,10 @@ class GithubStore(Store):
             repo_name, metrics['no_of_releases'], meta_data['last_monitored']
         )
 
-        self.redis.hset_multiple(Keys.get_hash_parent(parent_id), {
-            Keys.get_github_no_of_releases(repo_id):
-                str(metrics['no_of_releases']),
-            Keys.get_github_last_monitored(repo_id):
-                str(meta_data['last_monitored']),
-        })
+        self.redis_write_buffer.hset_multiple(
+            Keys.get_hash_parent(parent_id), {
+                Keys.get_github_no_of_releases(repo_id):
+                    str(metrics['no_of_releases']),
+                Keys.get_github_last_monitored(repo_id):
+                    str(meta_data['last_monitored']),
+            })
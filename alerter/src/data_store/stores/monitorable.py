@@ -1,4 +1,3 @@
-import json
 import logging
 from copy import deepcopy
 from datetime import datetime
@@ -8,6 +7,7 @@ import pika.exceptions
 
 from src.data_store.mongo import MongoApi
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME, DB_USERNAME, DB_PASSWORD
 from src.utils.constants.monitorables import (
@@ -85,7 +85,7 @@ class MonitorableStore(Store):
         Processes the data being received, from the queue. This data will be
         stored in Mongo as required. If successful, a heartbeat will be sent.
         """
-        monitorable_data = json.loads(body)
+        monitorable_data = decode_message(properties, body)
 
         self.logger.debug("Received %s. Now processing this data.",
                           monitorable_data)
@@ -99,6 +99,9 @@ class MonitorableStore(Store):
 
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
+        if processing_error:
+            self.heartbeat_batcher.record_failed()
+
         # Send a heartbeat only if there were no errors
         if not processing_error:
             try:
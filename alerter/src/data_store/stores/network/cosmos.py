@@ -9,6 +9,7 @@ from src.data_store.mongo import MongoApi
 from src.data_store.redis import Keys
 from src.data_store.stores.store import Store
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME, DB_USERNAME, DB_PASSWORD
 from src.utils.constants.rabbitmq import (
     STORE_EXCHANGE, TOPIC, COSMOS_NETWORK_STORE_INPUT_QUEUE_NAME,
@@ -77,7 +78,7 @@ class CosmosNetworkStore(Store):
         saved in Mongo and Redis as required. If successful, a heartbeat will be
         sent.
         """
-        network_data = json.loads(body)
+        network_data = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.",
                           network_data)
 
@@ -90,7 +91,10 @@ class CosmosNetworkStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_when_stored(method.delivery_tag)
+
+        if processing_error:
+            self.heartbeat_batcher.record_failed()
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -127,7 +131,7 @@ class CosmosNetworkStore(Store):
             chain_name, meta_data['last_monitored'], metrics['proposals'],
         )
 
-        self.redis.hset_multiple(
+        self.redis_write_buffer.hset_multiple(
             Keys.get_hash_parent(parent_id),
             {
                 Keys.get_cosmos_network_last_monitored_cosmos_rest(
@@ -169,7 +173,7 @@ class CosmosNetworkStore(Store):
         meta_data = data['meta_data']
         parent_id = meta_data['parent_id']
         time_now = datetime.now()
-        self.mongo.update_one(
+        self.mongo_write_buffer.update_one(
             parent_id,
             {'doc_type': 'network', 'd': time_now.hour},
             {
@@ -9,6 +9,7 @@ from src.data_store.mongo import MongoApi
 from src.data_store.redis import Keys
 from src.data_store.stores.store import Store
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME, DB_USERNAME, DB_PASSWORD
 from src.utils.constants.rabbitmq import (
     STORE_EXCHANGE, TOPIC, SUBSTRATE_NETWORK_STORE_INPUT_QUEUE_NAME,
@@ -77,7 +78,7 @@ class SubstrateNetworkStore(Store):
         saved in Mongo and Redis as required. If successful, a heartbeat will be
         sent.
         """
-        network_data = json.loads(body)
+        network_data = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.",
                           network_data)
 
@@ -90,7 +91,10 @@ class SubstrateNetworkStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_when_stored(method.delivery_tag)
+
+        if processing_error:
+            self.heartbeat_batcher.record_failed()
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -131,7 +135,7 @@ class SubstrateNetworkStore(Store):
             metrics['referendum_count'], metrics['referendums']
         )
 
-        self.redis.hset_multiple(
+        self.redis_write_buffer.hset_multiple(
             Keys.get_hash_parent(parent_id),
             {
                 Keys.get_substrate_network_last_monitored_websocket(
@@ -182,7 +186,7 @@ class SubstrateNetworkStore(Store):
         parent_id = meta_data['parent_id']
         time_now = datetime.now()
 
-        self.mongo.update_one(
+        self.mongo_write_buffer.update_one(
             parent_id,
             {'doc_type': 'network', 'd': time_now.hour},
             {
@@ -8,6 +8,7 @@ import pika
 from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis import Keys
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME, DB_USERNAME, DB_PASSWORD
 from src.utils.constants.rabbitmq import (STORE_EXCHANGE, TOPIC,
@@ -78,7 +79,7 @@ class ChainlinkNodeStore(Store):
         saved in Mongo and Redis as required. If successful, a heartbeat will be
         sent.
         """
-        node_data = json.loads(body)
+        node_data = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.", node_data)
 
         processing_error = False
@@ -90,7 +91,10 @@ class ChainlinkNodeStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_when_stored(method.delivery_tag)
+
+        if processing_error:
+            self.heartbeat_batcher.record_failed()
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -141,35 +145,36 @@ class ChainlinkNodeStore(Store):
             meta_data['last_monitored'], meta_data['last_source_used'],
             metrics['went_down_at'])
 
-        self.redis.hset_multiple(Keys.get_hash_parent(parent_id), {
-            Keys.get_cl_node_went_down_at_prometheus(node_id): str(
-                metrics['went_down_at']),
-            Keys.get_cl_node_current_height(node_id):
-                str(metrics['current_height']),
-            Keys.get_cl_node_total_block_headers_received(node_id):
-                str(metrics['total_block_headers_received']),
-            Keys.get_cl_node_max_pending_tx_delay(node_id):
-                str(metrics['max_pending_tx_delay']),
-            Keys.get_cl_node_process_start_time_seconds(node_id):
-                str(metrics['process_start_time_seconds']),
-            Keys.get_cl_node_total_gas_bumps(node_id):
-                str(metrics['total_gas_bumps']),
-            Keys.get_cl_node_total_gas_bumps_exceeds_limit(node_id):
-                str(metrics['total_gas_bumps_exceeds_limit']),
-            Keys.get_cl_node_no_of_unconfirmed_txs(node_id):
-                str(metrics['no_of_unconfirmed_txs']),
-            Keys.get_cl_node_total_errored_job_runs(node_id):
-                str(metrics['total_errored_job_runs']),
-            Keys.get_cl_node_current_gas_price_info(node_id):
-                'None' if metrics['current_gas_price_info'] is None
-                else json.dumps(metrics['current_gas_price_info']),
-            Keys.get_cl_node_balance_info(node_id):
-                json.dumps(metrics['balance_info']),
-            Keys.get_cl_node_last_prometheus_source_used(node_id):
-                str(meta_data['last_source_used']),
-            Keys.get_cl_node_last_monitored_prometheus(node_id):
-                str(meta_data['last_monitored'])
-        })
+        self.redis_write_buffer.hset_multiple(
+            Keys.get_hash_parent(parent_id), {
+                Keys.get_cl_node_went_down_at_prometheus(node_id): str(
+                    metrics['went_down_at']),
+                Keys.get_cl_node_current_height(node_id):
+                    str(metrics['current_height']),
+                Keys.get_cl_node_total_block_headers_received(node_id):
+                    str(metrics['total_block_headers_received']),
+                Keys.get_cl_node_max_pending_tx_delay(node_id):
+                    str(metrics['max_pending_tx_delay']),
+                Keys.get_cl_node_process_start_time_seconds(node_id):
+                    str(metrics['process_start_time_seconds']),
+                Keys.get_cl_node_total_gas_bumps(node_id):
+                    str(metrics['total_gas_bumps']),
+                Keys.get_cl_node_total_gas_bumps_exceeds_limit(node_id):
+                    str(metrics['total_gas_bumps_exceeds_limit']),
+                Keys.get_cl_node_no_of_unconfirmed_txs(node_id):
+                    str(metrics['no_of_unconfirmed_txs']),
+                Keys.get_cl_node_total_errored_job_runs(node_id):
+                    str(metrics['total_errored_job_runs']),
+                Keys.get_cl_node_current_gas_price_info(node_id):
+                    'None' if metrics['current_gas_price_info'] is None
+                    else json.dumps(metrics['current_gas_price_info']),
+                Keys.get_cl_node_balance_info(node_id):
+                    json.dumps(metrics['balance_info']),
+                Keys.get_cl_node_last_prometheus_source_used(node_id):
+                    str(meta_data['last_source_used']),
+                Keys.get_cl_node_last_monitored_prometheus(node_id):
+                    str(meta_data['last_monitored'])
+            })
 
     def _process_redis_prometheus_error_store(self, data: Dict) -> None:
         meta_data = data['meta_data']
@@ -187,19 +192,20 @@ class ChainlinkNodeStore(Store):
                 metrics['went_down_at'], meta_data['last_source_used']
             )
 
-            self.redis.hset_multiple(Keys.get_hash_parent(parent_id), {
-                Keys.get_cl_node_went_down_at_prometheus(node_id): str(
-                    metrics['went_down_at']),
-                Keys.get_cl_node_last_prometheus_source_used(node_id):
-                    str(meta_data['last_source_used']),
-            })
+            self.redis_write_buffer.hset_multiple(
+                Keys.get_hash_parent(parent_id), {
+                    Keys.get_cl_node_went_down_at_prometheus(node_id): str(
+                        metrics['went_down_at']),
+                    Keys.get_cl_node_last_prometheus_source_used(node_id):
+                        str(meta_data['last_source_used']),
+                })
         else:
             self.logger.debug(
                 "Saving %s state: _last_prometheus_source_used=%s", node_name,
                 meta_data['last_source_used']
             )
 
-            self.redis.hset(
+            self.redis_write_buffer.hset(
                 Keys.get_hash_parent(parent_id),
                 Keys.get_cl_node_last_prometheus_source_used(node_id),
                 str(meta_data['last_source_used']),
@@ -237,7 +243,7 @@ class ChainlinkNodeStore(Store):
         parent_id = meta_data['node_parent_id']
         metrics = data['data']
         time_now = datetime.now()
-        self.mongo.update_one(
+        self.mongo_write_buffer.update_one(
             parent_id,
             {'doc_type': 'node', 'd': time_now.hour},
             {
@@ -300,7 +306,7 @@ class ChainlinkNodeStore(Store):
 
         if error_code == downtime_exception.code:
             metrics = data['data']
-            self.mongo.update_one(
+            self.mongo_write_buffer.update_one(
                 parent_id,
                 {'doc_type': 'node', 'd': time_now.hour},
                 {
@@ -317,7 +323,7 @@ class ChainlinkNodeStore(Store):
                 }
             )
         else:
-            self.mongo.update_one(
+            self.mongo_write_buffer.update_one(
                 parent_id,
                 {'doc_type': 'node', 'd': time_now.hour},
                 {
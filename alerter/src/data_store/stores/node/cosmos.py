@@ -8,6 +8,7 @@ import pika
 from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis import Keys
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME, DB_USERNAME, DB_PASSWORD
 from src.utils.constants.rabbitmq import (
@@ -77,7 +78,7 @@ class CosmosNodeStore(Store):
         saved in Mongo and Redis as required. If successful, a heartbeat will be
         sent.
         """
-        node_data = json.loads(body)
+        node_data = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.", node_data)
 
         processing_error = False
@@ -89,7 +90,10 @@ class CosmosNodeStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_when_stored(method.delivery_tag)
+
+        if processing_error:
+            self.heartbeat_batcher.record_failed()
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -139,7 +143,7 @@ class CosmosNodeStore(Store):
             meta_data['last_monitored']
         )
 
-        self.redis.hset_multiple(
+        self.redis_write_buffer.hset_multiple(
             Keys.get_hash_parent(parent_id),
             {
                 Keys.get_cosmos_node_went_down_at_prometheus(
@@ -167,10 +171,11 @@ class CosmosNodeStore(Store):
                 node_name, metrics['went_down_at']
             )
 
-            self.redis.hset_multiple(Keys.get_hash_parent(parent_id), {
-                Keys.get_cosmos_node_went_down_at_prometheus(node_id):
-                    str(metrics['went_down_at']),
-            })
+            self.redis_write_buffer.hset_multiple(
+                Keys.get_hash_parent(parent_id), {
+                    Keys.get_cosmos_node_went_down_at_prometheus(node_id):
+                        str(metrics['went_down_at']),
+                })
 
     def _process_redis_cosmos_rest_result_store(self, data: Dict) -> None:
         meta_data = data['meta_data']
@@ -186,7 +191,7 @@ class CosmosNodeStore(Store):
             meta_data['last_monitored']
         )
 
-        self.redis.hset_multiple(
+        self.redis_write_buffer.hset_multiple(
             Keys.get_hash_parent(parent_id),
             {
                 Keys.get_cosmos_node_went_down_at_cosmos_rest(
@@ -214,10 +219,11 @@ class CosmosNodeStore(Store):
                 node_name, metrics['went_down_at']
             )
 
-            self.redis.hset_multiple(Keys.get_hash_parent(parent_id), {
-                Keys.get_cosmos_node_went_down_at_cosmos_rest(node_id):
-                    str(metrics['went_down_at']),
-            })
+            self.redis_write_buffer.hset_multiple(
+                Keys.get_hash_parent(parent_id), {
+                    Keys.get_cosmos_node_went_down_at_cosmos_rest(node_id):
+                        str(metrics['went_down_at']),
+                })
 
     def _process_redis_tendermint_rpc_error_store(self, data: Dict) -> None:
         meta_data = data['meta_data']
@@ -234,10 +240,11 @@ class CosmosNodeStore(Store):
                 node_name, metrics['went_down_at']
             )
 
-            self.redis.hset_multiple(Keys.get_hash_parent(parent_id), {
-                Keys.get_cosmos_node_went_down_at_tendermint_rpc(node_id):
-                    str(metrics['went_down_at']),
-            })
+            self.redis_write_buffer.hset_multiple(
+                Keys.get_hash_parent(parent_id), {
+                    Keys.get_cosmos_node_went_down_at_tendermint_rpc(node_id):
+                        str(metrics['went_down_at']),
+                })
 
     def _process_redis_tendermint_rpc_result_store(self, data: Dict) -> None:
         meta_data = data['meta_data']
@@ -255,7 +262,7 @@ class CosmosNodeStore(Store):
             meta_data['last_monitored'],
         )
 
-        self.redis.hset_multiple(
+        self.redis_write_buffer.hset_multiple(
             Keys.get_hash_parent(parent_id),
             {
                 Keys.get_cosmos_node_went_down_at_tendermint_rpc(
@@ -311,7 +318,7 @@ class CosmosNodeStore(Store):
         parent_id = meta_data['node_parent_id']
         metrics = data['data']
         time_now = datetime.now()
-        self.mongo.update_one(
+        self.mongo_write_buffer.update_one(
             parent_id,
             {'doc_type': 'node', 'd': time_now.hour},
             {
@@ -355,7 +362,7 @@ class CosmosNodeStore(Store):
 
         if error_code == downtime_exception.code:
             metrics = data['data']
-            self.mongo.update_one(
+            self.mongo_write_buffer.update_one(
                 parent_id,
                 {'doc_type': 'node', 'd': time_now.hour},
                 {
@@ -393,7 +400,7 @@ class CosmosNodeStore(Store):
         parent_id = meta_data['node_parent_id']
         metrics = data['data']
         time_now = datetime.now()
-        self.mongo.update_one(
+        self.mongo_write_buffer.update_one(
             parent_id,
             {'doc_type': 'node', 'd': time_now.hour},
             {
@@ -439,7 +446,7 @@ class CosmosNodeStore(Store):
 
         if error_code == downtime_exception.code:
             metrics = data['data']
-            self.mongo.update_one(
+            self.mongo_write_buffer.update_one(
                 parent_id,
                 {'doc_type': 'node', 'd': time_now.hour},
                 {
@@ -477,7 +484,7 @@ class CosmosNodeStore(Store):
         parent_id = meta_data['node_parent_id']
         metrics = data['data']
         time_now = datetime.now()
-        self.mongo.update_one(
+        self.mongo_write_buffer.update_one(
             parent_id,
             {'doc_type': 'node', 'd': time_now.hour},
             {
@@ -522,7 +529,7 @@ class CosmosNodeStore(Store):
 
         if error_code == downtime_exception.code:
             metrics = data['data']
-            self.mongo.update_one(
+            self.mongo_write_buffer.update_one(
                 parent_id,
                 {'doc_type': 'node', 'd': time_now.hour},
                 {
@@ -1,4 +1,3 @@
-import json
 import logging
 from datetime import datetime
 from typing import Dict
@@ -8,6 +7,7 @@ import pika
 from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis import Keys
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME, DB_USERNAME, DB_PASSWORD
 from src.utils.constants.rabbitmq import (STORE_EXCHANGE, TOPIC,
@@ -78,7 +78,7 @@ class EVMNodeStore(Store):
         saved in Mongo and Redis as required. If successful, a heartbeat will be
         sent.
         """
-        node_data = json.loads(body)
+        node_data = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.", node_data)
 
         processing_error = False
@@ -90,7 +90,10 @@ class EVMNodeStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_when_stored(method.delivery_tag)
+
+        if processing_error:
+            self.heartbeat_batcher.record_failed()
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -129,16 +132,17 @@ class EVMNodeStore(Store):
             metrics['current_height'], metrics['syncing'],
             meta_data['last_monitored'], metrics['went_down_at'])
 
-        self.redis.hset_multiple(Keys.get_hash_parent(parent_id), {
-            Keys.get_evm_node_current_height(node_id):
-                str(metrics['current_height']),
-            Keys.get_evm_node_syncing(node_id):
-                str(metrics['syncing']),
-            Keys.get_evm_node_went_down_at(node_id): str(
-                metrics['went_down_at']),
-            Keys.get_evm_node_last_monitored(node_id):
-                str(meta_data['last_monitored'])
-        })
+        self.redis_write_buffer.hset_multiple(
+            Keys.get_hash_parent(parent_id), {
+                Keys.get_evm_node_current_height(node_id):
+                    str(metrics['current_height']),
+                Keys.get_evm_node_syncing(node_id):
+                    str(metrics['syncing']),
+                Keys.get_evm_node_went_down_at(node_id): str(
+                    metrics['went_down_at']),
+                Keys.get_evm_node_last_monitored(node_id):
+                    str(meta_data['last_monitored'])
+            })
 
     def _process_redis_error_store(self, data: Dict) -> None:
         meta_data = data['meta_data']
@@ -155,7 +159,7 @@ class EVMNodeStore(Store):
                 metrics['went_down_at']
             )
 
-            self.redis.hset(
+            self.redis_write_buffer.hset(
                 Keys.get_hash_parent(parent_id),
                 Keys.get_evm_node_went_down_at(node_id),
                 str(metrics['went_down_at'])
@@ -193,7 +197,7 @@ class EVMNodeStore(Store):
         parent_id = meta_data['node_parent_id']
         metrics = data['data']
         time_now = datetime.now()
-        self.mongo.update_one(
+        self.mongo_write_buffer.update_one(
             parent_id,
             {'doc_type': 'node', 'd': time_now.hour},
             {
@@ -237,7 +241,7 @@ class EVMNodeStore(Store):
 
         if error_code == downtime_exception.code:
             metrics = data['data']
-            self.mongo.update_one(
+            self.mongo_write_buffer.update_one(
                 parent_id,
                 {'doc_type': 'node', 'd': time_now.hour},
                 {
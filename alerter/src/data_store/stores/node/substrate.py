@@ -9,6 +9,7 @@ from src.data_store.mongo import MongoApi
 from src.data_store.redis import Keys
 from src.data_store.stores.store import Store
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME, DB_USERNAME, DB_PASSWORD
 from src.utils.constants.rabbitmq import (
     STORE_EXCHANGE, HEALTH_CHECK_EXCHANGE, TOPIC,
@@ -80,7 +81,7 @@ class SubstrateNodeStore(Store):
         saved in Mongo and Redis as required. If successful, a heartbeat will be
         sent.
         """
-        node_data = json.loads(body)
+        node_data = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.", node_data)
 
         processing_error = False
@@ -92,7 +93,10 @@ class SubstrateNodeStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_when_stored(method.delivery_tag)
+
+        if processing_error:
+            self.heartbeat_batcher.record_failed()
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -147,7 +151,7 @@ class SubstrateNodeStore(Store):
             meta_data['token_symbol'],
         )
 
-        self.redis.hset_multiple(
+        self.redis_write_buffer.hset_multiple(
             Keys.get_hash_parent(parent_id),
             {
                 Keys.get_substrate_node_went_down_at_websocket(
@@ -207,10 +211,11 @@ class SubstrateNodeStore(Store):
                 node_name, metrics['went_down_at']
             )
 
-            self.redis.hset_multiple(Keys.get_hash_parent(parent_id), {
-                Keys.get_substrate_node_went_down_at_websocket(node_id):
-                    str(metrics['went_down_at']),
-            })
+            self.redis_write_buffer.hset_multiple(
+                Keys.get_hash_parent(parent_id), {
+                    Keys.get_substrate_node_went_down_at_websocket(node_id):
+                        str(metrics['went_down_at']),
+                })
 
     def _process_mongo_store(self, data: Dict) -> None:
         configuration = {
@@ -244,7 +249,7 @@ class SubstrateNodeStore(Store):
         parent_id = meta_data['node_parent_id']
         metrics = data['data']
         time_now = datetime.now()
-        self.mongo.update_one(
+        self.mongo_write_buffer.update_one(
             parent_id,
             {'doc_type': 'node', 'd': time_now.hour},
             {
@@ -303,7 +308,7 @@ class SubstrateNodeStore(Store):
 
         if error_code == downtime_exception.code:
             metrics = data['data']
-            self.mongo.update_one(
+            self.mongo_write_buffer.update_one(
                 parent_id,
                 {'doc_type': 'node', 'd': time_now.hour},
                 {
@@ -1,6 +1,7 @@
 import logging
 import sys
 from abc import abstractmethod
+from datetime import timedelta
 from types import FrameType
 
 import pika
@@ -8,11 +9,12 @@ import pika.exceptions
 
 from src.abstract.publisher_subscriber import PublisherSubscriberComponent
 from src.data_store.mongo.mongo_api import MongoApi
+from src.data_store.mongo.mongo_write_buffer import MongoWriteBuffer
 from src.data_store.redis.redis_api import RedisApi
+from src.data_store.redis.redis_write_buffer import RedisWriteBuffer
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils import env
-from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
-                                          HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
+from src.utils.heartbeat import HeartbeatBatcher
 from src.utils.logging import log_and_print
 
 
@@ -21,9 +23,32 @@ class Store(PublisherSubscriberComponent):
                  rabbitmq: RabbitMQApi) -> None:
         super().__init__(logger, rabbitmq)
         self._name = name        
+        self._heartbeat_batcher = HeartbeatBatcher(
+            timedelta(seconds=env.WORKER_HEARTBEAT_INTERVAL_SECONDS))
         self._mongo_db = env.DB_NAME
         self._mongo_port = env.DB_PORT
 
+        # Mongo updates are written in bulk by the stores which use the write
+        # buffer. The deliveries whose updates are still in the buffer are
+        # acknowledged only once the buffer is written to Mongo.
+        self._mongo_write_buffer = MongoWriteBuffer(
+            env.STORE_MONGO_BATCH_SIZE,
+            timedelta(seconds=env.STORE_MONGO_FLUSH_INTERVAL_SECONDS),
+            self._logger.getChild(MongoWriteBuffer.__name__))
+        self._unacked_delivery_tags = []
+        self._flush_scheduled = False
+
+        # In batch-consume mode deliveries are acknowledged in batches of
+        # STORE_CONSUME_BATCH_SIZE with a single multiple ack, and the Redis
+        # and Mongo writes of a batch are only sent when the batch is complete
+        # or STORE_CONSUME_BATCH_TIMEOUT_MS has elapsed since it was started.
+        self._consume_batch_size = env.STORE_CONSUME_BATCH_SIZE
+        if self.is_batch_consuming():
+            self._write_flush_interval = \
+                env.STORE_CONSUME_BATCH_TIMEOUT_MS / 1000
+        else:
+            self._write_flush_interval = env.STORE_MONGO_FLUSH_INTERVAL_SECONDS
+
         redis_ip = env.REDIS_IP
         redis_db = env.REDIS_DB
         redis_port = env.REDIS_PORT
@@ -33,6 +58,8 @@ class Store(PublisherSubscriberComponent):
         self._redis = RedisApi(logger=self._logger.getChild(RedisApi.__name__),
                                db=redis_db, host=redis_ip, port=redis_port,
                                namespace=unique_alerter_identifier)
+        self._redis_write_buffer = RedisWriteBuffer(self._redis,
+                                                    self.is_batch_consuming())
 
     def __str__(self) -> str:
         return self.name
@@ -57,6 +84,99 @@ class Store(PublisherSubscriberComponent):
     def mongo(self) -> MongoApi:
         return self._mongo
 
+    @property
+    def heartbeat_batcher(self) -> HeartbeatBatcher:
+        return self._heartbeat_batcher
+
+    @property
+    def mongo_write_buffer(self) -> MongoWriteBuffer:
+        return self._mongo_write_buffer
+
+    @property
+    def redis_write_buffer(self) -> RedisWriteBuffer:
+        return self._redis_write_buffer
+
+    @property
+    def consume_batch_size(self) -> int:
+        return self._consume_batch_size
+
+    def is_batch_consuming(self) -> bool:
+        return self.consume_batch_size > 1
+
+    def _flush_write_buffers(self) -> None:
+        # The writes which were not sent are kept in the buffers, and their
+        # deliveries are left unacknowledged until they are written.
+        if not self.redis_write_buffer.is_empty():
+            self.logger.debug("Writing %s buffered fields to Redis",
+                              self.redis_write_buffer.size)
+            if not self.redis_write_buffer.flush():
+                self.logger.error("Could not write %s buffered fields to "
+                                  "Redis. Keeping them so that they can be "
+                                  "written later.",
+                                  self.redis_write_buffer.size)
+                return
+
+        if not self.mongo_write_buffer.is_empty():
+            self.logger.debug("Writing %s buffered updates to Mongo",
+                              self.mongo_write_buffer.size)
+            if not self.mongo_write_buffer.flush(self.mongo):
+                self.logger.error("Could not write %s buffered updates to "
+                                  "Mongo. Keeping them so that they can be "
+                                  "written later.",
+                                  self.mongo_write_buffer.size)
+                return
+
+        # Delivery tags increase on a channel, therefore acknowledging the
+        # last tag with multiple=True acknowledges the whole batch.
+        if len(self._unacked_delivery_tags) != 0:
+            self.rabbitmq.basic_ack(self._unacked_delivery_tags[-1], True)
+            self._unacked_delivery_tags.clear()
+
+    def _schedule_write_flush(self) -> None:
+        if not self._flush_scheduled:
+            self.rabbitmq.connection.call_later(
+                self._write_flush_interval, self._flush_write_buffers_if_any)
+            self._flush_scheduled = True
+
+    def _flush_write_buffers_if_any(self) -> None:
+        self._flush_scheduled = False
+        if len(self._unacked_delivery_tags) != 0:
+            self._flush_write_buffers()
+
+        # If the writes could not be sent, try again later even if no other
+        # message is received.
+        if len(self._unacked_delivery_tags) != 0:
+            self._schedule_write_flush()
+
+    def _is_write_flush_due(self) -> bool:
+        if self.is_batch_consuming():
+            return len(self._unacked_delivery_tags) >= self.consume_batch_size
+
+        return self.mongo_write_buffer.is_flush_due()
+
+    def _ack_when_stored(self, delivery_tag: int) -> None:
+        """
+        Acknowledges a delivery once the writes buffered for it are sent. If
+        nothing is buffered and no delivery is waiting to be acknowledged, the
+        delivery is acknowledged immediately.
+        :param delivery_tag: The delivery tag of the processed message
+        """
+        if self.redis_write_buffer.is_empty() \
+                and self.mongo_write_buffer.is_empty() \
+                and len(self._unacked_delivery_tags) == 0:
+            self.rabbitmq.basic_ack(delivery_tag, False)
+            return
+
+        self._unacked_delivery_tags.append(delivery_tag)
+
+        # Send the writes if the batch is complete. Otherwise, or if they could
+        # not be sent, make sure that they are sent even if no other message
+        # is received.
+        if self._is_write_flush_due():
+            self._flush_write_buffers()
+        if len(self._unacked_delivery_tags) != 0:
+            self._schedule_write_flush()
+
     def _process_redis_store(self, *args) -> None:
         pass
 
@@ -72,16 +192,26 @@ class Store(PublisherSubscriberComponent):
         pass
 
     def _send_heartbeat(self, data_to_send: dict) -> None:
-        self.rabbitmq.basic_publish_confirm(
-            exchange=HEALTH_CHECK_EXCHANGE,
-            routing_key=HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, body=data_to_send,
-            is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
-            mandatory=True)
-        self.logger.debug("Sent heartbeat to '%s' exchange",
-                          HEALTH_CHECK_EXCHANGE)
+        self.heartbeat_batcher.send(self.rabbitmq, data_to_send, self.logger)
+
+    def _reset_write_batch(self) -> None:
+        # The deliveries which were not acknowledged on the previous channel
+        # are redelivered, therefore their writes are discarded so that they
+        # are not applied twice, and their tags are not acknowledged on the
+        # new channel. Timers do not survive a new connection either.
+        self._unacked_delivery_tags = []
+        self._flush_scheduled = False
+        self.redis_write_buffer.clear()
+        self.mongo_write_buffer.clear()
 
     def start(self) -> None:
+        # Start is called again to re-initialise RabbitMQ after a connection
+        # or channel error
+        self._reset_write_batch()
         self._initialise_rabbitmq()
+        if self.is_batch_consuming():
+            # Prefetch the next batch while the current one is being written
+            self.rabbitmq.basic_qos(prefetch_count=2 * self.consume_batch_size)
         while True:
             try:
                 self._listen_for_data()
@@ -99,6 +229,8 @@ class Store(PublisherSubscriberComponent):
         log_and_print("{} is terminating. Connections with RabbitMQ will be "
                       "closed, and afterwards the process will exit."
                       .format(self), self.logger)
+        if len(self._unacked_delivery_tags) != 0:
+            self._flush_write_buffers()
         self.disconnect_from_rabbit()
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
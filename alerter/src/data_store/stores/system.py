@@ -1,4 +1,3 @@
-import json
 import logging
 from datetime import datetime
 from typing import Dict
@@ -8,6 +7,7 @@ import pika.exceptions
 from src.data_store.mongo.mongo_api import MongoApi
 from src.data_store.redis.store_keys import Keys
 from src.data_store.stores.store import Store
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
 from src.utils.constants.mongo import REPLICA_SET_HOSTS, REPLICA_SET_NAME, DB_USERNAME, DB_PASSWORD
 from src.utils.constants.rabbitmq import (STORE_EXCHANGE, HEALTH_CHECK_EXCHANGE,
@@ -77,7 +77,7 @@ class SystemStore(Store):
         saved in Mongo and Redis as required. If successful, a heartbeat will be
         sent.
         """
-        system_data = json.loads(body)
+        system_data = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.", system_data)
 
         processing_error = False
@@ -96,7 +96,10 @@ class SystemStore(Store):
             self.logger.exception(e)
             processing_error = True
 
-        self.rabbitmq.basic_ack(method.delivery_tag, False)
+        self._ack_when_stored(method.delivery_tag)
+
+        if processing_error:
+            self.heartbeat_batcher.record_failed()
 
         # Send a heartbeat only if there were no errors
         if not processing_error:
@@ -154,38 +157,39 @@ class SystemStore(Store):
             metrics['went_down_at'], meta_data['last_monitored']
         )
 
-        self.redis.hset_multiple(Keys.get_hash_parent(parent_id), {
-            Keys.get_system_process_cpu_seconds_total(system_id):
-                str(metrics['process_cpu_seconds_total']),
-            Keys.get_system_process_memory_usage(system_id):
-                str(metrics['process_memory_usage']),
-            Keys.get_system_virtual_memory_usage(system_id):
-                str(metrics['virtual_memory_usage']),
-            Keys.get_system_open_file_descriptors(system_id):
-                str(metrics['open_file_descriptors']),
-            Keys.get_system_system_cpu_usage(system_id):
-                str(metrics['system_cpu_usage']),
-            Keys.get_system_system_ram_usage(system_id):
-                str(metrics['system_ram_usage']),
-            Keys.get_system_system_storage_usage(system_id):
-                str(metrics['system_storage_usage']),
-            Keys.get_system_network_transmit_bytes_per_second(system_id):
-                str(metrics['network_transmit_bytes_per_second']),
-            Keys.get_system_network_receive_bytes_per_second(system_id):
-                str(metrics['network_receive_bytes_per_second']),
-            Keys.get_system_network_receive_bytes_total(system_id):
-                str(metrics['network_receive_bytes_total']),
-            Keys.get_system_network_transmit_bytes_total(system_id):
-                str(metrics['network_transmit_bytes_total']),
-            Keys.get_system_disk_io_time_seconds_total(system_id):
-                str(metrics['disk_io_time_seconds_total']),
-            Keys.get_system_disk_io_time_seconds_in_interval(system_id):
-                str(metrics['disk_io_time_seconds_in_interval']),
-            Keys.get_system_went_down_at(system_id):
-                str(metrics['went_down_at']),
-            Keys.get_system_last_monitored(system_id):
-                str(meta_data['last_monitored']),
-        })
+        self.redis_write_buffer.hset_multiple(
+            Keys.get_hash_parent(parent_id), {
+                Keys.get_system_process_cpu_seconds_total(system_id):
+                    str(metrics['process_cpu_seconds_total']),
+                Keys.get_system_process_memory_usage(system_id):
+                    str(metrics['process_memory_usage']),
+                Keys.get_system_virtual_memory_usage(system_id):
+                    str(metrics['virtual_memory_usage']),
+                Keys.get_system_open_file_descriptors(system_id):
+                    str(metrics['open_file_descriptors']),
+                Keys.get_system_system_cpu_usage(system_id):
+                    str(metrics['system_cpu_usage']),
+                Keys.get_system_system_ram_usage(system_id):
+                    str(metrics['system_ram_usage']),
+                Keys.get_system_system_storage_usage(system_id):
+                    str(metrics['system_storage_usage']),
+                Keys.get_system_network_transmit_bytes_per_second(system_id):
+                    str(metrics['network_transmit_bytes_per_second']),
+                Keys.get_system_network_receive_bytes_per_second(system_id):
+                    str(metrics['network_receive_bytes_per_second']),
+                Keys.get_system_network_receive_bytes_total(system_id):
+                    str(metrics['network_receive_bytes_total']),
+                Keys.get_system_network_transmit_bytes_total(system_id):
+                    str(metrics['network_transmit_bytes_total']),
+                Keys.get_system_disk_io_time_seconds_total(system_id):
+                    str(metrics['disk_io_time_seconds_total']),
+                Keys.get_system_disk_io_time_seconds_in_interval(system_id):
+                    str(metrics['disk_io_time_seconds_in_interval']),
+                Keys.get_system_went_down_at(system_id):
+                    str(metrics['went_down_at']),
+                Keys.get_system_last_monitored(system_id):
+                    str(meta_data['last_monitored']),
+            })
 
     def _process_redis_error_store(self, data: Dict) -> None:
         meta_data = data['meta_data']
@@ -203,7 +207,7 @@ class SystemStore(Store):
                 metrics['went_down_at']
             )
 
-            self.redis.hset(
+            self.redis_write_buffer.hset(
                 Keys.get_hash_parent(parent_id),
                 Keys.get_system_went_down_at(system_id),
                 str(metrics['went_down_at'])
@@ -241,7 +245,7 @@ class SystemStore(Store):
         parent_id = meta_data['system_parent_id']
         metrics = data['data']
         time_now = datetime.now()
-        self.mongo.update_one(
+        self.mongo_write_buffer.update_one(
             parent_id,
             {'doc_type': 'system', 'd': time_now.hour},
             {
@@ -307,7 +311,7 @@ class SystemStore(Store):
             parent_id = meta_data['system_parent_id']
             metrics = data['data']
             time_now = datetime.now()
-            self.mongo.update_one(
+            self.mongo_write_buffer.update_one(
                 parent_id,
                 {'doc_type': 'system', 'd': time_now.hour},
                 {
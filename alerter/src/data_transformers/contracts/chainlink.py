@@ -2,7 +2,7 @@ import copy
 import json
 import logging
 from datetime import datetime
-from typing import Union, Type, Dict, Tuple
+from typing import Union, Type, Dict, List, Optional, Tuple
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -11,6 +11,7 @@ from src.data_store.redis import Keys
 from src.data_store.redis.redis_api import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitorables.contracts.chainlink.v3 import V3ChainlinkContract
 from src.monitorables.contracts.chainlink.v4 import V4ChainlinkContract
 from src.utils.constants.rabbitmq import (
@@ -73,16 +74,17 @@ class ChainlinkContractsDataTransformer(DataTransformer):
                                        True, False, False)
 
     def _load_number_state(self, state_type: Union[Type[float], Type[int]],
-                           cl_contract: ChainlinkContract) -> None:
+                           cl_contract: ChainlinkContract,
+                           redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a Chainlink contract's number metrics
         from redis. If the data from Redis cannot be obtained, the state won't
         be updated.
         :param state_type: What type of number metrics we want to obtain
         :param cl_contract: The Chainlink contract in question
+        :param redis_values: The contract's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_contract.parent_id)
         node_id = cl_contract.node_id
         proxy_address = cl_contract.proxy_address
         if state_type == int:
@@ -102,21 +104,22 @@ class ChainlinkContractsDataTransformer(DataTransformer):
             redis_key = eval('Keys.get_cl_contract' + attribute +
                              '(node_id, proxy_address)')
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             processed_redis_value = 'None' if redis_value is None \
                 else redis_value.decode("utf-8")
             new_value = convert_fn(processed_redis_value, None)
             eval("cl_contract.set" + attribute + '(new_value)')
 
-    def _load_list_state(self, cl_contract: ChainlinkContract) -> None:
+    def _load_list_state(self, cl_contract: ChainlinkContract,
+                         redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a Chainlink contract's list metrics
         from redis. If the data from Redis cannot be obtained, the state won't
         be updated.
         :param cl_contract: The Chainlink contract in question
+        :param redis_values: The contract's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_contract.parent_id)
         node_id = cl_contract.node_id
         proxy_address = cl_contract.proxy_address
         metric_attributes = cl_contract.get_list_metric_attributes()
@@ -126,25 +129,47 @@ class ChainlinkContractsDataTransformer(DataTransformer):
             redis_key = eval('Keys.get_cl_contract' + attribute +
                              '(node_id, proxy_address)')
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             new_value = [] if redis_value is None else json.loads(
                 redis_value.decode("utf-8"))
             eval("cl_contract.set" + attribute + '(new_value)')
 
-    def load_state(self, cl_contract: ChainlinkContract) -> ChainlinkContract:
+    def _get_state_redis_keys(self,
+                              cl_contract: ChainlinkContract) -> List[str]:
+        node_id = cl_contract.node_id
+        proxy_address = cl_contract.proxy_address
+        metric_attributes = (cl_contract.get_int_metric_attributes() +
+                             cl_contract.get_float_metric_attributes() +
+                             cl_contract.get_list_metric_attributes())
+        redis_keys = []
+        for attribute in metric_attributes:
+            redis_keys.append(eval('Keys.get_cl_contract' + attribute +
+                                   '(node_id, proxy_address)'))
+        return redis_keys
+
+    def load_state(self, cl_contract: ChainlinkContract,
+                   redis_values: Optional[Dict[str, Optional[bytes]]] = None) \
+            -> ChainlinkContract:
         """
         This function attempts to load the state of a Chainlink contract from
         redis. If the data from Redis cannot be obtained, the state won't be
         updated.
         :param cl_contract: The Chainlink Contract whose state we are interested
                           : in
+        :param redis_values: The contract's metrics already retrieved from
+                           : Redis. If not given they are retrieved in one
+                           : round trip
             :return: The loaded Chainlink Contract
         """
         self.logger.debug("Loading the state of %s from Redis", cl_contract)
 
-        self._load_number_state(int, cl_contract)
-        self._load_number_state(float, cl_contract)
-        self._load_list_state(cl_contract)
+        if redis_values is None:
+            redis_values = self._get_monitorable_state_redis_values(
+                cl_contract)
+
+        self._load_number_state(int, cl_contract, redis_values)
+        self._load_number_state(float, cl_contract, redis_values)
+        self._load_list_state(cl_contract, redis_values)
 
         loaded_metrics_list = [
             '{}={}'.format(key, val)
@@ -388,7 +413,7 @@ class ChainlinkContractsDataTransformer(DataTransformer):
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        raw_data = json.loads(body)
+        raw_data = decode_message(properties, body)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -403,6 +428,8 @@ class ChainlinkContractsDataTransformer(DataTransformer):
                 parent_id = meta_data['node_parent_id']
                 data = raw_data['result']['data']
 
+                # The state of all new contracts is loaded from Redis at once
+                new_contracts = []
                 for proxy_address, contract_details in data.items():
                     aggregator_address = contract_details['aggregatorAddress']
                     version = contract_details['contractVersion']
@@ -410,9 +437,9 @@ class ChainlinkContractsDataTransformer(DataTransformer):
                         node_id, proxy_address, parent_id, version,
                         aggregator_address)
                     if state_created:
-                        cl_contract: ChainlinkContract = self.state[node_id][
-                            proxy_address]
-                        self.load_state(cl_contract)
+                        new_contracts.append(
+                            self.state[node_id][proxy_address])
+                self.load_states(new_contracts)
 
                 transformed_data, data_for_alerting, data_for_saving = \
                     self._transform_data(raw_data)
@@ -455,6 +482,9 @@ class ChainlinkContractsDataTransformer(DataTransformer):
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.transformer_name,
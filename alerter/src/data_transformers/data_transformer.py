@@ -1,8 +1,9 @@
 import logging
 import sys
 from abc import abstractmethod
+from datetime import timedelta
 from types import FrameType
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -10,21 +11,29 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.abstract.publisher_subscriber import (
     QueuingPublisherSubscriberComponent)
 from src.data_store.redis.redis_api import RedisApi
+from src.data_store.redis.store_keys import Keys
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
-from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
-                                          HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
+from src.utils import env
 from src.utils.exceptions import MessageWasNotDeliveredException
+from src.utils.heartbeat import HeartbeatBatcher
 from src.utils.logging import log_and_print
+from src.utils.partitioning import (get_key_partition,
+                                    get_partition_queue_name,
+                                    get_partition_routing_key)
 from src.utils.types import Monitorable
 
 
 class DataTransformer(QueuingPublisherSubscriberComponent):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0,
+                 partition: Optional[int] = None) -> None:
         self._transformer_name = transformer_name
         self._redis = redis
+        self._partition = partition
         self._state = {}
+        self._heartbeat_batcher = HeartbeatBatcher(
+            timedelta(seconds=env.WORKER_HEARTBEAT_INTERVAL_SECONDS))
 
         super().__init__(logger, rabbitmq, max_queue_size)
 
@@ -39,14 +48,115 @@ class DataTransformer(QueuingPublisherSubscriberComponent):
     def redis(self) -> RedisApi:
         return self._redis
 
+    @property
+    def partition(self) -> Optional[int]:
+        return self._partition
+
     @property
     def state(self) -> Dict:
         return self._state
 
+    def _get_input_queue_name(self, queue_name: str) -> str:
+        return get_partition_queue_name(queue_name, self.partition)
+
+    def _get_input_routing_key(self, routing_key: str) -> str:
+        return get_partition_routing_key(routing_key, self.partition)
+
+    @staticmethod
+    def _get_alerter_routing_key(routing_key: str, data_for_alerting: Dict,
+                                 id_key: str) -> str:
+        """
+        The system and node alerters may be partitioned, in which case the
+        data for alerting is sent to the alerter of the partition the
+        monitorable's id hashes to.
+        :param routing_key: The routing key of the un-partitioned data
+        :param data_for_alerting: The data for alerting, either indexed by
+                                : 'result' or 'error', or by source
+        :param id_key: The meta_data field holding the monitorable's id, i.e.
+                     : system_id or node_id
+        :return: The routing key of the alerter's partition
+        """
+        if env.ALERTER_PARTITIONS <= 1:
+            return routing_key
+
+        if 'result' in data_for_alerting or 'error' in data_for_alerting:
+            sources_data = [data_for_alerting]
+        else:
+            sources_data = data_for_alerting.values()
+
+        for source_data in sources_data:
+            for response_index in ['result', 'error']:
+                if response_index in source_data:
+                    monitorable_id = \
+                        source_data[response_index]['meta_data'][id_key]
+                    return get_partition_routing_key(
+                        routing_key, get_key_partition(
+                            monitorable_id, env.ALERTER_PARTITIONS))
+
+        return routing_key
+
+    @property
+    def heartbeat_batcher(self) -> HeartbeatBatcher:
+        return self._heartbeat_batcher
+
     @abstractmethod
-    def load_state(self, monitorable: Monitorable) -> Monitorable:
+    def _get_state_redis_keys(self, monitorable: Monitorable) -> List[str]:
+        """
+        :param monitorable: The monitorable whose state is to be loaded
+        :return: The keys of the monitorable's metrics in its parent's hash
+        """
         pass
 
+    def _get_state_redis_values(self, monitorables: List[Monitorable]) \
+            -> Dict[str, Dict[str, Optional[bytes]]]:
+        """
+        Retrieves the stored metrics of all the given monitorables with one
+        HMGET per parent hash, sent to Redis in a single pipeline.
+        :param monitorables: The monitorables whose state is to be loaded
+        :return: {redis_hash: {redis_key: value}} for the metrics found in
+               : Redis. This is empty if Redis could not be used.
+        """
+        hash_keys = {}
+        for monitorable in monitorables:
+            redis_hash = Keys.get_hash_parent(monitorable.parent_id)
+            hash_keys.setdefault(redis_hash, []).extend(
+                self._get_state_redis_keys(monitorable))
+
+        return self.redis.hmget_multiple_hashes(hash_keys)
+
+    def _get_monitorable_state_redis_values(
+            self, monitorable: Monitorable) -> Dict[str, Optional[bytes]]:
+        redis_hash = Keys.get_hash_parent(monitorable.parent_id)
+        return self._get_state_redis_values([monitorable]).get(redis_hash, {})
+
+    @abstractmethod
+    def load_state(self, monitorable: Monitorable,
+                   redis_values: Optional[Dict[str, Optional[bytes]]] = None) \
+            -> Monitorable:
+        """
+        Loads the state of the monitorable from Redis.
+        :param monitorable: The monitorable whose state is to be loaded
+        :param redis_values: The metrics already retrieved from the
+                           : monitorable's parent hash. If not given they are
+                           : retrieved from Redis in one round trip.
+        :return: The loaded monitorable
+        """
+        pass
+
+    def load_states(self, monitorables: List[Monitorable]) \
+            -> List[Monitorable]:
+        """
+        Loads the state of many monitorables from Redis in one round trip.
+        :param monitorables: The monitorables whose state is to be loaded
+        :return: The loaded monitorables
+        """
+        hash_values = self._get_state_redis_values(monitorables)
+        return [
+            self.load_state(monitorable, hash_values.get(
+                Keys.get_hash_parent(monitorable.parent_id), {}))
+            for monitorable in monitorables
+        ]
+
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
 
@@ -64,6 +174,36 @@ class DataTransformer(QueuingPublisherSubscriberComponent):
                                                transformed_data: Dict) -> Dict:
         pass
 
+    @staticmethod
+    def _transform_result_meta_data(meta_data: Dict) -> Dict:
+        """
+        Transforms the meta_data of a result by removing the monitor_name and
+        changing the time key to the last_monitored key. A new dict is
+        returned, so the raw meta_data need not be copied beforehand.
+        :param meta_data: The raw meta_data
+        :return: The transformed meta_data
+        """
+        transformed_meta_data = {
+            key: value for key, value in meta_data.items()
+            if key not in ['monitor_name', 'time']
+        }
+        transformed_meta_data['last_monitored'] = meta_data['time']
+        return transformed_meta_data
+
+    @staticmethod
+    def _transform_error_meta_data(meta_data: Dict) -> Dict:
+        """
+        Transforms the meta_data of an error by removing the monitor_name. A
+        new dict is returned, so the raw meta_data need not be copied
+        beforehand.
+        :param meta_data: The raw meta_data
+        :return: The transformed meta_data
+        """
+        return {
+            key: value for key, value in meta_data.items()
+            if key != 'monitor_name'
+        }
+
     @abstractmethod
     def _transform_data(self, data: Dict) -> Tuple[Dict, Dict, Dict]:
         pass
@@ -79,13 +219,7 @@ class DataTransformer(QueuingPublisherSubscriberComponent):
         pass
 
     def _send_heartbeat(self, data_to_send: dict) -> None:
-        self.rabbitmq.basic_publish_confirm(
-            exchange=HEALTH_CHECK_EXCHANGE,
-            routing_key=HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, body=data_to_send,
-            is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
-            mandatory=True)
-        self.logger.debug("Sent heartbeat to '%s' exchange",
-                          HEALTH_CHECK_EXCHANGE)
+        self.heartbeat_batcher.send(self.rabbitmq, data_to_send, self.logger)
 
     def start(self) -> None:
         self._initialise_rabbitmq()
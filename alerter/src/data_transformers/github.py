@@ -1,8 +1,7 @@
 import copy
-import json
 import logging
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -11,6 +10,7 @@ from src.data_store.redis.redis_api import RedisApi
 from src.data_store.redis.store_keys import Keys
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitorables.repo import GitHubRepo
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE, STORE_EXCHANGE,
                                           ALERT_EXCHANGE, HEALTH_CHECK_EXCHANGE,
@@ -71,19 +71,27 @@ class GitHubDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
                                        True, False, False)
 
-    def load_state(self, repo: GitHubRepo) -> GitHubRepo:
+    def _get_state_redis_keys(self, repo: GitHubRepo) -> List[str]:
+        repo_id = repo.repo_id
+        return [Keys.get_github_no_of_releases(repo_id),
+                Keys.get_github_last_monitored(repo_id)]
+
+    def load_state(self, repo: GitHubRepo,
+                   redis_values: Optional[Dict[str, Optional[bytes]]] = None) \
+            -> GitHubRepo:
         # Below, we will try and get the data stored in redis and store it
         # in the repo's state. If the data from Redis cannot be obtained, the
         # state won't be updated.
 
         self.logger.debug("Loading the state of %s from Redis", repo)
-        redis_hash = Keys.get_hash_parent(repo.parent_id)
+        if redis_values is None:
+            redis_values = self._get_monitorable_state_redis_values(repo)
         repo_id = repo.repo_id
 
         # Load no_of_releases from Redis
         state_no_of_releases = repo.no_of_releases
-        redis_no_of_releases = self.redis.hget(
-            redis_hash, Keys.get_github_no_of_releases(repo_id),
+        redis_no_of_releases = redis_values.get(
+            Keys.get_github_no_of_releases(repo_id),
             bytes(str(state_no_of_releases), 'utf-8'))
         redis_no_of_releases = 'None' if redis_no_of_releases is None \
             else redis_no_of_releases.decode("utf-8")
@@ -92,8 +100,8 @@ class GitHubDataTransformer(DataTransformer):
 
         # Load last_monitored from Redis
         state_last_monitored = repo.last_monitored
-        redis_last_monitored = self.redis.hget(
-            redis_hash, Keys.get_github_last_monitored(repo_id),
+        redis_last_monitored = redis_values.get(
+            Keys.get_github_last_monitored(repo_id),
             bytes(str(state_last_monitored), 'utf-8'))
         redis_last_monitored = 'None' if redis_last_monitored is None \
             else redis_last_monitored.decode("utf-8")
@@ -279,7 +287,7 @@ class GitHubDataTransformer(DataTransformer):
                           method: pika.spec.Basic.Deliver,
                           properties: pika.spec.BasicProperties, body: bytes) \
             -> None:
-        raw_data = json.loads(body)
+        raw_data = decode_message(properties, body)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -338,6 +346,9 @@ class GitHubDataTransformer(DataTransformer):
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.transformer_name,
@@ -3,7 +3,7 @@ import multiprocessing
 import sys
 from datetime import datetime
 from types import FrameType
-from typing import Dict
+from typing import Dict, List, Optional
 
 import pika
 import pika.exceptions
@@ -30,12 +30,14 @@ from src.utils.constants.rabbitmq import (
     HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY, TOPIC)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.partitioning import get_partition_component_name
 
 
 class DataTransformersManager(PublisherSubscriberComponent):
     def __init__(self, logger: logging.Logger, name: str,
-                 rabbitmq: RabbitMQApi) -> None:
+                 rabbitmq: RabbitMQApi, partitions: int = 1) -> None:
         self._name = name
+        self._partitions = partitions
         self._transformer_process_dict = {}
 
         super().__init__(logger, rabbitmq)
@@ -47,10 +49,19 @@ class DataTransformersManager(PublisherSubscriberComponent):
     def name(self) -> str:
         return self._name
 
+    @property
+    def partitions(self) -> int:
+        return self._partitions
+
     @property
     def transformer_process_dict(self) -> Dict:
         return self._transformer_process_dict
 
+    def _get_partitions(self) -> List[Optional[int]]:
+        # With one partition the transformers are not partitioned, so they
+        # keep consuming from the un-partitioned queues.
+        return [None] if self.partitions <= 1 else list(range(self.partitions))
+
     def _initialise_rabbitmq(self) -> None:
         self.rabbitmq.connect_till_successful()
 
@@ -95,30 +106,48 @@ class DataTransformersManager(PublisherSubscriberComponent):
         :return: None
         """
         configuration = {
-            SYSTEM_DATA_TRANSFORMER_NAME: start_system_data_transformer,
             GITHUB_DATA_TRANSFORMER_NAME: start_github_data_transformer,
             DOCKERHUB_DATA_TRANSFORMER_NAME: start_dockerhub_data_transformer,
+            CL_CONTRACTS_DATA_TRANSFORMER_NAME:
+                start_chainlink_contracts_data_transformer,
+            COSMOS_NETWORK_DATA_TRANSFORMER_NAME:
+                start_cosmos_network_data_transformer,
+            SUBSTRATE_NETWORK_DATA_TRANSFORMER_NAME:
+                start_substrate_network_data_transformer,
+        }
+        # The system and node transformers are started once per partition,
+        # each process transforming the data of the systems or nodes in its
+        # partition.
+        partitioned_configuration = {
+            SYSTEM_DATA_TRANSFORMER_NAME: start_system_data_transformer,
             CL_NODE_DATA_TRANSFORMER_NAME:
                 start_chainlink_node_data_transformer,
             EVM_NODE_DATA_TRANSFORMER_NAME: start_evm_node_data_transformer,
-            CL_CONTRACTS_DATA_TRANSFORMER_NAME:
-                start_chainlink_contracts_data_transformer,
             COSMOS_NODE_DATA_TRANSFORMER_NAME:
                 start_cosmos_node_data_transformer,
-            COSMOS_NETWORK_DATA_TRANSFORMER_NAME:
-                start_cosmos_network_data_transformer,
             SUBSTRATE_NODE_DATA_TRANSFORMER_NAME:
                 start_substrate_node_data_transformer,
-            SUBSTRATE_NETWORK_DATA_TRANSFORMER_NAME:
-                start_substrate_network_data_transformer,
         }
-        for transformer_name, transformer_starter in configuration.items():
+        processes_configuration = {
+            transformer_name: (transformer_starter, ())
+            for transformer_name, transformer_starter in configuration.items()
+        }
+        for transformer_name, transformer_starter in \
+                partitioned_configuration.items():
+            for partition in self._get_partitions():
+                processes_configuration[get_partition_component_name(
+                    transformer_name, partition)] = (
+                    transformer_starter, () if partition is None else (
+                        partition,))
+
+        for transformer_name, (transformer_starter, transformer_args) in \
+                processes_configuration.items():
             if transformer_name not in self.transformer_process_dict or not \
                     self.transformer_process_dict[transformer_name].is_alive():
                 log_and_print("Attempting to start the {}.".format(
                     transformer_name), self.logger)
                 transformer_process = multiprocessing.Process(
-                    target=transformer_starter, args=())
+                    target=transformer_starter, args=transformer_args)
                 transformer_process.daemon = True
                 transformer_process.start()
                 self._transformer_process_dict[
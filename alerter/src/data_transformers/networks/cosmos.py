@@ -1,15 +1,15 @@
-import copy
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitorables.networks.cosmos import CosmosNetwork
 from src.utils.constants.data import VALID_COSMOS_NETWORK_SOURCES
 from src.utils.constants.rabbitmq import (
@@ -71,14 +71,15 @@ class CosmosNetworkTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
-    def _load_number_state(self, cosmos_network: CosmosNetwork) -> None:
+    def _load_number_state(self, cosmos_network: CosmosNetwork,
+                           redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a network's number metrics from redis
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_network: The network state to load
+        :param redis_values: The network's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_network.parent_id)
         loading_helper = get_load_number_state_helper_network(cosmos_network)
 
         # We iterate over each metric configuration and attempt to load from
@@ -92,21 +93,23 @@ class CosmosNetworkTransformer(DataTransformer):
             convert_fn = configuration['convert_fn']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
             new_value = convert_fn(processed_redis_value, state_value)
             set_fn(new_value)
 
-    def _load_list_of_dicts_state(self, cosmos_network: CosmosNetwork) -> None:
+    def _load_list_of_dicts_state(self, cosmos_network: CosmosNetwork,
+                                  redis_values: Dict[str, Optional[bytes]]) \
+            -> None:
         """
         This function will attempt to load a network's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_network: The network state to load
+        :param redis_values: The network's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_network.parent_id)
         loading_helper = get_load_list_of_dicts_state_helper(cosmos_network)
 
         # We iterate over each metric configuration and attempt to load from
@@ -119,18 +122,32 @@ class CosmosNetworkTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             new_value = (
                 state_value if redis_value is None
                 else json.loads(redis_value.decode("utf-8"))
             )
             set_fn(new_value)
 
-    def load_state(self, cosmos_network: CosmosNetwork) -> CosmosNetwork:
+    def _get_state_redis_keys(self,
+                              cosmos_network: CosmosNetwork) -> List[str]:
+        loading_helpers = [get_load_number_state_helper_network,
+                           get_load_list_of_dicts_state_helper]
+        return [configuration['redis_key']
+                for loading_helper in loading_helpers
+                for configuration in loading_helper(cosmos_network)]
+
+    def load_state(self, cosmos_network: CosmosNetwork,
+                   redis_values: Optional[Dict[str, Optional[bytes]]] = None) \
+            -> CosmosNetwork:
         self.logger.debug("Loading the state of %s from Redis", cosmos_network)
 
-        self._load_number_state(cosmos_network)
-        self._load_list_of_dicts_state(cosmos_network)
+        if redis_values is None:
+            redis_values = self._get_monitorable_state_redis_values(
+                cosmos_network)
+
+        self._load_number_state(cosmos_network, redis_values)
+        self._load_list_of_dicts_state(cosmos_network, redis_values)
 
         self.logger.debug(
             "Restored %s state: _proposals=%s, _last_monitored_cosmos_rest=%s",
@@ -208,7 +225,9 @@ class CosmosNetworkTransformer(DataTransformer):
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_saving".format(self))
 
-        return copy.deepcopy(transformed_data)
+        # The transformed data is built afresh for every message and is never
+        # modified after it is returned, so it can be stored as is.
+        return transformed_data
 
     def _process_transformed_cosmos_rest_data_for_alerting(
             self, transformed_cosmos_network_data: Dict) -> Dict:
@@ -221,7 +240,7 @@ class CosmosNetworkTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -230,13 +249,14 @@ class CosmosNetworkTransformer(DataTransformer):
             # Reformat the data in such a way that both the previous and current
             # states are sent to the alerter
             for metric, value in td_metrics.items():
-                pd_data[metric] = {}
-                pd_data[metric]['current'] = value
+                pd_data[metric] = {'current': value}
 
-            # Add previous for each metric
-            pd_data['proposals']['previous'] = copy.deepcopy(network.proposals)
+            # Add previous for each metric. The network's proposals are
+            # replaced, never modified, when the state is updated, so they can
+            # be shared with the processed data
+            pd_data['proposals']['previous'] = network.proposals
         elif 'error' in transformed_cosmos_network_data:
-            processed_data = copy.deepcopy(transformed_cosmos_network_data)
+            processed_data = transformed_cosmos_network_data
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_cosmos_rest_data_for_alerting".format(
@@ -272,43 +292,61 @@ class CosmosNetworkTransformer(DataTransformer):
 
         return processed_data
 
+    @staticmethod
+    def _transform_proposal(proposal: Dict) -> Dict:
+        transformed_proposal = {
+            **proposal,
+            'proposal_id': convert_to_int(proposal['proposal_id'], None),
+            'title': str(proposal['title']),
+            'description': str(proposal['description']),
+            'final_tally_result': {
+                result: convert_to_float(value, None)
+                for result, value in proposal['final_tally_result'].items()
+            },
+            'total_deposit': [
+                {
+                    **deposit,
+                    'denom': str(deposit['denom']),
+                    'amount': convert_to_float(deposit['amount'], None)
+                }
+                for deposit in proposal['total_deposit']
+            ]
+        }
+        for time_key in ['submit_time', 'deposit_end_time',
+                         'voting_start_time', 'voting_end_time']:
+            if type(proposal[time_key]) == str:
+                transformed_proposal[time_key] = iso_to_epoch(
+                    proposal[time_key])
+
+        return transformed_proposal
+
     def _transform_cosmos_rest_data(self, cosmos_network_data: Dict) -> Dict:
+        # The transformed data is built from new dicts for the changed fields
+        # only, the raw values themselves are shared rather than copied.
         if 'result' in cosmos_network_data:
             meta_data = cosmos_network_data['result']['meta_data']
-            transformed_data = copy.deepcopy(cosmos_network_data)
-            td_meta_data = transformed_data['result']['meta_data']
-            del td_meta_data['monitor_name']
-            del td_meta_data['time']
-            td_meta_data['last_monitored'] = meta_data['time']
-
-            td_data = transformed_data['result']['data']
-            for proposal in td_data['proposals']:
-                proposal['proposal_id'] = convert_to_int(
-                    proposal['proposal_id'], None)
-                proposal['title'] = str(proposal['title'])
-                proposal['description'] = str(proposal['description'])
-                if type(proposal['submit_time']) == str:
-                    proposal['submit_time'] = iso_to_epoch(
-                        proposal['submit_time'])
-                if type(proposal['deposit_end_time']) == str:
-                    proposal['deposit_end_time'] = iso_to_epoch(
-                        proposal['deposit_end_time'])
-                if type(proposal['voting_start_time']) == str:
-                    proposal['voting_start_time'] = iso_to_epoch(
-                        proposal['voting_start_time'])
-                if type(proposal['voting_end_time']) == str:
-                    proposal['voting_end_time'] = iso_to_epoch(
-                        proposal['voting_end_time'])
-                for result, value in proposal['final_tally_result'].items():
-                    proposal['final_tally_result'][result] = convert_to_float(
-                        value, None)
-                for deposit in proposal['total_deposit']:
-                    deposit['denom'] = str(deposit['denom'])
-                    deposit['amount'] = convert_to_float(
-                        deposit['amount'], None)
+            data = cosmos_network_data['result']['data']
+            transformed_data = {
+                'result': {
+                    **cosmos_network_data['result'],
+                    'meta_data': self._transform_result_meta_data(meta_data),
+                    'data': {
+                        **data,
+                        'proposals': [
+                            self._transform_proposal(proposal)
+                            for proposal in data['proposals']
+                        ]
+                    }
+                }
+            }
         elif 'error' in cosmos_network_data:
-            transformed_data = copy.deepcopy(cosmos_network_data)
-            del transformed_data['error']['meta_data']['monitor_name']
+            meta_data = cosmos_network_data['error']['meta_data']
+            transformed_data = {
+                'error': {
+                    **cosmos_network_data['error'],
+                    'meta_data': self._transform_error_meta_data(meta_data)
+                }
+            }
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _transform_cosmos_rest_data".format(self))
@@ -347,13 +385,16 @@ class CosmosNetworkTransformer(DataTransformer):
 
     def _place_latest_data_on_queue(self, data_for_alerting: Dict,
                                     data_for_saving: Dict) -> None:
+        # The data is built afresh for every message, so it need not be copied
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
                             COSMOS_NETWORK_TRANSFORMED_DATA_ROUTING_KEY,
-                            pika.BasicProperties(delivery_mode=2), True)
+                            pika.BasicProperties(delivery_mode=2), True,
+                            copy_data=False)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
                             COSMOS_NETWORK_TRANSFORMED_DATA_ROUTING_KEY,
-                            pika.BasicProperties(delivery_mode=2), True)
+                            pika.BasicProperties(delivery_mode=2), True,
+                            copy_data=False)
 
     def _validate_and_parse_raw_data_sources(
             self, raw_data: Dict) -> Tuple[str, str]:
@@ -418,7 +459,7 @@ class CosmosNetworkTransformer(DataTransformer):
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        raw_data = json.loads(body)
+        raw_data = decode_message(properties, body)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -449,8 +490,9 @@ class CosmosNetworkTransformer(DataTransformer):
         # if acknowledgement fails the state would be erroneous when processing
         # the data again. Note, only update the state if there were no
         # processing errors. IMP: We are allowed to update the state before
-        # sending the data because deep copies where constructed when computing
-        # data_for_alerting, data_for_saving and transformed_data.
+        # sending the data because the state setters replace the stored values
+        # rather than modify them, so the data shared with data_for_alerting,
+        # data_for_saving and transformed_data is never changed.
         if not processing_error:
             try:
                 self._update_state(transformed_data)
@@ -471,6 +513,9 @@ class CosmosNetworkTransformer(DataTransformer):
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.transformer_name,
@@ -3,14 +3,15 @@ import json
 import logging
 from ast import literal_eval
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitorables.networks.substrate import SubstrateNetwork
 from src.utils.constants.data import VALID_SUBSTRATE_NETWORK_SOURCES
 from src.utils.constants.rabbitmq import (
@@ -74,15 +75,16 @@ class SubstrateNetworkTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
-    def _load_boolean_state(self, substrate_network: SubstrateNetwork) -> None:
+    def _load_boolean_state(self, substrate_network: SubstrateNetwork,
+                            redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a network's boolean metrics from
         redis. If the data from Redis cannot be obtained, the state won't be
         updated.
         :param substrate_network: The network state to load
+        :param redis_values: The network's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_network.parent_id)
         loading_helper = get_load_bool_state_helper_network(substrate_network)
 
         # We iterate over each metric configuration and attempt to load from
@@ -95,7 +97,7 @@ class SubstrateNetworkTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
@@ -105,14 +107,15 @@ class SubstrateNetworkTransformer(DataTransformer):
             )
             set_fn(new_value)
 
-    def _load_number_state(self, substrate_network: SubstrateNetwork) -> None:
+    def _load_number_state(self, substrate_network: SubstrateNetwork,
+                           redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a network's number metrics from redis
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_network: The network state to load
+        :param redis_values: The network's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_network.parent_id)
         loading_helper = get_load_number_state_helper_network(substrate_network)
 
         # We iterate over each metric configuration and attempt to load from
@@ -126,7 +129,7 @@ class SubstrateNetworkTransformer(DataTransformer):
             convert_fn = configuration['convert_fn']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
@@ -134,14 +137,15 @@ class SubstrateNetworkTransformer(DataTransformer):
             set_fn(new_value)
 
     def _load_list_of_dicts_state(
-            self, substrate_network: SubstrateNetwork) -> None:
+            self, substrate_network: SubstrateNetwork,
+            redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a network's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_network: The network state to load
+        :param redis_values: The network's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_network.parent_id)
         loading_helper = get_load_list_of_dicts_state_helper_network(
             substrate_network)
 
@@ -155,21 +159,36 @@ class SubstrateNetworkTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             new_value = (
                 state_value if redis_value is None
                 else json.loads(redis_value.decode("utf-8"))
             )
             set_fn(new_value)
 
+    def _get_state_redis_keys(
+            self, substrate_network: SubstrateNetwork) -> List[str]:
+        loading_helpers = [get_load_bool_state_helper_network,
+                           get_load_number_state_helper_network,
+                           get_load_list_of_dicts_state_helper_network]
+        return [configuration['redis_key']
+                for loading_helper in loading_helpers
+                for configuration in loading_helper(substrate_network)]
+
     def load_state(
-            self, substrate_network: SubstrateNetwork) -> SubstrateNetwork:
+            self, substrate_network: SubstrateNetwork,
+            redis_values: Optional[Dict[str, Optional[bytes]]] = None) \
+            -> SubstrateNetwork:
         self.logger.debug("Loading the state of %s from Redis",
                           substrate_network)
 
-        self._load_boolean_state(substrate_network)
-        self._load_number_state(substrate_network)
-        self._load_list_of_dicts_state(substrate_network)
+        if redis_values is None:
+            redis_values = self._get_monitorable_state_redis_values(
+                substrate_network)
+
+        self._load_boolean_state(substrate_network, redis_values)
+        self._load_number_state(substrate_network, redis_values)
+        self._load_list_of_dicts_state(substrate_network, redis_values)
 
         self.logger.debug(
             "Restored %s state: _grandpa_stalled=%s, _public_prop_count=%s, "
@@ -610,7 +629,7 @@ class SubstrateNetworkTransformer(DataTransformer):
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        raw_data = json.loads(body)
+        raw_data = decode_message(properties, body)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -663,6 +682,9 @@ class SubstrateNetworkTransformer(DataTransformer):
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.transformer_name,
@@ -2,7 +2,7 @@ import copy
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Tuple, Union, Type
+from typing import Dict, List, Optional, Tuple, Union, Type
 
 import pika
 import pika.exceptions
@@ -11,6 +11,7 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.data_store.redis import RedisApi, Keys
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitorables.nodes.chainlink_node import ChainlinkNode
 from src.utils.constants.data import (VALID_CHAINLINK_SOURCES,
                                       RAW_TO_TRANSFORMED_CHAINLINK_METRICS,
@@ -30,34 +31,38 @@ from src.utils.types import convert_to_float, convert_to_int, is_mutable
 class ChainlinkNodeDataTransformer(DataTransformer):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0,
+                 partition: Optional[int] = None) -> None:
         super().__init__(transformer_name, logger, redis, rabbitmq,
-                         max_queue_size)
+                         max_queue_size, partition)
 
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
         # to initialise both the consuming and producing configurations.
         self.rabbitmq.connect_till_successful()
 
-        # Set consuming configuration
+        # Set consuming configuration. A partitioned transformer consumes
+        # from the queue of its partition only.
+        input_queue = self._get_input_queue_name(CL_NODE_DT_INPUT_QUEUE_NAME)
+        input_routing_key = self._get_input_routing_key(
+            CHAINLINK_NODE_RAW_DATA_ROUTING_KEY)
         self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
         self.rabbitmq.exchange_declare(RAW_DATA_EXCHANGE, 'topic', False, True,
                                        False, False)
-        self.logger.info("Creating queue '%s'", CL_NODE_DT_INPUT_QUEUE_NAME)
-        self.rabbitmq.queue_declare(CL_NODE_DT_INPUT_QUEUE_NAME, False, True,
-                                    False, False)
+        self.logger.info("Creating queue '%s'", input_queue)
+        self.rabbitmq.queue_declare(input_queue, False, True, False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", CL_NODE_DT_INPUT_QUEUE_NAME,
-                         RAW_DATA_EXCHANGE, CHAINLINK_NODE_RAW_DATA_ROUTING_KEY)
-        self.rabbitmq.queue_bind(CL_NODE_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
-                                 CHAINLINK_NODE_RAW_DATA_ROUTING_KEY)
+                         "key '%s'", input_queue, RAW_DATA_EXCHANGE,
+                         input_routing_key)
+        self.rabbitmq.queue_bind(input_queue, RAW_DATA_EXCHANGE,
+                                 input_routing_key)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(CL_NODE_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self.rabbitmq.basic_consume(input_queue, self._process_raw_data, False,
+                                    False, None)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -73,15 +78,16 @@ class ChainlinkNodeDataTransformer(DataTransformer):
                                        True, False, False)
 
     def _load_number_state(self, state_type: Union[Type[float], Type[int]],
-                           cl_node: ChainlinkNode) -> None:
+                           cl_node: ChainlinkNode,
+                           redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's number metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param state_type: What type of number metrics we want to obtain
         :param cl_node: The node in question
+        :param redis_values: The node's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_node.parent_id)
         cl_node_id = cl_node.node_id
         if state_type == int:
             metric_attributes = cl_node.get_int_metric_attributes()
@@ -99,20 +105,21 @@ class ChainlinkNodeDataTransformer(DataTransformer):
             state_value = eval('cl_node.' + attribute)
             redis_key = eval('Keys.get_cl_node_' + attribute + '(cl_node_id)')
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             processed_redis_value = 'None' if redis_value is None \
                 else redis_value.decode("utf-8")
             new_value = convert_fn(processed_redis_value, None)
             eval("cl_node.set_" + attribute + '(new_value)')
 
-    def _load_str_state(self, cl_node: ChainlinkNode) -> None:
+    def _load_str_state(self, cl_node: ChainlinkNode,
+                        redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's str metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cl_node: The node in question
+        :param redis_values: The node's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_node.parent_id)
         cl_node_id = cl_node.node_id
         str_metric_attributes = cl_node.get_str_metric_attributes()
 
@@ -127,27 +134,28 @@ class ChainlinkNodeDataTransformer(DataTransformer):
             state_value = eval('cl_node.' + attribute)
             redis_key = eval('Keys.get_cl_node_' + attribute + '(cl_node_id)')
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             new_value = None if redis_value is None or redis_value == b'None' \
                 else redis_value.decode("utf-8")
             eval("cl_node.set_" + attribute + '(new_value)')
 
-    def _load_dict_state(self, cl_node: ChainlinkNode) -> None:
+    def _load_dict_state(self, cl_node: ChainlinkNode,
+                         redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         Note that since dicts inherit different structures, this function
         cannot be generalised easily
         :param cl_node: The node in question
+        :param redis_values: The node's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cl_node.parent_id)
         cl_node_id = cl_node.node_id
 
         # Load current_gas_price_info from Redis
         state_current_gas_price_info = cl_node.current_gas_price_info
-        redis_current_gas_price_info = self.redis.hget(
-            redis_hash, Keys.get_cl_node_current_gas_price_info(cl_node_id),
+        redis_current_gas_price_info = redis_values.get(
+            Keys.get_cl_node_current_gas_price_info(cl_node_id),
             bytes(json.dumps(state_current_gas_price_info), 'utf-8'))
         current_gas_price_info = {
             'percentile': None,
@@ -159,20 +167,38 @@ class ChainlinkNodeDataTransformer(DataTransformer):
 
         # Load balance_info from Redis
         state_balance_info = cl_node.balance_info
-        redis_balance_info = self.redis.hget(
-            redis_hash, Keys.get_cl_node_balance_info(cl_node_id),
+        redis_balance_info = redis_values.get(
+            Keys.get_cl_node_balance_info(cl_node_id),
             bytes(json.dumps(state_balance_info), 'utf-8'))
         balance_info = {} if redis_balance_info is None \
             else json.loads(redis_balance_info.decode("utf-8"))
         cl_node.set_balance_info(balance_info)
 
-    def load_state(self, cl_node: ChainlinkNode) -> ChainlinkNode:
+    def _get_state_redis_keys(self, cl_node: ChainlinkNode) -> List[str]:
+        cl_node_id = cl_node.node_id
+        metric_attributes = (cl_node.get_int_metric_attributes() +
+                             cl_node.get_float_metric_attributes() +
+                             cl_node.get_str_metric_attributes())
+        redis_keys = []
+        for attribute in metric_attributes:
+            redis_keys.append(
+                eval('Keys.get_cl_node_' + attribute + '(cl_node_id)'))
+        redis_keys.append(Keys.get_cl_node_current_gas_price_info(cl_node_id))
+        redis_keys.append(Keys.get_cl_node_balance_info(cl_node_id))
+        return redis_keys
+
+    def load_state(self, cl_node: ChainlinkNode,
+                   redis_values: Optional[Dict[str, Optional[bytes]]] = None) \
+            -> ChainlinkNode:
         self.logger.debug("Loading the state of %s from Redis", cl_node)
 
-        self._load_number_state(int, cl_node)
-        self._load_number_state(float, cl_node)
-        self._load_str_state(cl_node)
-        self._load_dict_state(cl_node)
+        if redis_values is None:
+            redis_values = self._get_monitorable_state_redis_values(cl_node)
+
+        self._load_number_state(int, cl_node, redis_values)
+        self._load_number_state(float, cl_node, redis_values)
+        self._load_str_state(cl_node, redis_values)
+        self._load_dict_state(cl_node, redis_values)
 
         self.logger.debug(
             "Restored %s state: _current_height=%s, "
@@ -509,8 +535,10 @@ class ChainlinkNodeDataTransformer(DataTransformer):
 
     def _place_latest_data_on_queue(self, data_for_alerting: Dict,
                                     data_for_saving: Dict) -> None:
+        alerter_routing_key = self._get_alerter_routing_key(
+            CL_NODE_TRANSFORMED_DATA_ROUTING_KEY, data_for_alerting, 'node_id')
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
-                            CL_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                            alerter_routing_key,
                             pika.BasicProperties(delivery_mode=2), True)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
@@ -589,7 +617,7 @@ class ChainlinkNodeDataTransformer(DataTransformer):
                           method: pika.spec.Basic.Deliver,
                           properties: pika.spec.BasicProperties, body: bytes) \
             -> None:
-        raw_data = json.loads(body)
+        raw_data = decode_message(properties, body)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -641,6 +669,9 @@ class ChainlinkNodeDataTransformer(DataTransformer):
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.transformer_name,
@@ -1,15 +1,15 @@
-import copy
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitorables.nodes.cosmos_node import CosmosNode
 from src.utils.constants.data import (
     RAW_TO_TRANSFORMED_COSMOS_NODE_PROM_METRICS, INT_COSMOS_NODE_PROM_METRICS,
@@ -30,35 +30,39 @@ from src.utils.types import str_to_bool_strict, convert_to_int
 class CosmosNodeDataTransformer(DataTransformer):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0,
+                 partition: Optional[int] = None) -> None:
         super().__init__(transformer_name, logger, redis, rabbitmq,
-                         max_queue_size)
+                         max_queue_size, partition)
 
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
         # to initialise both the consuming and producing configurations.
         self.rabbitmq.connect_till_successful()
 
-        # Set consuming configuration
+        # Set consuming configuration. A partitioned transformer consumes
+        # from the queue of its partition only.
+        input_queue = self._get_input_queue_name(
+            COSMOS_NODE_DT_INPUT_QUEUE_NAME)
+        input_routing_key = self._get_input_routing_key(
+            COSMOS_NODE_RAW_DATA_ROUTING_KEY)
         self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
         self.rabbitmq.exchange_declare(
             RAW_DATA_EXCHANGE, 'topic', False, True, False, False)
-        self.logger.info("Creating queue '%s'", COSMOS_NODE_DT_INPUT_QUEUE_NAME)
-        self.rabbitmq.queue_declare(
-            COSMOS_NODE_DT_INPUT_QUEUE_NAME, False, True, False, False)
+        self.logger.info("Creating queue '%s'", input_queue)
+        self.rabbitmq.queue_declare(input_queue, False, True, False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", COSMOS_NODE_DT_INPUT_QUEUE_NAME,
-                         RAW_DATA_EXCHANGE, COSMOS_NODE_RAW_DATA_ROUTING_KEY)
-        self.rabbitmq.queue_bind(
-            COSMOS_NODE_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
-            COSMOS_NODE_RAW_DATA_ROUTING_KEY)
+                         "key '%s'", input_queue, RAW_DATA_EXCHANGE,
+                         input_routing_key)
+        self.rabbitmq.queue_bind(input_queue, RAW_DATA_EXCHANGE,
+                                 input_routing_key)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(COSMOS_NODE_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self.rabbitmq.basic_consume(input_queue, self._process_raw_data, False,
+                                    False, None)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -73,14 +77,15 @@ class CosmosNodeDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
-    def _load_number_state(self, cosmos_node: CosmosNode) -> None:
+    def _load_number_state(self, cosmos_node: CosmosNode,
+                           redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's number metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_node: The node state to load
+        :param redis_values: The node's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_node.parent_id)
         loading_helper = get_load_number_state_helper(cosmos_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -94,21 +99,22 @@ class CosmosNodeDataTransformer(DataTransformer):
             convert_fn = configuration['convert_fn']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
             new_value = convert_fn(processed_redis_value, state_value)
             set_fn(new_value)
 
-    def _load_bool_state(self, cosmos_node: CosmosNode) -> None:
+    def _load_bool_state(self, cosmos_node: CosmosNode,
+                         redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's boolean metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_node: The node state to load
+        :param redis_values: The node's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_node.parent_id)
         loading_helper = get_load_bool_state_helper(cosmos_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -121,7 +127,7 @@ class CosmosNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
@@ -131,14 +137,15 @@ class CosmosNodeDataTransformer(DataTransformer):
             )
             set_fn(new_value)
 
-    def _load_str_state(self, cosmos_node: CosmosNode) -> None:
+    def _load_str_state(self, cosmos_node: CosmosNode,
+                        redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's string metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_node: The node state to load
+        :param redis_values: The node's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_node.parent_id)
         loading_helper = get_load_str_state_helper(cosmos_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -151,21 +158,22 @@ class CosmosNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             new_value = (
                 None if redis_value is None or redis_value == b'None'
                 else redis_value.decode("utf-8")
             )
             set_fn(new_value)
 
-    def _load_dict_state(self, cosmos_node: CosmosNode) -> None:
+    def _load_dict_state(self, cosmos_node: CosmosNode,
+                         redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param cosmos_node: The node state to load
+        :param redis_values: The node's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(cosmos_node.parent_id)
         loading_helper = get_load_dict_state_helper(cosmos_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -178,20 +186,35 @@ class CosmosNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             new_value = (
                 state_value if redis_value is None
                 else json.loads(redis_value.decode("utf-8"))
             )
             set_fn(new_value)
 
-    def load_state(self, cosmos_node: CosmosNode) -> CosmosNode:
+    def _get_state_redis_keys(self, cosmos_node: CosmosNode) -> List[str]:
+        loading_helpers = [get_load_number_state_helper,
+                           get_load_bool_state_helper,
+                           get_load_str_state_helper,
+                           get_load_dict_state_helper]
+        return [configuration['redis_key']
+                for loading_helper in loading_helpers
+                for configuration in loading_helper(cosmos_node)]
+
+    def load_state(self, cosmos_node: CosmosNode,
+                   redis_values: Optional[Dict[str, Optional[bytes]]] = None) \
+            -> CosmosNode:
         self.logger.debug("Loading the state of %s from Redis", cosmos_node)
 
-        self._load_number_state(cosmos_node)
-        self._load_bool_state(cosmos_node)
-        self._load_str_state(cosmos_node)
-        self._load_dict_state(cosmos_node)
+        if redis_values is None:
+            redis_values = self._get_monitorable_state_redis_values(
+                cosmos_node)
+
+        self._load_number_state(cosmos_node, redis_values)
+        self._load_bool_state(cosmos_node, redis_values)
+        self._load_str_state(cosmos_node, redis_values)
+        self._load_dict_state(cosmos_node, redis_values)
 
         self.logger.debug(
             "Restored %s state: _went_down_at_prometheus=%s, "
@@ -370,7 +393,9 @@ class CosmosNodeDataTransformer(DataTransformer):
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_data_for_saving".format(self))
 
-        return copy.deepcopy(transformed_data)
+        # The transformed data is built afresh for every message and is never
+        # modified after it is returned, so it can be stored as is.
+        return transformed_data
 
     def _process_transformed_tendermint_rpc_data_for_alerting(
             self, transformed_tendermint_rpc_data: Dict) -> Dict:
@@ -383,7 +408,7 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -392,15 +417,15 @@ class CosmosNodeDataTransformer(DataTransformer):
             # Reformat the data in such a way that both the previous and current
             # states are sent to the alerter
             for metric, value in td_metrics.items():
-                pd_data[metric] = {}
-                pd_data[metric]['current'] = value
+                pd_data[metric] = {'current': value}
 
             # Add previous for each metric
             pd_data['went_down_at'][
                 'previous'] = node.went_down_at_tendermint_rpc
-            pd_data['slashed']['previous'] = copy.deepcopy(node.slashed)
-            pd_data['missed_blocks']['previous'] = copy.deepcopy(
-                node.missed_blocks)
+            # The node's dicts are replaced, never modified, when the state is
+            # updated, so they can be shared with the processed data
+            pd_data['slashed']['previous'] = node.slashed
+            pd_data['missed_blocks']['previous'] = node.missed_blocks
             pd_data['is_syncing']['previous'] = node.is_syncing
         elif 'error' in transformed_tendermint_rpc_data:
             td_meta_data = transformed_tendermint_rpc_data['error']['meta_data']
@@ -410,17 +435,23 @@ class CosmosNodeDataTransformer(DataTransformer):
             node: CosmosNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_tendermint_rpc_data)
+            # Only downtime errors are reformatted, other errors are sent as
+            # they are
+            processed_data = transformed_tendermint_rpc_data
             if td_error_code == downtime_exception.code:
                 td_data = transformed_tendermint_rpc_data['error']['data']
-                pd_data = processed_data['error']['data']
-
-                for metric, value in td_data.items():
-                    pd_data[metric] = {}
-                    pd_data[metric]['current'] = value
-
+                pd_data = {
+                    metric: {'current': value}
+                    for metric, value in td_data.items()
+                }
                 pd_data['went_down_at'][
                     'previous'] = node.went_down_at_tendermint_rpc
+                processed_data = {
+                    'error': {
+                        **transformed_tendermint_rpc_data['error'],
+                        'data': pd_data
+                    }
+                }
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_tendermint_rpc_data_for_"
@@ -438,7 +469,7 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -447,8 +478,7 @@ class CosmosNodeDataTransformer(DataTransformer):
             # Reformat the data in such a way that both the previous and current
             # states are sent to the alerter
             for metric, value in td_metrics.items():
-                pd_data[metric] = {}
-                pd_data[metric]['current'] = value
+                pd_data[metric] = {'current': value}
 
             # Add previous for each metric
             pd_data['went_down_at']['previous'] = node.went_down_at_cosmos_rest
@@ -462,17 +492,23 @@ class CosmosNodeDataTransformer(DataTransformer):
             node: CosmosNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_cosmos_rest_data)
+            # Only downtime errors are reformatted, other errors are sent as
+            # they are
+            processed_data = transformed_cosmos_rest_data
             if td_error_code == downtime_exception.code:
                 td_data = transformed_cosmos_rest_data['error']['data']
-                pd_data = processed_data['error']['data']
-
-                for metric, value in td_data.items():
-                    pd_data[metric] = {}
-                    pd_data[metric]['current'] = value
-
+                pd_data = {
+                    metric: {'current': value}
+                    for metric, value in td_data.items()
+                }
                 pd_data['went_down_at'][
                     'previous'] = node.went_down_at_cosmos_rest
+                processed_data = {
+                    'error': {
+                        **transformed_cosmos_rest_data['error'],
+                        'data': pd_data
+                    }
+                }
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_cosmos_rest_data_for_alerting".format(
@@ -490,7 +526,7 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -499,8 +535,7 @@ class CosmosNodeDataTransformer(DataTransformer):
             # Reformat the data in such a way that both the previous and current
             # states are sent to the alerter
             for metric, value in td_metrics.items():
-                pd_data[metric] = {}
-                pd_data[metric]['current'] = value
+                pd_data[metric] = {'current': value}
 
             # Add previous for each metric
             pd_data['went_down_at']['previous'] = node.went_down_at_prometheus
@@ -514,17 +549,23 @@ class CosmosNodeDataTransformer(DataTransformer):
             node: CosmosNode = self.state[td_node_id]
             downtime_exception = NodeIsDownException(td_node_name)
 
-            processed_data = copy.deepcopy(transformed_prometheus_data)
+            # Only downtime errors are reformatted, other errors are sent as
+            # they are
+            processed_data = transformed_prometheus_data
             if td_error_code == downtime_exception.code:
                 td_data = transformed_prometheus_data['error']['data']
-                pd_data = processed_data['error']['data']
-
-                for metric, value in td_data.items():
-                    pd_data[metric] = {}
-                    pd_data[metric]['current'] = value
-
+                pd_data = {
+                    metric: {'current': value}
+                    for metric, value in td_data.items()
+                }
                 pd_data['went_down_at'][
                     'previous'] = node.went_down_at_prometheus
+                processed_data = {
+                    'error': {
+                        **transformed_prometheus_data['error'],
+                        'data': pd_data
+                    }
+                }
         else:
             raise ReceivedUnexpectedDataException(
                 "{}: _process_transformed_prometheus_data_for_alerting".format(
@@ -567,18 +608,20 @@ class CosmosNodeDataTransformer(DataTransformer):
         return processed_data
 
     def _transform_tendermint_rpc_data(self, tendermint_rpc_data: Dict) -> Dict:
+        # The transformed data is built from new dicts for the changed fields
+        # only, the raw values themselves are shared rather than copied.
         if 'result' in tendermint_rpc_data:
             meta_data = tendermint_rpc_data['result']['meta_data']
             node_metrics = tendermint_rpc_data['result']['data']
-            transformed_data = copy.deepcopy(tendermint_rpc_data)
-            td_meta_data = transformed_data['result']['meta_data']
-            td_node_metrics = transformed_data['result']['data']
             node_id = meta_data['node_id']
             node: CosmosNode = self.state[node_id]
 
             # Historical data will be used to compute new metrics slashed and
             # missed blocks
-            del td_node_metrics['historical']
+            td_node_metrics = {
+                metric: value for metric, value in node_metrics.items()
+                if metric != 'historical'
+            }
             td_node_metrics['slashed'] = {
                 'slashed': False,
                 'amount_map': {}
@@ -623,12 +666,14 @@ class CosmosNodeDataTransformer(DataTransformer):
                         transformed_missed_blocks['missed_heights'].append(
                             block_height - 1)
 
-            # Transform the meta_data by deleting the monitor_name and changing
-            # the time key to last_monitored key
-            del td_meta_data['monitor_name']
-            del td_meta_data['time']
-            td_meta_data['last_monitored'] = meta_data['time']
             td_node_metrics['went_down_at'] = None
+            transformed_data = {
+                'result': {
+                    **tendermint_rpc_data['result'],
+                    'meta_data': self._transform_result_meta_data(meta_data),
+                    'data': td_node_metrics
+                }
+            }
         elif 'error' in tendermint_rpc_data:
             meta_data = tendermint_rpc_data['error']['meta_data']
             error_code = tendermint_rpc_data['error']['code']
@@ -640,8 +685,12 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name from
             # the meta data
-            transformed_data = copy.deepcopy(tendermint_rpc_data)
-            del transformed_data['error']['meta_data']['monitor_name']
+            transformed_data = {
+                'error': {
+                    **tendermint_rpc_data['error'],
+                    'meta_data': self._transform_error_meta_data(meta_data)
+                }
+            }
 
             # If we have a downtime error, set went_down_at_tendermint_rpc to
             # the time of error if the interface was up. Otherwise, leave
@@ -666,13 +715,14 @@ class CosmosNodeDataTransformer(DataTransformer):
             # meta_data by deleting the monitor_name and changing the time key
             # to last_monitored key
             meta_data = cosmos_rest_data['result']['meta_data']
-            transformed_data = copy.deepcopy(cosmos_rest_data)
-            td_meta_data = transformed_data['result']['meta_data']
-            td_node_metrics = transformed_data['result']['data']
-            del td_meta_data['monitor_name']
-            del td_meta_data['time']
-            td_meta_data['last_monitored'] = meta_data['time']
-            td_node_metrics['went_down_at'] = None
+            node_metrics = cosmos_rest_data['result']['data']
+            transformed_data = {
+                'result': {
+                    **cosmos_rest_data['result'],
+                    'meta_data': self._transform_result_meta_data(meta_data),
+                    'data': {**node_metrics, 'went_down_at': None}
+                }
+            }
         elif 'error' in cosmos_rest_data:
             meta_data = cosmos_rest_data['error']['meta_data']
             error_code = cosmos_rest_data['error']['code']
@@ -684,8 +734,12 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name from
             # the meta data
-            transformed_data = copy.deepcopy(cosmos_rest_data)
-            del transformed_data['error']['meta_data']['monitor_name']
+            transformed_data = {
+                'error': {
+                    **cosmos_rest_data['error'],
+                    'meta_data': self._transform_error_meta_data(meta_data)
+                }
+            }
 
             # If we have a downtime error, set went_down_at_cosmos_rest to the
             # time of error if the interface was up. Otherwise, leave
@@ -707,14 +761,14 @@ class CosmosNodeDataTransformer(DataTransformer):
         if 'result' in prometheus_data:
             meta_data = prometheus_data['result']['meta_data']
             node_metrics = prometheus_data['result']['data']
-            transformed_data = copy.deepcopy(prometheus_data)
-            td_meta_data = transformed_data['result']['meta_data']
-            td_node_metrics = transformed_data['result']['data']
 
             # First convert the raw metric names into the transformed names
+            td_node_metrics = {
+                metric: value for metric, value in node_metrics.items()
+                if metric not in RAW_TO_TRANSFORMED_COSMOS_NODE_PROM_METRICS
+            }
             for raw_metric, transformed_metric in \
                     RAW_TO_TRANSFORMED_COSMOS_NODE_PROM_METRICS.items():
-                del td_node_metrics[raw_metric]
                 td_node_metrics[transformed_metric] = node_metrics[
                     raw_metric]
 
@@ -723,12 +777,14 @@ class CosmosNodeDataTransformer(DataTransformer):
                 td_node_metrics[transformed_metric] = convert_to_int(
                     td_node_metrics[transformed_metric], None)
 
-            # Transform the meta_data by deleting the monitor_name and changing
-            # the time key to last_monitored key
-            del td_meta_data['monitor_name']
-            del td_meta_data['time']
-            td_meta_data['last_monitored'] = meta_data['time']
             td_node_metrics['went_down_at'] = None
+            transformed_data = {
+                'result': {
+                    **prometheus_data['result'],
+                    'meta_data': self._transform_result_meta_data(meta_data),
+                    'data': td_node_metrics
+                }
+            }
         elif 'error' in prometheus_data:
             meta_data = prometheus_data['error']['meta_data']
             error_code = prometheus_data['error']['code']
@@ -740,8 +796,12 @@ class CosmosNodeDataTransformer(DataTransformer):
 
             # In case of non-downtime errors only remove the monitor_name from
             # the meta data
-            transformed_data = copy.deepcopy(prometheus_data)
-            del transformed_data['error']['meta_data']['monitor_name']
+            transformed_data = {
+                'error': {
+                    **prometheus_data['error'],
+                    'meta_data': self._transform_error_meta_data(meta_data)
+                }
+            }
 
             # If we have a downtime error, set went_down_at_prometheus to
             # the time of error if the interface was up. Otherwise, leave
@@ -795,13 +855,19 @@ class CosmosNodeDataTransformer(DataTransformer):
 
     def _place_latest_data_on_queue(self, data_for_alerting: Dict,
                                     data_for_saving: Dict) -> None:
+        alerter_routing_key = self._get_alerter_routing_key(
+            COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY, data_for_alerting,
+            'node_id')
+        # The data is built afresh for every message, so it need not be copied
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
-                            COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY,
-                            pika.BasicProperties(delivery_mode=2), True)
+                            alerter_routing_key,
+                            pika.BasicProperties(delivery_mode=2), True,
+                            copy_data=False)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
                             COSMOS_NODE_TRANSFORMED_DATA_ROUTING_KEY,
-                            pika.BasicProperties(delivery_mode=2), True)
+                            pika.BasicProperties(delivery_mode=2), True,
+                            copy_data=False)
 
     def _validate_and_parse_raw_data_sources(
             self, raw_data: Dict) -> Tuple[str, str, str]:
@@ -871,7 +937,7 @@ class CosmosNodeDataTransformer(DataTransformer):
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        raw_data = json.loads(body)
+        raw_data = decode_message(properties, body)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -902,8 +968,9 @@ class CosmosNodeDataTransformer(DataTransformer):
         # if acknowledgement fails the state would be erroneous when processing
         # the data again. Note, only update the state if there were no
         # processing errors. IMP: We are allowed to update the state before
-        # sending the data because deep copies where constructed when computing
-        # data_for_alerting, data_for_saving and transformed_data.
+        # sending the data because the state setters replace the stored values
+        # rather than modify them, so the data shared with data_for_alerting,
+        # data_for_saving and transformed_data is never changed.
         if not processing_error:
             try:
                 self._update_state(transformed_data)
@@ -924,6 +991,9 @@ class CosmosNodeDataTransformer(DataTransformer):
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.transformer_name,
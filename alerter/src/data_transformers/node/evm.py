@@ -1,8 +1,7 @@
 import copy
-import json
 import logging
 from datetime import datetime
-from typing import Union, Type, Dict, Tuple
+from typing import Union, Type, Dict, List, Optional, Tuple
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
@@ -11,6 +10,7 @@ from src.data_store.redis import Keys
 from src.data_store.redis.redis_api import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitorables.nodes.evm_node import EVMNode
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, STORE_EXCHANGE, RAW_DATA_EXCHANGE, HEALTH_CHECK_EXCHANGE,
@@ -26,9 +26,10 @@ from src.utils.types import (convert_to_int, convert_to_float,
 class EVMNodeDataTransformer(DataTransformer):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0,
+                 partition: Optional[int] = None) -> None:
         super().__init__(transformer_name, logger, redis, rabbitmq,
-                         max_queue_size)
+                         max_queue_size, partition)
 
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
@@ -36,26 +37,28 @@ class EVMNodeDataTransformer(DataTransformer):
 
         self.rabbitmq.connect_till_successful()
 
-        # Set consuming configuration
+        # Set consuming configuration. A partitioned transformer consumes
+        # from the queue of its partition only.
+        input_queue = self._get_input_queue_name(EVM_NODE_DT_INPUT_QUEUE_NAME)
+        input_routing_key = self._get_input_routing_key(
+            EVM_NODE_RAW_DATA_ROUTING_KEY)
         self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
         self.rabbitmq.exchange_declare(RAW_DATA_EXCHANGE, TOPIC, False, True,
                                        False, False)
-        self.logger.info("Creating queue '%s'", EVM_NODE_DT_INPUT_QUEUE_NAME)
-        self.rabbitmq.queue_declare(EVM_NODE_DT_INPUT_QUEUE_NAME, False, True,
-                                    False, False)
+        self.logger.info("Creating queue '%s'", input_queue)
+        self.rabbitmq.queue_declare(input_queue, False, True, False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", EVM_NODE_DT_INPUT_QUEUE_NAME,
-                         RAW_DATA_EXCHANGE, EVM_NODE_RAW_DATA_ROUTING_KEY)
-        self.rabbitmq.queue_bind(EVM_NODE_DT_INPUT_QUEUE_NAME,
-                                 RAW_DATA_EXCHANGE,
-                                 EVM_NODE_RAW_DATA_ROUTING_KEY)
+                         "key '%s'", input_queue, RAW_DATA_EXCHANGE,
+                         input_routing_key)
+        self.rabbitmq.queue_bind(input_queue, RAW_DATA_EXCHANGE,
+                                 input_routing_key)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(EVM_NODE_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self.rabbitmq.basic_consume(input_queue, self._process_raw_data, False,
+                                    False, None)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -71,15 +74,16 @@ class EVMNodeDataTransformer(DataTransformer):
                                        True, False, False)
 
     def _load_number_state(self, state_type: Union[Type[float], Type[int]],
-                           evm_node: EVMNode) -> None:
+                           evm_node: EVMNode,
+                           redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's number metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param state_type: What type of number metrics we want to obtain
         :param evm_node: The node in question
+        :param redis_values: The node's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(evm_node.parent_id)
         evm_node_id = evm_node.node_id
         if state_type == int:
             metric_attributes = evm_node.get_int_metric_attributes()
@@ -99,24 +103,42 @@ class EVMNodeDataTransformer(DataTransformer):
             state_value = eval('evm_node.' + attribute)
             redis_key = eval('Keys.get_evm_node_' + attribute + '(evm_node_id)')
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             processed_redis_value = 'None' if redis_value is None \
                 else redis_value.decode("utf-8")
             new_value = convert_fn(processed_redis_value, None)
             eval("evm_node.set_" + attribute + '(new_value)')
 
-    def load_state(self, evm_node: EVMNode) -> EVMNode:
+    def _get_state_redis_keys(self, evm_node: EVMNode) -> List[str]:
+        evm_node_id = evm_node.node_id
+        metric_attributes = (evm_node.get_int_metric_attributes() +
+                             evm_node.get_float_metric_attributes() +
+                             evm_node.get_bool_metric_attributes())
+        redis_keys = []
+        for attribute in metric_attributes:
+            redis_keys.append(
+                eval('Keys.get_evm_node_' + attribute + '(evm_node_id)'))
+        return redis_keys
+
+    def load_state(self, evm_node: EVMNode,
+                   redis_values: Optional[Dict[str, Optional[bytes]]] = None) \
+            -> EVMNode:
         """
         This function attempts to load the state of an evm_node from redis. If
         the data from Redis cannot be obtained, the state won't be updated.
         :param evm_node: The EVM Node whose state we are interested in
+        :param redis_values: The node's metrics already retrieved from Redis.
+                           : If not given they are retrieved in one round trip
         :return: The loaded EVM node
         """
         self.logger.debug("Loading the state of %s from Redis", evm_node)
 
-        self._load_number_state(int, evm_node)
-        self._load_number_state(float, evm_node)
-        self._load_number_state(bool, evm_node)
+        if redis_values is None:
+            redis_values = self._get_monitorable_state_redis_values(evm_node)
+
+        self._load_number_state(int, evm_node, redis_values)
+        self._load_number_state(float, evm_node, redis_values)
+        self._load_number_state(bool, evm_node, redis_values)
 
         self.logger.debug(
             "Restored %s state: _current_height=%s, _syncing=%s, "
@@ -316,7 +338,7 @@ class EVMNodeDataTransformer(DataTransformer):
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        raw_data = json.loads(body)
+        raw_data = decode_message(properties, body)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -376,6 +398,9 @@ class EVMNodeDataTransformer(DataTransformer):
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.transformer_name,
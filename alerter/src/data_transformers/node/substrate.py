@@ -3,14 +3,15 @@ import json
 import logging
 from ast import literal_eval
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
-from src.data_store.redis import RedisApi, Keys
+from src.data_store.redis import RedisApi
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitorables.nodes.substrate_node import SubstrateNode
 from src.utils.constants.data import (
     VALID_SUBSTRATE_NODE_SOURCES, INT_SUBSTRATE_NODE_WS_METRICS)
@@ -31,36 +32,39 @@ from src.utils.types import str_to_bool_strict
 class SubstrateNodeDataTransformer(DataTransformer):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0,
+                 partition: Optional[int] = None) -> None:
         super().__init__(transformer_name, logger, redis, rabbitmq,
-                         max_queue_size)
+                         max_queue_size, partition)
 
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
         # to initialise both the consuming and producing configurations.
         self.rabbitmq.connect_till_successful()
 
-        # Set consuming configuration
+        # Set consuming configuration. A partitioned transformer consumes
+        # from the queue of its partition only.
+        input_queue = self._get_input_queue_name(
+            SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME)
+        input_routing_key = self._get_input_routing_key(
+            SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY)
         self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
         self.rabbitmq.exchange_declare(
             RAW_DATA_EXCHANGE, 'topic', False, True, False, False)
-        self.logger.info("Creating queue '%s'",
-                         SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME)
-        self.rabbitmq.queue_declare(
-            SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME, False, True, False, False)
+        self.logger.info("Creating queue '%s'", input_queue)
+        self.rabbitmq.queue_declare(input_queue, False, True, False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME,
-                         RAW_DATA_EXCHANGE, SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY)
-        self.rabbitmq.queue_bind(
-            SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
-            SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY)
+                         "key '%s'", input_queue, RAW_DATA_EXCHANGE,
+                         input_routing_key)
+        self.rabbitmq.queue_bind(input_queue, RAW_DATA_EXCHANGE,
+                                 input_routing_key)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(SUBSTRATE_NODE_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self.rabbitmq.basic_consume(input_queue, self._process_raw_data, False,
+                                    False, None)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -75,14 +79,15 @@ class SubstrateNodeDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, 'topic', False,
                                        True, False, False)
 
-    def _load_number_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_number_state(self, substrate_node: SubstrateNode,
+                           redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's number metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_node: The node state to load
+        :param redis_values: The node's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_number_state_helper(substrate_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -96,21 +101,22 @@ class SubstrateNodeDataTransformer(DataTransformer):
             convert_fn = configuration['convert_fn']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
             new_value = convert_fn(processed_redis_value, state_value)
             set_fn(new_value)
 
-    def _load_bool_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_bool_state(self, substrate_node: SubstrateNode,
+                         redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's boolean metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_node: The node state to load
+        :param redis_values: The node's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_bool_state_helper(substrate_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -123,7 +129,7 @@ class SubstrateNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             processed_redis_value = ('None'
                                      if redis_value is None
                                      else redis_value.decode("utf-8"))
@@ -133,14 +139,15 @@ class SubstrateNodeDataTransformer(DataTransformer):
             )
             set_fn(new_value)
 
-    def _load_str_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_str_state(self, substrate_node: SubstrateNode,
+                        redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's string metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_node: The node state to load
+        :param redis_values: The node's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_str_state_helper(substrate_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -153,21 +160,22 @@ class SubstrateNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(str(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             new_value = (
                 None if redis_value is None or redis_value == b'None'
                 else redis_value.decode("utf-8")
             )
             set_fn(new_value)
 
-    def _load_dict_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_dict_state(self, substrate_node: SubstrateNode,
+                         redis_values: Dict[str, Optional[bytes]]) -> None:
         """
         This function will attempt to load a node's dict metrics from redis.
         If the data from Redis cannot be obtained, the state won't be updated.
         :param substrate_node: The node state to load
+        :param redis_values: The node's metrics retrieved from Redis
         :return: Nothing
         """
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_dict_state_helper(substrate_node)
 
         # We iterate over each metric configuration and attempt to load from
@@ -180,16 +188,16 @@ class SubstrateNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             new_value = (
                 state_value if redis_value is None
                 else json.loads(redis_value.decode("utf-8"))
             )
             set_fn(new_value)
 
-    def _load_list_state(self, substrate_node: SubstrateNode) -> None:
+    def _load_list_state(self, substrate_node: SubstrateNode,
+                         redis_values: Dict[str, Optional[bytes]]) -> None:
 
-        redis_hash = Keys.get_hash_parent(substrate_node.parent_id)
         loading_helper = get_load_list_state_helper(substrate_node)
 
         for configuration in loading_helper:
@@ -197,19 +205,36 @@ class SubstrateNodeDataTransformer(DataTransformer):
             redis_key = configuration['redis_key']
             set_fn = configuration['setter']
             default_value = bytes(json.dumps(state_value), 'utf-8')
-            redis_value = self.redis.hget(redis_hash, redis_key, default_value)
+            redis_value = redis_values.get(redis_key, default_value)
             new_value = [] if redis_value is None else json.loads(
                 redis_value.decode("utf-8"))
             set_fn(new_value)
 
-    def load_state(self, substrate_node: SubstrateNode) -> SubstrateNode:
+    def _get_state_redis_keys(self,
+                              substrate_node: SubstrateNode) -> List[str]:
+        loading_helpers = [get_load_number_state_helper,
+                           get_load_bool_state_helper,
+                           get_load_str_state_helper,
+                           get_load_dict_state_helper,
+                           get_load_list_state_helper]
+        return [configuration['redis_key']
+                for loading_helper in loading_helpers
+                for configuration in loading_helper(substrate_node)]
+
+    def load_state(self, substrate_node: SubstrateNode,
+                   redis_values: Optional[Dict[str, Optional[bytes]]] = None) \
+            -> SubstrateNode:
         self.logger.debug("Loading the state of %s from Redis", substrate_node)
 
-        self._load_number_state(substrate_node)
-        self._load_bool_state(substrate_node)
-        self._load_str_state(substrate_node)
-        self._load_dict_state(substrate_node)
-        self._load_list_state(substrate_node)
+        if redis_values is None:
+            redis_values = self._get_monitorable_state_redis_values(
+                substrate_node)
+
+        self._load_number_state(substrate_node, redis_values)
+        self._load_bool_state(substrate_node, redis_values)
+        self._load_str_state(substrate_node, redis_values)
+        self._load_dict_state(substrate_node, redis_values)
+        self._load_list_state(substrate_node, redis_values)
 
         self.logger.debug(
             "Restored %s state: _last_monitored_websocket=%s, "
@@ -550,8 +575,11 @@ class SubstrateNodeDataTransformer(DataTransformer):
 
     def _place_latest_data_on_queue(self, data_for_alerting: Dict,
                                     data_for_saving: Dict) -> None:
+        alerter_routing_key = self._get_alerter_routing_key(
+            SUBSTRATE_NODE_TRANSFORMED_DATA_ROUTING_KEY, data_for_alerting,
+            'node_id')
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
-                            SUBSTRATE_NODE_TRANSFORMED_DATA_ROUTING_KEY,
+                            alerter_routing_key,
                             pika.BasicProperties(delivery_mode=2), True)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
@@ -626,7 +654,7 @@ class SubstrateNodeDataTransformer(DataTransformer):
     def _process_raw_data(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        raw_data = json.loads(body)
+        raw_data = decode_message(properties, body)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -679,6 +707,9 @@ class SubstrateNodeDataTransformer(DataTransformer):
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.transformer_name,
@@ -1,6 +1,6 @@
 import logging
 import time
-from typing import TypeVar, Type
+from typing import TypeVar, Type, Optional
 
 import pika.exceptions
 
@@ -30,6 +30,7 @@ from src.utils.constants.names import (
 from src.utils.constants.starters import (RE_INITIALISE_SLEEPING_PERIOD,
                                           RESTART_SLEEPING_PERIOD)
 from src.utils.logging import create_logger, log_and_print
+from src.utils.partitioning import get_partition_component_name
 from src.utils.starters import (get_initialisation_error_message,
                                 get_stopped_message)
 
@@ -82,7 +83,8 @@ def _initialise_transformer_redis(
 
 
 def _initialise_data_transformer(data_transformer_type: Type[T],
-                                 data_transformer_display_name: str) -> T:
+                                 data_transformer_display_name: str,
+                                 partition: Optional[int] = None) -> T:
     transformer_logger = _initialise_transformer_logger(
         data_transformer_display_name, data_transformer_type.__name__)
     redis = _initialise_transformer_redis(data_transformer_display_name,
@@ -94,9 +96,13 @@ def _initialise_data_transformer(data_transformer_type: Type[T],
             rabbitmq = RabbitMQApi(
                 logger=transformer_logger.getChild(RabbitMQApi.__name__),
                 host=env.RABBIT_IP)
-            data_transformer = data_transformer_type(
+            data_transformer_args = [
                 data_transformer_display_name, transformer_logger, redis,
-                rabbitmq, env.DATA_TRANSFORMER_PUBLISHING_QUEUE_SIZE)
+                rabbitmq, env.DATA_TRANSFORMER_PUBLISHING_QUEUE_SIZE]
+            if partition is not None:
+                # Only the system and node transformers are partitioned
+                data_transformer_args.append(partition)
+            data_transformer = data_transformer_type(*data_transformer_args)
             log_and_print("Successfully initialised {}".format(
                 data_transformer_display_name), transformer_logger)
             break
@@ -110,9 +116,10 @@ def _initialise_data_transformer(data_transformer_type: Type[T],
     return data_transformer
 
 
-def start_system_data_transformer() -> None:
+def start_system_data_transformer(partition: Optional[int] = None) -> None:
     system_data_transformer = _initialise_data_transformer(
-        SystemDataTransformer, SYSTEM_DATA_TRANSFORMER_NAME)
+        SystemDataTransformer, get_partition_component_name(
+            SYSTEM_DATA_TRANSFORMER_NAME, partition), partition)
     start_transformer(system_data_transformer)
 
 
@@ -128,15 +135,18 @@ def start_dockerhub_data_transformer() -> None:
     start_transformer(dockerhub_data_transformer)
 
 
-def start_chainlink_node_data_transformer() -> None:
+def start_chainlink_node_data_transformer(
+        partition: Optional[int] = None) -> None:
     chainlink_node_data_transformer = _initialise_data_transformer(
-        ChainlinkNodeDataTransformer, CL_NODE_DATA_TRANSFORMER_NAME)
+        ChainlinkNodeDataTransformer, get_partition_component_name(
+            CL_NODE_DATA_TRANSFORMER_NAME, partition), partition)
     start_transformer(chainlink_node_data_transformer)
 
 
-def start_evm_node_data_transformer() -> None:
+def start_evm_node_data_transformer(partition: Optional[int] = None) -> None:
     evm_node_data_transformer = _initialise_data_transformer(
-        EVMNodeDataTransformer, EVM_NODE_DATA_TRANSFORMER_NAME)
+        EVMNodeDataTransformer, get_partition_component_name(
+            EVM_NODE_DATA_TRANSFORMER_NAME, partition), partition)
     start_transformer(evm_node_data_transformer)
 
 
@@ -146,9 +156,10 @@ def start_chainlink_contracts_data_transformer() -> None:
     start_transformer(chainlink_contracts_data_transformer)
 
 
-def start_cosmos_node_data_transformer() -> None:
+def start_cosmos_node_data_transformer(partition: Optional[int] = None) -> None:
     cosmos_node_data_transformer = _initialise_data_transformer(
-        CosmosNodeDataTransformer, COSMOS_NODE_DATA_TRANSFORMER_NAME)
+        CosmosNodeDataTransformer, get_partition_component_name(
+            COSMOS_NODE_DATA_TRANSFORMER_NAME, partition), partition)
     start_transformer(cosmos_node_data_transformer)
 
 
@@ -158,9 +169,11 @@ def start_cosmos_network_data_transformer() -> None:
     start_transformer(cosmos_network_data_transformer)
 
 
-def start_substrate_node_data_transformer() -> None:
+def start_substrate_node_data_transformer(
+        partition: Optional[int] = None) -> None:
     substrate_node_data_transformer = _initialise_data_transformer(
-        SubstrateNodeDataTransformer, SUBSTRATE_NODE_DATA_TRANSFORMER_NAME)
+        SubstrateNodeDataTransformer, get_partition_component_name(
+            SUBSTRATE_NODE_DATA_TRANSFORMER_NAME, partition), partition)
     start_transformer(substrate_node_data_transformer)
 
 
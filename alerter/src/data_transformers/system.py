@@ -1,8 +1,6 @@
-import copy
-import json
 import logging
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -11,6 +9,7 @@ from src.data_store.redis.redis_api import RedisApi
 from src.data_store.redis.store_keys import Keys
 from src.data_transformers.data_transformer import DataTransformer
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitorables.system import System
 from src.utils.constants.rabbitmq import (
     ALERT_EXCHANGE, STORE_EXCHANGE, RAW_DATA_EXCHANGE, HEALTH_CHECK_EXCHANGE,
@@ -25,9 +24,10 @@ from src.utils.types import convert_to_float
 class SystemDataTransformer(DataTransformer):
     def __init__(self, transformer_name: str, logger: logging.Logger,
                  redis: RedisApi, rabbitmq: RabbitMQApi,
-                 max_queue_size: int = 0) -> None:
+                 max_queue_size: int = 0,
+                 partition: Optional[int] = None) -> None:
         super().__init__(transformer_name, logger, redis, rabbitmq,
-                         max_queue_size)
+                         max_queue_size, partition)
 
     def _initialise_rabbitmq(self) -> None:
         # A data transformer is both a consumer and producer, therefore we need
@@ -35,26 +35,28 @@ class SystemDataTransformer(DataTransformer):
 
         self.rabbitmq.connect_till_successful()
 
-        # Set consuming configuration
+        # Set consuming configuration. A partitioned transformer consumes
+        # from the queue of its partition only.
+        input_queue = self._get_input_queue_name(SYSTEM_DT_INPUT_QUEUE_NAME)
+        input_routing_key = self._get_input_routing_key(
+            SYSTEM_RAW_DATA_ROUTING_KEY)
         self.logger.info("Creating '%s' exchange", RAW_DATA_EXCHANGE)
         self.rabbitmq.exchange_declare(RAW_DATA_EXCHANGE, TOPIC, False, True,
                                        False, False)
-        self.logger.info("Creating queue '%s'", SYSTEM_DT_INPUT_QUEUE_NAME)
-        self.rabbitmq.queue_declare(SYSTEM_DT_INPUT_QUEUE_NAME, False, True,
-                                    False, False)
+        self.logger.info("Creating queue '%s'", input_queue)
+        self.rabbitmq.queue_declare(input_queue, False, True, False, False)
         self.logger.info("Binding queue '%s' to exchange '%s' with routing "
-                         "key '%s'", SYSTEM_DT_INPUT_QUEUE_NAME,
-                         RAW_DATA_EXCHANGE,
-                         SYSTEM_RAW_DATA_ROUTING_KEY)
-        self.rabbitmq.queue_bind(SYSTEM_DT_INPUT_QUEUE_NAME, RAW_DATA_EXCHANGE,
-                                 SYSTEM_RAW_DATA_ROUTING_KEY)
+                         "key '%s'", input_queue, RAW_DATA_EXCHANGE,
+                         input_routing_key)
+        self.rabbitmq.queue_bind(input_queue, RAW_DATA_EXCHANGE,
+                                 input_routing_key)
 
         # Pre-fetch count is 5 times less the maximum queue size
         prefetch_count = round(self.publishing_queue.maxsize / 5)
         self.rabbitmq.basic_qos(prefetch_count=prefetch_count)
         self.logger.debug("Declaring consuming intentions")
-        self.rabbitmq.basic_consume(SYSTEM_DT_INPUT_QUEUE_NAME,
-                                    self._process_raw_data, False, False, None)
+        self.rabbitmq.basic_consume(input_queue, self._process_raw_data, False,
+                                    False, None)
 
         # Set producing configuration
         self.logger.info("Setting delivery confirmation on RabbitMQ channel")
@@ -69,19 +71,44 @@ class SystemDataTransformer(DataTransformer):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
                                        True, False, False)
 
-    def load_state(self, system: System) -> System:
+    def _get_state_redis_keys(self, system: System) -> List[str]:
+        system_id = system.system_id
+        return [
+            Keys.get_system_process_cpu_seconds_total(system_id),
+            Keys.get_system_process_memory_usage(system_id),
+            Keys.get_system_virtual_memory_usage(system_id),
+            Keys.get_system_open_file_descriptors(system_id),
+            Keys.get_system_system_cpu_usage(system_id),
+            Keys.get_system_system_ram_usage(system_id),
+            Keys.get_system_system_storage_usage(system_id),
+            Keys.get_system_network_transmit_bytes_per_second(system_id),
+            Keys.get_system_network_receive_bytes_per_second(system_id),
+            Keys.get_system_network_transmit_bytes_total(system_id),
+            Keys.get_system_network_receive_bytes_total(system_id),
+            Keys.get_system_disk_io_time_seconds_in_interval(system_id),
+            Keys.get_system_disk_io_time_seconds_total(system_id),
+            Keys.get_system_last_monitored(system_id),
+            Keys.get_system_went_down_at(system_id),
+        ]
+
+    def load_state(self, system: System,
+                   redis_values: Optional[Dict[str, Optional[bytes]]] = None) \
+            -> System:
         # Below, we will try and get the data stored in redis and store it
         # in the system's state. If the data from Redis cannot be obtained, the
-        # state won't be updated.
+        # state won't be updated. All the metrics are retrieved in one round
+        # trip, unless they were already retrieved together with those of
+        # other systems.
 
         self.logger.debug("Loading the state of %s from Redis", system)
-        redis_hash = Keys.get_hash_parent(system.parent_id)
+        if redis_values is None:
+            redis_values = self._get_monitorable_state_redis_values(system)
         system_id = system.system_id
 
         # Load process_cpu_seconds_total from Redis
         state_process_cpu_seconds_total = system.process_cpu_seconds_total
-        redis_process_cpu_seconds_total = self.redis.hget(
-            redis_hash, Keys.get_system_process_cpu_seconds_total(system_id),
+        redis_process_cpu_seconds_total = redis_values.get(
+            Keys.get_system_process_cpu_seconds_total(system_id),
             bytes(str(state_process_cpu_seconds_total), 'utf8'))
         redis_process_cpu_seconds_total = 'None' if \
             redis_process_cpu_seconds_total is None \
@@ -92,8 +119,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load process_memory_usage from Redis
         state_process_memory_usage = system.process_memory_usage
-        redis_process_memory_usage = self.redis.hget(
-            redis_hash, Keys.get_system_process_memory_usage(system_id),
+        redis_process_memory_usage = redis_values.get(
+            Keys.get_system_process_memory_usage(system_id),
             bytes(str(state_process_memory_usage), 'utf-8'))
         redis_process_memory_usage = 'None' if \
             redis_process_memory_usage is None \
@@ -104,8 +131,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load virtual_memory_usage from Redis
         state_virtual_memory_usage = system.virtual_memory_usage
-        redis_virtual_memory_usage = self.redis.hget(
-            redis_hash, Keys.get_system_virtual_memory_usage(system_id),
+        redis_virtual_memory_usage = redis_values.get(
+            Keys.get_system_virtual_memory_usage(system_id),
             bytes(str(state_virtual_memory_usage), 'utf-8'))
         redis_virtual_memory_usage = 'None' if \
             redis_virtual_memory_usage is None \
@@ -116,8 +143,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load open_file_descriptors from Redis
         state_open_file_descriptors = system.open_file_descriptors
-        redis_open_file_descriptors = self.redis.hget(
-            redis_hash, Keys.get_system_open_file_descriptors(system_id),
+        redis_open_file_descriptors = redis_values.get(
+            Keys.get_system_open_file_descriptors(system_id),
             bytes(str(state_open_file_descriptors), 'utf-8'))
         redis_open_file_descriptors = 'None' if \
             redis_open_file_descriptors is None \
@@ -128,8 +155,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load system_cpu_usage from Redis
         state_system_cpu_usage = system.system_cpu_usage
-        redis_system_cpu_usage = self.redis.hget(
-            redis_hash, Keys.get_system_system_cpu_usage(system_id),
+        redis_system_cpu_usage = redis_values.get(
+            Keys.get_system_system_cpu_usage(system_id),
             bytes(str(state_system_cpu_usage), 'utf-8'))
         redis_system_cpu_usage = 'None' if redis_system_cpu_usage is None \
             else redis_system_cpu_usage.decode("utf-8")
@@ -138,8 +165,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load system_ram_usage from Redis
         state_system_ram_usage = system.system_ram_usage
-        redis_system_ram_usage = self.redis.hget(
-            redis_hash, Keys.get_system_system_ram_usage(system_id),
+        redis_system_ram_usage = redis_values.get(
+            Keys.get_system_system_ram_usage(system_id),
             bytes(str(state_system_ram_usage), 'utf-8'))
         redis_system_ram_usage = 'None' if redis_system_ram_usage is None \
             else redis_system_ram_usage.decode("utf-8")
@@ -148,8 +175,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load system_storage_usage from Redis
         state_system_storage_usage = system.system_storage_usage
-        redis_system_storage_usage = self.redis.hget(
-            redis_hash, Keys.get_system_system_storage_usage(system_id),
+        redis_system_storage_usage = redis_values.get(
+            Keys.get_system_system_storage_usage(system_id),
             bytes(str(state_system_storage_usage), 'utf-8'))
         redis_system_storage_usage = 'None' \
             if redis_system_storage_usage is None \
@@ -161,8 +188,7 @@ class SystemDataTransformer(DataTransformer):
         # Load network_transmit_bytes_per_second from Redis
         state_network_transmit_bytes_per_second = \
             system.network_transmit_bytes_per_second
-        redis_network_transmit_bytes_per_second = self.redis.hget(
-            redis_hash,
+        redis_network_transmit_bytes_per_second = redis_values.get(
             Keys.get_system_network_transmit_bytes_per_second(system_id),
             bytes(str(state_network_transmit_bytes_per_second), 'utf-8'))
         redis_network_transmit_bytes_per_second = 'None' if \
@@ -176,8 +202,7 @@ class SystemDataTransformer(DataTransformer):
         # Load network_receive_bytes_per_second from Redis
         state_network_receive_bytes_per_second = \
             system.network_receive_bytes_per_second
-        redis_network_receive_bytes_per_second = self.redis.hget(
-            redis_hash,
+        redis_network_receive_bytes_per_second = redis_values.get(
             Keys.get_system_network_receive_bytes_per_second(system_id),
             bytes(str(state_network_receive_bytes_per_second), 'utf-8'))
         redis_network_receive_bytes_per_second = 'None' if \
@@ -190,8 +215,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load network_transmit_bytes_total from Redis
         state_network_transmit_bytes_total = system.network_transmit_bytes_total
-        redis_network_transmit_bytes_total = self.redis.hget(
-            redis_hash, Keys.get_system_network_transmit_bytes_total(system_id),
+        redis_network_transmit_bytes_total = redis_values.get(
+            Keys.get_system_network_transmit_bytes_total(system_id),
             bytes(str(state_network_transmit_bytes_total), 'utf-8'))
         redis_network_transmit_bytes_total = 'None' if \
             redis_network_transmit_bytes_total is None \
@@ -202,8 +227,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load network_receive_bytes_total from Redis
         state_network_receive_bytes_total = system.network_receive_bytes_total
-        redis_network_receive_bytes_total = self.redis.hget(
-            redis_hash, Keys.get_system_network_receive_bytes_total(system_id),
+        redis_network_receive_bytes_total = redis_values.get(
+            Keys.get_system_network_receive_bytes_total(system_id),
             bytes(str(state_network_receive_bytes_total), 'utf-8'))
         redis_network_receive_bytes_total = 'None' if \
             redis_network_receive_bytes_total is None \
@@ -215,8 +240,7 @@ class SystemDataTransformer(DataTransformer):
         # Load disk_io_time_seconds_in_interval from Redis
         state_disk_io_time_seconds_in_interval = \
             system.disk_io_time_seconds_in_interval
-        redis_disk_io_time_seconds_in_interval = self.redis.hget(
-            redis_hash,
+        redis_disk_io_time_seconds_in_interval = redis_values.get(
             Keys.get_system_disk_io_time_seconds_in_interval(system_id),
             bytes(str(state_disk_io_time_seconds_in_interval), 'utf-8'))
         redis_disk_io_time_seconds_in_interval = 'None' \
@@ -229,8 +253,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load disk_io_time_seconds_total from Redis
         state_disk_io_time_seconds_total = system.disk_io_time_seconds_total
-        redis_disk_io_time_seconds_total = self.redis.hget(
-            redis_hash, Keys.get_system_disk_io_time_seconds_total(system_id),
+        redis_disk_io_time_seconds_total = redis_values.get(
+            Keys.get_system_disk_io_time_seconds_total(system_id),
             bytes(str(state_disk_io_time_seconds_total), 'utf-8'))
         redis_disk_io_time_seconds_total = 'None' if \
             redis_disk_io_time_seconds_total is None \
@@ -241,8 +265,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load last_monitored from Redis
         state_last_monitored = system.last_monitored
-        redis_last_monitored = self.redis.hget(
-            redis_hash, Keys.get_system_last_monitored(system_id),
+        redis_last_monitored = redis_values.get(
+            Keys.get_system_last_monitored(system_id),
             bytes(str(state_last_monitored), 'utf-8'))
         redis_last_monitored = 'None' if redis_last_monitored is None \
             else redis_last_monitored.decode("utf-8")
@@ -251,8 +275,8 @@ class SystemDataTransformer(DataTransformer):
 
         # Load went_down_at from Redis
         state_went_down_at = system.went_down_at
-        redis_went_down_at = self.redis.hget(
-            redis_hash, Keys.get_system_went_down_at(system_id),
+        redis_went_down_at = redis_values.get(
+            Keys.get_system_went_down_at(system_id),
             bytes(str(state_went_down_at), 'utf-8'))
         redis_went_down_at = 'None' if redis_went_down_at is None \
             else redis_went_down_at.decode("utf-8")
@@ -347,8 +371,10 @@ class SystemDataTransformer(DataTransformer):
                                              transformed_data: Dict) -> Dict:
         self.logger.debug("Performing further processing for storage ...")
 
+        # The transformed data is built afresh for every message and is never
+        # modified after it is returned, so it can be stored as is.
         if 'result' in transformed_data or 'error' in transformed_data:
-            processed_data = copy.deepcopy(transformed_data)
+            processed_data = transformed_data
         else:
             # Since the processing function calling this method caters for
             # unexpected data this condition will never be executed. Regardless,
@@ -372,7 +398,7 @@ class SystemDataTransformer(DataTransformer):
 
             processed_data = {
                 'result': {
-                    'meta_data': copy.deepcopy(td_meta_data),
+                    'meta_data': td_meta_data,
                     'data': {}
                 }
             }
@@ -381,8 +407,7 @@ class SystemDataTransformer(DataTransformer):
             # states are sent to the alerter
             processed_data_metrics = processed_data['result']['data']
             for metric, value in td_metrics.items():
-                processed_data_metrics[metric] = {}
-                processed_data_metrics[metric]['current'] = value
+                processed_data_metrics[metric] = {'current': value}
 
             processed_data_metrics['process_cpu_seconds_total']['previous'] = \
                 system.process_cpu_seconds_total
@@ -420,18 +445,24 @@ class SystemDataTransformer(DataTransformer):
             system: System = self.state[td_system_id]
             downtime_exception = SystemIsDownException(td_system_name)
 
-            processed_data = copy.deepcopy(transformed_data)
+            # Only downtime errors are reformatted, other errors are sent as
+            # they are
+            processed_data = transformed_data
 
             if td_error_code == downtime_exception.code:
                 td_metrics = transformed_data['error']['data']
-                processed_data_metrics = processed_data['error']['data']
-
-                for metric, value in td_metrics.items():
-                    processed_data_metrics[metric] = {}
-                    processed_data_metrics[metric]['current'] = value
-
+                processed_data_metrics = {
+                    metric: {'current': value}
+                    for metric, value in td_metrics.items()
+                }
                 processed_data_metrics['went_down_at']['previous'] = \
                     system.went_down_at
+                processed_data = {
+                    'error': {
+                        **transformed_data['error'],
+                        'data': processed_data_metrics
+                    }
+                }
         else:
             # Since the processing function calling this method caters for
             # unexpected data this condition will never be executed. Regardless,
@@ -485,24 +516,26 @@ class SystemDataTransformer(DataTransformer):
                     disk_io_time_seconds_total - \
                     system.disk_io_time_seconds_total
 
-            transformed_data = copy.deepcopy(data)
-            td_meta_data = transformed_data['result']['meta_data']
-            td_metrics = transformed_data['result']['data']
-
-            # Transform the meta_data by deleting the monitor_name and changing
-            # the time key to last_monitored key
-            del td_meta_data['monitor_name']
-            del td_meta_data['time']
-            td_meta_data['last_monitored'] = meta_data['time']
-
-            # Transform the data by adding the new processed data.
-            td_metrics['network_transmit_bytes_per_second'] = \
-                network_transmit_bytes_per_second
-            td_metrics['network_receive_bytes_per_second'] = \
-                network_receive_bytes_per_second
-            td_metrics['disk_io_time_seconds_in_interval'] = \
-                disk_io_time_seconds_in_interval
-            td_metrics['went_down_at'] = None
+            # Transform the meta_data by removing the monitor_name and changing
+            # the time key to last_monitored key, and the data by adding the
+            # new processed data. Only the changed fields are built anew, the
+            # raw values are shared rather than copied.
+            transformed_data = {
+                'result': {
+                    **data['result'],
+                    'meta_data': self._transform_result_meta_data(meta_data),
+                    'data': {
+                        **system_metrics,
+                        'network_transmit_bytes_per_second':
+                            network_transmit_bytes_per_second,
+                        'network_receive_bytes_per_second':
+                            network_receive_bytes_per_second,
+                        'disk_io_time_seconds_in_interval':
+                            disk_io_time_seconds_in_interval,
+                        'went_down_at': None
+                    }
+                }
+            }
         elif 'error' in data:
             meta_data = data['error']['meta_data']
             error_code = data['error']['code']
@@ -514,8 +547,12 @@ class SystemDataTransformer(DataTransformer):
 
             # In case of errors in the sent messages only remove the
             # monitor_name from the meta data
-            transformed_data = copy.deepcopy(data)
-            del transformed_data['error']['meta_data']['monitor_name']
+            transformed_data = {
+                'error': {
+                    **data['error'],
+                    'meta_data': self._transform_error_meta_data(meta_data)
+                }
+            }
 
             # If we have a downtime error, set went_down_at to the time of error
             # if the system was up. Otherwise, leave went_down_at as stored in
@@ -544,19 +581,25 @@ class SystemDataTransformer(DataTransformer):
     def _place_latest_data_on_queue(self, transformed_data: Dict,
                                     data_for_alerting: Dict,
                                     data_for_saving: Dict) -> None:
+        alerter_routing_key = self._get_alerter_routing_key(
+            SYSTEM_TRANSFORMED_DATA_ROUTING_KEY, data_for_alerting,
+            'system_id')
+        # The data is built afresh for every message, so it need not be copied
         self._push_to_queue(data_for_alerting, ALERT_EXCHANGE,
-                            SYSTEM_TRANSFORMED_DATA_ROUTING_KEY,
-                            pika.BasicProperties(delivery_mode=2), True)
+                            alerter_routing_key,
+                            pika.BasicProperties(delivery_mode=2), True,
+                            copy_data=False)
 
         self._push_to_queue(data_for_saving, STORE_EXCHANGE,
                             SYSTEM_TRANSFORMED_DATA_ROUTING_KEY,
-                            pika.BasicProperties(delivery_mode=2), True)
+                            pika.BasicProperties(delivery_mode=2), True,
+                            copy_data=False)
 
     def _process_raw_data(self, ch: BlockingChannel,
                           method: pika.spec.Basic.Deliver,
                           properties: pika.spec.BasicProperties, body: bytes) \
             -> None:
-        raw_data = json.loads(body)
+        raw_data = decode_message(properties, body)
         self.logger.debug("Received %s from monitors. Now processing this "
                           "data.", raw_data)
 
@@ -617,6 +660,9 @@ class SystemDataTransformer(DataTransformer):
         try:
             self._send_data()
 
+            if processing_error:
+                self.heartbeat_batcher.record_failed()
+
             if not processing_error:
                 heartbeat = {
                     'component_name': self.transformer_name,
@@ -3,7 +3,7 @@ import json
 import logging
 import signal
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from types import FrameType
 
 import pika.exceptions
@@ -12,6 +12,7 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.data_store.redis.redis_api import RedisApi
 from src.data_store.redis.store_keys import Keys
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.utils import env
 from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
                                           HB_HANDLER_HEARTBEAT_QUEUE_NAME,
@@ -21,7 +22,7 @@ from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
                                           TOPIC)
 from src.utils.exceptions import ReceivedUnexpectedDataException
 from src.utils.logging import log_and_print
-from src.utils.types import RedisType
+from src.utils.timing import TimedTaskLimiter
 
 
 class HeartbeatHandler:
@@ -35,10 +36,15 @@ class HeartbeatHandler:
         self._rabbitmq = RabbitMQApi(
             logger=self.logger.getChild(RabbitMQApi.__name__), host=rabbit_ip)
 
-        # This dict stores the keys-values that should have been stored to redis
-        # but where not saved due to an error in redis. This is done so that the
-        # heartbeats are saved eventually redis is back online
-        self._unsavable_redis_data = {}
+        # This dict stores the heartbeats which still need to be saved to
+        # redis, keyed by their redis key. Heartbeats are saved in pipelined
+        # batches, and if saving fails they are kept here so that they are
+        # saved eventually redis is back online. Only the latest heartbeat of
+        # each component is kept.
+        self._pending_redis_data = {}
+        self._save_limiter = TimedTaskLimiter(timedelta(
+            seconds=env.HEARTBEAT_HANDLER_FLUSH_INTERVAL_SECONDS))
+        self._save_scheduled = False
 
         # Handle termination signals by stopping the monitor gracefully
         signal.signal(signal.SIGTERM, self.on_terminate)
@@ -66,6 +72,8 @@ class HeartbeatHandler:
 
     def _initialise_rabbitmq(self) -> None:
         self.rabbitmq.connect_till_successful()
+        # Timers do not survive a new connection
+        self._save_scheduled = False
 
         self.logger.info("Creating '%s' exchange", HEALTH_CHECK_EXCHANGE)
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
@@ -90,52 +98,40 @@ class HeartbeatHandler:
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
 
-    def _save_to_redis_and_add_to_state_if_fail(
-            self, key: str, value: RedisType) -> None:
-        self.logger.debug('Saving %s=%s to Redis', key, value)
-        ret = self.redis.set(key, value)
+    def _save_pending_redis_data(self) -> None:
+        self._save_limiter.did_task()
 
-        # If None is returned it means that saving failed. Therefore store
-        # this in the dict. If execution reaches the second condition it means
-        # that saving was successful. Therefore remove the key from the dict if
-        # it is present.
+        # The heartbeat of the handler itself is saved with every batch
+        key_heartbeat = Keys.get_component_heartbeat(self.name)
+        handler_heartbeat = {'component_name': self.name,
+                             'timestamp': datetime.now().timestamp()}
+        self._pending_redis_data[key_heartbeat] = json.dumps(handler_heartbeat)
+
+        self.logger.debug("Saving %s heartbeats to Redis",
+                          len(self._pending_redis_data))
+        ret = self.redis.set_multiple(copy.copy(self._pending_redis_data))
+
+        # If None is returned it means that saving failed. Therefore keep the
+        # heartbeats in state so that they are saved with the next batch.
         if ret is None:
-            self.logger.error("Could not save %s=%s to Redis. Storing it in "
-                              "state so that it can be saved later.",
-                              key, value)
-            self._unsavable_redis_data[key] = value
-        elif key in self._unsavable_redis_data:
-            self.logger.debug("Removing %s=%s from state", key, value)
-            del self._unsavable_redis_data[key]
-
-        self.logger.debug("Successfully saved %s=%s to Redis", key, value)
-
-    def _dump_unsavable_redis_data(self) -> None:
-        if len(self._unsavable_redis_data) == 0:
-            return
-
-        self.logger.debug("Attempting to save data that was not able to be "
-                          "saved to redis.")
-
-        unsavable_redis_data_copy = copy.deepcopy(self._unsavable_redis_data)
-        for key, value in unsavable_redis_data_copy.items():
-            ret = self.redis.set(key, value)
-            if ret is not None:
-                self.logger.debug("Successfully saved %s=%s. Removing from "
-                                  "state.", key, value)
-                del self._unsavable_redis_data[key]
-
-        if len(self._unsavable_redis_data) == 0:
-            self.logger.debug("Successfully saved all redis data in waiting "
-                              "state.")
+            self.logger.error("Could not save %s heartbeats to Redis. Keeping "
+                              "them in state so that they can be saved later.",
+                              len(self._pending_redis_data))
         else:
-            self.logger.debug("Could not save all data to Redis.")
+            self.logger.debug("Successfully saved %s heartbeats to Redis",
+                              len(self._pending_redis_data))
+            self._pending_redis_data.clear()
+
+    def _save_pending_redis_data_if_any(self) -> None:
+        self._save_scheduled = False
+        if len(self._pending_redis_data) != 0:
+            self._save_pending_redis_data()
 
     def _process_heartbeat(self, ch: BlockingChannel,
                            method: pika.spec.Basic.Deliver,
                            properties: pika.spec.BasicProperties, body: bytes) \
             -> None:
-        heartbeat = json.loads(body)
+        heartbeat = decode_message(properties, body)
         self.logger.debug("Received %s. Now processing this data.", heartbeat)
 
         try:
@@ -144,11 +140,7 @@ class HeartbeatHandler:
                 component_name = heartbeat['component_name']
 
                 key_heartbeat = Keys.get_component_heartbeat(component_name)
-                transformed_heartbeat = json.dumps(heartbeat)
-                self._save_to_redis_and_add_to_state_if_fail(
-                    key_heartbeat, transformed_heartbeat)
-
-                self._dump_unsavable_redis_data()
+                self._pending_redis_data[key_heartbeat] = json.dumps(heartbeat)
 
                 self.logger.debug("Successfully processed %s", heartbeat)
             else:
@@ -160,15 +152,17 @@ class HeartbeatHandler:
 
         self.rabbitmq.basic_ack(method.delivery_tag, False)
 
-        self.logger.debug("Saving %s heartbeat to Redis", self)
-        key_heartbeat = Keys.get_component_heartbeat(self.name)
-        handler_heartbeat = {'component_name': self.name,
-                             'timestamp': datetime.now().timestamp()}
-        transformed_handler_heartbeat = json.dumps(handler_heartbeat)
-        ret = self.redis.set(key_heartbeat, transformed_handler_heartbeat)
-        if ret is None:
-            self.logger.error("Could not save %s=%s to Redis.", key_heartbeat,
-                              transformed_handler_heartbeat)
+        # Save the batch if it is full or if it has been waiting long enough.
+        # Otherwise make sure that the batch is saved even if no other
+        # heartbeat is received.
+        if len(self._pending_redis_data) >= env.HEARTBEAT_HANDLER_BATCH_SIZE \
+                or self._save_limiter.can_do_task():
+            self._save_pending_redis_data()
+        elif not self._save_scheduled:
+            self.rabbitmq.connection.call_later(
+                env.HEARTBEAT_HANDLER_FLUSH_INTERVAL_SECONDS,
+                self._save_pending_redis_data_if_any)
+            self._save_scheduled = True
 
     def start(self) -> None:
         self._initialise_rabbitmq()
@@ -196,6 +190,7 @@ class HeartbeatHandler:
         log_and_print("{} is terminating. Connections with RabbitMQ will be "
                       "closed, and afterwards the process will exit."
                       .format(self), self.logger)
+        self._save_pending_redis_data_if_any()
         self.disconnect_from_rabbit()
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
@@ -0,0 +1,128 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+import msgpack
+import pika
+
+JSON_CONTENT_TYPE = 'application/json'
+MSGPACK_CONTENT_TYPE = 'application/msgpack'
+
+
+class MessageCodec(ABC):
+    """
+    Serializes the dict messages published on RabbitMQ, and de-serializes the
+    messages received. The content type of a codec is set as the content_type
+    property of the messages it serializes, so that consumers know how to
+    de-serialize them.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        pass
+
+    @property
+    @abstractmethod
+    def content_type(self) -> str:
+        pass
+
+    @abstractmethod
+    def encode(self, message: Dict) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, body: bytes) -> Any:
+        pass
+
+
+class JsonMessageCodec(MessageCodec):
+    @property
+    def name(self) -> str:
+        return 'json'
+
+    @property
+    def content_type(self) -> str:
+        return JSON_CONTENT_TYPE
+
+    def encode(self, message: Dict) -> bytes:
+        return json.dumps(message).encode('utf-8')
+
+    def decode(self, body: bytes) -> Any:
+        return json.loads(body)
+
+
+def _json_compatible_map(pairs: List[Tuple[Any, Any]]) -> Dict:
+    # JSON objects can only have string keys, therefore json.dumps converts
+    # any other key to the string it would serialize it to. This is done for
+    # msgpack maps as well, so that consumers receive the same message
+    # whatever the codec of the publisher.
+    return {key if isinstance(key, str) else json.dumps(key): value
+            for key, value in pairs}
+
+
+class MsgpackMessageCodec(MessageCodec):
+    """
+    Serializes messages to MessagePack, in which numbers are stored in binary
+    form rather than as text, and strings and lists are length-prefixed.
+    """
+
+    @property
+    def name(self) -> str:
+        return 'msgpack'
+
+    @property
+    def content_type(self) -> str:
+        return MSGPACK_CONTENT_TYPE
+
+    def encode(self, message: Dict) -> bytes:
+        # Integers which do not fit in 64 bits raise an OverflowError, and
+        # objects which are not supported raise a TypeError
+        return msgpack.packb(message)
+
+    def decode(self, body: bytes) -> Any:
+        try:
+            return msgpack.unpackb(body)
+        except ValueError:
+            # A map has a key which is not a string. This is not the case for
+            # most messages, so they are decoded without the slower map hook.
+            return msgpack.unpackb(body, strict_map_key=False,
+                                   object_pairs_hook=_json_compatible_map)
+
+
+JSON_MESSAGE_CODEC = JsonMessageCodec()
+MSGPACK_MESSAGE_CODEC = MsgpackMessageCodec()
+
+_MESSAGE_CODECS = [JSON_MESSAGE_CODEC, MSGPACK_MESSAGE_CODEC]
+_MESSAGE_CODECS_BY_NAME = {codec.name: codec for codec in _MESSAGE_CODECS}
+_MESSAGE_CODECS_BY_CONTENT_TYPE = {codec.content_type: codec
+                                   for codec in _MESSAGE_CODECS}
+
+
+def get_message_codec(name: str) -> MessageCodec:
+    """
+    :param name: The name of the codec, i.e. json or msgpack
+    :return: The codec with the given name
+    :raises ValueError: If there is no codec with the given name
+    """
+    try:
+        return _MESSAGE_CODECS_BY_NAME[name.strip().lower()]
+    except KeyError:
+        raise ValueError("Unknown RabbitMQ message codec '{}'. Expected one "
+                         "of {}".format(name, list(_MESSAGE_CODECS_BY_NAME)))
+
+
+def decode_message(properties: Optional[pika.spec.BasicProperties],
+                   body: bytes) -> Any:
+    """
+    De-serializes a received message using the codec of its content_type
+    property. Messages without a content type, or with a content type which is
+    not known, were published as JSON.
+    :param properties: The properties of the message
+    :param body: The body of the message
+    :return: The de-serialized message
+    """
+    content_type = None if properties is None else properties.content_type
+    codec = _MESSAGE_CODECS_BY_CONTENT_TYPE.get(content_type,
+                                                JSON_MESSAGE_CODEC)
+    return codec.decode(body)
@@ -1,13 +1,16 @@
-import json
 import logging
 import time
 from datetime import timedelta
-from typing import List, Optional, Union, Dict, Callable, Any, Sequence
+from typing import (List, Optional, Union, Dict, Callable, Any, Sequence,
+                    Collection, Set, Tuple)
 
 import pika
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
 
+from src.message_broker.rabbitmq.message_codecs import (
+    MessageCodec, JSON_MESSAGE_CODEC, get_message_codec)
+from src.utils import env
 from src.utils.constants.rabbitmq import TOPIC
 from src.utils.exceptions import (ConnectionNotInitialisedException,
                                   MessageWasNotDeliveredException,
@@ -24,8 +27,8 @@ class RabbitMQApi:
     def __init__(self, logger: logging.Logger, host: str = 'localhost',
                  port: int = 5672, username: str = '', password: str = '',
                  connection_check_time_interval: timedelta = timedelta(
-                     seconds=30)) \
-            -> None:
+                     seconds=30), publisher_confirm_window: int = 1,
+                 message_codec: Optional[MessageCodec] = None) -> None:
         self._logger = logger
         self._host = host
         self._connection = None
@@ -42,6 +45,22 @@ class RabbitMQApi:
         # A boolean variable which keeps track of the connection status with
         # RabbitMQ
         self._is_connected = False
+        # The maximum number of published messages which may be awaiting a
+        # delivery confirmation at the same time. If 1, confirm_delivery puts
+        # the channel in pika's blocking confirm mode, in which every publish
+        # waits for its confirmation. Otherwise the delivery confirmations are
+        # received asynchronously and tracked below by delivery tag.
+        self._publisher_confirm_window = publisher_confirm_window
+        self._next_delivery_tag: Optional[int] = None
+        self._unconfirmed_delivery_tags: Set[int] = set()
+        self._delivery_confirmations: Dict[int, bool] = {}
+        self._returned_delivery_tags: Set[int] = set()
+        # The codec used to serialize the dict messages published. Consumers
+        # de-serialize messages according to their content_type property, so
+        # the codec can differ between publishers.
+        self._message_codec = get_message_codec(
+            env.RABBITMQ_MESSAGE_CODEC) if message_codec is None \
+            else message_codec
 
     @property
     def is_connected(self) -> bool:
@@ -83,6 +102,83 @@ class RabbitMQApi:
     def connection_check_time_interval_seconds(self) -> float:
         return self._connection_check_time_interval_seconds
 
+    @property
+    def publisher_confirm_window(self) -> int:
+        return self._publisher_confirm_window
+
+    @property
+    def message_codec(self) -> MessageCodec:
+        return self._message_codec
+
+    def _encode_body(self, body: Union[str, Dict, bytes], is_body_dict: bool,
+                     properties: Optional[pika.spec.BasicProperties]) \
+            -> Tuple[Union[str, bytes], Optional[pika.spec.BasicProperties]]:
+        # Dict messages are serialized using the message codec, whose content
+        # type is set in the message properties. If the codec cannot serialize
+        # the message, for example because it has an integer which is too
+        # large, the message is serialized as JSON.
+        if not is_body_dict:
+            return body, properties
+
+        codec = self.message_codec
+        try:
+            encoded_body = codec.encode(body)
+        except (OverflowError, TypeError):
+            if codec is JSON_MESSAGE_CODEC:
+                raise
+            codec = JSON_MESSAGE_CODEC
+            encoded_body = codec.encode(body)
+
+        if properties is None:
+            properties = pika.BasicProperties()
+        properties.content_type = codec.content_type
+        return encoded_body, properties
+
+    def _is_confirming_asynchronously(self) -> bool:
+        return self._next_delivery_tag is not None
+
+    def _reset_delivery_confirmations(self) -> None:
+        # A new channel is not in confirm mode, and the delivery tags of the
+        # messages published on the old channel are no longer valid.
+        self._next_delivery_tag = None
+        self._unconfirmed_delivery_tags = set()
+        self._delivery_confirmations = {}
+        self._returned_delivery_tags = set()
+
+    def _on_message_returned(self, channel: pika.channel.Channel,
+                             method: pika.spec.Basic.Return,
+                             properties: pika.spec.BasicProperties,
+                             body: bytes) -> None:
+        # The broker returns an unroutable mandatory message before confirming
+        # it, but the confirmation may also cover other messages. Therefore
+        # the returned message is identified by the delivery tag which was set
+        # as its message_id when it was published.
+        try:
+            delivery_tag = int(properties.message_id)
+        except (TypeError, ValueError):
+            return
+
+        if delivery_tag in self._unconfirmed_delivery_tags:
+            self._returned_delivery_tags.add(delivery_tag)
+
+    def _on_delivery_confirmation(self, method_frame: pika.frame.Method) \
+            -> None:
+        method = method_frame.method
+        delivered = isinstance(method, pika.spec.Basic.Ack)
+        if method.multiple:
+            delivery_tags = [tag for tag in self._unconfirmed_delivery_tags
+                             if tag <= method.delivery_tag]
+        elif method.delivery_tag in self._unconfirmed_delivery_tags:
+            delivery_tags = [method.delivery_tag]
+        else:
+            delivery_tags = []
+
+        for delivery_tag in delivery_tags:
+            self._unconfirmed_delivery_tags.remove(delivery_tag)
+            self._delivery_confirmations[delivery_tag] = delivered and \
+                delivery_tag not in self._returned_delivery_tags
+            self._returned_delivery_tags.discard(delivery_tag)
+
     def _set_as_connected(self) -> None:
         if not self.is_connected:
             self._logger.info("RabbitMQ connection is live.")
@@ -171,6 +267,7 @@ class RabbitMQApi:
                 self._connection = pika.BlockingConnection(
                     pika.ConnectionParameters(host=self.host))
                 self._channel = self.connection.channel()
+                self._reset_delivery_confirmations()
             elif stripped_credentials['username'] and stripped_credentials[
                 'password']:
                 # Else if neither is blank/none/spaces
@@ -182,6 +279,7 @@ class RabbitMQApi:
                 )
                 self._connection = pika.BlockingConnection(parameters)
                 self._channel = self.connection.channel()
+                self._reset_delivery_confirmations()
             else:
                 # Error case if exactly one of them is blank/none/spaces:
                 blank_credentials = []
@@ -276,15 +374,92 @@ class RabbitMQApi:
                       body: Union[str, Dict, bytes], is_body_dict: bool = False,
                       properties: pika.spec.BasicProperties = None,
                       mandatory: bool = False) -> Optional[int]:
-        # If the message to be published is a Dict, serialize to json first
-        args = [exchange, routing_key,
-                json.dumps(body) if is_body_dict else body,
-                properties, mandatory]
+        # If the message to be published is a Dict, serialize it first
+        body, properties = self._encode_body(body, is_body_dict, properties)
+        args = [exchange, routing_key, body, properties, mandatory]
         # Perform operation only if a connection has been initialised, if not,
         # this function will throw a ConnectionNotInitialised exception
         if self._connection_initialised():
+            if self._is_confirming_asynchronously():
+                return self._safe(self._basic_publish_tracked_unsafe,
+                                  args + [False], -1)
             return self._safe(self.channel.basic_publish, args, -1)
 
+    # Should not be used if the channel is not confirming asynchronously
+    def _basic_publish_tracked_unsafe(
+            self, exchange: str, routing_key: str, body: Union[str, bytes],
+            properties: Optional[pika.spec.BasicProperties], mandatory: bool,
+            is_confirmation_awaited: bool) -> Optional[int]:
+        # In confirm mode the broker numbers every message published on the
+        # channel, so the delivery tag must be counted even if the
+        # confirmation of this message is not awaited. The tag is recorded
+        # before publishing as the confirmation may be received while the
+        # message is being flushed.
+        delivery_tag = self._next_delivery_tag
+        self._next_delivery_tag += 1
+        if is_confirmation_awaited:
+            self._unconfirmed_delivery_tags.add(delivery_tag)
+            if mandatory:
+                # Identifies the message if it is returned as unroutable
+                if properties is None:
+                    properties = pika.BasicProperties()
+                properties.message_id = str(delivery_tag)
+
+        self.channel.basic_publish(exchange, routing_key, body, properties,
+                                   mandatory)
+
+        return delivery_tag if is_confirmation_awaited else None
+
+    def basic_publish_async(self, exchange: str, routing_key: str,
+                            body: Union[str, Dict, bytes],
+                            is_body_dict: bool = False,
+                            properties: pika.spec.BasicProperties = None,
+                            mandatory: bool = False) -> Optional[int]:
+        # Publishes a message without waiting for its delivery confirmation
+        # and returns its delivery tag, which is then passed to
+        # wait_for_delivery_confirmations. Note: self.confirm_delivery() must
+        # be called once on a channel with a publisher_confirm_window larger
+        # than 1 for this function to work as expected.
+        body, properties = self._encode_body(body, is_body_dict, properties)
+        args = [exchange, routing_key, body, properties, mandatory, True]
+        # Perform operation only if a connection has been initialised, if not,
+        # this function will throw a ConnectionNotInitialised exception
+        if self._connection_initialised():
+            return self._safe(self._basic_publish_tracked_unsafe, args, -1)
+
+    def _wait_for_delivery_confirmations_unsafe(
+            self, delivery_tags: Collection[int]) -> Dict[int, bool]:
+        # Wait until at least one of the messages is confirmed. Messages which
+        # are neither confirmed nor awaiting a confirmation were published on
+        # a previous channel, and will never be confirmed.
+        self._process_data_events_until(
+            lambda: any(tag in self._delivery_confirmations
+                        for tag in delivery_tags) or
+            not any(tag in self._unconfirmed_delivery_tags
+                    for tag in delivery_tags))
+
+        confirmations = {}
+        for delivery_tag in delivery_tags:
+            if delivery_tag in self._delivery_confirmations:
+                confirmations[delivery_tag] = self._delivery_confirmations.pop(
+                    delivery_tag)
+
+        return confirmations
+
+    def wait_for_delivery_confirmations(
+            self, delivery_tags: Collection[int]) \
+            -> Optional[Union[Dict[int, bool], int]]:
+        # Blocks until at least one of the given messages is confirmed, and
+        # returns whether each of the given messages confirmed so far was
+        # delivered. A message is not delivered if the broker nacked it, or
+        # returned it as unroutable. An empty dict is returned if none of the
+        # messages can be confirmed anymore.
+        # Perform operation only if a connection has been initialised, if not,
+        # this function will throw a ConnectionNotInitialised exception
+        if self._connection_initialised():
+            return self._safe(self._wait_for_delivery_confirmations_unsafe,
+                              [delivery_tags], -1)
+
     def basic_publish_confirm(self, exchange: str, routing_key: str,
                               body: Union[str, Dict, bytes],
                               is_body_dict: bool = False,
@@ -294,6 +469,23 @@ class RabbitMQApi:
         # mandatory is set to true, this function will block until the consumer
         # receives the message. Note: self.confirm_delivery() must be called
         # once on a channel for this function to work as expected.
+        if self._is_confirming_asynchronously():
+            delivery_tag = self.basic_publish_async(
+                exchange, routing_key, body, is_body_dict, properties,
+                mandatory)
+            if delivery_tag in [None, -1]:
+                return delivery_tag
+
+            confirmations = self.wait_for_delivery_confirmations(
+                [delivery_tag])
+            if confirmations == -1:
+                return -1
+            if not confirmations.get(delivery_tag, False):
+                raise MessageWasNotDeliveredException(
+                    "Message with delivery tag {} was not confirmed as "
+                    "delivered".format(delivery_tag))
+            return None
+
         try:
             return self.basic_publish(exchange, routing_key, body, is_body_dict,
                                       properties, mandatory)
@@ -364,10 +556,58 @@ class RabbitMQApi:
         if self._connection_initialised():
             return self._safe(self.channel.exchange_declare, args, -1)
 
+    # pika's BlockingChannel does not expose the asynchronous channel it wraps,
+    # nor a way to wait for the callbacks registered on it. The two functions
+    # below are the only places where pika's internals are used, and pika is
+    # pinned to the versions whose internals are covered by the tests.
+    def _get_asynchronous_channel(self) -> Optional[pika.channel.Channel]:
+        # None is returned if pika's internals ever change
+        channel_impl = getattr(self.channel, '_impl', None)
+        if isinstance(channel_impl, pika.channel.Channel):
+            return channel_impl
+        return None
+
+    def _process_data_events_until(self, is_done: Callable[[], bool]) -> None:
+        # process_data_events never returns if it is called from a consumer
+        # callback, for example when publishing while processing a message.
+        # Therefore the events are processed the way BlockingChannel waits
+        # for the replies to its own requests. If the channel is closed
+        # meanwhile, the next _flush_output raises ChannelWrongStateError.
+        while not is_done():
+            self.channel._flush_output(is_done)
+
+    # Should not be used if connection has not yet been initialised
+    def _confirm_delivery_asynchronously_unsafe(self) -> None:
+        # pika's BlockingChannel only supports waiting for the confirmation of
+        # each publish, therefore confirm mode is enabled on the underlying
+        # asynchronous channel, with the confirmations tracked by this class.
+        self._reset_delivery_confirmations()
+        channel_impl = self._get_asynchronous_channel()
+        if channel_impl is None:
+            self._logger.warning(
+                "The asynchronous channel of pika could not be accessed. "
+                "Waiting for the confirmation of each publish instead.")
+            self._publisher_confirm_window = 1
+            self.channel.confirm_delivery()
+            return
+
+        selected = []
+
+        channel_impl.add_on_return_callback(self._on_message_returned)
+        channel_impl.confirm_delivery(
+            ack_nack_callback=self._on_delivery_confirmation,
+            callback=selected.append)
+        self._process_data_events_until(lambda: len(selected) > 0)
+
+        self._next_delivery_tag = 1
+
     def confirm_delivery(self) -> Optional[int]:
         # Perform operation only if a connection has been initialised, if not,
         # this function will throw a ConnectionNotInitialised exception
         if self._connection_initialised():
+            if self.publisher_confirm_window > 1:
+                return self._safe(self._confirm_delivery_asynchronously_unsafe,
+                                  [], -1)
             return self._safe(self.channel.confirm_delivery, [], -1)
 
     def queue_purge(self, queue: str) -> Optional[int]:
@@ -402,6 +642,7 @@ class RabbitMQApi:
             self.channel.close()
         self._logger.info("Created a new RabbitMQ Channel")
         self._channel = self.connection.channel()
+        self._reset_delivery_confirmations()
 
     def new_channel(self) -> Optional[int]:
         # Perform operation only if a connection has been initialised, if not,
@@ -0,0 +1,426 @@
+import heapq
+import logging
+import multiprocessing
+import queue
+import sys
+import time
+from types import FrameType
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pika.exceptions
+
+from src.abstract import Component
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.monitor import Monitor
+from src.monitors.starters import (MONITOR_CREATORS,
+                                   _initialise_monitor_logger)
+from src.utils import env
+from src.utils.constants.names import MONITORS_WORKER_NAME_TEMPLATE
+from src.utils.constants.starters import (RESTART_SLEEPING_PERIOD,
+                                          RE_INITIALISE_SLEEPING_PERIOD)
+from src.utils.logging import log_and_print
+from src.utils.starters import (get_initialisation_error_message,
+                                get_stopped_message)
+
+# Commands sent from the executor to a worker process
+ADD_MONITOR_COMMAND = 'add'
+REMOVE_MONITOR_COMMAND = 'remove'
+
+# The maximum number of seconds a worker sleeps before checking for commands
+COMMANDS_POLL_INTERVAL = 1
+
+
+class MonitorsWorker(Component):
+    """
+    A MonitorsWorker drives many monitors from a single process. Monitoring
+    rounds are scheduled according to each monitor's monitoring period and all
+    monitors publish through the same RabbitMQ connection and channel. Monitors
+    are added and removed by the MonitorsExecutor through the commands queue,
+    and the ids of the removed monitors are reported back through the removals
+    queue.
+    """
+
+    def __init__(self, name: str, logger: logging.Logger,
+                 rabbitmq: RabbitMQApi, commands: multiprocessing.Queue,
+                 removals: multiprocessing.Queue) -> None:
+        self._name = name
+        self._logger = logger
+        self._rabbitmq = rabbitmq
+        self._commands = commands
+        self._removals = removals
+        self._monitors: Dict[int, Monitor] = {}
+        # The monitors which could not be created yet, and are re-attempted
+        # when their entry in the schedule becomes due
+        self._pending_monitors: Dict[int, Tuple[Callable, Tuple]] = {}
+        # A heap of (next round time, task id) tuples
+        self._schedule: List[Tuple[float, int]] = []
+
+        super().__init__()
+
+    def __str__(self) -> str:
+        return self.name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def logger(self) -> logging.Logger:
+        return self._logger
+
+    @property
+    def rabbitmq(self) -> RabbitMQApi:
+        return self._rabbitmq
+
+    @property
+    def monitors(self) -> Dict[int, Monitor]:
+        return self._monitors
+
+    @property
+    def pending_monitors(self) -> Dict[int, Tuple[Callable, Tuple]]:
+        return self._pending_monitors
+
+    @property
+    def schedule(self) -> List[Tuple[float, int]]:
+        return self._schedule
+
+    def _add_monitor(self, task_id: int, starter: Callable,
+                     args: Tuple) -> None:
+        # A single attempt is made to create the monitor, so that a monitor
+        # which cannot be created does not hold back the other monitors.
+        try:
+            monitor = MONITOR_CREATORS[starter](self.rabbitmq, *args)
+            monitor._initialise_rabbitmq()
+        except Exception as e:
+            self.logger.exception(e)
+            log_and_print("{} could not start a monitor, re-attempting in {} "
+                          "seconds.".format(
+                              self, RE_INITIALISE_SLEEPING_PERIOD),
+                          self.logger)
+            self._pending_monitors[task_id] = (starter, args)
+            heapq.heappush(self._schedule, (
+                time.monotonic() + RE_INITIALISE_SLEEPING_PERIOD, task_id))
+            return
+
+        self._pending_monitors.pop(task_id, None)
+        self._monitors[task_id] = monitor
+        heapq.heappush(self._schedule, (time.monotonic(), task_id))
+        log_and_print("{} started {}.".format(self, monitor), self.logger)
+
+    def _remove_monitor(self, task_id: int) -> None:
+        # The entry in the schedule is discarded lazily when it becomes due
+        self._pending_monitors.pop(task_id, None)
+        monitor = self._monitors.pop(task_id, None)
+        if monitor is not None:
+            log_and_print("{} stopped {}.".format(self, monitor), self.logger)
+        self._removals.put(task_id)
+
+    def _process_commands(self) -> None:
+        while True:
+            try:
+                command = self._commands.get_nowait()
+            except queue.Empty:
+                return
+
+            if command[0] == ADD_MONITOR_COMMAND:
+                _, task_id, starter, args = command
+                self._add_monitor(task_id, starter, args)
+            elif command[0] == REMOVE_MONITOR_COMMAND:
+                self._remove_monitor(command[1])
+
+    def _reinitialise_rabbitmq(self) -> None:
+        # The connection is shared, therefore all monitors must re-declare
+        # their exchanges and delivery confirmation on the new channel
+        for monitor in self.monitors.values():
+            monitor._initialise_rabbitmq()
+
+    def _run_monitor_round(self, task_id: int) -> None:
+        monitor = self.monitors[task_id]
+        next_round = monitor.monitor_period
+        try:
+            monitor.monitor_round()
+        except (pika.exceptions.AMQPConnectionError,
+                pika.exceptions.AMQPChannelError):
+            # Error would have already been logged by RabbitMQ logger.
+            log_and_print(get_stopped_message(monitor), monitor.logger)
+            self._reinitialise_rabbitmq()
+        except Exception:
+            # The error was already logged by the monitor. Re-schedule the
+            # monitor as if it were restarted by its own process.
+            log_and_print(get_stopped_message(monitor), monitor.logger)
+            log_and_print("Restarting {} in {} seconds.".format(
+                monitor, RESTART_SLEEPING_PERIOD), monitor.logger)
+            next_round = RESTART_SLEEPING_PERIOD
+
+        heapq.heappush(self._schedule,
+                       (time.monotonic() + next_round, task_id))
+
+    def _run_due_rounds(self) -> None:
+        while self._schedule and self._schedule[0][0] <= time.monotonic():
+            _, task_id = heapq.heappop(self._schedule)
+            if task_id in self.monitors:
+                self._run_monitor_round(task_id)
+            elif task_id in self.pending_monitors:
+                self._add_monitor(task_id, *self.pending_monitors[task_id])
+
+    def _sleep_till_next_round(self) -> None:
+        sleep_period = COMMANDS_POLL_INTERVAL
+        if self._schedule:
+            sleep_period = max(0, min(
+                sleep_period, self._schedule[0][0] - time.monotonic()))
+
+        # Use the BlockingConnection sleep to avoid dropped connections
+        if self.rabbitmq.connection is not None \
+                and self.rabbitmq.connection.is_open:
+            self.rabbitmq.connection.sleep(sleep_period)
+        else:
+            time.sleep(sleep_period)
+
+    def start(self) -> None:
+        self.rabbitmq.connect_till_successful()
+        while True:
+            self._process_commands()
+            self._run_due_rounds()
+            self._sleep_till_next_round()
+
+    def _on_terminate(self, signum: int, stack: FrameType) -> None:
+        log_and_print("{} is terminating. Connections with RabbitMQ will be "
+                      "closed, and afterwards the process will exit."
+                      .format(self), self.logger)
+        self.rabbitmq.disconnect_till_successful()
+        log_and_print("{} terminated.".format(self), self.logger)
+        sys.exit()
+
+
+def start_monitors_worker(worker_name: str, commands: multiprocessing.Queue,
+                          removals: multiprocessing.Queue) -> None:
+    worker_logger = _initialise_monitor_logger(worker_name,
+                                               MonitorsWorker.__name__)
+
+    # Try initialising the worker until successful
+    while True:
+        try:
+            rabbitmq = RabbitMQApi(
+                logger=worker_logger.getChild(RabbitMQApi.__name__),
+                host=env.RABBIT_IP)
+            worker = MonitorsWorker(worker_name, worker_logger, rabbitmq,
+                                    commands, removals)
+            log_and_print("Successfully initialised {}".format(worker_name),
+                          worker_logger)
+            break
+        except Exception as e:
+            msg = get_initialisation_error_message(worker_name, e)
+            log_and_print(msg, worker_logger)
+            # sleep before trying again
+            time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
+
+    log_and_print("{} started.".format(worker), worker_logger)
+    worker.start()
+
+
+class PooledMonitorHandle:
+    """
+    A process-like handle of a monitor running inside a MonitorsWorker. It
+    exposes the is_alive/terminate/join interface of multiprocessing.Process
+    so that the monitors managers can treat pooled and standalone monitors
+    in the same way.
+    """
+
+    def __init__(self, executor: 'MonitorsExecutor', task_id: int) -> None:
+        self._executor = executor
+        self._task_id = task_id
+
+    @property
+    def task_id(self) -> int:
+        return self._task_id
+
+    def is_alive(self) -> bool:
+        return self._executor.is_task_alive(self.task_id)
+
+    def terminate(self) -> None:
+        self._executor.cancel(self.task_id)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._executor.join_task(self.task_id, timeout)
+
+
+class MonitorsExecutor:
+    """
+    The MonitorsExecutor runs monitors on a fixed pool of MonitorsWorker
+    processes rather than on one process per monitor. Each new monitor is
+    given to the worker with the least monitors, unless it belongs to a group
+    which is already assigned to a worker, in which case it is given to that
+    worker so that the group's monitors can share in-process caches. A dead
+    worker is replaced as soon as it is noticed, and the monitors it was
+    running are given to the new worker.
+    """
+
+    def __init__(self, name: str, pool_size: int,
+                 logger: logging.Logger) -> None:
+        self._name = name
+        self._pool_size = pool_size
+        self._logger = logger
+        self._workers: List[Optional[multiprocessing.Process]] = \
+            [None] * pool_size
+        self._commands: List[Optional[multiprocessing.Queue]] = \
+            [None] * pool_size
+        self._removals: List[Optional[multiprocessing.Queue]] = \
+            [None] * pool_size
+        self._worker_tasks: List[set] = [set() for _ in range(pool_size)]
+        self._task_worker: Dict[int, int] = {}
+        self._task_args: Dict[int, Tuple[Callable, Tuple]] = {}
+        # The cancelled tasks whose removal the worker did not report yet
+        self._cancelled_tasks: Dict[int, int] = {}
+        self._group_worker: Dict[str, int] = {}
+        self._next_task_id = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool_size
+
+    @property
+    def workers(self) -> List[Optional[multiprocessing.Process]]:
+        return self._workers
+
+    @property
+    def task_worker(self) -> Dict[int, int]:
+        return self._task_worker
+
+    def _get_worker_name(self, index: int) -> str:
+        return MONITORS_WORKER_NAME_TEMPLATE.format(self.name, index)
+
+    def _start_worker(self, index: int) -> None:
+        # The cancelled monitors of the previous worker are gone with it
+        for task_id, task_index in list(self._cancelled_tasks.items()):
+            if task_index == index:
+                del self._cancelled_tasks[task_id]
+
+        worker_name = self._get_worker_name(index)
+        log_and_print("Creating a new process for {}".format(worker_name),
+                      self._logger)
+        commands = multiprocessing.Queue()
+        removals = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=start_monitors_worker,
+            args=(worker_name, commands, removals))
+        # Kill children if parent is killed
+        process.daemon = True
+        process.start()
+        self._workers[index] = process
+        self._commands[index] = commands
+        self._removals[index] = removals
+
+        # Give the monitors of the previous worker to the new one
+        for task_id in self._worker_tasks[index]:
+            starter, args = self._task_args[task_id]
+            commands.put((ADD_MONITOR_COMMAND, task_id, starter, args))
+
+    def replace_dead_workers(self) -> None:
+        """
+        Starts a new process for every worker which was started and died.
+        """
+        for index, worker in enumerate(self._workers):
+            if worker is not None and not worker.is_alive():
+                log_and_print("{} died.".format(self._get_worker_name(index)),
+                              self._logger)
+                self._start_worker(index)
+
+    def _is_worker_alive(self, index: int) -> bool:
+        worker = self._workers[index]
+        return worker is not None and worker.is_alive()
+
+    def submit(self, starter: Callable, args: Tuple,
+               group: Optional[str] = None) -> PooledMonitorHandle:
+        """
+        Schedules the monitor which `starter(*args)` would have started on one
+        of the workers.
+        :param starter: One of the monitor starters in src.monitors.starters
+        :param args: The arguments that would have been passed to the starter
+        :param group: If given, monitors of the same group are run by the same
+                    : worker
+        :return: A process-like handle of the pooled monitor
+        """
+        if group in self._group_worker:
+            index = self._group_worker[group]
+        else:
+            index = min(range(self.pool_size),
+                        key=lambda i: len(self._worker_tasks[i]))
+        if not self._is_worker_alive(index):
+            self._start_worker(index)
+        if group is not None:
+            self._group_worker[group] = index
+
+        task_id = self._next_task_id
+        self._next_task_id += 1
+        self._commands[index].put(
+            (ADD_MONITOR_COMMAND, task_id, starter, args))
+        self._worker_tasks[index].add(task_id)
+        self._task_worker[task_id] = index
+        self._task_args[task_id] = (starter, args)
+
+        return PooledMonitorHandle(self, task_id)
+
+    def is_task_alive(self, task_id: int) -> bool:
+        # The managers check their monitors periodically, therefore dead
+        # workers are replaced here without waiting for a new submission.
+        self.replace_dead_workers()
+        index = self._task_worker.get(task_id)
+        return index is not None and self._is_worker_alive(index)
+
+    def cancel(self, task_id: int) -> None:
+        index = self._task_worker.pop(task_id, None)
+        self._task_args.pop(task_id, None)
+        if index is None:
+            return
+
+        self._worker_tasks[index].discard(task_id)
+        if self._is_worker_alive(index):
+            self._commands[index].put((REMOVE_MONITOR_COMMAND, task_id))
+            self._cancelled_tasks[task_id] = index
+
+    def join_task(self, task_id: int,
+                  timeout: Optional[float] = None) -> None:
+        """
+        Waits until the worker reports that the given cancelled task was
+        removed, or until the worker running the given task dies.
+        :param task_id: The id of the task
+        :param timeout: The maximum number of seconds to wait, if given
+        """
+        if task_id in self._cancelled_tasks:
+            index = self._cancelled_tasks[task_id]
+        elif task_id in self._task_worker:
+            # Like a process, a running task ends only when its worker ends
+            self._workers[self._task_worker[task_id]].join(timeout)
+            return
+        else:
+            return
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while task_id in self._cancelled_tasks:
+            if not self._is_worker_alive(index):
+                self._cancelled_tasks.pop(task_id)
+                return
+
+            wait = COMMANDS_POLL_INTERVAL
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    return
+
+            try:
+                removed_task_id = self._removals[index].get(timeout=wait)
+            except queue.Empty:
+                continue
+            self._cancelled_tasks.pop(removed_task_id, None)
+
+    def shutdown(self) -> None:
+        for index, worker in enumerate(self._workers):
+            if worker is not None:
+                log_and_print("Terminating the process of {}".format(
+                    self._get_worker_name(index)), self._logger)
+                worker.terminate()
+                worker.join()
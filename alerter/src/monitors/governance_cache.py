@@ -0,0 +1,88 @@
+import json
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from src.data_store.redis import RedisApi
+
+
+class GovernanceCache:
+    """
+    Keeps the proposals or referenda of a chain which a network monitor
+    retrieved, keyed by their id. Once an item reaches a final state its data
+    never changes, so the monitor only needs to retrieve the items which are
+    new or still open. The items are also saved in a Redis hash, so that the
+    final items are not retrieved again when the monitor is restarted. If
+    Redis is not given or is unreachable, the items are only kept in memory.
+    """
+
+    def __init__(self, redis: Optional[RedisApi], hash_name: str,
+                 is_final: Callable[[Any], bool],
+                 logger: logging.Logger) -> None:
+        self._redis = redis
+        self._hash_name = hash_name
+        self._is_final = is_final
+        self._logger = logger
+        # The items are loaded from Redis when they are first needed
+        self._items: Optional[Dict[str, Any]] = None
+
+    @property
+    def redis(self) -> Optional[RedisApi]:
+        return self._redis
+
+    @property
+    def hash_name(self) -> str:
+        return self._hash_name
+
+    @property
+    def items(self) -> Dict[str, Any]:
+        if self._items is None:
+            self._items = self._load()
+        return self._items
+
+    def _load(self) -> Dict[str, Any]:
+        if self.redis is None:
+            return {}
+
+        item_ids = self.redis.hkeys(self.hash_name) or []
+        items = {}
+        for item_id, item in zip(item_ids,
+                                 self.redis.hmget(self.hash_name, item_ids)):
+            if item is None:
+                continue
+            try:
+                items[item_id] = json.loads(item)
+            except ValueError as e:
+                self._logger.error("Could not load item %s of %s.", item_id,
+                                   self.hash_name)
+                self._logger.exception(e)
+
+        self._logger.debug("Loaded %s items from %s.", len(items),
+                           self.hash_name)
+        return items
+
+    def is_final(self, item_id: str) -> bool:
+        """
+        :param item_id: The id of the item
+        :return: True if the item is known and reached a final state
+               : False otherwise
+        """
+        return item_id in self.items and self._is_final(self.items[item_id])
+
+    def update(self, items: Dict[str, Any]) -> None:
+        """
+        Stores the given items, and saves to Redis those which changed.
+        :param items: The retrieved items keyed by their id
+        """
+        changed_items = {
+            item_id: item for item_id, item in items.items()
+            if item_id not in self.items or self.items[item_id] != item
+        }
+        if not changed_items:
+            return
+
+        self.items.update(changed_items)
+        if self.redis is not None:
+            self.redis.hset_multiple(self.hash_name, {
+                item_id: json.dumps(item)
+                for item_id, item in changed_items.items()
+            })
@@ -1,7 +1,6 @@
 import copy
 import json
 import logging
-import multiprocessing
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -10,6 +9,7 @@ from pika.adapters.blocking_connection import BlockingChannel
 
 from src.configs.nodes.chainlink import ChainlinkNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitors.managers.manager import MonitorsManager
 from src.monitors.starters import start_chainlink_contracts_monitor
 from src.utils.constants.monitorables import MonitorableType
@@ -204,14 +204,9 @@ class ContractMonitorsManager(MonitorsManager):
         """
         log_and_print("Creating a new process for the Chainlink contracts "
                       "monitor of {}".format(full_chain_name), self.logger)
-        process = multiprocessing.Process(
-            target=start_chainlink_contracts_monitor,
-            args=(weiwatchers_url, evm_nodes, node_configs, sub_chain,
-                  parent_id,))
-
-        # Kills children if parent is killed
-        process.daemon = True
-        process.start()
+        process = self._start_monitor_process(
+            start_chainlink_contracts_monitor,
+            (weiwatchers_url, evm_nodes, node_configs, sub_chain, parent_id,))
         self._config_process_dict[full_chain_name] = {}
         self._config_process_dict[full_chain_name][
             'component_name'] = CL_CONTRACTS_MONITOR_NAME_TEMPLATE.format(
@@ -286,7 +281,7 @@ class ContractMonitorsManager(MonitorsManager):
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(properties, body)
 
         self.logger.debug("Received configs %s. Now processing.", sent_configs)
 
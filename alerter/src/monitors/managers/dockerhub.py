@@ -1,7 +1,5 @@
 import copy
-import json
 import logging
-import multiprocessing
 from datetime import datetime
 from typing import Dict
 
@@ -10,6 +8,7 @@ from pika.adapters.blocking_connection import BlockingChannel
 
 from src.configs.repo import DockerHubRepoConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitors.managers.manager import MonitorsManager
 from src.monitors.starters import start_dockerhub_monitor
 from src.utils import env
@@ -93,11 +92,8 @@ class DockerHubMonitorsManager(MonitorsManager):
             str, base_chain: str, sub_chain: str) -> None:
         log_and_print("Creating a new process for the monitor of {}"
                       .format(repo_config.repo_name), self.logger)
-        process = multiprocessing.Process(target=start_dockerhub_monitor,
-                                          args=(repo_config,))
-        # Kill children if parent is killed
-        process.daemon = True
-        process.start()
+        process = self._start_monitor_process(start_dockerhub_monitor,
+                                              (repo_config,))
         self._config_process_dict[config_id] = {}
         self._config_process_dict[config_id]['component_name'] = (
             DOCKERHUB_MONITOR_NAME_TEMPLATE.format(
@@ -115,7 +111,7 @@ class DockerHubMonitorsManager(MonitorsManager):
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(properties, body)
 
         self.logger.debug("Received configs %s", sent_configs)
 
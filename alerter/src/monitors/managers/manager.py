@@ -1,8 +1,9 @@
 import logging
+import multiprocessing
 import sys
 from abc import ABC, abstractmethod
 from types import FrameType
-from typing import Dict
+from typing import Dict, Callable, Tuple, Optional, Union
 
 import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
@@ -10,6 +11,8 @@ from pika.adapters.blocking_connection import BlockingChannel
 from src.abstract.publisher_subscriber import \
     QueuingPublisherSubscriberComponent
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
+from src.monitors.executor import MonitorsExecutor, PooledMonitorHandle
+from src.utils import env
 from src.utils.constants.monitorables import MonitorableType
 from src.utils.constants.rabbitmq import (
     HEALTH_CHECK_EXCHANGE, HEARTBEAT_OUTPUT_MANAGER_ROUTING_KEY,
@@ -23,6 +26,13 @@ class MonitorsManager(QueuingPublisherSubscriberComponent, ABC):
         self._config_process_dict = {}
         self._name = name
 
+        # If a worker pool size is configured, monitors are driven by a pool
+        # of worker processes rather than by one process each.
+        self._monitors_executor = (
+            MonitorsExecutor(name, env.MONITORS_WORKER_POOL_SIZE,
+                             logger.getChild(MonitorsExecutor.__name__))
+            if env.MONITORS_WORKER_POOL_SIZE > 0 else None)
+
         super().__init__(logger, rabbitmq)
 
     def __str__(self) -> str:
@@ -36,6 +46,34 @@ class MonitorsManager(QueuingPublisherSubscriberComponent, ABC):
     def name(self) -> str:
         return self._name
 
+    @property
+    def monitors_executor(self) -> Optional[MonitorsExecutor]:
+        return self._monitors_executor
+
+    def _start_monitor_process(
+            self, starter: Callable, args: Tuple,
+            group: Optional[str] = None) \
+            -> Union[multiprocessing.Process, PooledMonitorHandle]:
+        """
+        This function starts the monitor which is run by the given starter. If
+        the monitors executor is enabled the monitor is scheduled on one of the
+        executor's workers, otherwise a new process is started for it.
+        :param starter: The starter function of the monitor
+        :param args: The arguments to be passed to the starter
+        :param group: Monitors of the same group are run by the same worker if
+                    : the monitors executor is enabled
+        :return: The process of the monitor, or a process-like handle if the
+               : monitor is pooled
+        """
+        if self.monitors_executor is not None:
+            return self.monitors_executor.submit(starter, args, group)
+
+        process = multiprocessing.Process(target=starter, args=args)
+        # Kill children if parent is killed
+        process.daemon = True
+        process.start()
+        return process
+
     def _listen_for_data(self) -> None:
         self.rabbitmq.start_consuming()
 
@@ -136,5 +174,8 @@ class MonitorsManager(QueuingPublisherSubscriberComponent, ABC):
             process.terminate()
             process.join()
 
+        if self.monitors_executor is not None:
+            self.monitors_executor.shutdown()
+
         log_and_print("{} terminated.".format(self), self.logger)
         sys.exit()
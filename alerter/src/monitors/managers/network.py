@@ -1,7 +1,6 @@
 import copy
 import json
 import logging
-import multiprocessing
 from datetime import datetime
 from typing import Dict, Optional, List, Callable, Any
 
@@ -12,6 +11,7 @@ from src.configs.nodes.cosmos import CosmosNodeConfig
 from src.configs.nodes.node import NodeConfig
 from src.configs.nodes.substrate import SubstrateNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitors.managers.manager import (
     MonitorsManager)
 from src.monitors.starters import (
@@ -221,12 +221,8 @@ class NetworkMonitorsManager(MonitorsManager):
         """
         log_and_print("Creating a new process for the network monitor of "
                       "{}".format(chain), self.logger)
-        process = multiprocessing.Process(
-            target=starter_fn, args=(data_sources, parent_id, sub_chain, *args))
-
-        # Kills children if parent is killed
-        process.daemon = True
-        process.start()
+        process = self._start_monitor_process(
+            starter_fn, (data_sources, parent_id, sub_chain, *args))
         self._config_process_dict[chain] = {}
         self._config_process_dict[chain][
             'component_name'] = network_monitor_name_template.format(sub_chain)
@@ -356,7 +352,7 @@ class NetworkMonitorsManager(MonitorsManager):
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(properties, body)
 
         self.logger.debug("Received configs %s. Now processing.", sent_configs)
 
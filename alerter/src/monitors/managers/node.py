@@ -1,7 +1,5 @@
 import copy
-import json
 import logging
-import multiprocessing
 from datetime import datetime
 from typing import Dict, Type, List, Callable
 
@@ -12,6 +10,7 @@ from src.configs.nodes.cosmos import CosmosNodeConfig
 from src.configs.nodes.node import NodeConfig
 from src.configs.nodes.substrate import SubstrateNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import decode_message
 from src.monitors.managers.manager import (
     MonitorsManager)
 from src.monitors.monitor import Monitor
@@ -117,11 +116,12 @@ class NodeMonitorsManager(MonitorsManager):
         """
         log_and_print("Creating a new process for the monitor of {}".format(
             node_config.node_name), self.logger)
-        process = multiprocessing.Process(
-            target=start_node_monitor, args=(node_config, monitor_type, *args))
-        # Kill children if parent is killed
-        process.daemon = True
-        process.start()
+        # Pooled Cosmos node monitors of the same chain are grouped together
+        # so that they share one Tendermint block cache.
+        group = (node_config.parent_id if monitor_type == CosmosNodeMonitor
+                 else None)
+        process = self._start_monitor_process(
+            start_node_monitor, (node_config, monitor_type, *args), group)
         self._config_process_dict[config_id] = {}
         self._config_process_dict[config_id]['component_name'] = (
             NODE_MONITOR_NAME_TEMPLATE.format(node_config.node_name))
@@ -653,7 +653,7 @@ class NodeMonitorsManager(MonitorsManager):
     def _process_configs(
             self, ch: BlockingChannel, method: pika.spec.Basic.Deliver,
             properties: pika.spec.BasicProperties, body: bytes) -> None:
-        sent_configs = json.loads(body)
+        sent_configs = decode_message(properties, body)
 
         self.logger.debug("Received configs %s. Now processing.", sent_configs)
 
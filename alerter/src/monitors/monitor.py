@@ -1,23 +1,32 @@
 import logging
 import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from types import FrameType
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Union, Callable
 
 import pika.exceptions
 import urllib3
 
 from src.abstract.publisher import PublisherComponent
 from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
+from src.utils import env
 from src.utils.constants.rabbitmq import (RAW_DATA_EXCHANGE,
                                           HEALTH_CHECK_EXCHANGE,
                                           HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY,
                                           TOPIC)
 from src.utils.exceptions import MessageWasNotDeliveredException
 from src.utils.logging import log_and_print
+from src.utils.partitioning import (get_key_partition,
+                                    get_partition_routing_key)
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# If a monitor has fewer heights than this to retrieve it is following the tip
+# of the chain, otherwise it is catching up and heights are retrieved
+# concurrently.
+CATCHUP_MODE_MIN_HEIGHTS = 10
+
 
 class Monitor(PublisherComponent, ABC):
 
@@ -53,6 +62,18 @@ class Monitor(PublisherComponent, ABC):
         self.rabbitmq.exchange_declare(HEALTH_CHECK_EXCHANGE, TOPIC, False,
                                        True, False, False)
 
+    @staticmethod
+    def _get_raw_data_routing_key(routing_key: str, monitorable_id: str) -> str:
+        """
+        The data transformers of systems and nodes may be partitioned, in which
+        case the data of a monitorable must be sent to its partition.
+        :param routing_key: The raw data routing key of the monitorable type
+        :param monitorable_id: The id of the system or node being monitored
+        :return: The routing key of the monitorable's partition
+        """
+        return get_partition_routing_key(routing_key, get_key_partition(
+            monitorable_id, env.DATA_TRANSFORMER_PARTITIONS))
+
     @abstractmethod
     def _get_data(self, *args) -> Union[Dict, List]:
         pass
@@ -76,6 +97,36 @@ class Monitor(PublisherComponent, ABC):
     def _monitor(self) -> None:
         pass
 
+    @staticmethod
+    def _retrieve_heights(retrieval: Callable[[int], Any],
+                          starting_height: int, stopping_height: int,
+                          max_in_flight: int) -> List[Any]:
+        """
+        This function calls retrieval for every height in
+        [starting_height, stopping_height) and returns the results in height
+        order. When catching up with the chain, up to max_in_flight heights are
+        retrieved at the same time.
+        :param retrieval: The function which retrieves the data of a height
+        :param starting_height: The first height to retrieve
+        :param stopping_height: The height after the last height to retrieve
+        :param max_in_flight: The maximum number of heights retrieved at the
+                            : same time
+        :return: The data of each height, ordered by height
+        :raises: The exception raised by the retrieval of the lowest failing
+               : height
+        """
+        heights = range(starting_height, stopping_height)
+        max_in_flight = min(max_in_flight, len(heights))
+        if len(heights) < CATCHUP_MODE_MIN_HEIGHTS or max_in_flight <= 1:
+            return [retrieval(height) for height in heights]
+
+        executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        try:
+            return list(executor.map(retrieval, heights))
+        finally:
+            # If a height fails there is no use in retrieving the rest
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _send_heartbeat(self, data_to_send: dict) -> None:
         self.rabbitmq.basic_publish_confirm(
             exchange=HEALTH_CHECK_EXCHANGE,
@@ -85,25 +136,33 @@ class Monitor(PublisherComponent, ABC):
         self.logger.debug("Sent heartbeat to '%s' exchange",
                           HEALTH_CHECK_EXCHANGE)
 
+    def monitor_round(self) -> None:
+        """
+        This function performs one monitoring round and handles its errors. It
+        is used by the monitor's own loop and by the pooled monitors executor,
+        which drives many monitors from one process.
+        """
+        try:
+            self._monitor()
+        except MessageWasNotDeliveredException as e:
+            # Log the fact that the message could not be sent. Sleep just
+            # because there is no use in consuming a lot of resources until
+            # the problem is fixed.
+            self.logger.exception(e)
+        except (pika.exceptions.AMQPConnectionError,
+                pika.exceptions.AMQPChannelError) as e:
+            # If we have either a channel error or connection error, the
+            # channel is reset, therefore we need to re-initialise the
+            # connection or channel settings
+            raise e
+        except Exception as e:
+            self.logger.exception(e)
+            raise e
+
     def start(self) -> None:
         self._initialise_rabbitmq()
         while True:
-            try:
-                self._monitor()
-            except MessageWasNotDeliveredException as e:
-                # Log the fact that the message could not be sent. Sleep just
-                # because there is no use in consuming a lot of resources until
-                # the problem is fixed.
-                self.logger.exception(e)
-            except (pika.exceptions.AMQPConnectionError,
-                    pika.exceptions.AMQPChannelError) as e:
-                # If we have either a channel error or connection error, the
-                # channel is reset, therefore we need to re-initialise the
-                # connection or channel settings
-                raise e
-            except Exception as e:
-                self.logger.exception(e)
-                raise e
+            self.monitor_round()
 
             self.logger.debug("Sleeping for %s seconds.", self.monitor_period)
 
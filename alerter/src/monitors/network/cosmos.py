@@ -6,10 +6,12 @@ from typing import List, Dict, Optional, Callable
 import pika
 
 from src.configs.nodes.cosmos import CosmosNodeConfig
+from src.data_store.redis import Keys, RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.cosmos import (
     CosmosMonitor, _REST_VERSION_COSMOS_SDK_0_42_6,
     _REST_VERSION_COSMOS_SDK_0_39_2, _VERSION_INCOMPATIBILITY_EXCEPTIONS)
+from src.monitors.governance_cache import GovernanceCache
 from src.utils.constants.cosmos import (
     PROPOSAL_STATUS_UNSPECIFIED, PROPOSAL_STATUS_DEPOSIT_PERIOD,
     PROPOSAL_STATUS_VOTING_PERIOD, PROPOSAL_STATUS_PASSED,
@@ -22,6 +24,14 @@ from src.utils.exceptions import (
     IncorrectJSONRetrievedException, NoSyncedDataSourceWasAccessibleException,
     CannotConnectWithDataSourceException, CosmosNetworkDataCouldNotBeObtained)
 
+# The statuses of the proposals whose data does not change any more
+_FINAL_PROPOSAL_STATUSES = [PROPOSAL_STATUS_PASSED, PROPOSAL_STATUS_REJECTED,
+                            PROPOSAL_STATUS_FAILED]
+
+# The values of the proposal_status parameter of the v0.42.6 proposals
+# endpoint for the deposit and voting periods
+_OPEN_PROPOSAL_STATUS_PARAMS = [1, 2]
+
 
 class CosmosNetworkMonitor(CosmosMonitor):
     """
@@ -42,13 +52,23 @@ class CosmosNetworkMonitor(CosmosMonitor):
 
     def __init__(self, monitor_name: str, data_sources: List[CosmosNodeConfig],
                  parent_id: str, chain_name: str, logger: logging.Logger,
-                 monitor_period: int, rabbitmq: RabbitMQApi) -> None:
+                 monitor_period: int, rabbitmq: RabbitMQApi,
+                 redis: Optional[RedisApi] = None) -> None:
 
         super().__init__(monitor_name, data_sources, logger, monitor_period,
                          rabbitmq)
         self._parent_id = parent_id
         self._chain_name = chain_name
 
+        # The proposals retrieved, so that concluded proposals are not
+        # retrieved again in every monitoring round. Proposals which were
+        # deleted from the chain are stored as None.
+        self._proposals = GovernanceCache(
+            redis, Keys.get_cosmos_network_monitored_proposals(parent_id),
+            lambda proposal: (proposal is None or proposal['status']
+                              in _FINAL_PROPOSAL_STATUSES),
+            self.logger.getChild(GovernanceCache.__name__))
+
     @property
     def parent_id(self) -> str:
         return self._parent_id
@@ -57,6 +77,10 @@ class CosmosNetworkMonitor(CosmosMonitor):
     def chain_name(self) -> str:
         return self._chain_name
 
+    @property
+    def proposals(self) -> GovernanceCache:
+        return self._proposals
+
     @staticmethod
     def _parse_proposal(proposal: Dict) -> Dict:
         """
@@ -119,6 +143,37 @@ class CosmosNetworkMonitor(CosmosMonitor):
 
         return parsed_proposal
 
+    def _get_monitored_proposals(self) -> List[Dict]:
+        """
+        :return: The proposals in the cache which were not deleted, ordered by
+                 proposal id
+        """
+        return [
+            proposal for _, proposal in sorted(
+                self.proposals.items.items(),
+                key=lambda item: int(item[0]))
+            if proposal is not None
+        ]
+
+    def _scan_proposals(self, proposals: List[Dict]) -> List[Dict]:
+        """
+        This function stores all the proposals of the chain in the cache. Any
+        proposal id up to the highest one which is not in the given proposals
+        was deleted from the chain, and it is stored as None so that it is not
+        retrieved again.
+        :param proposals: All the proposals of the chain
+        :return: The given proposals
+        """
+        scanned_proposals = {str(proposal['proposal_id']): proposal
+                             for proposal in proposals}
+        highest_proposal_id = max(
+            [0, *map(int, scanned_proposals), *map(int, self.proposals.items)])
+        self.proposals.update({
+            str(proposal_id): scanned_proposals.get(str(proposal_id))
+            for proposal_id in range(1, highest_proposal_id + 1)
+        })
+        return proposals
+
     def _get_cosmos_rest_v0_39_2_indirect_data(
             self, source: CosmosNodeConfig) -> Dict:
         """
@@ -180,19 +235,51 @@ class CosmosNetworkMonitor(CosmosMonitor):
         source_url = source.cosmos_rest_url
         source_name = source.node_name
 
-        def retrieval_process() -> Dict:
+        def get_proposals(params: Dict) -> List[Dict]:
             paginated_data = self._get_rest_data_with_pagination_keys(
                 self.cosmos_rest_server_api.get_proposals_v0_42_6,
-                [source_url, None], {}, source_name,
+                [source_url, None], params, source_name,
                 _REST_VERSION_COSMOS_SDK_0_42_6)
+            return [self._parse_proposal(proposal)
+                    for page in paginated_data
+                    for proposal in page['proposals']]
 
-            parsed_proposals = {'proposals': []}
-            for page in paginated_data:
-                for proposal in page['proposals']:
-                    parsed_proposals['proposals'].append(
-                        self._parse_proposal(proposal))
-
-            return parsed_proposals
+        def retrieval_process() -> Dict:
+            if not self.proposals.items:
+                return {'proposals': self._scan_proposals(get_proposals({}))}
+
+            # Only the open proposals are listed. The proposals which are
+            # neither open nor concluded in the cache were either concluded or
+            # deleted since they were last retrieved, so they are retrieved
+            # one by one.
+            retrieved_proposals = {
+                str(proposal['proposal_id']): proposal
+                for status in _OPEN_PROPOSAL_STATUS_PARAMS
+                for proposal in get_proposals({'proposal_status': status})
+            }
+            highest_proposal_id = max(
+                int(proposal_id) for proposal_id in
+                [*self.proposals.items, *retrieved_proposals])
+            for proposal_id in map(str, range(1, highest_proposal_id + 1)):
+                if (proposal_id in retrieved_proposals
+                        or self.proposals.is_final(proposal_id)):
+                    continue
+                try:
+                    result = self.cosmos_rest_server_api.execute_with_checks(
+                        self.cosmos_rest_server_api.get_proposals_v0_42_6,
+                        [source_url, proposal_id], source_name,
+                        _REST_VERSION_COSMOS_SDK_0_42_6)
+                except CosmosRestServerApiCallException:
+                    # A proposal which is not found was deleted, therefore
+                    # scan all proposals to find the ones which remain.
+                    return {
+                        'proposals': self._scan_proposals(get_proposals({}))
+                    }
+                retrieved_proposals[proposal_id] = self._parse_proposal(
+                    result['proposal'])
+
+            self.proposals.update(retrieved_proposals)
+            return {'proposals': self._get_monitored_proposals()}
 
         return self._execute_cosmos_rest_retrieval_with_exceptions(
             retrieval_process, source_name, source_url,
@@ -2,12 +2,14 @@ import copy
 import logging
 from ast import literal_eval
 from datetime import datetime
-from typing import List, Dict, Optional, Callable
+from typing import Any, List, Dict, Optional, Callable
 
 import pika
 
 from src.configs.nodes.substrate import SubstrateNodeConfig
+from src.data_store.redis import Keys, RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.governance_cache import GovernanceCache
 from src.monitors.substrate import (
     SubstrateMonitor, _VERSION_INCOMPATIBILITY_EXCEPTIONS)
 from src.utils.constants.rabbitmq import (
@@ -30,13 +32,20 @@ class SubstrateNetworkMonitor(SubstrateMonitor):
             self, monitor_name: str, data_sources: List[SubstrateNodeConfig],
             governance_addresses: List[str], parent_id: str, chain_name: str,
             logger: logging.Logger, monitor_period: int,
-            rabbitmq: RabbitMQApi) -> None:
+            rabbitmq: RabbitMQApi, redis: Optional[RedisApi] = None) -> None:
         super().__init__(monitor_name, data_sources, logger, monitor_period,
                          rabbitmq)
         self._governance_addresses = governance_addresses
         self._parent_id = parent_id
         self._chain_name = chain_name
 
+        # The info of the referendums retrieved, so that finished referendums
+        # are not retrieved again in every monitoring round
+        self._referendums = GovernanceCache(
+            redis, Keys.get_substrate_network_monitored_referendums(parent_id),
+            self._is_referendum_finished,
+            self.logger.getChild(GovernanceCache.__name__))
+
     @property
     def governance_addresses(self) -> List[str]:
         return self._governance_addresses
@@ -49,6 +58,15 @@ class SubstrateNetworkMonitor(SubstrateMonitor):
     def chain_name(self) -> str:
         return self._chain_name
 
+    @property
+    def referendums(self) -> GovernanceCache:
+        return self._referendums
+
+    @staticmethod
+    def _is_referendum_finished(referendum_info: Any) -> bool:
+        return (isinstance(referendum_info, dict)
+                and 'finished' in referendum_info)
+
     def _get_websocket_indirect_data(self, source: SubstrateNodeConfig) -> Dict:
         """
         This function returns the metrics of the substrate network from the
@@ -86,13 +104,21 @@ class SubstrateNetworkMonitor(SubstrateMonitor):
                 self.substrate_api_wrapper.get_democracy_referendums,
                 [source_url], source_name, False)
 
-            # Get info of every referendum to date
-            referendum_info_of = {}
+            # Get info of every referendum to date. The info of a finished
+            # referendum does not change, so only the info of new and ongoing
+            # referendums is retrieved.
+            retrieved_referendums = {}
             for i in range(0, referendum_count):
-                data = self.substrate_api_wrapper.execute_with_checks(
-                    self.substrate_api_wrapper.get_referendum_info_of,
-                    [source_url, i], source_name, False)
-                referendum_info_of[i] = data['result']
+                if not self.referendums.is_final(str(i)):
+                    data = self.substrate_api_wrapper.execute_with_checks(
+                        self.substrate_api_wrapper.get_referendum_info_of,
+                        [source_url, i], source_name, False)
+                    retrieved_referendums[str(i)] = data['result']
+            self.referendums.update(retrieved_referendums)
+            referendum_info_of = {
+                i: self.referendums.items[str(i)]
+                for i in range(0, referendum_count)
+            }
 
             return {
                 'grandpa_stalled': grandpa_stalled['result'],
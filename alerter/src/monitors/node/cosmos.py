@@ -3,7 +3,7 @@ import copy
 import logging
 from datetime import datetime
 from http.client import IncompleteRead
-from typing import List, Dict, Optional, Callable, Union
+from typing import AbstractSet, List, Dict, Optional, Callable, Union
 
 import pika
 from requests.exceptions import (ConnectionError as ReqConnectionError,
@@ -16,6 +16,9 @@ from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.cosmos import (
     CosmosMonitor, _REST_VERSION_COSMOS_SDK_0_42_6,
     _REST_VERSION_COSMOS_SDK_0_39_2, _VERSION_INCOMPATIBILITY_EXCEPTIONS)
+from src.monitors.tendermint_block_cache import (
+    TendermintBlockCache, TendermintHeightData, get_tendermint_block_cache)
+from src.utils import env
 from src.utils.constants.cosmos import (
     BOND_STATUS_BONDED, BOND_STATUS_UNBONDED, BOND_STATUS_UNBONDING,
     BOND_STATUS_INVALID)
@@ -54,7 +57,8 @@ class CosmosNodeMonitor(CosmosMonitor):
     def __init__(self, monitor_name: str, node_config: CosmosNodeConfig,
                  logger: logging.Logger, monitor_period: int,
                  rabbitmq: RabbitMQApi,
-                 data_sources: List[CosmosNodeConfig]) -> None:
+                 data_sources: List[CosmosNodeConfig],
+                 block_cache: Optional[TendermintBlockCache] = None) -> None:
 
         super().__init__(monitor_name, data_sources, logger, monitor_period,
                          rabbitmq)
@@ -77,6 +81,10 @@ class CosmosNodeMonitor(CosmosMonitor):
         # number)
         self._max_catchup_blocks = 300
 
+        # The maximum number of heights retrieved at the same time from a data
+        # source while catching up
+        self._catchup_concurrency = env.NODE_MONITOR_CATCHUP_CONCURRENCY
+
         # Construct list of archive nodes from data sources
         self._archive_nodes = [
             node for node in self.data_sources if node.is_archive_node
@@ -100,6 +108,14 @@ class CosmosNodeMonitor(CosmosMonitor):
         # the node at each monitoring round if it is a validator
         self._validator_consensus_address = None
 
+        # The archive data of each height is independent of the validator, so
+        # node monitors of the same chain running in the same process share
+        # one cache and each height is retrieved once.
+        self._block_cache = (
+            get_tendermint_block_cache(self.node_config.parent_id)
+            if block_cache is None else block_cache)
+        self._block_cache.subscribe(self.node_config.node_id)
+
     @property
     def node_config(self) -> CosmosNodeConfig:
         return self._node_config
@@ -112,6 +128,10 @@ class CosmosNodeMonitor(CosmosMonitor):
     def max_catchup_blocks(self) -> int:
         return self._max_catchup_blocks
 
+    @property
+    def catchup_concurrency(self) -> int:
+        return self._catchup_concurrency
+
     @property
     def archive_nodes(self) -> List[CosmosNodeConfig]:
         return self._archive_nodes
@@ -128,6 +148,10 @@ class CosmosNodeMonitor(CosmosMonitor):
     def validator_consensus_address(self) -> Optional[str]:
         return self._validator_consensus_address
 
+    @property
+    def block_cache(self) -> TendermintBlockCache:
+        return self._block_cache
+
     @staticmethod
     def _parse_validator_status(validator_status: Union[str, int]) -> str:
         """
@@ -556,6 +580,87 @@ class CosmosNodeMonitor(CosmosMonitor):
 
         return slashed, slashed_amount
 
+    def _get_validator_set(self, height: int, source_url: str,
+                           source_name: str) -> AbstractSet[str]:
+        """
+        This function returns the consensus addresses of the validator set at
+        the given height. The validator set is looked up in the chain's
+        validator set index by the validators_hash of the height, so that it is
+        only retrieved from the paginated /validators endpoint when the
+        validator set changes. The validators_hash itself is only retrieved if
+        the header of the height was not seen already.
+        :param height: The height to retrieve the validator set of
+        :param source_url: The Tendermint RPC url of the data source
+        :param source_name: The name of the data source
+        :return: The consensus addresses of the validator set at height
+        """
+        validator_sets = self.block_cache.validator_sets
+        validators_hash = validator_sets.get_validators_hash(height)
+        if validators_hash is None:
+            blockchain = self.tendermint_rpc_api.execute_with_checks(
+                self.tendermint_rpc_api.get_blockchain,
+                [source_url, {'minHeight': height, 'maxHeight': height}],
+                source_name)
+            validators_hash = blockchain['result']['block_metas'][0][
+                'header']['validators_hash']
+            validator_sets.set_validators_hash(height, validators_hash)
+
+        validators = validator_sets.get(validators_hash)
+        if validators is not None:
+            return validators
+
+        paginated_validators = self._get_tendermint_data_with_count(
+            self.tendermint_rpc_api.get_validators, [source_url],
+            {'height': height}, source_name)
+        validators_list = self._parse_validators_list(paginated_validators)
+        return validator_sets.add(
+            validators_hash,
+            [validator_info['address'] for validator_info in validators_list])
+
+    def _get_tendermint_height_data(
+            self, height: int, source_url: str,
+            source_name: str) -> TendermintHeightData:
+        """
+        This function returns the validator set of height - 1, the signatures
+        of block height - 1 and the begin block events of the given height.
+        The data is taken from the block cache if another monitor of the chain
+        already retrieved it, otherwise it is retrieved from the given source
+        and added to the cache.
+        :param height: The height to retrieve data for
+        :param source_url: The Tendermint RPC url of the data source
+        :param source_name: The name of the data source
+        :return: The TendermintHeightData of the given height
+        """
+        height_data = self.block_cache.get(height)
+        if height_data is not None:
+            return height_data
+
+        active_validators = self._get_validator_set(height - 1, source_url,
+                                                    source_name)
+        block_at_height = self.tendermint_rpc_api.execute_with_checks(
+            self.tendermint_rpc_api.get_block,
+            [source_url, {'height': height}], source_name)
+        block_results_at_height = self.tendermint_rpc_api.execute_with_checks(
+            self.tendermint_rpc_api.get_block_results,
+            [source_url, {'height': height}], source_name)
+
+        # The header of the block is already retrieved, so its validators_hash
+        # is remembered for when the next height is retrieved.
+        self.block_cache.validator_sets.set_validators_hash(
+            height, block_at_height['result']['block']['header'][
+                'validators_hash'])
+        previous_block_signatures = block_at_height['result']['block'][
+            'last_commit']['signatures']
+        height_data = TendermintHeightData(
+            height, active_validators,
+            {signature['validator_address']
+             for signature in previous_block_signatures
+             if signature['signature']},
+            block_results_at_height['result']['begin_block_events'])
+        self.block_cache.add(height_data)
+
+        return height_data
+
     def _get_tendermint_rpc_archive_data_validator(
             self, source: CosmosNodeConfig) -> Dict:
         source_url = source.tendermint_rpc_url
@@ -572,8 +677,10 @@ class CosmosNodeMonitor(CosmosMonitor):
                 self.tendermint_rpc_api.execute_with_checks(
                     self.tendermint_rpc_api.get_block, [source_url],
                     source_name)
-            current_height = int(latest_block['result']['block']['header'][
-                                     'height'])
+            latest_header = latest_block['result']['block']['header']
+            current_height = int(latest_header['height'])
+            self.block_cache.validator_sets.set_validators_hash(
+                current_height, latest_header['validators_hash'])
             self._last_height_monitored_tendermint = \
                 self._determine_last_height_monitored_tendermint(
                     self.last_height_monitored_tendermint, current_height,
@@ -581,50 +688,34 @@ class CosmosNodeMonitor(CosmosMonitor):
             starting_height = self.last_height_monitored_tendermint + 1
             stopping_height = current_height + 1
             historical_data = []
+            heights_data = self._retrieve_heights(
+                lambda height: self._get_tendermint_height_data(
+                    height, source_url, source_name),
+                starting_height, stopping_height, self.catchup_concurrency)
+
+            for height_data in heights_data:
+                height_to_monitor = height_data.height
 
-            for height_to_monitor in range(starting_height, stopping_height):
                 # Since the current block has signing info belonging to the
                 # previous block, we must first check if the validator was
                 # active in the previous block
-                paginated_validators = \
-                    self._get_tendermint_data_with_count(
-                        self.tendermint_rpc_api.get_validators, [source_url],
-                        {'height': height_to_monitor - 1}, source_name)
-                validators_list = self._parse_validators_list(
-                    paginated_validators)
-                validator_was_active = self._is_validator_active(
-                    validators_list)
-                block_at_height = \
-                    self.tendermint_rpc_api.execute_with_checks(
-                        self.tendermint_rpc_api.get_block,
-                        [source_url, {'height': height_to_monitor}],
-                        source_name)
+                validator_was_active = (
+                    self.validator_consensus_address not in [None, ""]
+                    and self.validator_consensus_address
+                    in height_data.active_validators)
 
                 # Check if the validator was slashed and get the slash amount
                 # if it is provided
-                block_results_at_height = \
-                    self.tendermint_rpc_api.execute_with_checks(
-                        self.tendermint_rpc_api.get_block_results,
-                        [source_url, {'height': height_to_monitor}],
-                        source_name)
                 slashed, slashed_amount = self._validator_was_slashed(
-                    block_results_at_height['result']['begin_block_events'])
+                    height_data.begin_block_events)
 
                 if validator_was_active:
-                    previous_block_signatures = block_at_height['result'][
-                        'block']['last_commit']['signatures']
-                    non_null_signatures = filter(lambda x: x['signature'],
-                                                 previous_block_signatures)
-                    signed_validators = set(
-                        map(lambda x: x['validator_address'],
-                            non_null_signatures))
-
                     historical_data.append({
                         'height': height_to_monitor,
                         'active_in_prev_block': True,
                         'signed_prev_block':
                             (self.validator_consensus_address
-                             in signed_validators),
+                             in height_data.signed_validators),
                         'slashed': slashed,
                         'slashed_amount': slashed_amount
                     })
@@ -638,6 +729,8 @@ class CosmosNodeMonitor(CosmosMonitor):
                     })
 
             self._last_height_monitored_tendermint = current_height
+            self.block_cache.set_last_height_monitored(
+                self.node_config.node_id, current_height)
 
             # We need to reverse the historical data to show info about the
             # latest block first
@@ -953,9 +1046,10 @@ class CosmosNodeMonitor(CosmosMonitor):
         return processing_fn(data)
 
     def _send_data(self, data: Dict) -> None:
+        routing_key = self._get_raw_data_routing_key(
+            COSMOS_NODE_RAW_DATA_ROUTING_KEY, self.node_config.node_id)
         self.rabbitmq.basic_publish_confirm(
-            exchange=RAW_DATA_EXCHANGE,
-            routing_key=COSMOS_NODE_RAW_DATA_ROUTING_KEY, body=data,
+            exchange=RAW_DATA_EXCHANGE, routing_key=routing_key, body=data,
             is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
             mandatory=True)
         self.logger.debug("Sent data to '%s' exchange", RAW_DATA_EXCHANGE)
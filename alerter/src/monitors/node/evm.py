@@ -95,9 +95,10 @@ class EVMNodeMonitor(Monitor):
         return processed_data
 
     def _send_data(self, data: Dict) -> None:
+        routing_key = self._get_raw_data_routing_key(
+            EVM_NODE_RAW_DATA_ROUTING_KEY, self.node_config.node_id)
         self.rabbitmq.basic_publish_confirm(
-            exchange=RAW_DATA_EXCHANGE,
-            routing_key=EVM_NODE_RAW_DATA_ROUTING_KEY, body=data,
+            exchange=RAW_DATA_EXCHANGE, routing_key=routing_key, body=data,
             is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
             mandatory=True)
         self.logger.debug("Sent data to '%s' exchange", RAW_DATA_EXCHANGE)
@@ -10,6 +10,7 @@ from src.configs.nodes.substrate import SubstrateNodeConfig
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.substrate import (
     SubstrateMonitor, _VERSION_INCOMPATIBILITY_EXCEPTIONS)
+from src.utils import env
 from src.utils.constants.rabbitmq import (
     RAW_DATA_EXCHANGE, SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY)
 from src.utils.exceptions import (
@@ -51,6 +52,10 @@ class SubstrateNodeMonitor(SubstrateMonitor):
         # large number)
         self._max_catchup_blocks = 300
 
+        # The maximum number of heights retrieved at the same time from a data
+        # source while catching up
+        self._catchup_concurrency = env.NODE_MONITOR_CATCHUP_CONCURRENCY
+
         # Construct list of archive nodes from data sources
         self._archive_nodes = [
             node for node in self.data_sources if node.is_archive_node
@@ -79,6 +84,10 @@ class SubstrateNodeMonitor(SubstrateMonitor):
     def max_catchup_blocks(self) -> int:
         return self._max_catchup_blocks
 
+    @property
+    def catchup_concurrency(self) -> int:
+        return self._catchup_concurrency
+
     @property
     def archive_nodes(self) -> List[SubstrateNodeConfig]:
         return self._archive_nodes
@@ -423,6 +432,26 @@ class SubstrateNodeMonitor(SubstrateMonitor):
         is_source_archive = source.is_archive_node
         stash_address = self.node_config.stash_address
 
+        def retrieve_height(height_to_monitor: int) -> Dict:
+            block_hash = self.substrate_api_wrapper.execute_with_checks(
+                self.substrate_api_wrapper.get_block_hash,
+                [source_ws_url, height_to_monitor], source_name, False)
+            slashed_amount = self.substrate_api_wrapper.execute_with_checks(
+                self.substrate_api_wrapper.get_slashed_amount,
+                [source_ws_url, block_hash['result'], stash_address],
+                source_name, False)
+            is_offline = self.substrate_api_wrapper.execute_with_checks(
+                self.substrate_api_wrapper.get_is_offline,
+                [source_ws_url, block_hash['result'], stash_address],
+                source_name, False)
+
+            return {
+                'height': height_to_monitor,
+                'slashed': slashed_amount['result'] > 0,
+                'slashed_amount': slashed_amount['result'],
+                'is_offline': is_offline['result']
+            }
+
         def retrieval_process() -> Dict:
             # Get the height of the last finalized block of the archive source.
             finalized_head = self.substrate_api_wrapper.execute_with_checks(
@@ -439,27 +468,9 @@ class SubstrateNodeMonitor(SubstrateMonitor):
                     current_finalized_height, is_source_archive)
             starting_height = self.last_height_monitored_websocket + 1
             stopping_height = current_finalized_height + 1
-            historical_data = []
-
-            for height_to_monitor in range(starting_height, stopping_height):
-                block_hash = self.substrate_api_wrapper.execute_with_checks(
-                    self.substrate_api_wrapper.get_block_hash,
-                    [source_ws_url, height_to_monitor], source_name, False)
-                slashed_amount = self.substrate_api_wrapper.execute_with_checks(
-                    self.substrate_api_wrapper.get_slashed_amount,
-                    [source_ws_url, block_hash['result'], stash_address],
-                    source_name, False)
-                is_offline = self.substrate_api_wrapper.execute_with_checks(
-                    self.substrate_api_wrapper.get_is_offline,
-                    [source_ws_url, block_hash['result'], stash_address],
-                    source_name, False)
-
-                historical_data.append({
-                    'height': height_to_monitor,
-                    'slashed': slashed_amount['result'] > 0,
-                    'slashed_amount': slashed_amount['result'],
-                    'is_offline': is_offline['result']
-                })
+            historical_data = self._retrieve_heights(
+                retrieve_height, starting_height, stopping_height,
+                self.catchup_concurrency)
 
             self._last_height_monitored_websocket = current_finalized_height
 
@@ -641,9 +652,10 @@ class SubstrateNodeMonitor(SubstrateMonitor):
         return processing_fn(data)
 
     def _send_data(self, data: Dict) -> None:
+        routing_key = self._get_raw_data_routing_key(
+            SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY, self.node_config.node_id)
         self.rabbitmq.basic_publish_confirm(
-            exchange=RAW_DATA_EXCHANGE,
-            routing_key=SUBSTRATE_NODE_RAW_DATA_ROUTING_KEY, body=data,
+            exchange=RAW_DATA_EXCHANGE, routing_key=routing_key, body=data,
             is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
             mandatory=True)
         self.logger.debug("Sent data to '%s' exchange", RAW_DATA_EXCHANGE)
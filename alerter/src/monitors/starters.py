@@ -1,6 +1,6 @@
 import logging
 import time
-from typing import TypeVar, Type, List
+from typing import TypeVar, Type, List, Optional, Callable, Dict
 
 import pika.exceptions
 
@@ -10,6 +10,7 @@ from src.configs.nodes.node import NodeConfig
 from src.configs.nodes.substrate import SubstrateNodeConfig
 from src.configs.repo import GitHubRepoConfig, DockerHubRepoConfig
 from src.configs.system import SystemConfig
+from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.contracts.chainlink import ChainlinkContractsMonitor
 from src.monitors.dockerhub import DockerHubMonitor
@@ -57,26 +58,53 @@ def _initialise_monitor_logger(monitor_display_name: str,
     return monitor_logger
 
 
+def _initialise_monitor_redis(monitor_display_name: str,
+                             monitor_logger: logging.Logger) -> RedisApi:
+    # Try initialising the Redis API until successful. This had to be done
+    # separately to avoid instances when Redis creation failed and we
+    # attempt to use it.
+    while True:
+        try:
+            redis = RedisApi(logger=monitor_logger.getChild(
+                RedisApi.__name__), db=env.REDIS_DB, host=env.REDIS_IP,
+                port=env.REDIS_PORT, namespace=env.UNIQUE_ALERTER_IDENTIFIER)
+            break
+        except Exception as e:
+            msg = get_initialisation_error_message(monitor_display_name, e)
+            log_and_print(msg, monitor_logger)
+            # sleep before trying again
+            time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
+
+    return redis
+
+
 def _initialise_monitor(
         monitor_type: Type[T], monitor_display_name: str,
-        monitoring_period: int, config: MonitorableConfig, *args) -> T:
+        monitoring_period: int, config: MonitorableConfig, *args,
+        rabbitmq: Optional[RabbitMQApi] = None,
+        max_attempts: Optional[int] = None) -> T:
     monitor_logger = _initialise_monitor_logger(monitor_display_name,
                                                 monitor_type.__name__)
 
-    # Try initialising the monitor until successful
+    # Try initialising the monitor until successful, or until the given
+    # number of attempts is used up
+    attempts = 0
     while True:
+        attempts += 1
         try:
-            rabbitmq = RabbitMQApi(
+            monitor_rabbitmq = rabbitmq or RabbitMQApi(
                 logger=monitor_logger.getChild(RabbitMQApi.__name__),
                 host=env.RABBIT_IP)
             monitor = monitor_type(monitor_display_name, config, monitor_logger,
-                                   monitoring_period, rabbitmq, *args)
+                                   monitoring_period, monitor_rabbitmq, *args)
             log_and_print("Successfully initialised {}".format(
                 monitor_display_name), monitor_logger)
             break
         except Exception as e:
             msg = get_initialisation_error_message(monitor_display_name, e)
             log_and_print(msg, monitor_logger)
+            if max_attempts is not None and attempts >= max_attempts:
+                raise
             # sleep before trying again
             time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
 
@@ -86,25 +114,32 @@ def _initialise_monitor(
 def _initialise_chainlink_contracts_monitor(
         monitor_display_name: str, monitoring_period: int, weiwatchers_url: str,
         evm_nodes: List[str], node_configs: List[ChainlinkNodeConfig],
-        parent_id: str) -> ChainlinkContractsMonitor:
+        parent_id: str, rabbitmq: Optional[RabbitMQApi] = None,
+        max_attempts: Optional[int] = None
+) -> ChainlinkContractsMonitor:
     monitor_logger = _initialise_monitor_logger(
         monitor_display_name, ChainlinkContractsMonitor.__name__)
 
-    # Try initialising the monitor until successful
+    # Try initialising the monitor until successful, or until the given
+    # number of attempts is used up
+    attempts = 0
     while True:
+        attempts += 1
         try:
-            rabbitmq = RabbitMQApi(
+            monitor_rabbitmq = rabbitmq or RabbitMQApi(
                 logger=monitor_logger.getChild(RabbitMQApi.__name__),
                 host=env.RABBIT_IP)
             monitor = ChainlinkContractsMonitor(
                 monitor_display_name, weiwatchers_url, evm_nodes, node_configs,
-                monitor_logger, monitoring_period, rabbitmq, parent_id)
+                monitor_logger, monitoring_period, monitor_rabbitmq, parent_id)
             log_and_print("Successfully initialised {}".format(
                 monitor_display_name), monitor_logger)
             break
         except Exception as e:
             msg = get_initialisation_error_message(monitor_display_name, e)
             log_and_print(msg, monitor_logger)
+            if max_attempts is not None and attempts >= max_attempts:
+                raise
             # sleep before trying again
             time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
 
@@ -114,25 +149,33 @@ def _initialise_chainlink_contracts_monitor(
 def _initialise_cosmos_network_monitor(
         monitor_display_name: str, monitoring_period: int,
         data_sources: List[CosmosNodeConfig], parent_id: str,
-        chain_name: str) -> CosmosNetworkMonitor:
+        chain_name: str, rabbitmq: Optional[RabbitMQApi] = None,
+        max_attempts: Optional[int] = None
+) -> CosmosNetworkMonitor:
     monitor_logger = _initialise_monitor_logger(
         monitor_display_name, CosmosNetworkMonitor.__name__)
+    redis = _initialise_monitor_redis(monitor_display_name, monitor_logger)
 
-    # Try initialising the monitor until successful
+    # Try initialising the monitor until successful, or until the given
+    # number of attempts is used up
+    attempts = 0
     while True:
+        attempts += 1
         try:
-            rabbitmq = RabbitMQApi(
+            monitor_rabbitmq = rabbitmq or RabbitMQApi(
                 logger=monitor_logger.getChild(RabbitMQApi.__name__),
                 host=env.RABBIT_IP)
             monitor = CosmosNetworkMonitor(
                 monitor_display_name, data_sources, parent_id, chain_name,
-                monitor_logger, monitoring_period, rabbitmq)
+                monitor_logger, monitoring_period, monitor_rabbitmq, redis)
             log_and_print("Successfully initialised {}".format(
                 monitor_display_name), monitor_logger)
             break
         except Exception as e:
             msg = get_initialisation_error_message(monitor_display_name, e)
             log_and_print(msg, monitor_logger)
+            if max_attempts is not None and attempts >= max_attempts:
+                raise
             # sleep before trying again
             time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
 
@@ -143,32 +186,54 @@ def _initialise_substrate_network_monitor(
         monitor_display_name: str, monitoring_period: int,
         data_sources: List[SubstrateNodeConfig],
         governance_addresses: List[str], parent_id: str,
-        chain_name: str) -> SubstrateNetworkMonitor:
+        chain_name: str, rabbitmq: Optional[RabbitMQApi] = None,
+        max_attempts: Optional[int] = None
+) -> SubstrateNetworkMonitor:
     monitor_logger = _initialise_monitor_logger(
         monitor_display_name, SubstrateNetworkMonitor.__name__)
+    redis = _initialise_monitor_redis(monitor_display_name, monitor_logger)
 
-    # Try initialising the monitor until successful
+    # Try initialising the monitor until successful, or until the given
+    # number of attempts is used up
+    attempts = 0
     while True:
+        attempts += 1
         try:
-            rabbitmq = RabbitMQApi(
+            monitor_rabbitmq = rabbitmq or RabbitMQApi(
                 logger=monitor_logger.getChild(RabbitMQApi.__name__),
                 host=env.RABBIT_IP)
             monitor = SubstrateNetworkMonitor(
                 monitor_display_name, data_sources, governance_addresses,
                 parent_id, chain_name, monitor_logger, monitoring_period,
-                rabbitmq)
+                monitor_rabbitmq, redis)
             log_and_print("Successfully initialised {}".format(
                 monitor_display_name), monitor_logger)
             break
         except Exception as e:
             msg = get_initialisation_error_message(monitor_display_name, e)
             log_and_print(msg, monitor_logger)
+            if max_attempts is not None and attempts >= max_attempts:
+                raise
             # sleep before trying again
             time.sleep(RE_INITIALISE_SLEEPING_PERIOD)
 
     return monitor
 
 
+def _get_github_monitor_display_name(repo_config: GitHubRepoConfig) -> str:
+    # Monitor display name based on repo name. The '/' are replaced with spaces,
+    # and the last space is removed.
+    return GITHUB_MONITOR_NAME_TEMPLATE.format(
+        repo_config.repo_name.replace('/', ' ')[:-1])
+
+
+def _get_dockerhub_monitor_display_name(
+        repo_config: DockerHubRepoConfig) -> str:
+    # Monitor display name based on repo namespace and name
+    return DOCKERHUB_MONITOR_NAME_TEMPLATE.format(
+        repo_config.repo_namespace + ' ' + repo_config.repo_name)
+
+
 def start_system_monitor(system_config: SystemConfig) -> None:
     # Monitor display name based on system
     monitor_display_name = SYSTEM_MONITOR_NAME_TEMPLATE.format(
@@ -180,10 +245,7 @@ def start_system_monitor(system_config: SystemConfig) -> None:
 
 
 def start_github_monitor(repo_config: GitHubRepoConfig) -> None:
-    # Monitor display name based on repo name. The '/' are replaced with spaces,
-    # and the last space is removed.
-    monitor_display_name = GITHUB_MONITOR_NAME_TEMPLATE.format(
-        repo_config.repo_name.replace('/', ' ')[:-1])
+    monitor_display_name = _get_github_monitor_display_name(repo_config)
     github_monitor = _initialise_monitor(GitHubMonitor, monitor_display_name,
                                          env.GITHUB_MONITOR_PERIOD_SECONDS,
                                          repo_config)
@@ -191,10 +253,7 @@ def start_github_monitor(repo_config: GitHubRepoConfig) -> None:
 
 
 def start_dockerhub_monitor(repo_config: DockerHubRepoConfig) -> None:
-    # Monitor display name based on repo name. The '/' are replaced with spaces,
-    # and the last space is removed.
-    monitor_display_name = DOCKERHUB_MONITOR_NAME_TEMPLATE.format(
-        repo_config.repo_namespace + ' ' + repo_config.repo_name)
+    monitor_display_name = _get_dockerhub_monitor_display_name(repo_config)
     dockerhub_monitor = _initialise_monitor(
         DockerHubMonitor, monitor_display_name,
         env.DOCKERHUB_MONITOR_PERIOD_SECONDS, repo_config)
@@ -262,3 +321,84 @@ def start_monitor(monitor: Monitor) -> None:
             log_and_print("Restarting {} in {} seconds.".format(
                 monitor, RESTART_SLEEPING_PERIOD), monitor.logger)
             time.sleep(RESTART_SLEEPING_PERIOD)
+
+
+# The functions below only create the monitor which the respective starter
+# would run, using the given RabbitMQ interface. They are used by the pooled
+# monitors executor, where many monitors share the connection of one process.
+# Only one attempt is made, as the worker retries a monitor which could not
+# be created later on without holding back the other monitors it runs.
+
+def create_system_monitor(rabbitmq: RabbitMQApi,
+                          system_config: SystemConfig) -> SystemMonitor:
+    return _initialise_monitor(
+        SystemMonitor,
+        SYSTEM_MONITOR_NAME_TEMPLATE.format(system_config.system_name),
+        env.SYSTEM_MONITOR_PERIOD_SECONDS, system_config, rabbitmq=rabbitmq,
+        max_attempts=1)
+
+
+def create_github_monitor(rabbitmq: RabbitMQApi,
+                          repo_config: GitHubRepoConfig) -> GitHubMonitor:
+    return _initialise_monitor(
+        GitHubMonitor, _get_github_monitor_display_name(repo_config),
+        env.GITHUB_MONITOR_PERIOD_SECONDS, repo_config, rabbitmq=rabbitmq,
+        max_attempts=1)
+
+
+def create_dockerhub_monitor(
+        rabbitmq: RabbitMQApi,
+        repo_config: DockerHubRepoConfig) -> DockerHubMonitor:
+    return _initialise_monitor(
+        DockerHubMonitor, _get_dockerhub_monitor_display_name(repo_config),
+        env.DOCKERHUB_MONITOR_PERIOD_SECONDS, repo_config, rabbitmq=rabbitmq,
+        max_attempts=1)
+
+
+def create_node_monitor(rabbitmq: RabbitMQApi, node_config: NodeConfig,
+                        monitor_type: Type[T], *args) -> T:
+    return _initialise_monitor(
+        monitor_type, NODE_MONITOR_NAME_TEMPLATE.format(node_config.node_name),
+        env.NODE_MONITOR_PERIOD_SECONDS, node_config, *args, rabbitmq=rabbitmq,
+        max_attempts=1)
+
+
+def create_chainlink_contracts_monitor(
+        rabbitmq: RabbitMQApi, weiwatchers_url: str, evm_nodes: List[str],
+        node_configs: List[ChainlinkNodeConfig], sub_chain: str,
+        parent_id: str) -> ChainlinkContractsMonitor:
+    return _initialise_chainlink_contracts_monitor(
+        CL_CONTRACTS_MONITOR_NAME_TEMPLATE.format(sub_chain),
+        env.CHAINLINK_CONTRACTS_MONITOR_PERIOD_SECONDS, weiwatchers_url,
+        evm_nodes, node_configs, parent_id, rabbitmq=rabbitmq,
+        max_attempts=1)
+
+
+def create_cosmos_network_monitor(
+        rabbitmq: RabbitMQApi, data_sources: List[CosmosNodeConfig],
+        parent_id: str, chain_name: str) -> CosmosNetworkMonitor:
+    return _initialise_cosmos_network_monitor(
+        COSMOS_NETWORK_MONITOR_NAME_TEMPLATE.format(chain_name),
+        env.NETWORK_MONITOR_PERIOD_SECONDS, data_sources, parent_id,
+        chain_name, rabbitmq=rabbitmq, max_attempts=1)
+
+
+def create_substrate_network_monitor(
+        rabbitmq: RabbitMQApi, data_sources: List[SubstrateNodeConfig],
+        parent_id: str, chain_name: str,
+        governance_addresses: List[str]) -> SubstrateNetworkMonitor:
+    return _initialise_substrate_network_monitor(
+        SUBSTRATE_NETWORK_MONITOR_NAME_TEMPLATE.format(chain_name),
+        env.NETWORK_MONITOR_PERIOD_SECONDS, data_sources, governance_addresses,
+        parent_id, chain_name, rabbitmq=rabbitmq, max_attempts=1)
+
+
+MONITOR_CREATORS: Dict[Callable, Callable[..., Monitor]] = {
+    start_system_monitor: create_system_monitor,
+    start_github_monitor: create_github_monitor,
+    start_dockerhub_monitor: create_dockerhub_monitor,
+    start_node_monitor: create_node_monitor,
+    start_chainlink_contracts_monitor: create_chainlink_contracts_monitor,
+    start_cosmos_network_monitor: create_cosmos_network_monitor,
+    start_substrate_network_monitor: create_substrate_network_monitor,
+}
@@ -233,10 +233,12 @@ class SystemMonitor(Monitor):
         return processed_data
 
     def _send_data(self, data: Dict) -> None:
+        routing_key = self._get_raw_data_routing_key(
+            SYSTEM_RAW_DATA_ROUTING_KEY, self.system_config.system_id)
         self.rabbitmq.basic_publish_confirm(
-            exchange=RAW_DATA_EXCHANGE, routing_key=SYSTEM_RAW_DATA_ROUTING_KEY,
-            body=data, is_body_dict=True,
-            properties=pika.BasicProperties(delivery_mode=2), mandatory=True)
+            exchange=RAW_DATA_EXCHANGE, routing_key=routing_key, body=data,
+            is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
+            mandatory=True)
         self.logger.debug("Sent data to '%s' exchange", RAW_DATA_EXCHANGE)
 
     def _monitor(self) -> None:
@@ -0,0 +1,250 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import AbstractSet, Dict, FrozenSet, Iterable, List, Optional, Set
+
+
+class TendermintHeightData:
+    """
+    The Tendermint RPC data of one height which the Cosmos node monitors need
+    for their archive scans. It is independent of the validator being
+    monitored, so it can be shared by all node monitors of a chain.
+    """
+    __slots__ = ('_height', '_active_validators', '_signed_validators',
+                 '_begin_block_events')
+
+    def __init__(self, height: int, active_validators: AbstractSet[str],
+                 signed_validators: Set[str],
+                 begin_block_events: List[Dict]) -> None:
+        self._height = height
+        # The consensus addresses of the validator set at height - 1
+        self._active_validators = active_validators
+        # The consensus addresses which signed block height - 1, as recorded
+        # in the last commit of the block at height
+        self._signed_validators = signed_validators
+        self._begin_block_events = begin_block_events
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def active_validators(self) -> AbstractSet[str]:
+        return self._active_validators
+
+    @property
+    def signed_validators(self) -> Set[str]:
+        return self._signed_validators
+
+    @property
+    def begin_block_events(self) -> List[Dict]:
+        return self._begin_block_events
+
+
+class TendermintValidatorSetIndex:
+    """
+    An index of the validator sets of a chain, keyed by the validators_hash
+    which every block header carries. The validator set rarely changes, so the
+    sets of consecutive heights are the same snapshot, and it only needs to be
+    retrieved from the /validators endpoint when the hash changes. It also
+    remembers the validators_hash of the heights whose header was seen, so
+    that the hash of a height does not have to be retrieved again. The index
+    never holds more than max_snapshots sets and max_heights hashes, evicting
+    the least recently used first.
+    """
+
+    def __init__(self, max_snapshots: int = 16,
+                 max_heights: int = 1000) -> None:
+        self._max_snapshots = max_snapshots
+        self._max_heights = max_heights
+        self._snapshots: 'OrderedDict[str, FrozenSet[str]]' = OrderedDict()
+        self._validators_hashes: 'OrderedDict[int, str]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_snapshots(self) -> int:
+        return self._max_snapshots
+
+    @property
+    def max_heights(self) -> int:
+        return self._max_heights
+
+    @property
+    def validators_hashes(self) -> List[str]:
+        return list(self._snapshots.keys())
+
+    @property
+    def heights(self) -> List[int]:
+        return list(self._validators_hashes.keys())
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get_validators_hash(self, height: int) -> Optional[str]:
+        with self._lock:
+            return self._validators_hashes.get(height)
+
+    def set_validators_hash(self, height: int, validators_hash: str) -> None:
+        with self._lock:
+            self._validators_hashes[height] = validators_hash
+            self._validators_hashes.move_to_end(height)
+            while len(self._validators_hashes) > self.max_heights:
+                self._validators_hashes.popitem(last=False)
+
+    def get(self, validators_hash: str) -> Optional[FrozenSet[str]]:
+        with self._lock:
+            validators = self._snapshots.get(validators_hash)
+            if validators is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._snapshots.move_to_end(validators_hash)
+            return validators
+
+    def add(self, validators_hash: str,
+            validators: Iterable[str]) -> FrozenSet[str]:
+        """
+        Stores the consensus addresses of the validator set with the given
+        hash. The set is frozen since it is shared by all the heights which
+        have the same validator set.
+        :param validators_hash: The validators_hash of the validator set
+        :param validators: The consensus addresses of the validator set
+        :return: The stored snapshot of the validator set
+        """
+        snapshot = frozenset(validators)
+        with self._lock:
+            self._snapshots[validators_hash] = snapshot
+            self._snapshots.move_to_end(validators_hash)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+
+        return snapshot
+
+
+class TendermintBlockCache:
+    """
+    A per-chain cache of TendermintHeightData. Node monitors subscribe to the
+    cache of their chain, and they report the last height they monitored after
+    each round. Heights which every subscriber has passed are evicted, and the
+    cache never holds more than max_heights heights, evicting the least
+    recently used height first. Subscribers which stop reporting (e.g. removed
+    monitors) are forgotten after subscriber_timeout seconds. The cache also
+    holds the chain's TendermintValidatorSetIndex.
+    """
+
+    def __init__(self, max_heights: int = 1000,
+                 subscriber_timeout: float = 600) -> None:
+        self._max_heights = max_heights
+        self._subscriber_timeout = subscriber_timeout
+        self._heights: 'OrderedDict[int, TendermintHeightData]' = \
+            OrderedDict()
+        # subscriber_id -> (last height monitored, last report time)
+        self._subscribers: Dict[str, List] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._validator_sets = TendermintValidatorSetIndex()
+
+    @property
+    def max_heights(self) -> int:
+        return self._max_heights
+
+    @property
+    def heights(self) -> List[int]:
+        return list(self._heights.keys())
+
+    @property
+    def validator_sets(self) -> TendermintValidatorSetIndex:
+        return self._validator_sets
+
+    @property
+    def subscribers(self) -> List[str]:
+        return list(self._subscribers.keys())
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def subscribe(self, subscriber_id: str) -> None:
+        with self._lock:
+            self._subscribers.setdefault(subscriber_id,
+                                         [None, time.monotonic()])
+
+    def unsubscribe(self, subscriber_id: str) -> None:
+        with self._lock:
+            self._subscribers.pop(subscriber_id, None)
+            self._evict_passed_heights()
+
+    def get(self, height: int) -> Optional[TendermintHeightData]:
+        with self._lock:
+            height_data = self._heights.get(height)
+            if height_data is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._heights.move_to_end(height)
+            return height_data
+
+    def add(self, height_data: TendermintHeightData) -> None:
+        with self._lock:
+            self._heights[height_data.height] = height_data
+            self._heights.move_to_end(height_data.height)
+            while len(self._heights) > self.max_heights:
+                self._heights.popitem(last=False)
+
+    def set_last_height_monitored(self, subscriber_id: str,
+                                  height: int) -> None:
+        with self._lock:
+            self._subscribers[subscriber_id] = [height, time.monotonic()]
+            self._evict_passed_heights()
+
+    def _evict_passed_heights(self) -> None:
+        # Forget subscribers which stopped reporting. Subscribers which have
+        # not monitored any height yet do not hold back eviction, since they
+        # start monitoring from the tip of the chain.
+        now = time.monotonic()
+        self._subscribers = {
+            subscriber_id: progress
+            for subscriber_id, progress in self._subscribers.items()
+            if now - progress[1] <= self._subscriber_timeout
+        }
+        last_heights = [progress[0]
+                        for progress in self._subscribers.values()
+                        if progress[0] is not None]
+        if not last_heights:
+            return
+
+        lowest_last_height = min(last_heights)
+        for height in [height for height in self._heights
+                       if height <= lowest_last_height]:
+            del self._heights[height]
+
+
+# The caches of the chains monitored by the current process, keyed by the
+# chain's parent_id.
+_tendermint_block_caches: Dict[str, TendermintBlockCache] = {}
+
+
+def get_tendermint_block_cache(parent_id: str) -> TendermintBlockCache:
+    """
+    Returns the block cache shared by the node monitors of the chain with the
+    given parent_id which run in the current process.
+    :param parent_id: The id of the chain
+    :return: The chain's TendermintBlockCache
+    """
+    if parent_id not in _tendermint_block_caches:
+        _tendermint_block_caches[parent_id] = TendermintBlockCache()
+    return _tendermint_block_caches[parent_id]
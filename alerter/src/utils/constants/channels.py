@@ -53,3 +53,11 @@ Triggered At: {date_time}
 Parent ID: {parent_id}
 Origin ID: {origin_id}
 """
+
+# The minimum number of seconds between two alerts sent through a channel when
+# retries are non-blocking, so that the rate limits of the provider are not hit
+TELEGRAM_MIN_SEND_INTERVAL_SECONDS = 1
+SLACK_MIN_SEND_INTERVAL_SECONDS = 1
+EMAIL_MIN_SEND_INTERVAL_SECONDS = 0
+PAGERDUTY_MIN_SEND_INTERVAL_SECONDS = 0.5
+OPSGENIE_MIN_SEND_INTERVAL_SECONDS = 0.1
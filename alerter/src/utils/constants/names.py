@@ -65,6 +65,7 @@ NODE_MONITOR_NAME_TEMPLATE = 'Node monitor ({})'
 CL_CONTRACTS_MONITOR_NAME_TEMPLATE = 'Chainlink Contracts Monitor ({})'
 COSMOS_NETWORK_MONITOR_NAME_TEMPLATE = 'Cosmos Network Monitor ({})'
 SUBSTRATE_NETWORK_MONITOR_NAME_TEMPLATE = 'Substrate Network Monitor ({})'
+MONITORS_WORKER_NAME_TEMPLATE = '{} worker {}'
 TELEGRAM_ALERTS_HANDLER_NAME_TEMPLATE = 'Telegram Alerts Handler ({})'
 TELEGRAM_COMMANDS_HANDLER_NAME_TEMPLATE = 'Telegram Commands Handler ({})'
 SLACK_ALERTS_HANDLER_NAME_TEMPLATE = 'Slack Alerts Handler ({})'
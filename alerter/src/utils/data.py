@@ -1,12 +1,14 @@
 import json
 import logging
+import os
 from enum import Enum
 from json import JSONDecodeError
-from typing import Dict
+from typing import Dict, Optional, Iterable, Tuple
 
 import requests
-from prometheus_client.parser import text_string_to_metric_families
+from requests.adapters import HTTPAdapter
 
+from src.utils import env
 from src.utils.exceptions import (NoMetricsGivenException,
                                   MetricNotFoundException,
                                   ReceivedUnexpectedDataException)
@@ -17,16 +19,82 @@ class RequestStatus(Enum):
     FAILED = False
 
 
+class HttpSessionPool:
+    """
+    A keep-alive HTTP session whose connections are pooled per host. Requests
+    to a host re-use an idle connection of that host's pool instead of paying
+    for a new TCP and TLS handshake on every request.
+    """
+
+    def __init__(self, pool_connections: int, pool_maxsize: int) -> None:
+        # pool_connections is the number of hosts whose pools are kept open,
+        # and pool_maxsize is the number of connections kept open per host.
+        self._adapter = HTTPAdapter(pool_connections=pool_connections,
+                                    pool_maxsize=pool_maxsize)
+        self._session = requests.Session()
+        self._session.mount('http://', self._adapter)
+        self._session.mount('https://', self._adapter)
+
+    @property
+    def session(self) -> requests.Session:
+        return self._session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self._session.get(url, **kwargs)
+
+    def get_connection_reuse_metrics(self) -> Dict[str, Dict[str, int]]:
+        """
+        :return: For each host whose pool is open, the number of requests sent
+               : and the number of connections opened, in the form
+               : {'<scheme>://<host>:<port>': {'requests': int,
+               :                               'connections': int}}
+        """
+        pools = self._adapter.poolmanager.pools
+        metrics = {}
+        for pool_key in pools.keys():
+            pool = pools[pool_key]
+            host = '{}://{}:{}'.format(pool.scheme, pool.host, pool.port)
+            metrics[host] = {
+                'requests': pool.num_requests,
+                'connections': pool.num_connections,
+            }
+
+        return metrics
+
+    def close(self) -> None:
+        self._session.close()
+
+
+# Open connections cannot be shared between processes, therefore the pool is
+# re-created if the process was forked after the pool was created.
+_http_session_pool: Optional[HttpSessionPool] = None
+_http_session_pool_pid: Optional[int] = None
+
+
+def get_http_session_pool() -> HttpSessionPool:
+    """
+    :return: The HttpSessionPool shared by all HTTP requests of this process
+    """
+    global _http_session_pool, _http_session_pool_pid
+    if _http_session_pool is None or _http_session_pool_pid != os.getpid():
+        _http_session_pool = HttpSessionPool(env.HTTP_POOL_CONNECTIONS,
+                                             env.HTTP_POOL_MAXSIZE)
+        _http_session_pool_pid = os.getpid()
+
+    return _http_session_pool
+
+
 def get_cosmos_json(endpoint: str, logger: logging.Logger, params=None,
-                    verify: bool = True, timeout=10):
+                    verify: bool = True,
+                    timeout=env.HTTP_REQUEST_TIMEOUT_SECONDS):
     # For Cosmos SDK versions <= 0.39.2 a 404 not found error may be returned if
     # a function is deprecated. Hence we want to return the error and not
     # convert into JSON as this may raise a JSONDecodeError.
     if params is None:
         params = {}
 
-    get_ret = requests.get(url=endpoint, params=params, timeout=timeout,
-                           verify=verify, headers={'Connection': 'close'})
+    get_ret = get_http_session_pool().get(url=endpoint, params=params,
+                                          timeout=timeout, verify=verify)
     logger.debug("get_json: get_ret: %s", get_ret)
 
     try:
@@ -36,22 +104,124 @@ def get_cosmos_json(endpoint: str, logger: logging.Logger, params=None,
 
 
 def get_json(endpoint: str, logger: logging.Logger, params=None,
-             verify: bool = True, timeout=10):
+             verify: bool = True, timeout=env.HTTP_REQUEST_TIMEOUT_SECONDS):
     if params is None:
         params = {}
-    get_ret = requests.get(url=endpoint, params=params, timeout=timeout,
-                           verify=verify, headers={'Connection': 'close'})
+    get_ret = get_http_session_pool().get(url=endpoint, params=params,
+                                          timeout=timeout, verify=verify)
     logger.debug("get_json: get_ret: %s", get_ret)
     return json.loads(get_ret.content.decode('UTF-8'))
 
 
 def get_prometheus(endpoint: str, logger: logging.Logger, verify: bool = True):
-    metrics = requests.get(endpoint, timeout=10, verify=verify, headers={
-        'Connection': 'close'}).content
+    metrics = get_http_session_pool().get(
+        endpoint, timeout=env.HTTP_REQUEST_TIMEOUT_SECONDS,
+        verify=verify).content
     logger.debug("Retrieved prometheus data from endpoint: " + endpoint)
     return metrics.decode('utf-8')
 
 
+# The size of the chunks in which Prometheus endpoints are read
+PROMETHEUS_CHUNK_SIZE = 64 * 1024
+
+_PROMETHEUS_LABEL_VALUE_ESCAPES = {'\\': '\\', '"': '"', 'n': '\n'}
+
+
+def _parse_prometheus_labels(line: str, start: int) -> Tuple[Dict, int]:
+    """
+    Parses the labels of a Prometheus text format sample line, unescaping the
+    label values.
+    :param line: The sample line
+    :param start: The index of the opening brace of the labels
+    :return: The labels and the index after the closing brace
+    :raises: ValueError if the labels are malformed
+    """
+    labels = {}
+    index = start + 1
+    while True:
+        while line[index] in ' \t':
+            index += 1
+        if line[index] == '}':
+            return labels, index + 1
+
+        equals = line.index('=', index)
+        label_name = line[index:equals].strip()
+        index = line.index('"', equals) + 1
+        value_chars = []
+        while line[index] != '"':
+            if line[index] == '\\':
+                index += 1
+                value_chars.append(_PROMETHEUS_LABEL_VALUE_ESCAPES.get(
+                    line[index], '\\' + line[index]))
+            else:
+                value_chars.append(line[index])
+            index += 1
+        labels[label_name] = ''.join(value_chars)
+
+        index += 1
+        while line[index] in ' \t':
+            index += 1
+        if line[index] == ',':
+            index += 1
+        elif line[index] != '}':
+            raise ValueError("Invalid Prometheus labels: " + line)
+
+
+def _parse_prometheus_lines(lines: Iterable[bytes],
+                            requested_metrics: Dict[str, str]) -> Dict:
+    """
+    Extracts the requested metrics from the lines of a Prometheus text format
+    exposition. Only the name of each sample is looked at unless it is one of
+    the requested metrics, so the cost of non-requested families is small.
+    :param lines: The lines of the exposition, as bytes
+    :param requested_metrics: The names of the metrics to extract
+    :return: The found metrics, in the format returned by
+           : get_prometheus_metrics_data
+    :raises: ValueError if a requested sample is malformed
+    """
+    requested_names = {name.encode('utf-8') for name in requested_metrics}
+    response = {}
+    for line in lines:
+        # Comments, HELP and TYPE lines start with a hash, and names cannot
+        # start with whitespace.
+        if not line or line[0] in b'# \t':
+            continue
+
+        name_end = len(line)
+        for separator in b'{ \t':
+            separator_index = line.find(separator)
+            if -1 < separator_index < name_end:
+                name_end = separator_index
+        if line[:name_end] not in requested_names:
+            continue
+
+        decoded_line = line.decode('utf-8')
+        name = decoded_line[:name_end]
+        labels, value_start = {}, name_end
+        if decoded_line[name_end:name_end + 1] == '{':
+            try:
+                labels, value_start = _parse_prometheus_labels(decoded_line,
+                                                               name_end)
+            except IndexError:
+                raise ValueError("Invalid Prometheus labels: " + decoded_line)
+        # The value may be followed by a timestamp, which is not needed
+        value = float(decoded_line[value_start:].split()[0])
+
+        if name not in response:
+            if labels != {}:
+                response[name] = {}
+                response[name][json.dumps(labels)] = value
+            else:
+                response[name] = value
+        else:
+            if labels != {}:
+                response[name][json.dumps(labels)] = value
+            else:
+                response[name] = value + response[name]
+
+    return response
+
+
 def get_prometheus_metrics_data(endpoint: str,
                                 requested_metrics: Dict[str, str],
                                 logger: logging.Logger,
@@ -72,29 +242,19 @@ def get_prometheus_metrics_data(endpoint: str,
     :param verify: Will verify the certificate if set to True
     :return: The metrics with their values
     """
-    response = {}
     if len(requested_metrics) == 0:
         raise NoMetricsGivenException("No metrics given when requesting "
                                       "prometheus data from " + endpoint)
 
-    metrics = get_prometheus(endpoint, logger, verify)
-    for family in text_string_to_metric_families(metrics):
-        for sample in family.samples:
-            if sample.name in requested_metrics:
-                if sample.name not in response:
-                    if sample.labels != {}:
-                        response[sample.name] = {}
-                        response[sample.name][json.dumps(sample.labels)] = \
-                            sample.value
-                    else:
-                        response[sample.name] = sample.value
-                else:
-                    if sample.labels != {}:
-                        response[sample.name][json.dumps(sample.labels)] = \
-                            sample.value
-                    else:
-                        response[sample.name] = sample.value + \
-                                                response[sample.name]
+    # The exposition is parsed while it is being downloaded, so it is never
+    # held in memory as a whole.
+    with get_http_session_pool().get(
+            endpoint, timeout=env.HTTP_REQUEST_TIMEOUT_SECONDS, verify=verify,
+            stream=True) as metrics:
+        response = _parse_prometheus_lines(
+            metrics.iter_lines(chunk_size=PROMETHEUS_CHUNK_SIZE),
+            requested_metrics)
+    logger.debug("Retrieved prometheus data from endpoint: " + endpoint)
 
     missing_metrics = set(requested_metrics) - set(response)
     for metric in missing_metrics:
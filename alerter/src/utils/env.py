@@ -66,6 +66,131 @@ NETWORK_MONITOR_PERIOD_SECONDS = int(
     os.environ['NETWORK_MONITOR_PERIOD_SECONDS'])
 # These define how often a monitor runs an iteration of its monitoring loop
 
+# Monitors executor - If greater than 0, the monitors managers run their
+# monitors on this number of worker processes per manager rather than on one
+# process per monitor.
+MONITORS_WORKER_POOL_SIZE = int(os.getenv('MONITORS_WORKER_POOL_SIZE', 0))
+
+# The maximum number of heights a node monitor retrieves at the same time from
+# a data source when catching up with the chain.
+NODE_MONITOR_CATCHUP_CONCURRENCY = int(
+    os.getenv('NODE_MONITOR_CATCHUP_CONCURRENCY', 1))
+
+# Worker heartbeats - The data transformers, data stores and alerters send at
+# most one heartbeat per interval, carrying the number of messages processed
+# and failed since the previous heartbeat. If 0, a heartbeat is sent after
+# every processed message.
+WORKER_HEARTBEAT_INTERVAL_SECONDS = int(
+    os.getenv('WORKER_HEARTBEAT_INTERVAL_SECONDS', 0))
+
+# Heartbeat handler - Heartbeats are written to Redis in pipelined batches
+# every HEARTBEAT_HANDLER_FLUSH_INTERVAL_SECONDS, or as soon as
+# HEARTBEAT_HANDLER_BATCH_SIZE heartbeats are waiting to be written.
+HEARTBEAT_HANDLER_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv('HEARTBEAT_HANDLER_FLUSH_INTERVAL_SECONDS', 1))
+HEARTBEAT_HANDLER_BATCH_SIZE = int(
+    os.getenv('HEARTBEAT_HANDLER_BATCH_SIZE', 100))
+
+# Data store Mongo batching - The system, node, network and contract stores
+# write to Mongo in bulk every STORE_MONGO_FLUSH_INTERVAL_SECONDS, or as soon as
+# STORE_MONGO_BATCH_SIZE updates are waiting to be written. Messages are
+# acknowledged only once their updates are written. If the batch size is 1,
+# every update is written as soon as it is received.
+STORE_MONGO_BATCH_SIZE = int(os.getenv('STORE_MONGO_BATCH_SIZE', 1))
+STORE_MONGO_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv('STORE_MONGO_FLUSH_INTERVAL_SECONDS', 1))
+
+# Data store batch consuming - If STORE_CONSUME_BATCH_SIZE is greater than 1,
+# the stores process messages in batches of up to this size, waiting at most
+# STORE_CONSUME_BATCH_TIMEOUT_MS for a batch to fill. The Redis and Mongo
+# writes of a batch are sent together, after which the whole batch is
+# acknowledged at once. In this mode STORE_MONGO_BATCH_SIZE and
+# STORE_MONGO_FLUSH_INTERVAL_SECONDS are not used.
+STORE_CONSUME_BATCH_SIZE = int(os.getenv('STORE_CONSUME_BATCH_SIZE', 1))
+STORE_CONSUME_BATCH_TIMEOUT_MS = int(
+    os.getenv('STORE_CONSUME_BATCH_TIMEOUT_MS', 100))
+
+# Alert router mute cache - The alert router caches the mute state of the
+# alerter and of each chain for ALERT_ROUTER_MUTE_CACHE_TTL_SECONDS. If 0, the
+# mute state is read from Redis for every alert.
+ALERT_ROUTER_MUTE_CACHE_TTL_SECONDS = float(
+    os.getenv('ALERT_ROUTER_MUTE_CACHE_TTL_SECONDS', 0))
+
+# Alert router publisher confirms - The maximum number of routed alerts which
+# may be awaiting a delivery confirmation from RabbitMQ at the same time. If
+# 1, each alert is published only once the previous one is confirmed.
+ALERT_ROUTER_PUBLISHER_CONFIRM_WINDOW = int(
+    os.getenv('ALERT_ROUTER_PUBLISHER_CONFIRM_WINDOW', 1))
+
+# Alert router digests - Non-critical alerts routed to a channel with the same
+# parent_id, alert code and severity within ALERT_ROUTER_DIGEST_WINDOW_SECONDS
+# of each other are sent to that channel as a single digest alert. If 0, every
+# alert is sent on its own.
+ALERT_ROUTER_DIGEST_WINDOW_SECONDS = float(
+    os.getenv('ALERT_ROUTER_DIGEST_WINDOW_SECONDS', 0))
+
+# Channel handlers retries - If CHANNEL_HANDLERS_NON_BLOCKING_RETRIES is
+# enabled, an alert which could not be sent through a channel is re-tried
+# with exponential backoff while newer alerts are still sent. Otherwise the
+# handler keeps re-trying it, sleeping in between, before sending newer alerts.
+CHANNEL_HANDLERS_NON_BLOCKING_RETRIES: bool = \
+    os.getenv('CHANNEL_HANDLERS_NON_BLOCKING_RETRIES', 'false').lower() in (
+        "true", "yes", "y")
+
+# SMTP connection pooling - If EMAIL_SMTP_CONNECTION_POOLING is enabled, the
+# e-mail alerts handlers keep their authenticated SMTP connections open for up
+# to EMAIL_SMTP_IDLE_TIMEOUT_SECONDS seconds of inactivity.
+EMAIL_SMTP_CONNECTION_POOLING: bool = \
+    os.getenv('EMAIL_SMTP_CONNECTION_POOLING', 'false').lower() in (
+        "true", "yes", "y")
+EMAIL_SMTP_IDLE_TIMEOUT_SECONDS = int(
+    os.getenv('EMAIL_SMTP_IDLE_TIMEOUT_SECONDS', 60))
+
+# E-mail recipients batching - If EMAIL_BATCH_RECIPIENTS is enabled, the e-mail
+# alerts handlers send one e-mail to all the destination emails of a channel in
+# a single SMTP transaction. The destination emails are only given as envelope
+# recipients, so they are not disclosed to each other.
+EMAIL_BATCH_RECIPIENTS: bool = \
+    os.getenv('EMAIL_BATCH_RECIPIENTS', 'false').lower() in (
+        "true", "yes", "y")
+
+# Alerting state snapshots - If ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS is
+# greater than 0, the alerters save their alerting state to Redis at most this
+# often, and when they are stopped. A restarted alerter restores a snapshot
+# which is at most ALERTERS_STATE_SNAPSHOT_MAX_AGE_SECONDS old, and only resets
+# its alerts in Redis if it could not restore one.
+ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS = float(
+    os.getenv('ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0))
+ALERTERS_STATE_SNAPSHOT_MAX_AGE_SECONDS = float(
+    os.getenv('ALERTERS_STATE_SNAPSHOT_MAX_AGE_SECONDS', 300))
+
+# RabbitMQ message codec - The codec used by the components to serialize the
+# messages they publish, either json or msgpack. Received messages are
+# de-serialized according to their content type, so components using
+# different codecs can exchange messages.
+RABBITMQ_MESSAGE_CODEC = os.getenv('RABBITMQ_MESSAGE_CODEC', 'json')
+
+# Data transformer partitions - The number of processes started for each of
+# the system and node data transformers. Every process transforms the data of
+# the systems and nodes whose id hashes to its partition, so the data of a
+# monitorable is always transformed in order by the same process.
+DATA_TRANSFORMER_PARTITIONS = int(os.getenv('DATA_TRANSFORMER_PARTITIONS', 1))
+
+# Alerter partitions - The number of processes started for each of the system
+# and node alerters. Every process alerts on the systems and nodes whose id
+# hashes to its partition, and keeps the alerting state of those only. Alert
+# configs are sent to every process.
+ALERTER_PARTITIONS = int(os.getenv('ALERTER_PARTITIONS', 1))
+
+# HTTP connection pooling - The monitors and API wrappers keep connections
+# open to the hosts they query. HTTP_POOL_CONNECTIONS is the number of hosts
+# whose connections are kept open per process, and HTTP_POOL_MAXSIZE is the
+# number of connections kept open per host.
+HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', 100))
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 10))
+HTTP_REQUEST_TIMEOUT_SECONDS = int(os.getenv('HTTP_REQUEST_TIMEOUT_SECONDS',
+                                             10))
+
 # Publishers limits
 DATA_TRANSFORMER_PUBLISHING_QUEUE_SIZE = int(
     os.environ['DATA_TRANSFORMER_PUBLISHING_QUEUE_SIZE'])
@@ -0,0 +1,127 @@
+import copy
+import functools
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+import pika
+from pika.adapters.blocking_connection import BlockingConnection
+
+from src.message_broker.rabbitmq.rabbitmq_api import RabbitMQApi
+from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
+                                          HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
+from src.utils.exceptions import MessageWasNotDeliveredException
+from src.utils.timing import TimedTaskLimiter
+
+
+class HeartbeatBatcher:
+    """
+    Coalesces the heartbeats a worker component sends after processing each
+    message, so that at most one heartbeat is sent per interval. The heartbeat
+    which is sent carries the number of messages that were processed and that
+    failed since the previous heartbeat was sent. A heartbeat which is held
+    back is sent once the interval elapses, even if no other message is
+    processed in the meantime.
+    """
+
+    def __init__(self, interval: timedelta) -> None:
+        self._limiter = TimedTaskLimiter(interval)
+        self._processed = 0
+        self._failed = 0
+        self._pending_heartbeat: Optional[Dict] = None
+        # Timers do not survive a new connection, therefore the connection
+        # the flush was scheduled on is kept rather than a flag.
+        self._flush_connection: Optional[BlockingConnection] = None
+
+    def __eq__(self, other: Any) -> bool:
+        return self.__dict__ == other.__dict__
+
+    @property
+    def interval(self) -> timedelta:
+        return self._limiter.time_interval
+
+    @property
+    def processed(self) -> int:
+        return self._processed
+
+    @property
+    def failed(self) -> int:
+        return self._failed
+
+    def record_processed(self) -> None:
+        self._processed += 1
+
+    def record_failed(self) -> None:
+        self._failed += 1
+
+    def get_heartbeat(self, heartbeat: Dict) -> Optional[Dict]:
+        """
+        :param heartbeat: The heartbeat of the last message processed
+        :return: The heartbeat together with the processed and failed counts
+               : if a heartbeat is due, None otherwise
+        """
+        if not self._limiter.can_do_task():
+            return None
+
+        batched_heartbeat = copy.deepcopy(heartbeat)
+        batched_heartbeat['processed'] = self._processed
+        batched_heartbeat['failed'] = self._failed
+        return batched_heartbeat
+
+    def heartbeat_sent(self) -> None:
+        self._limiter.did_task()
+        self._processed = 0
+        self._failed = 0
+        self._pending_heartbeat = None
+
+    def send(self, rabbitmq: RabbitMQApi, heartbeat: Dict,
+             logger: logging.Logger) -> None:
+        """
+        Records that a message was processed and publishes the given heartbeat
+        of a worker if a heartbeat is due. Otherwise the heartbeat is held
+        back and published when the interval elapses.
+        :param rabbitmq: The RabbitMQ interface of the worker
+        :param heartbeat: The heartbeat of the last message processed
+        :param logger: The logger of the worker
+        """
+        self.record_processed()
+        self._pending_heartbeat = heartbeat
+        self._publish_pending_heartbeat(rabbitmq, logger)
+
+    def _publish_pending_heartbeat(self, rabbitmq: RabbitMQApi,
+                                   logger: logging.Logger) -> None:
+        heartbeat = self.get_heartbeat(self._pending_heartbeat)
+        if heartbeat is None:
+            self._schedule_flush(rabbitmq, logger)
+            return
+
+        rabbitmq.basic_publish_confirm(
+            exchange=HEALTH_CHECK_EXCHANGE,
+            routing_key=HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, body=heartbeat,
+            is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
+            mandatory=True)
+        self.heartbeat_sent()
+        logger.debug("Sent heartbeat to '%s' exchange", HEALTH_CHECK_EXCHANGE)
+
+    def _schedule_flush(self, rabbitmq: RabbitMQApi,
+                        logger: logging.Logger) -> None:
+        if rabbitmq.connection is None \
+                or self._flush_connection is rabbitmq.connection:
+            return
+
+        due_time = self._limiter.last_time_that_did_task + self.interval
+        delay = max(0.0, (due_time - datetime.now()).total_seconds())
+        rabbitmq.connection.call_later(delay, functools.partial(
+            self._flush, rabbitmq, logger))
+        self._flush_connection = rabbitmq.connection
+
+    def _flush(self, rabbitmq: RabbitMQApi, logger: logging.Logger) -> None:
+        self._flush_connection = None
+        if self._pending_heartbeat is None:
+            return
+
+        try:
+            self._publish_pending_heartbeat(rabbitmq, logger)
+        except MessageWasNotDeliveredException as e:
+            # The heartbeat is sent again with the next processed message
+            logger.exception(e)
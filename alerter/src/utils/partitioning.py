@@ -0,0 +1,80 @@
+import hashlib
+from typing import Optional
+
+_UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+_JUMP_HASH_MULTIPLIER = 2862933555777941757
+
+
+def _key_hash(key: str) -> int:
+    # The built-in hash of a string is randomised per process, therefore a
+    # digest is used so that every process maps a key to the same partition.
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'),
+                                          digest_size=8).digest(), 'big')
+
+
+def get_partition(key: str, partitions: int) -> int:
+    """
+    Maps a key to one of the partitions using jump consistent hashing. When
+    the number of partitions changes from n to n + 1, only 1/(n + 1) of the
+    keys move, and they all move to the new partition.
+    :param key: The key to partition, e.g. a node_id or a system_id
+    :param partitions: The number of partitions
+    :return: The index of the key's partition, in [0, partitions)
+    :raises ValueError: If the number of partitions is not positive
+    """
+    if partitions < 1:
+        raise ValueError("The number of partitions must be positive, got "
+                         "{}".format(partitions))
+
+    key_hash = _key_hash(key)
+    partition = -1
+    jump = 0
+    while jump < partitions:
+        partition = jump
+        key_hash = (key_hash * _JUMP_HASH_MULTIPLIER + 1) & _UINT64_MASK
+        jump = int((partition + 1) * ((1 << 31) / ((key_hash >> 33) + 1)))
+
+    return partition
+
+
+def get_key_partition(key: str, partitions: int) -> Optional[int]:
+    """
+    :param key: The key to partition
+    :param partitions: The number of partitions
+    :return: The index of the key's partition, or None if there is only one
+           : partition, in which case the components are not partitioned.
+    """
+    return None if partitions <= 1 else get_partition(key, partitions)
+
+
+def get_partition_routing_key(routing_key: str,
+                              partition: Optional[int]) -> str:
+    """
+    :param routing_key: The routing key of the un-partitioned messages
+    :param partition: The index of the partition, or None if not partitioned
+    :return: The routing key of the messages of the partition
+    """
+    return routing_key if partition is None else '{}.{}'.format(routing_key,
+                                                                partition)
+
+
+def get_partition_queue_name(queue_name: str,
+                             partition: Optional[int]) -> str:
+    """
+    :param queue_name: The name of the un-partitioned queue
+    :param partition: The index of the partition, or None if not partitioned
+    :return: The name of the queue of the partition
+    """
+    return queue_name if partition is None else '{}_{}'.format(queue_name,
+                                                               partition)
+
+
+def get_partition_component_name(component_name: str,
+                                 partition: Optional[int]) -> str:
+    """
+    :param component_name: The name of the un-partitioned component
+    :param partition: The index of the partition, or None if not partitioned
+    :return: The name of the component handling the partition
+    """
+    return component_name if partition is None else '{} (partition {})'.format(
+        component_name, partition)
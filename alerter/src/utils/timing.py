@@ -1,11 +1,21 @@
+from collections import deque
 from datetime import datetime, timedelta
-from queue import Queue
+from itertools import repeat
 from typing import Optional, Any
 
 from src.utils.datetime import strfdelta
 
 
+def _slots_equal(cls: type, obj: Any, other: Any) -> bool:
+    return isinstance(other, cls) and all(
+        getattr(obj, slot) == getattr(other, slot) for slot in cls.__slots__)
+
+
 class TimedTaskLimiter:
+    # A limiter is kept for every metric of every monitorable, so its fields
+    # are slotted to avoid a per-instance __dict__
+    __slots__ = ('_time_interval', '_last_time_that_did_task')
+
     def __init__(self, time_interval: timedelta) -> None:
         super().__init__()
 
@@ -13,7 +23,7 @@ class TimedTaskLimiter:
         self._last_time_that_did_task = datetime.min
 
     def __eq__(self, other: Any) -> bool:
-        return self.__dict__ == other.__dict__
+        return _slots_equal(TimedTaskLimiter, self, other)
 
     @property
     def time_interval(self) -> timedelta:
@@ -44,6 +54,11 @@ class TimedTaskLimiter:
 
 
 class TimedTaskTracker:
+    # A tracker is kept for every metric of every monitorable, so its fields
+    # are slotted to avoid a per-instance __dict__
+    __slots__ = ('_time_interval', '_start_time', '_timer_started',
+                 '_did_task')
+
     def __init__(self, time_interval: timedelta) -> None:
         super().__init__()
 
@@ -53,7 +68,7 @@ class TimedTaskTracker:
         self._did_task = False
 
     def __eq__(self, other: Any) -> bool:
-        return self.__dict__ == other.__dict__
+        return _slots_equal(TimedTaskTracker, self, other)
 
     @property
     def time_interval(self) -> timedelta:
@@ -84,13 +99,13 @@ class TimedTaskTracker:
         self._did_task = False
 
     def can_do_task(self, time: datetime = None) -> bool:
-        if not self.timer_started or self.did_task:
+        if not self._timer_started or self._did_task:
             return False
         else:
             if time is None:
                 time = datetime.now()
 
-            return (time - self.start_time) >= self.time_interval
+            return (time - self._start_time) >= self._time_interval
 
     def do_task(self) -> None:
         if self.timer_started:
@@ -103,13 +118,17 @@ class TimedTaskTracker:
 
 
 class TimedOccurrenceTracker:
+    # The last occurrences are kept in a bounded deque, which drops the oldest
+    # occurrence when a new one is appended without the locking of a Queue
+    __slots__ = ('_max_occurrences', '_time_interval', '_last_occurrences')
+
     def __init__(self, max_occurrences: int, time_interval: timedelta) -> None:
         super().__init__()
 
         self._max_occurrences = max_occurrences
         self._time_interval = time_interval
 
-        self._last_occurrences = Queue(maxsize=max_occurrences)
+        self._last_occurrences = deque(maxlen=max_occurrences)
         self.reset()
 
     @property
@@ -129,8 +148,7 @@ class TimedOccurrenceTracker:
         if at_time is None:
             at_time = datetime.now()
 
-        self._last_occurrences.get()
-        self._last_occurrences.put(at_time)
+        self._last_occurrences.append(at_time)
 
     def too_many_occurrences(self, from_time: Optional[datetime] = None) \
             -> bool:
@@ -138,50 +156,43 @@ class TimedOccurrenceTracker:
         if from_time is None:
             from_time = datetime.now()
 
-        # noinspection PyUnresolvedReferences
-        oldest_occurrence = self._last_occurrences.queue[0]
+        oldest_occurrence = self._last_occurrences[0]
         return (from_time - oldest_occurrence) < self._time_interval
 
     def reset(self) -> None:
-        while not self._last_occurrences.empty():
-            self._last_occurrences.get()
-        for i in range(self._max_occurrences):
-            self._last_occurrences.put(datetime.min)
+        self._last_occurrences.clear()
+        self._last_occurrences.extend(
+            repeat(datetime.min, self._max_occurrences))
 
 
 class OccurrencesInTimePeriodTracker:
     """
     This class keeps track of how many occurrences happened in a time period.
     Each element represents the time of an occurrence and thus the length of the
-    queue is the number of occurrences. When adding a new occurrence the class
+    deque is the number of occurrences. When adding a new occurrence the class
     attempts to keep the occurrences happened within a time period.
     """
+    # A tracker is kept for every metric of every monitorable, so its fields
+    # are slotted, and the occurrences are kept in a deque rather than a Queue
+    # which would take a lock on every access
+    __slots__ = ('_time_period', '_occurrences')
 
     def __init__(self, time_period: timedelta) -> None:
         super().__init__()
 
         self._time_period = time_period
-        self._occurrences_queue = Queue()
+        self._occurrences = deque()
 
     def __eq__(self, other: Any) -> bool:
         """
-        This function checks that all keys and values are the same for both
-        objects except for the `self._occurrences_queue` variable. This is
-        omitted because __eq__ was not implemented for the Queue object.
+        This function checks that both objects are trackers of the same time
+        period. The occurrences themselves are not compared.
         :param other: Other objects
         :return: True if conditions described above are matched
                : False otherwise
         """
-
-        if self.__dict__.keys() != other.__dict__.keys():
-            return False
-
-        for key, val in self.__dict__.items():
-            if not key == '_occurrences_queue' \
-                    and not val == other.__dict__[key]:
-                return False
-
-        return True
+        return isinstance(other, OccurrencesInTimePeriodTracker) and \
+            self._time_period == other._time_period
 
     @property
     def time_period(self) -> timedelta:
@@ -193,21 +204,19 @@ class OccurrencesInTimePeriodTracker:
 
         self.remove_old_occurrences(time)
 
-        self._occurrences_queue.put(time)
+        self._occurrences.append(time)
 
     def remove_old_occurrences(self, time: datetime = None) -> None:
         if time is None:
             time = datetime.now()
 
-        while not self._occurrences_queue.empty():
-            oldest_occurrence = self._occurrences_queue.queue[0]
-            if (time - oldest_occurrence) > self.time_period:
-                self._occurrences_queue.get()
-            else:
-                break
+        occurrences = self._occurrences
+        time_period = self._time_period
+        while occurrences and (time - occurrences[0]) > time_period:
+            occurrences.popleft()
 
     def no_of_occurrences(self) -> int:
-        return self._occurrences_queue.qsize()
+        return len(self._occurrences)
 
     def reset(self) -> None:
-        self._occurrences_queue.queue.clear()
+        self._occurrences.clear()
@@ -0,0 +1,168 @@
+import unittest
+from datetime import datetime, timedelta
+
+from freezegun import freeze_time
+from parameterized import parameterized
+
+from src.alert_router.alert_digests import AlertDigests
+from src.alerter.alerts.alert import Alert
+from src.alerter.grouped_alerts_metric_code import GroupedGithubAlertsMetricCode
+from test.test_utils.utils import DummyAlertCode
+
+
+class TestAlertDigests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_window = timedelta(seconds=10)
+        self.test_alert_digests = AlertDigests(self.test_window)
+        self.test_channel_id = 'test_channel_1'
+        self.test_other_channel_id = 'test_channel_2'
+
+    def tearDown(self) -> None:
+        self.test_alert_digests = None
+
+    @staticmethod
+    def _create_alert(message: str, severity: str = 'WARNING',
+                      parent_id: str = 'GENERAL',
+                      alert_code: DummyAlertCode =
+                      DummyAlertCode.TEST_ALERT_CODE) -> dict:
+        return Alert(alert_code, message, severity, datetime.now().timestamp(),
+                     parent_id, 'origin_123',
+                     GroupedGithubAlertsMetricCode.GithubRelease,
+                     []).alert_data
+
+    def test_add_does_not_hold_back_critical_alerts(self) -> None:
+        alert = self._create_alert('test alert', 'CRITICAL')
+
+        self.assertFalse(self.test_alert_digests.add(self.test_channel_id,
+                                                     alert))
+        self.assertTrue(self.test_alert_digests.is_empty())
+
+    @parameterized.expand([("INFO",), ("WARNING",), ("ERROR",), ])
+    def test_add_holds_back_non_critical_alerts(self, severity) -> None:
+        alert = self._create_alert('test alert', severity)
+
+        self.assertTrue(self.test_alert_digests.add(self.test_channel_id,
+                                                    alert))
+        self.assertFalse(self.test_alert_digests.is_empty())
+
+    def test_pop_due_returns_nothing_before_window_elapses(self) -> None:
+        with freeze_time("2012-01-01") as frozen_time:
+            self.test_alert_digests.add(self.test_channel_id,
+                                        self._create_alert('test alert'))
+            frozen_time.tick(self.test_window - timedelta(seconds=1))
+
+            self.assertEqual([], self.test_alert_digests.pop_due())
+            self.assertEqual(1, self.test_alert_digests.next_due_in())
+
+    def test_pop_due_returns_single_alert_unchanged(self) -> None:
+        with freeze_time("2012-01-01") as frozen_time:
+            alert = self._create_alert('test alert')
+            self.test_alert_digests.add(self.test_channel_id, alert)
+            frozen_time.tick(self.test_window)
+
+            self.assertEqual([(self.test_channel_id, alert)],
+                             self.test_alert_digests.pop_due())
+            self.assertTrue(self.test_alert_digests.is_empty())
+            self.assertIsNone(self.test_alert_digests.next_due_in())
+            self.assertEqual({}, self.test_alert_digests.merged_alerts_count)
+
+    def test_pop_due_merges_alerts_of_the_same_group(self) -> None:
+        with freeze_time("2012-01-01") as frozen_time:
+            alert_1 = self._create_alert('test alert 1')
+            self.test_alert_digests.add(self.test_channel_id, alert_1)
+            frozen_time.tick(1)
+            alert_2 = self._create_alert('test alert 2')
+            self.test_alert_digests.add(self.test_channel_id, alert_2)
+            frozen_time.tick(self.test_window)
+
+            due = self.test_alert_digests.pop_due()
+
+        self.assertEqual(1, len(due))
+        channel_id, digest = due[0]
+        self.assertEqual(self.test_channel_id, channel_id)
+        self.assertEqual(2, digest['digest_size'])
+        self.assertEqual(alert_2['timestamp'], digest['timestamp'])
+        self.assertEqual(
+            "2 {} alerts were raised:\n- test alert 1\n- test alert 2".format(
+                DummyAlertCode.TEST_ALERT_CODE.name), digest['message'])
+        self.assertEqual({self.test_channel_id: 1},
+                         self.test_alert_digests.merged_alerts_count)
+        self.assertEqual({self.test_channel_id: 1},
+                         self.test_alert_digests.digests_count)
+
+    def test_pop_due_keeps_groups_and_channels_separate(self) -> None:
+        with freeze_time("2012-01-01") as frozen_time:
+            warning_alert = self._create_alert('test alert 1')
+            error_alert = self._create_alert('test alert 2', 'ERROR')
+            other_parent_alert = self._create_alert('test alert 3',
+                                                    parent_id='parent_2')
+            self.test_alert_digests.add(self.test_channel_id, warning_alert)
+            self.test_alert_digests.add(self.test_channel_id, error_alert)
+            self.test_alert_digests.add(self.test_channel_id,
+                                        other_parent_alert)
+            self.test_alert_digests.add(self.test_other_channel_id,
+                                        warning_alert)
+            frozen_time.tick(self.test_window)
+
+            due = self.test_alert_digests.pop_due()
+
+        self.assertEqual([
+            (self.test_channel_id, warning_alert),
+            (self.test_channel_id, error_alert),
+            (self.test_channel_id, other_parent_alert),
+            (self.test_other_channel_id, warning_alert),
+        ], due)
+
+    def test_pop_due_lists_a_limited_number_of_messages(self) -> None:
+        with freeze_time("2012-01-01"):
+            for i in range(15):
+                self.test_alert_digests.add(
+                    self.test_channel_id,
+                    self._create_alert('test alert {}'.format(i)))
+
+            _, digest = self.test_alert_digests.pop_due(flush_all=True)[0]
+
+        lines = digest['message'].split("\n")
+        self.assertEqual(12, len(lines))
+        self.assertEqual("... and 5 more", lines[-1])
+        self.assertEqual({self.test_channel_id: 14},
+                         self.test_alert_digests.merged_alerts_count)
+
+    def test_pop_due_flush_all_returns_all_digests(self) -> None:
+        with freeze_time("2012-01-01"):
+            alert = self._create_alert('test alert')
+            self.test_alert_digests.add(self.test_channel_id, alert)
+
+            self.assertEqual([(self.test_channel_id, alert)],
+                             self.test_alert_digests.pop_due(flush_all=True))
+
+    def test_pop_alert_code_returns_digests_with_the_same_code(self) -> None:
+        with freeze_time("2012-01-01"):
+            warning_alert = self._create_alert('test alert 1')
+            error_alert = self._create_alert('test alert 2', 'ERROR')
+            other_parent_alert = self._create_alert('test alert 3',
+                                                    parent_id='parent_2')
+            self.test_alert_digests.add(self.test_channel_id, warning_alert)
+            self.test_alert_digests.add(self.test_channel_id, error_alert)
+            self.test_alert_digests.add(self.test_channel_id,
+                                        other_parent_alert)
+            self.test_alert_digests.add(self.test_other_channel_id,
+                                        warning_alert)
+
+            popped = self.test_alert_digests.pop_alert_code(
+                self.test_channel_id,
+                self._create_alert('test alert 4', 'CRITICAL'))
+
+            self.assertEqual([warning_alert, error_alert], popped)
+            self.assertEqual([
+                (self.test_channel_id, other_parent_alert),
+                (self.test_other_channel_id, warning_alert),
+            ], self.test_alert_digests.pop_due(flush_all=True))
+
+    def test_pop_alert_code_returns_nothing_if_no_digest_is_held(
+            self) -> None:
+        alert = self._create_alert('test alert', 'CRITICAL')
+
+        self.assertEqual([], self.test_alert_digests.pop_alert_code(
+            self.test_channel_id, alert))
+        self.assertTrue(self.test_alert_digests.is_empty())
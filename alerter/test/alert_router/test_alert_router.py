@@ -27,7 +27,9 @@ from src.utils.constants.rabbitmq import (
     CONSOLE_HANDLER_INPUT_ROUTING_KEY, LOG_HANDLER_INPUT_ROUTING_KEY,
     ALERT_STORE_INPUT_ROUTING_KEY, HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY
 )
-from src.utils.exceptions import MissingKeyInConfigException
+from src.utils.exceptions import (
+    MissingKeyInConfigException, MessageWasNotDeliveredException
+)
 from test.test_utils.utils import (
     DummyAlertCode, delete_exchange_if_exists, delete_queue_if_exists,
     disconnect_from_rabbit, connect_to_rabbit
@@ -797,11 +799,12 @@ class TestAlertRouter(unittest.TestCase):
                 'warning': True,
                 'critical': True,
                 'error': True,
-                'parent_ids': "GENERAL,",
+                'parent_ids': ["GENERAL"],
             }
         }
 
         self._test_alert_router._config = {self.CONFIG_ROUTING_KEY: config}
+        self._test_alert_router._build_routing_table()
         try:
 
             # Must create a connection so that the blocking channel is passed
@@ -904,13 +907,14 @@ class TestAlertRouter(unittest.TestCase):
                 'warning': True,
                 'critical': True,
                 'error': True,
-                'parent_ids': "GENERAL,",
+                'parent_ids': ["GENERAL"],
             }
         }
 
         config['test_234'][severity] = False
 
         self._test_alert_router._config = {self.CONFIG_ROUTING_KEY: config}
+        self._test_alert_router._build_routing_table()
 
         try:
             # Must create a connection so that the blocking channel is passed
@@ -999,11 +1003,12 @@ class TestAlertRouter(unittest.TestCase):
                 'warning': True,
                 'critical': True,
                 'error': True,
-                'parent_ids': "GENERAL,",
+                'parent_ids': ["GENERAL"],
             }
         }
 
         self._test_alert_router._config = {self.CONFIG_ROUTING_KEY: config}
+        self._test_alert_router._build_routing_table()
 
         try:
             # Must create a connection so that the blocking channel is passed
@@ -1092,11 +1097,12 @@ class TestAlertRouter(unittest.TestCase):
                 'warning': True,
                 'critical': True,
                 'error': True,
-                'parent_ids': "GENERAL,",
+                'parent_ids': ["GENERAL"],
             }
         }
 
         self._test_alert_router._config = {self.CONFIG_ROUTING_KEY: config}
+        self._test_alert_router._build_routing_table()
 
         try:
             # Must create a connection so that the blocking channel is passed
@@ -1330,3 +1336,388 @@ class TestAlertRouter(unittest.TestCase):
                          self._test_alert_router.is_all_muted(severity_in))
         mock_redis_get.assert_called_once_with(self._test_alert_router._redis,
                                                test_redis_key, default=b"{}")
+
+    def test_build_routing_table_maps_parent_and_severity_to_channels(
+            self) -> None:
+        self._test_alert_router._config = {
+            'channels.telegram_config': {
+                'test_1': {'id': "test_1", 'info': True, 'warning': False,
+                           'critical': True, 'error': False,
+                           'parent_ids': ["GENERAL", "chain_1", "GENERAL"]},
+                'test_2': {'id': "test_2", 'info': False, 'warning': False,
+                           'critical': True, 'error': False,
+                           'parent_ids': ["GENERAL"]},
+            },
+            'channels.email_config': None,
+            'channels.slack_config': {
+                'test_3': {'id': "test_3", 'info': False, 'warning': False,
+                           'critical': False, 'error': False,
+                           'parent_ids': ["GENERAL"]},
+            },
+        }
+
+        self._test_alert_router._build_routing_table()
+
+        self.assertEqual({
+            ("GENERAL", "info"): ["test_1"],
+            ("chain_1", "info"): ["test_1"],
+            ("GENERAL", "critical"): ["test_1", "test_2"],
+            ("chain_1", "critical"): ["test_1"],
+        }, self._test_alert_router._routing_table)
+
+    @mock.patch.object(RabbitMQApi, "basic_ack", autospec=True)
+    def test_process_configs_rebuilds_routing_table(
+            self, mock_basic_ack: MagicMock) -> None:
+        mock_basic_ack.return_value = None
+        self.TEST_CHANNEL_CONFIG_FILE['test_123']['critical'] = "true"
+        try:
+            connect_to_rabbit(self.rabbitmq)
+            self._test_alert_router._initialise_rabbitmq()
+            blocking_channel = self._test_alert_router._rabbitmq.channel
+            method_chains = pika.spec.Basic.Deliver(
+                routing_key=self.CONFIG_ROUTING_KEY)
+            properties = pika.spec.BasicProperties()
+
+            self._test_alert_router._process_configs(
+                blocking_channel, method_chains, properties,
+                json.dumps(self.TEST_CHANNEL_CONFIG_FILE))
+            self.assertEqual({("GENERAL", "critical"): ["test_123"]},
+                             self._test_alert_router._routing_table)
+
+            self._test_alert_router._process_configs(
+                blocking_channel, method_chains, properties, json.dumps({}))
+            self.assertEqual({}, self._test_alert_router._routing_table)
+        finally:
+            disconnect_from_rabbit(self._test_alert_router.rabbitmq)
+
+    @mock.patch.object(RedisApi, "hget", autospec=True)
+    @mock.patch.object(RedisApi, "get", autospec=True)
+    def test_mute_state_is_read_from_redis_every_time_if_cache_disabled(
+            self, mock_redis_get: MagicMock,
+            mock_redis_hget: MagicMock) -> None:
+        with mock.patch.object(env, 'ALERT_ROUTER_MUTE_CACHE_TTL_SECONDS', 0):
+            self._test_alert_router = AlertRouter(
+                self.ALERT_ROUTER_NAME, self._alert_router_logger,
+                self._rabbit_ip, self._redis_ip, self._redis_db,
+                self._redis_port, "test_alerter", True, True
+            )
+        mock_redis_get.return_value = '{"x": true}'
+        mock_redis_hget.return_value = '{"x": true}'
+
+        for _ in range(3):
+            self.assertTrue(self._test_alert_router.is_all_muted("x"))
+            self.assertTrue(self._test_alert_router.is_chain_severity_muted(
+                "PARENT_1", "x"))
+
+        self.assertEqual(3, mock_redis_get.call_count)
+        self.assertEqual(3, mock_redis_hget.call_count)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RedisApi, "hget", autospec=True)
+    @mock.patch.object(RedisApi, "get", autospec=True)
+    def test_mute_state_is_cached_until_ttl_elapses(
+            self, mock_redis_get: MagicMock,
+            mock_redis_hget: MagicMock) -> None:
+        with mock.patch.object(env, 'ALERT_ROUTER_MUTE_CACHE_TTL_SECONDS', 5):
+            self._test_alert_router = AlertRouter(
+                self.ALERT_ROUTER_NAME, self._alert_router_logger,
+                self._rabbit_ip, self._redis_ip, self._redis_db,
+                self._redis_port, "test_alerter", True, True
+            )
+        mock_redis_get.return_value = '{"x": true}'
+        mock_redis_hget.return_value = '{"x": true}'
+
+        for _ in range(3):
+            self.assertTrue(self._test_alert_router.is_all_muted("x"))
+            self.assertTrue(self._test_alert_router.is_chain_severity_muted(
+                "PARENT_1", "x"))
+            self.assertTrue(self._test_alert_router.is_chain_severity_muted(
+                "PARENT_2", "x"))
+        self.assertEqual(1, mock_redis_get.call_count)
+        self.assertEqual(2, mock_redis_hget.call_count)
+
+        mock_redis_get.return_value = '{"x": false}'
+        mock_redis_hget.return_value = '{"x": false}'
+        with freeze_time("2012-01-01 00:00:05"):
+            self.assertFalse(self._test_alert_router.is_all_muted("x"))
+            self.assertFalse(self._test_alert_router.is_chain_severity_muted(
+                "PARENT_1", "x"))
+        self.assertEqual(2, mock_redis_get.call_count)
+        self.assertEqual(3, mock_redis_hget.call_count)
+
+    def _push_windowed_test_data(self, n_data: int) -> None:
+        # Queues n_data alerts to be sent through a publisher confirm window
+        # of 3 messages
+        self._test_alert_router.rabbitmq._publisher_confirm_window = 3
+        for i in range(n_data):
+            self._test_alert_router._push_to_queue(
+                {'alert': i}, ALERT_EXCHANGE,
+                self.ALERT_ROUTER_INPUT_ROUTING_KEY)
+
+    def _get_queued_test_data(self) -> list:
+        return [data['data']['alert'] for data in
+                self._test_alert_router.publishing_queue.queue]
+
+    @mock.patch.object(RabbitMQApi, "wait_for_delivery_confirmations")
+    @mock.patch.object(RabbitMQApi, "basic_publish_async")
+    def test_send_data_keeps_at_most_window_messages_unconfirmed(
+            self, mock_basic_publish_async: MagicMock,
+            mock_wait_for_delivery_confirmations: MagicMock) -> None:
+        self._push_windowed_test_data(7)
+        unconfirmed = set()
+        max_unconfirmed = 0
+
+        def publish_async(**kwargs):
+            nonlocal max_unconfirmed
+            delivery_tag = kwargs['body']['alert'] + 1
+            unconfirmed.add(delivery_tag)
+            max_unconfirmed = max(max_unconfirmed, len(unconfirmed))
+            return delivery_tag
+
+        def wait_for_delivery_confirmations(delivery_tags):
+            delivery_tag = min(delivery_tags)
+            unconfirmed.remove(delivery_tag)
+            return {delivery_tag: True}
+
+        mock_basic_publish_async.side_effect = publish_async
+        mock_wait_for_delivery_confirmations.side_effect = \
+            wait_for_delivery_confirmations
+
+        self._test_alert_router._send_data()
+
+        self.assertEqual(7, mock_basic_publish_async.call_count)
+        self.assertEqual(3, max_unconfirmed)
+        self.assertTrue(self._test_alert_router.publishing_queue.empty())
+        self.assertEqual(
+            0, self._test_alert_router.publishing_queue.unfinished_tasks)
+
+    @mock.patch.object(RabbitMQApi, "wait_for_delivery_confirmations")
+    @mock.patch.object(RabbitMQApi, "basic_publish_async")
+    def test_send_data_keeps_undelivered_messages_in_order_and_raises(
+            self, mock_basic_publish_async: MagicMock,
+            mock_wait_for_delivery_confirmations: MagicMock) -> None:
+        self._push_windowed_test_data(5)
+        mock_basic_publish_async.side_effect = \
+            lambda **kwargs: kwargs['body']['alert'] + 1
+        mock_wait_for_delivery_confirmations.side_effect = \
+            lambda delivery_tags: {tag: tag not in [2, 4]
+                                   for tag in delivery_tags}
+
+        self.assertRaises(MessageWasNotDeliveredException,
+                          self._test_alert_router._send_data)
+
+        self.assertEqual([1, 3], self._get_queued_test_data())
+        self.assertEqual(
+            2, self._test_alert_router.publishing_queue.unfinished_tasks)
+
+    @parameterized.expand([(-1,), ({},)])
+    @mock.patch.object(RabbitMQApi, "wait_for_delivery_confirmations")
+    @mock.patch.object(RabbitMQApi, "basic_publish_async")
+    def test_send_data_keeps_unconfirmed_messages_if_rabbit_unusable(
+            self, unusable_return: Any, mock_basic_publish_async: MagicMock,
+            mock_wait_for_delivery_confirmations: MagicMock) -> None:
+        self._push_windowed_test_data(5)
+        mock_basic_publish_async.side_effect = \
+            lambda **kwargs: kwargs['body']['alert'] + 1
+        mock_wait_for_delivery_confirmations.side_effect = [
+            {1: True}, unusable_return]
+
+        self._test_alert_router._send_data()
+
+        self.assertEqual(4, mock_basic_publish_async.call_count)
+        self.assertEqual([1, 2, 3, 4], self._get_queued_test_data())
+
+    @mock.patch.object(RabbitMQApi, "wait_for_delivery_confirmations")
+    @mock.patch.object(RabbitMQApi, "basic_publish_async")
+    def test_send_data_stops_publishing_if_rabbit_recently_disconnected(
+            self, mock_basic_publish_async: MagicMock,
+            mock_wait_for_delivery_confirmations: MagicMock) -> None:
+        self._push_windowed_test_data(3)
+        mock_basic_publish_async.side_effect = [1, -1]
+        mock_wait_for_delivery_confirmations.return_value = {1: True}
+
+        self._test_alert_router._send_data()
+
+        self.assertEqual(2, mock_basic_publish_async.call_count)
+        self.assertEqual([1, 2], self._get_queued_test_data())
+
+    def _create_digest_test_router(self) -> AlertRouter:
+        with mock.patch.object(env, 'ALERT_ROUTER_DIGEST_WINDOW_SECONDS', 10):
+            router = AlertRouter(
+                self.ALERT_ROUTER_NAME, self._alert_router_logger,
+                self._rabbit_ip, self._redis_ip, self._redis_db,
+                self._redis_port, "test_alerter", False, False
+            )
+        router._config = {self.CONFIG_ROUTING_KEY: {
+            'test_234': {
+                'id': "test_234",
+                'info': True,
+                'warning': True,
+                'critical': True,
+                'error': True,
+                'parent_ids': ["GENERAL"],
+            }
+        }}
+        router._build_routing_table()
+        return router
+
+    def _process_digest_test_alert(self, severity: str) -> Dict:
+        alert = Alert(
+            DummyAlertCode.TEST_ALERT_CODE, "This is a test alert", severity,
+            datetime.now().timestamp(), "GENERAL", "origin_123",
+            GroupedGithubAlertsMetricCode.GithubRelease, []
+        )
+        self._test_alert_router._process_alert(
+            MagicMock(), pika.spec.Basic.Deliver(delivery_tag=1),
+            pika.spec.BasicProperties(), json.dumps(alert.alert_data))
+        return alert.alert_data
+
+    def _get_channel_pushes(self, mock_push_to_queue: MagicMock) -> list:
+        return [
+            call_args[0][1] for call_args in mock_push_to_queue.call_args_list
+            if call_args[0][3] ==
+            CHANNEL_HANDLER_INPUT_ROUTING_KEY_TEMPLATE.format("test_234")
+        ]
+
+    def test_alerts_are_not_held_back_if_digests_disabled(self) -> None:
+        with mock.patch.object(env, 'ALERT_ROUTER_DIGEST_WINDOW_SECONDS', 0):
+            self._test_alert_router = AlertRouter(
+                self.ALERT_ROUTER_NAME, self._alert_router_logger,
+                self._rabbit_ip, self._redis_ip, self._redis_db,
+                self._redis_port, "test_alerter", True, True
+            )
+
+        self.assertIsNone(self._test_alert_router._alert_digests)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(AlertRouter, "_send_data", autospec=True)
+    @mock.patch.object(AlertRouter, "_push_to_queue", autospec=True)
+    @mock.patch.object(AlertRouter, "is_all_muted", autospec=True)
+    @mock.patch.object(AlertRouter, "is_chain_severity_muted", autospec=True)
+    @mock.patch.object(RabbitMQApi, "basic_ack", autospec=True)
+    def test__process_alert_holds_back_non_critical_alerts_for_digest(
+            self, mock_basic_ack: MagicMock,
+            mock_is_chain_severity_muted: MagicMock,
+            mock_is_all_muted: MagicMock, mock_push_to_queue: MagicMock,
+            mock_send_data: MagicMock, mock_connection: MagicMock) -> None:
+        mock_is_all_muted.return_value = False
+        mock_is_chain_severity_muted.return_value = False
+        self._test_alert_router = self._create_digest_test_router()
+
+        alert_data = self._process_digest_test_alert("WARNING")
+        self._process_digest_test_alert("WARNING")
+
+        self.assertEqual([], self._get_channel_pushes(mock_push_to_queue))
+        mock_push_to_queue.assert_any_call(
+            self._test_alert_router, alert_data, STORE_EXCHANGE,
+            ALERT_STORE_INPUT_ROUTING_KEY, mandatory=True)
+        mock_connection.call_later.assert_called_once_with(
+            10, self._test_alert_router._on_digests_timer)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(AlertRouter, "_send_data", autospec=True)
+    @mock.patch.object(AlertRouter, "_push_to_queue", autospec=True)
+    @mock.patch.object(AlertRouter, "is_all_muted", autospec=True)
+    @mock.patch.object(AlertRouter, "is_chain_severity_muted", autospec=True)
+    @mock.patch.object(RabbitMQApi, "basic_ack", autospec=True)
+    def test__process_alert_sends_critical_alerts_immediately_with_digests(
+            self, mock_basic_ack: MagicMock,
+            mock_is_chain_severity_muted: MagicMock,
+            mock_is_all_muted: MagicMock, mock_push_to_queue: MagicMock,
+            mock_send_data: MagicMock, mock_connection: MagicMock) -> None:
+        mock_is_all_muted.return_value = False
+        mock_is_chain_severity_muted.return_value = False
+        self._test_alert_router = self._create_digest_test_router()
+
+        alert_data = self._process_digest_test_alert("CRITICAL")
+
+        self.assertEqual([{**alert_data, 'destination_id': 'test_234'}],
+                         self._get_channel_pushes(mock_push_to_queue))
+        mock_connection.call_later.assert_not_called()
+
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(AlertRouter, "_send_data", autospec=True)
+    @mock.patch.object(AlertRouter, "_push_to_queue", autospec=True)
+    @mock.patch.object(AlertRouter, "is_all_muted", autospec=True)
+    @mock.patch.object(AlertRouter, "is_chain_severity_muted", autospec=True)
+    @mock.patch.object(RabbitMQApi, "basic_ack", autospec=True)
+    def test_on_digests_timer_sends_digest_once_window_elapses(
+            self, mock_basic_ack: MagicMock,
+            mock_is_chain_severity_muted: MagicMock,
+            mock_is_all_muted: MagicMock, mock_push_to_queue: MagicMock,
+            mock_send_data: MagicMock, mock_connection: MagicMock) -> None:
+        mock_is_all_muted.return_value = False
+        mock_is_chain_severity_muted.return_value = False
+        mock_connection.call_later.return_value = 'timer_1'
+        self._test_alert_router = self._create_digest_test_router()
+
+        with freeze_time("2012-01-01") as frozen_time:
+            for _ in range(3):
+                self._process_digest_test_alert("ERROR")
+            frozen_time.tick(10)
+            mock_send_data.reset_mock()
+
+            self._test_alert_router._on_digests_timer()
+
+        channel_pushes = self._get_channel_pushes(mock_push_to_queue)
+        self.assertEqual(1, len(channel_pushes))
+        self.assertEqual(3, channel_pushes[0]['digest_size'])
+        self.assertEqual('test_234', channel_pushes[0]['destination_id'])
+        self.assertEqual(
+            {'test_234': 2},
+            self._test_alert_router._alert_digests.merged_alerts_count)
+        mock_send_data.assert_called_once_with(self._test_alert_router)
+        self.assertIsNone(self._test_alert_router._digests_timer_id)
+        mock_connection.call_later.assert_called_once()
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(AlertRouter, "_send_data", autospec=True)
+    @mock.patch.object(AlertRouter, "_push_to_queue", autospec=True)
+    @mock.patch.object(AlertRouter, "is_all_muted", autospec=True)
+    @mock.patch.object(AlertRouter, "is_chain_severity_muted", autospec=True)
+    @mock.patch.object(RabbitMQApi, "basic_ack", autospec=True)
+    def test__process_alert_sends_held_digest_before_critical_alert(
+            self, mock_basic_ack: MagicMock,
+            mock_is_chain_severity_muted: MagicMock,
+            mock_is_all_muted: MagicMock, mock_push_to_queue: MagicMock,
+            mock_send_data: MagicMock, mock_connection: MagicMock) -> None:
+        mock_is_all_muted.return_value = False
+        mock_is_chain_severity_muted.return_value = False
+        self._test_alert_router = self._create_digest_test_router()
+
+        warning_alert_data = self._process_digest_test_alert("WARNING")
+        critical_alert_data = self._process_digest_test_alert("CRITICAL")
+
+        self.assertEqual([
+            {**warning_alert_data, 'destination_id': 'test_234'},
+            {**critical_alert_data, 'destination_id': 'test_234'},
+        ], self._get_channel_pushes(mock_push_to_queue))
+        self.assertTrue(self._test_alert_router._alert_digests.is_empty())
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(RabbitMQApi, "basic_consume")
+    @mock.patch.object(RabbitMQApi, "exchange_declare")
+    @mock.patch.object(AlertRouter, "_declare_exchange_and_bind_queue")
+    @mock.patch.object(RabbitMQApi, "basic_qos")
+    @mock.patch.object(RabbitMQApi, "confirm_delivery")
+    @mock.patch.object(RabbitMQApi, "connect_till_successful")
+    def test__initialise_rabbitmq_sets_digests_timer_on_new_connection(
+            self, *mocks: MagicMock) -> None:
+        mock_connection = mocks[-1]
+        mock_connection.call_later.return_value = 'timer_2'
+        self._test_alert_router = self._create_digest_test_router()
+        self._test_alert_router._alert_digests.add(
+            'test_234', {'severity': "WARNING", 'parent_id': "GENERAL",
+                         'alert_code': {'code': 1}})
+        # The timer of the previous connection never fires
+        self._test_alert_router._digests_timer_id = 'timer_1'
+
+        self._test_alert_router._initialise_rabbitmq()
+
+        mock_connection.call_later.assert_called_once_with(
+            10, self._test_alert_router._on_digests_timer)
+        self.assertEqual('timer_2', self._test_alert_router._digests_timer_id)
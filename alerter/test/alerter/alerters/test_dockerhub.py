@@ -523,7 +523,8 @@ class TestDockerhubAlerter(unittest.TestCase):
 
         _, _, body = self.test_rabbit_manager.basic_get(
             self.heartbeat_queue)
-        self.assertEqual(self.heartbeat_test, json.loads(body))
+        self.assertEqual(dict(self.heartbeat_test, processed=1, failed=0),
+                         json.loads(body))
 
     @freeze_time("2012-01-01")
     @mock.patch(
@@ -502,7 +502,8 @@ class TestGithubAlerter(unittest.TestCase):
 
             _, _, body = self.test_rabbit_manager.basic_get(
                 self.heartbeat_queue)
-            self.assertEqual(self.heartbeat_test, json.loads(body))
+            self.assertEqual(dict(self.heartbeat_test, processed=1, failed=0),
+                             json.loads(body))
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
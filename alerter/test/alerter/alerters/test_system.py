@@ -13,20 +13,27 @@ from parameterized import parameterized
 
 from src.alerter.alerters.system import SystemAlerter
 from src.alerter.alerts import system_alerts
+from src.alerter.alerts.internal_alerts import ComponentResetAlert
+from src.alerter.factory.alerting_state_snapshots import (
+    AlertingStateSnapshots, get_configs_digest)
 from src.alerter.factory.system_alerting_factory import SystemAlertingFactory
 from src.alerter.grouped_alerts_metric_code.system \
     import GroupedSystemAlertsMetricCode as MetricCode
 from src.configs.factory.alerts.system_alerts import SystemAlertsConfigsFactory
+from src.data_store.redis import RedisApi
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils.constants.rabbitmq import (
     CONFIG_EXCHANGE, SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME,
     HEALTH_CHECK_EXCHANGE, ALERT_EXCHANGE,
     SYSTEM_TRANSFORMED_DATA_ROUTING_KEY,
-    SYSTEM_ALERT_ROUTING_KEY, ALERTS_CONFIGS_ROUTING_KEY_GEN)
-from src.utils.env import RABBIT_IP
+    SYSTEM_ALERT_ROUTING_KEY, ALERTS_CONFIGS_ROUTING_KEY_GEN,
+    ALERTS_CONFIGS_ROUTING_KEY_CHAIN)
+from src.utils import env
+from src.utils.env import RABBIT_IP, REDIS_IP, REDIS_DB, REDIS_PORT
 from src.utils.exceptions import (
     PANICException, SystemIsDownException, InvalidUrlException,
     MetricNotFoundException)
+from src.utils.partitioning import get_partition
 from test.test_utils.utils import (
     connect_to_rabbit, delete_queue_if_exists, delete_exchange_if_exists,
     disconnect_from_rabbit)
@@ -173,6 +180,146 @@ class TestSystemAlerter(unittest.TestCase):
         self.assertEqual(self.test_alerting_factory,
                          self.test_system_alerter.alerting_factory)
 
+    def _set_alerting_state_snapshots(self) -> None:
+        redis = RedisApi(self.dummy_logger, REDIS_DB, REDIS_IP, REDIS_PORT)
+        self.test_system_alerter._alerting_state_snapshots = \
+            AlertingStateSnapshots(
+                self.test_alerter_name, redis, self.dummy_logger,
+                datetime.timedelta(seconds=10),
+                datetime.timedelta(seconds=300))
+
+    @mock.patch.object(AlertingStateSnapshots, "restore")
+    @mock.patch.object(SystemAlerter, "_place_latest_data_on_queue")
+    def test_restore_alerting_state_restores_snapshot_once_if_one_exists(
+            self, mock_place_on_queue, mock_restore) -> None:
+        self._set_alerting_state_snapshots()
+        restored_state = {self.test_parent_id: {self.test_system_id: {}}}
+        restored_digests = {self.test_parent_id: 'test_digest'}
+        mock_restore.return_value = (restored_state, restored_digests)
+
+        self.test_system_alerter._restore_alerting_state()
+        self.test_system_alerter._restore_alerting_state()
+
+        self.assertEqual(
+            restored_state,
+            self.test_system_alerter.alerting_factory.alerting_state)
+        self.assertEqual(restored_digests,
+                         self.test_system_alerter._configs_digests)
+        mock_restore.assert_called_once()
+        mock_place_on_queue.assert_not_called()
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(AlertingStateSnapshots, "restore")
+    @mock.patch.object(SystemAlerter, "_place_latest_data_on_queue")
+    def test_restore_alerting_state_resets_alerts_if_no_snapshot_restored(
+            self, mock_place_on_queue, mock_restore) -> None:
+        self._set_alerting_state_snapshots()
+        mock_restore.return_value = None
+
+        self.test_system_alerter._restore_alerting_state()
+
+        expected_alert = ComponentResetAlert(
+            self.test_alerter_name, datetime.datetime.now().timestamp(),
+            SystemAlerter.__name__)
+        self.assertEqual(
+            {}, self.test_system_alerter.alerting_factory.alerting_state)
+        mock_place_on_queue.assert_called_once_with(
+            [expected_alert.alert_data])
+
+    @mock.patch.object(SystemAlerter, "_place_latest_data_on_queue")
+    def test_restore_alerting_state_does_nothing_if_no_snapshots(
+            self, mock_place_on_queue) -> None:
+        self.test_system_alerter._restore_alerting_state()
+
+        self.assertEqual(
+            {}, self.test_system_alerter.alerting_factory.alerting_state)
+        mock_place_on_queue.assert_not_called()
+
+    @mock.patch.object(env, 'ALERTER_PARTITIONS', 8)
+    @mock.patch.object(AlertingStateSnapshots, "restore")
+    @mock.patch.object(SystemAlerter, "_place_latest_data_on_queue")
+    def test_restore_alerting_state_restores_partition_systems_only(
+            self, mock_place_on_queue, mock_restore) -> None:
+        self._set_alerting_state_snapshots()
+        self.test_system_alerter._partition = get_partition('node_1', 8)
+        self.assertNotEqual(get_partition('node_1', 8),
+                            get_partition('node_3', 8))
+        mock_restore.return_value = (
+            {self.test_parent_id: {'node_1': {}, 'node_3': {}}}, {})
+
+        self.test_system_alerter._restore_alerting_state()
+
+        self.assertEqual(
+            {self.test_parent_id: {'node_1': {}}},
+            self.test_system_alerter.alerting_factory.alerting_state)
+        mock_place_on_queue.assert_not_called()
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTER_PARTITIONS', 4)
+    @mock.patch.object(AlertingStateSnapshots, "restore")
+    @mock.patch.object(SystemAlerter, "_place_latest_data_on_queue")
+    def test_restore_alerting_state_resets_partition_alerts_if_partitioned(
+            self, mock_place_on_queue, mock_restore) -> None:
+        self._set_alerting_state_snapshots()
+        self.test_system_alerter._partition = 2
+        mock_restore.return_value = None
+
+        self.test_system_alerter._restore_alerting_state()
+
+        expected_alert = ComponentResetAlert(
+            self.test_alerter_name, datetime.datetime.now().timestamp(),
+            SystemAlerter.__name__, partition=2, partitions=4)
+        mock_place_on_queue.assert_called_once_with(
+            [expected_alert.alert_data])
+
+    @parameterized.expand([(False,), (True,)])
+    @mock.patch.object(AlertingStateSnapshots, "save")
+    def test_save_alerting_state_saves_the_alerting_factory_state(
+            self, force, mock_save) -> None:
+        self.test_system_alerter._save_alerting_state(force)
+        mock_save.assert_not_called()
+
+        self._set_alerting_state_snapshots()
+        self.test_system_alerter._save_alerting_state(force)
+
+        mock_save.assert_called_once_with(
+            self.test_system_alerter.alerting_factory.alerting_state,
+            self.test_system_alerter._configs_digests, force)
+
+    @mock.patch.object(RabbitMQApi, "basic_consume")
+    @mock.patch.object(RabbitMQApi, "basic_qos")
+    @mock.patch.object(RabbitMQApi, "queue_bind")
+    @mock.patch.object(RabbitMQApi, "queue_declare")
+    @mock.patch.object(RabbitMQApi, "exchange_declare")
+    @mock.patch.object(RabbitMQApi, "confirm_delivery")
+    @mock.patch.object(RabbitMQApi, "connect_till_successful")
+    def test_initialise_rabbitmq_consumes_partition_data_and_all_configs(
+            self, mock_connect, mock_confirm_delivery, mock_exchange_declare,
+            mock_queue_declare, mock_queue_bind, mock_basic_qos,
+            mock_basic_consume) -> None:
+        self.test_system_alerter._partition = 2
+        partition_queue_name = '{}_2'.format(
+            SYSTEM_ALERTER_INPUT_CONFIGS_QUEUE_NAME)
+
+        self.test_system_alerter._initialise_rabbitmq()
+
+        mock_queue_declare.assert_called_once_with(
+            partition_queue_name, passive=False, durable=True,
+            exclusive=False, auto_delete=False)
+        mock_queue_bind.assert_has_calls([
+            call(queue=partition_queue_name, exchange=ALERT_EXCHANGE,
+                 routing_key='{}.2'.format(
+                     SYSTEM_TRANSFORMED_DATA_ROUTING_KEY)),
+            call(partition_queue_name, CONFIG_EXCHANGE,
+                 ALERTS_CONFIGS_ROUTING_KEY_CHAIN),
+            call(partition_queue_name, CONFIG_EXCHANGE,
+                 ALERTS_CONFIGS_ROUTING_KEY_GEN),
+        ])
+        mock_basic_consume.assert_called_once_with(
+            queue=partition_queue_name,
+            on_message_callback=self.test_system_alerter._process_data,
+            auto_ack=False, exclusive=False, consumer_tag=None)
+
     def test_initialise_rabbitmq_initialises_everything_as_expected(
             self) -> None:
         # To make sure that there is no connection/channel already
@@ -320,6 +467,99 @@ class TestSystemAlerter(unittest.TestCase):
         mock_remove_config.assert_called_once_with(chain)
         mock_ack.assert_called_once()
 
+    @mock.patch.object(AlertingStateSnapshots, "restore")
+    @mock.patch.object(SystemAlerter, "_place_latest_data_on_queue")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_process_confs_keeps_restored_alerting_state_if_confs_unchanged(
+            self, mock_ack, mock_place_on_queue, mock_restore) -> None:
+        """
+        In this test we will check that if the configs received after the
+        alerting state is restored are those the state was built with, as is
+        the case when PANIC starts, the restored state is kept and the chain's
+        alerts are not reset.
+        """
+        self._set_alerting_state_snapshots()
+        sent_configs = copy.deepcopy(self.received_configurations)
+        del sent_configs['DEFAULT']
+        restored_state = {self.test_parent_id: {self.test_system_id: {}}}
+        mock_restore.return_value = (
+            restored_state,
+            {self.test_parent_id: get_configs_digest(sent_configs)})
+
+        self.test_system_alerter._restore_alerting_state()
+        method = pika.spec.Basic.Deliver(
+            routing_key=self.test_configs_routing_key)
+        body = json.dumps(self.received_configurations)
+        self.test_system_alerter._process_configs(method, body)
+
+        self.assertEqual(
+            restored_state,
+            self.test_system_alerter.alerting_factory.alerting_state)
+        mock_place_on_queue.assert_not_called()
+        mock_ack.assert_called_once()
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(AlertingStateSnapshots, "restore")
+    @mock.patch.object(SystemAlerter, "_place_latest_data_on_queue")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_process_confs_resets_restored_alerting_state_if_confs_changed(
+            self, mock_ack, mock_place_on_queue, mock_restore) -> None:
+        """
+        In this test we will check that if the configs received after the
+        alerting state is restored are not those the state was built with, the
+        chain's alerting state is cleared, the new configs' digest is stored
+        and the chain's alerts are reset.
+        """
+        self._set_alerting_state_snapshots()
+        sent_configs = copy.deepcopy(self.received_configurations)
+        del sent_configs['DEFAULT']
+        mock_restore.return_value = (
+            {self.test_parent_id: {self.test_system_id: {}}},
+            {self.test_parent_id: 'old_digest'})
+
+        self.test_system_alerter._restore_alerting_state()
+        method = pika.spec.Basic.Deliver(
+            routing_key=self.test_configs_routing_key)
+        body = json.dumps(self.received_configurations)
+        self.test_system_alerter._process_configs(method, body)
+
+        parsed_routing_key = self.test_configs_routing_key.split('.')
+        chain = parsed_routing_key[1] + ' ' + parsed_routing_key[2]
+        expected_alert = ComponentResetAlert(
+            self.test_alerter_name, datetime.datetime.now().timestamp(),
+            SystemAlerter.__name__, self.test_parent_id, chain)
+        self.assertEqual(
+            {}, self.test_system_alerter.alerting_factory.alerting_state)
+        self.assertEqual(
+            {self.test_parent_id: get_configs_digest(sent_configs)},
+            self.test_system_alerter._configs_digests)
+        mock_place_on_queue.assert_called_once_with(
+            [expected_alert.alert_data])
+        mock_ack.assert_called_once()
+
+    @mock.patch.object(SystemAlerter, "_place_latest_data_on_queue")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_process_confs_always_clears_alerting_state_if_no_snapshots(
+            self, mock_ack, mock_place_on_queue) -> None:
+        """
+        In this test we will check that if no alerting state snapshots are
+        taken, the chain's alerting state is cleared whenever configs are
+        received, leaving the reset of its alerts to the manager.
+        """
+        self.test_system_alerter.alerting_factory.alerting_state[
+            self.test_parent_id] = {self.test_system_id: {}}
+        method = pika.spec.Basic.Deliver(
+            routing_key=self.test_configs_routing_key)
+        body = json.dumps(self.received_configurations)
+
+        self.test_system_alerter._process_configs(method, body)
+
+        self.assertEqual(
+            {}, self.test_system_alerter.alerting_factory.alerting_state)
+        self.assertEqual({}, self.test_system_alerter._configs_digests)
+        mock_place_on_queue.assert_not_called()
+        mock_ack.assert_called_once()
+
     @mock.patch.object(SystemAlertsConfigsFactory, "add_new_config")
     @mock.patch.object(SystemAlertsConfigsFactory, "get_parent_id")
     @mock.patch.object(SystemAlertsConfigsFactory, "remove_config")
@@ -0,0 +1,194 @@
+import copy
+import unittest
+from datetime import datetime, timedelta
+
+from src.alerter.factory.alerting_state import (
+    MetricFlags, MetricValues, MetricTrackers, MetricLimiters,
+    MonitorableAlertingState)
+from src.utils.timing import (TimedTaskTracker, TimedTaskLimiter,
+                              OccurrencesInTimePeriodTracker)
+
+
+class _DummyAlertingState(MonitorableAlertingState):
+    __slots__ = ('current_height',)
+
+
+class TestMetricContainers(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_metric_1 = 'test_metric_1'
+        self.test_metric_2 = 'test_metric_2'
+        self.test_datetime = datetime(2012, 1, 1)
+
+    def test_metric_flags_acts_like_the_dict_it_was_created_from(self) -> None:
+        flags = MetricFlags({self.test_metric_1: False,
+                             self.test_metric_2: True})
+        flags[self.test_metric_1] = True
+        flags[self.test_metric_2] = False
+
+        self.assertIs(True, flags[self.test_metric_1])
+        self.assertIs(False, flags[self.test_metric_2])
+        self.assertEqual({self.test_metric_1: True, self.test_metric_2: False},
+                         flags)
+        self.assertEqual([self.test_metric_1, self.test_metric_2],
+                         list(flags))
+        self.assertRaises(KeyError, flags.__getitem__, 'unknown_metric')
+
+    def test_containers_of_the_same_metrics_share_their_layout(self) -> None:
+        flags_1 = MetricFlags({self.test_metric_1: False})
+        flags_2 = MetricFlags({self.test_metric_1: True})
+        values = MetricValues({self.test_metric_1: None})
+
+        self.assertIs(flags_1._layout, flags_2._layout)
+        self.assertIs(flags_1._layout, values._layout)
+
+    def test_setting_an_unexpected_metric_does_not_modify_shared_layout(
+            self) -> None:
+        flags_1 = MetricFlags({self.test_metric_1: False})
+        flags_2 = MetricFlags({self.test_metric_1: False})
+
+        flags_1[self.test_metric_2] = True
+
+        self.assertEqual({self.test_metric_1: False, self.test_metric_2: True},
+                         flags_1)
+        self.assertEqual({self.test_metric_1: False}, flags_2)
+
+    def test_deleting_a_metric_removes_its_value(self) -> None:
+        values = MetricValues({self.test_metric_1: 1, self.test_metric_2: 2})
+
+        del values[self.test_metric_1]
+
+        self.assertEqual({self.test_metric_2: 2}, values)
+        self.assertRaises(KeyError, values.__delitem__, self.test_metric_1)
+
+    def test_metric_trackers_changes_are_stored_through_views(self) -> None:
+        trackers = MetricTrackers({
+            self.test_metric_1: TimedTaskTracker(timedelta(seconds=10)),
+            self.test_metric_2: TimedTaskTracker(timedelta(seconds=20)),
+        })
+        expected_tracker = TimedTaskTracker(timedelta(seconds=10))
+
+        trackers[self.test_metric_1].start_timer(self.test_datetime)
+        expected_tracker.start_timer(self.test_datetime)
+
+        self.assertIsInstance(trackers[self.test_metric_1], TimedTaskTracker)
+        self.assertTrue(trackers[self.test_metric_1].timer_started)
+        self.assertEqual(self.test_datetime,
+                         trackers[self.test_metric_1].start_time)
+        self.assertTrue(trackers[self.test_metric_1].can_do_task(
+            self.test_datetime + timedelta(seconds=10)))
+        self.assertFalse(trackers[self.test_metric_2].timer_started)
+        self.assertEqual(expected_tracker, trackers[self.test_metric_1])
+        self.assertEqual(trackers[self.test_metric_1], expected_tracker)
+        self.assertNotEqual(expected_tracker, trackers[self.test_metric_2])
+
+    def test_metric_limiters_changes_are_stored_through_views(self) -> None:
+        limiters = MetricLimiters({
+            self.test_metric_1: TimedTaskLimiter(timedelta(seconds=10)),
+        })
+
+        limiters[self.test_metric_1].set_last_time_that_did_task(
+            self.test_datetime)
+        limiters[self.test_metric_1].set_time_interval(timedelta(seconds=30))
+
+        self.assertEqual(self.test_datetime,
+                         limiters[self.test_metric_1].last_time_that_did_task)
+        self.assertFalse(limiters[self.test_metric_1].can_do_task(
+            self.test_datetime + timedelta(seconds=20)))
+        self.assertTrue(limiters[self.test_metric_1].can_do_task(
+            self.test_datetime + timedelta(seconds=30)))
+
+    def test_metric_timers_share_equal_time_intervals(self) -> None:
+        trackers_1 = MetricTrackers({
+            self.test_metric_1: TimedTaskTracker(timedelta(seconds=10))})
+        trackers_2 = MetricTrackers({
+            self.test_metric_1: TimedTaskTracker(timedelta(seconds=10))})
+
+        self.assertIs(trackers_1[self.test_metric_1].time_interval,
+                      trackers_2[self.test_metric_1].time_interval)
+
+    def test_setting_a_metric_timer_replaces_its_fields(self) -> None:
+        trackers = MetricTrackers({
+            self.test_metric_1: TimedTaskTracker(timedelta(seconds=10))})
+        new_tracker = TimedTaskTracker(timedelta(seconds=30))
+        new_tracker.start_timer(self.test_datetime)
+
+        trackers[self.test_metric_1] = new_tracker
+        trackers[self.test_metric_2] = TimedTaskTracker(timedelta(seconds=5))
+
+        self.assertEqual({
+            self.test_metric_1: new_tracker,
+            self.test_metric_2: TimedTaskTracker(timedelta(seconds=5)),
+        }, trackers)
+
+
+class TestMonitorableAlertingState(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_metric = 'test_metric'
+        self.test_state_dict = {
+            'warning_sent': {self.test_metric: False},
+            'critical_sent': {self.test_metric: False},
+            'warning_window_timer': {
+                self.test_metric: TimedTaskTracker(timedelta(seconds=10))},
+            'critical_repeat_timer': {
+                self.test_metric: TimedTaskLimiter(timedelta(seconds=10))},
+            'warning_occurrences_in_period_tracker': {
+                self.test_metric: OccurrencesInTimePeriodTracker(
+                    timedelta(seconds=10))},
+            'current_height': None,
+        }
+        self.test_state = _DummyAlertingState(**self.test_state_dict)
+
+    def tearDown(self) -> None:
+        self.test_state_dict = None
+        self.test_state = None
+
+    def test_init_stores_per_metric_dicts_in_compact_containers(self) -> None:
+        self.assertIsInstance(self.test_state['warning_sent'], MetricFlags)
+        self.assertIsInstance(self.test_state['warning_window_timer'],
+                              MetricTrackers)
+        self.assertIsInstance(self.test_state['critical_repeat_timer'],
+                              MetricLimiters)
+        self.assertIsInstance(
+            self.test_state['warning_occurrences_in_period_tracker'],
+            MetricValues)
+        self.assertIsNone(self.test_state['current_height'])
+
+    def test_state_equals_the_dict_it_was_created_from(self) -> None:
+        self.assertEqual(self.test_state_dict, self.test_state)
+        self.assertEqual(self.test_state, self.test_state_dict)
+
+        self.test_state['warning_sent'][self.test_metric] = True
+
+        self.assertNotEqual(self.test_state_dict, self.test_state)
+
+    def test_missing_fields_act_like_missing_keys(self) -> None:
+        self.assertNotIn('error_sent', self.test_state)
+        self.assertIn('critical_sent', self.test_state)
+        self.assertRaises(KeyError, self.test_state.__getitem__, 'error_sent')
+        self.assertRaises(KeyError, self.test_state.__getitem__, 'keys')
+        self.assertEqual(list(self.test_state_dict), list(self.test_state))
+        self.assertEqual(len(self.test_state_dict), len(self.test_state))
+
+    def test_fields_can_be_set_and_deleted(self) -> None:
+        self.test_state['current_height'] = 100
+        self.test_state['error_sent'] = {self.test_metric: True}
+        del self.test_state['warning_sent']
+
+        self.assertEqual(100, self.test_state['current_height'])
+        self.assertTrue(self.test_state['error_sent'][self.test_metric])
+        self.assertNotIn('warning_sent', self.test_state)
+        self.assertRaises(KeyError, self.test_state.__delitem__,
+                          'warning_sent')
+
+    def test_setting_an_unknown_field_raises_key_error(self) -> None:
+        self.assertRaises(KeyError, self.test_state.__setitem__,
+                          'unknown_field', None)
+        self.assertRaises(KeyError, MonitorableAlertingState,
+                          current_height=None)
+
+    def test_deepcopy_copies_the_state(self) -> None:
+        state_copy = copy.deepcopy(self.test_state)
+        state_copy['warning_sent'][self.test_metric] = True
+
+        self.assertEqual(self.test_state_dict, self.test_state)
+        self.assertTrue(state_copy['warning_sent'][self.test_metric])
@@ -0,0 +1,187 @@
+import logging
+import pickle
+import unittest
+import zlib
+from datetime import datetime, timedelta
+from unittest import mock
+
+from freezegun import freeze_time
+from parameterized import parameterized
+
+from src.alerter.factory.alerting_state import (
+    MonitorableAlertingState, MetricTrackers)
+from src.alerter.factory.alerting_state_snapshots import (
+    AlertingStateSnapshots, dump_alerting_state, get_configs_digest,
+    load_alerting_state)
+from src.data_store.redis import RedisApi, Keys
+from src.utils import env
+from src.utils.timing import (TimedTaskTracker, TimedTaskLimiter,
+                              OccurrencesInTimePeriodTracker)
+
+
+class TestAlertingStateSnapshots(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.test_alerter_name = 'test_alerter'
+        self.test_parent_id = 'test_parent_id'
+        self.test_monitorable_id = 'test_monitorable_id'
+        self.test_metric = 'test_metric'
+        self.test_datetime = datetime(2012, 1, 1)
+        self.snapshot_interval = timedelta(seconds=10)
+        self.max_age = timedelta(seconds=300)
+
+        warning_window_timer = TimedTaskTracker(timedelta(seconds=60))
+        warning_window_timer.start_timer(self.test_datetime)
+        critical_repeat_timer = TimedTaskLimiter(timedelta(seconds=300))
+        critical_repeat_timer.set_last_time_that_did_task(self.test_datetime)
+        occurrences_tracker = OccurrencesInTimePeriodTracker(
+            timedelta(seconds=60))
+        occurrences_tracker.add_occurrence(self.test_datetime)
+        self.test_alerting_state = {
+            self.test_parent_id: {
+                self.test_monitorable_id: MonitorableAlertingState(
+                    warning_sent={self.test_metric: True},
+                    warning_window_timer={
+                        self.test_metric: warning_window_timer},
+                    critical_repeat_timer={
+                        self.test_metric: critical_repeat_timer},
+                    warning_occurrences_in_period_tracker={
+                        self.test_metric: occurrences_tracker},
+                ),
+                'active_proposals': {1: {'proposal_id': 1}},
+            }
+        }
+
+        self.test_configs_digests = {
+            self.test_parent_id: get_configs_digest({'1': {'enabled': True}})}
+
+        self.redis = RedisApi(self.dummy_logger, env.REDIS_DB, env.REDIS_IP,
+                              env.REDIS_PORT, '',
+                              env.UNIQUE_ALERTER_IDENTIFIER)
+        self.test_snapshots = AlertingStateSnapshots(
+            self.test_alerter_name, self.redis, self.dummy_logger,
+            self.snapshot_interval, self.max_age)
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+        self.redis = None
+        self.test_snapshots = None
+        self.test_alerting_state = None
+        self.test_configs_digests = None
+
+    def test_load_alerting_state_returns_the_dumped_alerting_state(
+            self) -> None:
+        loaded_state = load_alerting_state(
+            dump_alerting_state(self.test_alerting_state))
+        monitorable_state = loaded_state[self.test_parent_id][
+            self.test_monitorable_id]
+        occurrences_tracker = monitorable_state[
+            'warning_occurrences_in_period_tracker'][self.test_metric]
+        original_state = self.test_alerting_state[self.test_parent_id][
+            self.test_monitorable_id]
+
+        self.assertEqual(self.test_alerting_state, loaded_state)
+        self.assertIsInstance(monitorable_state, MonitorableAlertingState)
+        self.assertIsInstance(monitorable_state['warning_window_timer'],
+                              MetricTrackers)
+        self.assertIs(original_state['warning_window_timer']._layout,
+                      monitorable_state['warning_window_timer']._layout)
+        self.assertEqual(1, occurrences_tracker.no_of_occurrences())
+
+    def test_load_alerting_state_refuses_unexpected_classes(self) -> None:
+        snapshot = zlib.compress(pickle.dumps(
+            {self.test_parent_id: mock.Mock}))
+
+        self.assertRaises(pickle.UnpicklingError, load_alerting_state,
+                          snapshot)
+
+    @parameterized.expand([
+        ('src.alerter.factory.alerting_state_snapshots', 'logging.os.getpid'),
+        ('src.utils.timing', 'TimedTaskLimiter.__init__'),
+        ('src.alerter.factory.alerting_state', 'Dict'),
+    ])
+    def test_load_alerting_state_refuses_globals_not_listed(
+            self, module: str, name: str) -> None:
+        # A protocol 4 pickle which calls module.name()
+        snapshot = b'\x80\x04'
+        for string in (module, name):
+            snapshot += b'\x8c' + bytes([len(string)]) + string.encode()
+        snapshot += b'\x93)R.'
+
+        self.assertRaises(pickle.UnpicklingError, load_alerting_state,
+                          zlib.compress(snapshot))
+
+    def test_get_configs_digest_changes_only_if_configs_change(self) -> None:
+        configs = {'1': {'enabled': True, 'warning_threshold': 10},
+                   '2': {'enabled': False}}
+        same_configs = {'2': {'enabled': False},
+                        '1': {'warning_threshold': 10, 'enabled': True}}
+        changed_configs = {'1': {'enabled': True, 'warning_threshold': 20},
+                           '2': {'enabled': False}}
+
+        self.assertEqual(get_configs_digest(configs),
+                         get_configs_digest(same_configs))
+        self.assertNotEqual(get_configs_digest(configs),
+                            get_configs_digest(changed_configs))
+
+    @mock.patch.object(RedisApi, 'set_for')
+    def test_save_stores_snapshot_until_max_age(self, mock_set_for) -> None:
+        self.test_snapshots.save(self.test_alerting_state,
+                                 self.test_configs_digests)
+
+        mock_set_for.assert_called_once_with(
+            Keys.get_component_alerting_state(self.test_alerter_name),
+            dump_alerting_state({
+                'alerting_state': self.test_alerting_state,
+                'configs_digests': self.test_configs_digests,
+            }), self.max_age)
+
+    @mock.patch.object(RedisApi, 'set_for')
+    def test_save_does_nothing_until_snapshot_interval_elapses(
+            self, mock_set_for) -> None:
+        with freeze_time(self.test_datetime) as frozen_datetime:
+            self.test_snapshots.save(self.test_alerting_state,
+                                     self.test_configs_digests)
+            frozen_datetime.tick(self.snapshot_interval - timedelta(seconds=1))
+            self.test_snapshots.save(self.test_alerting_state,
+                                     self.test_configs_digests)
+            self.assertEqual(1, mock_set_for.call_count)
+
+            self.test_snapshots.save(self.test_alerting_state,
+                                     self.test_configs_digests, force=True)
+            self.assertEqual(2, mock_set_for.call_count)
+
+            frozen_datetime.tick(self.snapshot_interval)
+            self.test_snapshots.save(self.test_alerting_state,
+                                     self.test_configs_digests)
+            self.assertEqual(3, mock_set_for.call_count)
+
+    @mock.patch.object(RedisApi, 'get')
+    def test_restore_returns_the_saved_alerting_state_and_configs_digests(
+            self, mock_get) -> None:
+        mock_get.return_value = dump_alerting_state({
+            'alerting_state': self.test_alerting_state,
+            'configs_digests': self.test_configs_digests,
+        })
+
+        restored_snapshot = self.test_snapshots.restore()
+
+        self.assertEqual(
+            (self.test_alerting_state, self.test_configs_digests),
+            restored_snapshot)
+        mock_get.assert_called_once_with(
+            Keys.get_component_alerting_state(self.test_alerter_name))
+
+    @mock.patch.object(RedisApi, 'get')
+    def test_restore_returns_none_if_no_snapshot_or_invalid_snapshot(
+            self, mock_get) -> None:
+        mock_get.return_value = None
+        self.assertIsNone(self.test_snapshots.restore())
+
+        mock_get.return_value = b'invalid_snapshot'
+        self.assertIsNone(self.test_snapshots.restore())
+
+        # A snapshot taken without the configs digests
+        mock_get.return_value = dump_alerting_state(self.test_alerting_state)
+        self.assertIsNone(self.test_snapshots.restore())
@@ -3,6 +3,7 @@ import logging
 import unittest
 from datetime import timedelta
 
+from src.alerter.factory.alerting_state import MonitorableAlertingState
 from src.alerter.factory.system_alerting_factory import SystemAlertingFactory
 from src.alerter.grouped_alerts_metric_code.system \
     import GroupedSystemAlertsMetricCode as MetricCode
@@ -195,6 +196,9 @@ class TestSystemAlertingFactory(unittest.TestCase):
 
         self.assertDictEqual(
             expected_state, self.system_alerting_factory.alerting_state)
+        self.assertIsInstance(
+            self.system_alerting_factory.alerting_state[self.test_parent_id][
+                self.test_system_id], MonitorableAlertingState)
 
     def test_create_alerting_state_does_not_modify_state_if_already_created(
             self) -> None:
@@ -146,6 +146,7 @@ class TestChainlinkAlertersManager(unittest.TestCase):
                 'factory': self.node_alerts_config_factory,
                 'routing_key': CL_NODE_ALERT_ROUTING_KEY,
                 'starter': start_chainlink_node_alerter,
+                'partitioned': True,
             },
             CHAINLINK_CONTRACT_ALERTER_NAME: {
                 'alerterClass': ChainlinkContractAlerter,
@@ -481,6 +482,7 @@ class TestChainlinkAlertersManager(unittest.TestCase):
         ('self.alerter_process_dict_example', True)
     ])
     @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0)
     @mock.patch.object(ChainlinkAlertersManager,
                        "_push_latest_data_to_queue_and_send")
     @mock.patch.object(multiprocessing.Process, "start")
@@ -562,6 +564,7 @@ class TestChainlinkAlertersManager(unittest.TestCase):
         mock_start.assert_not_called()
 
     @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0)
     @mock.patch.object(RabbitMQApi, 'basic_ack')
     @mock.patch.object(ChainlinkAlertersManager,
                        "_push_latest_data_to_queue_and_send")
@@ -158,6 +158,7 @@ class TestCosmosAlertersManager(unittest.TestCase):
                 'factory': self.node_alerts_config_factory,
                 'routing_key': COSMOS_NODE_ALERT_ROUTING_KEY,
                 'starter': start_cosmos_node_alerter,
+                'partitioned': True,
             },
             COSMOS_NETWORK_ALERTER_NAME: {
                 'alerterClass': CosmosNetworkAlerter,
@@ -222,6 +223,11 @@ class TestCosmosAlertersManager(unittest.TestCase):
         self.assertEqual(self.network_alerts_config_factory,
                          self.test_manager.network_alerts_config_factory)
 
+    def test_partitions_returns_partitions(self) -> None:
+        self.assertEqual(1, self.test_manager.partitions)
+        self.test_manager._partitions = 3
+        self.assertEqual(3, self.test_manager.partitions)
+
     def test_configs_processor_helper_return_correctly(self) -> None:
         self.test_manager._configs_processor_helper = \
             self.configs_processor_helper_example
@@ -492,6 +498,7 @@ class TestCosmosAlertersManager(unittest.TestCase):
         ('self.alerter_process_dict_example', True)
     ])
     @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0)
     @mock.patch.object(CosmosAlertersManager,
                        "_push_latest_data_to_queue_and_send")
     @mock.patch.object(multiprocessing.Process, "start")
@@ -547,6 +554,48 @@ class TestCosmosAlertersManager(unittest.TestCase):
         ]
         mock_push_and_send.assert_has_calls(expected_calls, True)
 
+    @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0)
+    @mock.patch.object(CosmosAlertersManager,
+                       "_push_latest_data_to_queue_and_send")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_create_and_start_alerter_processes_starts_node_alerter_partitions(
+            self, mock_start, mock_push_and_send) -> None:
+        mock_start.return_value = None
+        mock_push_and_send.return_value = None
+        self.test_manager._partitions = 3
+
+        self.test_manager._create_and_start_alerter_processes()
+
+        # The network alerter is started once, and the node alerter is
+        # started once per partition
+        self.assertEqual(4, mock_start.call_count)
+        self.assertNotIn(COSMOS_NODE_ALERTER_NAME,
+                         self.test_manager.alerter_process_dict)
+        network_alerter_process = self.test_manager.alerter_process_dict[
+            COSMOS_NETWORK_ALERTER_NAME]
+        self.assertEqual(1, len(network_alerter_process._args))
+        expected_calls = []
+        for partition in range(3):
+            node_alerter_name = '{} (partition {})'.format(
+                COSMOS_NODE_ALERTER_NAME, partition)
+            node_alerter_process = self.test_manager.alerter_process_dict[
+                node_alerter_name]
+            self.assertTrue(node_alerter_process.daemon)
+            self.assertEqual((self.test_manager.node_alerts_config_factory,
+                              partition), node_alerter_process._args)
+            self.assertEqual(start_cosmos_node_alerter,
+                             node_alerter_process._target)
+
+            # Each partition only resets the metrics of its own nodes
+            expected_alert = ComponentResetAlert(
+                node_alerter_name, datetime.now().timestamp(),
+                CosmosNodeAlerter.__name__, partition=partition, partitions=3)
+            self.assertEqual(partition, expected_alert.alert_data['partition'])
+            expected_calls.append(call(expected_alert.alert_data,
+                                       COSMOS_NODE_ALERT_ROUTING_KEY))
+        mock_push_and_send.assert_has_calls(expected_calls, True)
+
     @mock.patch.object(CosmosAlertersManager,
                        "_push_latest_data_to_queue_and_send")
     @mock.patch.object(multiprocessing, "Process")
@@ -573,6 +622,7 @@ class TestCosmosAlertersManager(unittest.TestCase):
         mock_start.assert_not_called()
 
     @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0)
     @mock.patch.object(RabbitMQApi, 'basic_ack')
     @mock.patch.object(CosmosAlertersManager,
                        "_push_latest_data_to_queue_and_send")
@@ -397,6 +397,7 @@ class TestEVMNodeAlerterManager(unittest.TestCase):
         ('self.alerter_process_dict_example', True)
     ])
     @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0)
     @mock.patch.object(EVMNodeAlerterManager,
                        "_push_latest_data_to_queue_and_send")
     @mock.patch.object(multiprocessing.Process, "start")
@@ -461,6 +462,7 @@ class TestEVMNodeAlerterManager(unittest.TestCase):
         mock_start.assert_not_called()
 
     @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0)
     @mock.patch.object(RabbitMQApi, 'basic_ack')
     @mock.patch.object(EVMNodeAlerterManager,
                        "_push_latest_data_to_queue_and_send")
@@ -165,6 +165,7 @@ class TestSubstrateAlertersManager(unittest.TestCase):
                 'factory': self.node_alerts_config_factory,
                 'routing_key': SUBSTRATE_NODE_ALERT_ROUTING_KEY,
                 'starter': start_substrate_node_alerter,
+                'partitioned': True,
             },
             SUBSTRATE_NETWORK_ALERTER_NAME: {
                 'alerterClass': SubstrateNetworkAlerter,
@@ -500,6 +501,7 @@ class TestSubstrateAlertersManager(unittest.TestCase):
         ('self.alerter_process_dict_example', True)
     ])
     @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0)
     @mock.patch.object(SubstrateAlertersManager,
                        "_push_latest_data_to_queue_and_send")
     @mock.patch.object(multiprocessing.Process, "start")
@@ -582,6 +584,7 @@ class TestSubstrateAlertersManager(unittest.TestCase):
         mock_start.assert_not_called()
 
     @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0)
     @mock.patch.object(RabbitMQApi, 'basic_ack')
     @mock.patch.object(SubstrateAlertersManager,
                        "_push_latest_data_to_queue_and_send")
@@ -100,6 +100,7 @@ class TestSystemAlertersManager(unittest.TestCase):
                 'factory': self.alerts_config_factory_example,
                 'routing_key': SYSTEM_ALERT_ROUTING_KEY,
                 'starter': start_system_alerter,
+                'partitioned': True,
             }
         }
 
@@ -425,6 +426,7 @@ class TestSystemAlertersManager(unittest.TestCase):
         ('self.alerter_process_dict_example', True)
     ])
     @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0)
     @mock.patch.object(SystemAlertersManager,
                        "_push_latest_data_to_queue_and_send")
     @mock.patch.object(multiprocessing.Process, "start")
@@ -464,6 +466,24 @@ class TestSystemAlertersManager(unittest.TestCase):
         mock_push_and_send.assert_called_once_with(
             expected_alert.alert_data, SYSTEM_ALERT_ROUTING_KEY)
 
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 10)
+    @mock.patch.object(SystemAlertersManager,
+                       "_push_latest_data_to_queue_and_send")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_create_and_start_alerter_process_no_reset_if_alerter_snapshots(
+            self, mock_start, mock_push_and_send) -> None:
+        """
+        In this test we will check that the alerter process is started without
+        a reset alert if the alerters take alerting state snapshots, as in
+        that case the alerter resets its alerts if it cannot restore its state.
+        """
+        mock_start.return_value = None
+
+        self.test_manager._create_and_start_alerter_process()
+
+        mock_start.assert_called_once()
+        mock_push_and_send.assert_not_called()
+
     @mock.patch.object(SystemAlertersManager,
                        "_push_latest_data_to_queue_and_send")
     @mock.patch.object(multiprocessing, "Process")
@@ -490,6 +510,7 @@ class TestSystemAlertersManager(unittest.TestCase):
         mock_start.assert_not_called()
 
     @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0)
     @mock.patch.object(RabbitMQApi, 'basic_ack')
     @mock.patch.object(SystemAlertersManager,
                        "_push_latest_data_to_queue_and_send")
@@ -535,7 +556,38 @@ class TestSystemAlertersManager(unittest.TestCase):
             expected_alert.alert_data, SYSTEM_ALERT_ROUTING_KEY)
         mock_ack.assert_called_once()
 
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 10)
+    @mock.patch.object(RabbitMQApi, 'basic_ack')
+    @mock.patch.object(SystemAlertersManager,
+                       "_push_latest_data_to_queue_and_send")
+    def test_process_configs_does_not_send_reset_alert_if_snapshots_taken(
+            self, mock_push_and_send, mock_ack) -> None:
+        """
+        In this test we will check that if the alerters take alerting state
+        snapshots, the process_configs function stores the received configs
+        but leaves the reset of the chain's alerts to the alerter, which only
+        resets them if the configs changed.
+        """
+        mock_ack.return_value = None
+
+        blocking_channel = self.test_manager.rabbitmq.channel
+        method_chains = pika.spec.Basic.Deliver(
+            routing_key=self.chains_routing_key)
+        body = json.dumps(self.config_1)
+        properties = pika.spec.BasicProperties()
+        parsed_routing_key = self.chains_routing_key.split('.')
+        chain_name = parsed_routing_key[1] + ' ' + parsed_routing_key[2]
+
+        self.test_manager._process_configs(blocking_channel, method_chains,
+                                           properties, body)
+
+        self.assertIn(chain_name,
+                      self.test_manager.system_alerts_config_factory.configs)
+        mock_push_and_send.assert_not_called()
+        mock_ack.assert_called_once()
+
     @freeze_time("2012-01-01")
+    @mock.patch.object(env, 'ALERTERS_STATE_SNAPSHOT_INTERVAL_SECONDS', 0)
     @mock.patch.object(RabbitMQApi, 'basic_ack')
     @mock.patch.object(SystemAlertersManager,
                        "_push_latest_data_to_queue_and_send")
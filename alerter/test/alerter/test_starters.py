@@ -462,6 +462,21 @@ class TestAlertersStarters(unittest.TestCase):
         self.assertEqual(self.cosmos_node_alerts_configs_factory, args[3])
         self.assertEqual(env.ALERTER_PUBLISHING_QUEUE_SIZE, args[4])
 
+    @mock.patch("src.alerter.alerter_starters._initialise_alerter_logger")
+    @mock.patch('src.alerter.alerter_starters.CosmosNodeAlerter')
+    def test_initialise_cosmos_node_alerter_creates_partition_alerter_correct(
+            self, mock_cosmos_alerter, mock_init_logger) -> None:
+        mock_init_logger.return_value = self.dummy_logger
+        mock_cosmos_alerter.__name__ = 'cosmos_alerter_name'
+
+        _initialise_cosmos_node_alerter(self.cosmos_node_alerts_configs_factory,
+                                        2)
+
+        args, _ = mock_cosmos_alerter.call_args
+        self.assertEqual('{} (partition 2)'.format(COSMOS_NODE_ALERTER_NAME),
+                         args[0])
+        self.assertEqual(2, args[6])
+
     @mock.patch("src.alerter.alerter_starters._initialise_alerter_logger")
     @mock.patch('src.alerter.alerter_starters.CosmosNetworkAlerter')
     def test_initialise_cosmos_network_alerter_creates_alerter_correctly(
@@ -526,7 +541,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_system_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.system_alerts_configs_factory
+            self.system_alerts_configs_factory, None
         )
 
     @mock.patch("src.alerter.alerter_starters._initialise_github_alerter")
@@ -570,7 +585,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_chainlink_node_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.chainlink_node_alerts_configs_factory)
+            self.chainlink_node_alerts_configs_factory, None)
 
     @mock.patch(
         "src.alerter.alerter_starters._initialise_evm_node_alerter")
@@ -619,7 +634,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_cosmos_node_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.cosmos_node_alerts_configs_factory)
+            self.cosmos_node_alerts_configs_factory, None)
 
     @mock.patch(
         "src.alerter.alerter_starters._initialise_cosmos_network_alerter")
@@ -652,7 +667,7 @@ class TestAlertersStarters(unittest.TestCase):
             self.test_substrate_node_alerter
         )
         mock_initialise_alerter.assert_called_once_with(
-            self.substrate_node_alerts_configs_factory)
+            self.substrate_node_alerts_configs_factory, None)
 
     @mock.patch(
         "src.alerter.alerter_starters._initialise_substrate_network_alerter")
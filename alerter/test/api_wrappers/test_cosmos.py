@@ -233,6 +233,27 @@ class TestTendermintRpcApiWrapper(unittest.TestCase):
             params=None
         )
 
+    @mock.patch("src.api_wrappers.cosmos.get_cosmos_json")
+    def test_get_blockchain_calls_api_correctly(
+            self, mock_get_cosmos_json) -> None:
+        # First test with parameters not None
+        self.test_wrapper.get_blockchain(self.tendermint_rpc_url,
+                                         self.test_params)
+        mock_get_cosmos_json.assert_called_once_with(
+            endpoint="{}/blockchain".format(self.tendermint_rpc_url),
+            logger=self.dummy_logger, verify=self.verify, timeout=self.timeout,
+            params=self.test_params
+        )
+        mock_get_cosmos_json.reset_mock()
+
+        # Test with parameters None
+        self.test_wrapper.get_blockchain(self.tendermint_rpc_url)
+        mock_get_cosmos_json.assert_called_once_with(
+            endpoint="{}/blockchain".format(self.tendermint_rpc_url),
+            logger=self.dummy_logger, verify=self.verify, timeout=self.timeout,
+            params=None
+        )
+
     @mock.patch("src.api_wrappers.cosmos.get_cosmos_json")
     def test_get_block_results_calls_api_correctly(
             self, mock_get_cosmos_json) -> None:
@@ -11,9 +11,10 @@ from parameterized import parameterized
 
 from src.alerter.alerts.system_alerts import (
     OpenFileDescriptorsIncreasedAboveThresholdAlert)
-from src.channels_manager.apis.email_api import EmailApi
+from src.channels_manager.apis.email_api import EmailApi, SmtpConnectionPool
 from src.utils.constants.channels import (EMAIL_HTML_TEMPLATE,
                                           EMAIL_TEXT_TEMPLATE)
+from test.test_utils.smtp_server import LocalSmtpServer
 
 
 class TestEmailApi(unittest.TestCase):
@@ -67,6 +68,7 @@ class TestEmailApi(unittest.TestCase):
             '_username': self.test_email_api._username,
             '_password': self.test_email_api._password,
             '_port': self.test_email_api._port,
+            '_connection_pool': None,
         }
         self.assertDictEqual(expected_instance_variables,
                              self.test_email_api.__dict__)
@@ -91,12 +93,31 @@ class TestEmailApi(unittest.TestCase):
                                        self.test_receiver)
 
         args, _ = mock_send_smtp.call_args
-        self.assertEqual(1, len(args))
+        self.assertEqual(2, len(args))
+        self.assertIsNone(args[1])
         mock_send_smtp.assert_called_once()
 
         # By the as_string function we will get the formatted e-mail as string
         self.assertEqual(expected_msg.as_string(), args[0].as_string())
 
+    @freeze_time("2012-01-01")
+    @mock.patch.object(EmailApi, "_send_smtp")
+    def test_send_email_sends_to_a_list_of_recipients_through_envelope(
+            self, mock_send_smtp) -> None:
+        # The recipients of a batched e-mail must not see each other's
+        # addresses, therefore these are only given as envelope recipients.
+        mock_send_smtp.return_value = None
+        test_receivers = [self.test_receiver, 'test2@email.com']
+
+        self.test_email_api.send_email(self.test_subject, self.test_message,
+                                       test_receivers)
+
+        args, _ = mock_send_smtp.call_args
+        mock_send_smtp.assert_called_once()
+        self.assertEqual('undisclosed-recipients:;', args[0]['To'])
+        self.assertIsNone(args[0]['Bcc'])
+        self.assertEqual(test_receivers, args[1])
+
     @freeze_time("2012-01-01")
     @mock.patch.object(EmailApi, "_send_smtp")
     def test_send_email_with_html_sends_the_correct_message(
@@ -148,7 +169,8 @@ class TestEmailApi(unittest.TestCase):
                                                  self.test_receiver)
 
         args, _ = mock_send_smtp.call_args
-        self.assertEqual(1, len(args))
+        self.assertEqual(2, len(args))
+        self.assertIsNone(args[1])
         mock_send_smtp.assert_called_once()
 
         # This must be done because boundaries are auto-generated
@@ -187,7 +209,8 @@ class TestEmailApi(unittest.TestCase):
         mock_smtp_init.assert_called_once_with(self.test_smtp, self.test_port)
 
         # Check that send_message was called correctly.
-        mock_send_message.assert_called_once_with(self.test_msg)
+        mock_send_message.assert_called_once_with(self.test_msg,
+                                                  to_addrs=None)
 
         # Check that quit was called correctly.
         mock_quit.assert_called_once_with()
@@ -248,3 +271,102 @@ class TestEmailApi(unittest.TestCase):
 
         # Check that the login function was not called.
         mock_login.assert_not_called()
+
+
+class TestSmtpConnectionPool(unittest.TestCase):
+    def setUp(self) -> None:
+        # The pool is tested against a stand-in SMTP server on localhost which
+        # records the connections made to it and the messages it receives.
+        self.test_server = LocalSmtpServer()
+        self.test_server.start()
+        self.test_idle_timeout = 60
+        self.test_connection_pool = SmtpConnectionPool(
+            'localhost', self.test_server.port, None, None,
+            idle_timeout=self.test_idle_timeout)
+        self.test_sender = 'PANIC alerter'
+        self.test_receivers = ['test1@email.com', 'test2@email.com']
+        self.test_email_api = EmailApi(
+            'localhost', self.test_sender, None, None, self.test_server.port,
+            self.test_connection_pool)
+
+    def tearDown(self) -> None:
+        self.test_connection_pool.close()
+        self.test_server.stop()
+        self.test_server = None
+        self.test_connection_pool = None
+        self.test_email_api = None
+
+    def test_send_email_reuses_the_same_connection(self) -> None:
+        for i in range(3):
+            self.test_email_api.send_email('Test Alert {}'.format(i),
+                                           'This is a test alert',
+                                           self.test_receivers[0])
+
+        self.assertEqual(1, self.test_server.connections)
+        self.assertEqual(3, len(self.test_server.messages))
+        self.assertEqual(1, self.test_connection_pool.size)
+
+    def test_send_email_with_html_sends_to_all_recipients_at_once(
+            self) -> None:
+        self.test_email_api.send_email_with_html(
+            'Test Alert', '<p>This is a test alert</p>',
+            'This is a test alert', self.test_receivers)
+
+        self.assertEqual(1, len(self.test_server.messages))
+        mail_from, rcpt_tos, data = self.test_server.messages[0]
+        self.assertEqual(self.test_receivers, rcpt_tos)
+        self.assertIn('To: undisclosed-recipients:;', data)
+        for receiver in self.test_receivers:
+            self.assertNotIn(receiver, data)
+
+    def test_send_message_opens_new_connection_if_idle_timeout_exceeded(
+            self) -> None:
+        with freeze_time("2012-01-01") as frozen_time:
+            self.test_email_api.send_email('Test Alert', 'This is a test alert',
+                                           self.test_receivers[0])
+            frozen_time.tick(self.test_idle_timeout + 1)
+            self.test_email_api.send_email('Test Alert', 'This is a test alert',
+                                           self.test_receivers[0])
+
+        self.assertEqual(2, self.test_server.connections)
+        self.assertEqual(2, len(self.test_server.messages))
+        self.assertEqual(1, self.test_connection_pool.size)
+
+    def test_send_message_reconnects_if_server_dropped_connection(
+            self) -> None:
+        self.test_email_api.send_email('Test Alert', 'This is a test alert',
+                                       self.test_receivers[0])
+        self.test_server.drop_connections()
+
+        self.test_email_api.send_email('Test Alert', 'This is a test alert',
+                                       self.test_receivers[0])
+
+        self.assertEqual(2, self.test_server.connections)
+        self.assertEqual(2, len(self.test_server.messages))
+
+    def test_send_message_raises_if_new_connection_cannot_be_opened(
+            self) -> None:
+        self.test_server.stop()
+
+        self.assertRaises(
+            ConnectionRefusedError, self.test_email_api.send_email,
+            'Test Alert', 'This is a test alert', self.test_receivers[0])
+        self.assertEqual(0, self.test_connection_pool.size)
+
+    def test_release_closes_connections_beyond_max_size(self) -> None:
+        connection = mock.MagicMock()
+        self.test_connection_pool._idle_connections = [
+            (mock.MagicMock(), datetime.now().timestamp())]
+
+        self.test_connection_pool._release(connection)
+
+        connection.quit.assert_called_once_with()
+        self.assertEqual(1, self.test_connection_pool.size)
+
+    def test_close_quits_idle_connections(self) -> None:
+        self.test_email_api.send_email('Test Alert', 'This is a test alert',
+                                       self.test_receivers[0])
+
+        self.test_connection_pool.close()
+
+        self.assertEqual(0, self.test_connection_pool.size)
@@ -1,9 +1,8 @@
 import unittest
 from unittest import mock
 
-import requests
-
 from src.channels_manager.apis.telegram_bot_api import TelegramBotApi
+from src.utils.data import HttpSessionPool
 
 
 class TestTelegramBotApi(unittest.TestCase):
@@ -39,7 +38,7 @@ class TestTelegramBotApi(unittest.TestCase):
     have to expose infrastructure details.
     '''
 
-    @mock.patch.object(requests, "get")
+    @mock.patch.object(HttpSessionPool, "get")
     def test_send_message_sends_a_message_correctly(self, mock_get) -> None:
         data_dict = {
             'chat_id': self.test_bot_chat_id,
@@ -50,21 +49,18 @@ class TestTelegramBotApi(unittest.TestCase):
         self.test_telegram_bot_api.send_message(self.test_message)
 
         mock_get.assert_called_once_with(self.test_base_url + "/sendMessage",
-                                         data=data_dict, timeout=10,
-                                         headers={'Connection': 'close'})
+                                         data=data_dict, timeout=10)
 
-    @mock.patch.object(requests, "get")
+    @mock.patch.object(HttpSessionPool, "get")
     def test_send_get_updates_sends_request_correctly(self, mock_get) -> None:
         self.test_telegram_bot_api.get_updates()
 
         mock_get.assert_called_once_with(self.test_base_url + "/getUpdates",
-                                         timeout=10,
-                                         headers={'Connection': 'close'})
+                                         timeout=10)
 
-    @mock.patch.object(requests, "get")
+    @mock.patch.object(HttpSessionPool, "get")
     def test_send_get_me_sends_request_correctly(self, mock_get) -> None:
         self.test_telegram_bot_api.get_me()
 
         mock_get.assert_called_once_with(self.test_base_url + "/getMe",
-                                         timeout=10,
-                                         headers={'Connection': 'close'})
+                                         timeout=10)
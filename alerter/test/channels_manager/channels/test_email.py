@@ -117,6 +117,23 @@ class TestEmailChannel(unittest.TestCase):
                               self.test_emails_to[2]),
                          mock_send_email_html.call_args_list[2])
 
+    @mock.patch.object(EmailApi, "send_email_with_html")
+    def test_alert_sends_one_email_to_all_addresses_if_batch_recipients(
+            self, mock_send_email_html) -> None:
+        mock_send_email_html.return_value = None
+        self.test_email_channel = EmailChannel(self.test_channel_name,
+                                               self.test_channel_id,
+                                               self.dummy_logger,
+                                               self.test_emails_to,
+                                               self.test_email_api, True)
+
+        actual_ret = self.test_email_channel.alert(self.test_alert)
+
+        self.assertEqual(RequestStatus.SUCCESS, actual_ret)
+        mock_send_email_html.assert_called_once_with(
+            "PANIC {}".format(self.test_alert.severity), mock.ANY, mock.ANY,
+            self.test_emails_to)
+
     @mock.patch.object(EmailApi, "send_email_with_html")
     def test_alert_returns_success_if_emails_sent_successfully(
             self, mock_send_email_html) -> None:
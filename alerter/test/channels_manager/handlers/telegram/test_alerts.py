@@ -878,3 +878,122 @@ class TestTelegramAlertsHandler(unittest.TestCase):
         self.assertEqual(
             test_alert_2,
             self.test_telegram_alerts_handler.alerts_queue.queue[1])
+
+    @freeze_time("2012-01-01")
+    @mock.patch("src.channels_manager.handlers.telegram.alerts."
+                "TELEGRAM_MIN_SEND_INTERVAL_SECONDS", 0)
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(TelegramChannel, "alert")
+    def test_send_alerts_sends_newer_alerts_if_non_blocking_retries(
+            self, mock_alert, mock_connection) -> None:
+        mock_alert.side_effect = [RequestStatus.FAILED, RequestStatus.SUCCESS]
+        self.test_telegram_alerts_handler = TelegramAlertsHandler(
+            self.test_handler_name, self.dummy_logger, self.rabbitmq,
+            self.test_channel, self.test_queue_size,
+            self.test_max_attempts, self.test_alert_validity_threshold,
+            non_blocking_retries=True)
+        test_alert_1 = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage,
+            self.test_panic_severity, datetime.now().timestamp(),
+            self.test_panic_severity, self.test_parent_id, self.test_system_id
+        )
+        test_alert_2 = OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage,
+            self.test_panic_severity, datetime.now().timestamp() + 1,
+            self.test_panic_severity, self.test_parent_id, self.test_system_id
+        )
+        test_queue = Queue(4)
+        self.test_telegram_alerts_handler._alerts_queue = test_queue
+        test_queue.put(test_alert_1)
+        test_queue.put(test_alert_2)
+
+        self.test_telegram_alerts_handler._send_alerts()
+
+        self.assertEqual([call(test_alert_1), call(test_alert_2)],
+                         mock_alert.call_args_list)
+        self.assertEqual(
+            [test_alert_1],
+            list(self.test_telegram_alerts_handler.alerts_queue.queue))
+        mock_connection.sleep.assert_not_called()
+        mock_connection.call_later.assert_called_once_with(
+            mock.ANY, self.test_telegram_alerts_handler._on_send_alerts_timer)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    def test_schedule_send_alerts_does_nothing_if_no_alert_is_waiting(
+            self, mock_connection) -> None:
+        self.test_telegram_alerts_handler._schedule_send_alerts(None)
+
+        mock_connection.call_later.assert_not_called()
+        self.assertIsNone(
+            self.test_telegram_alerts_handler._send_alerts_timer_due_time)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    def test_schedule_send_alerts_keeps_timer_if_it_fires_earlier(
+            self, mock_connection) -> None:
+        self.test_telegram_alerts_handler._schedule_send_alerts(10)
+        self.test_telegram_alerts_handler._schedule_send_alerts(20)
+
+        mock_connection.call_later.assert_called_once_with(
+            10, self.test_telegram_alerts_handler._on_send_alerts_timer)
+        mock_connection.remove_timeout.assert_not_called()
+        self.assertEqual(
+            datetime.now().timestamp() + 10,
+            self.test_telegram_alerts_handler._send_alerts_timer_due_time)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    def test_schedule_send_alerts_replaces_timer_if_it_fires_later(
+            self, mock_connection) -> None:
+        mock_connection.call_later.side_effect = ['timer_1', 'timer_2']
+
+        self.test_telegram_alerts_handler._schedule_send_alerts(20)
+        self.test_telegram_alerts_handler._schedule_send_alerts(10)
+
+        mock_connection.remove_timeout.assert_called_once_with('timer_1')
+        mock_connection.call_later.assert_called_with(
+            10, self.test_telegram_alerts_handler._on_send_alerts_timer)
+        self.assertEqual(
+            'timer_2', self.test_telegram_alerts_handler._send_alerts_timer_id)
+
+    @mock.patch.object(TelegramAlertsHandler, "_send_alerts")
+    def test_on_send_alerts_timer_resets_timer_and_sends_alerts(
+            self, mock_send_alerts) -> None:
+        self.test_telegram_alerts_handler._send_alerts_timer_id = 'timer_1'
+        self.test_telegram_alerts_handler._send_alerts_timer_due_time = 10
+
+        self.test_telegram_alerts_handler._on_send_alerts_timer()
+
+        mock_send_alerts.assert_called_once_with()
+        self.assertIsNone(
+            self.test_telegram_alerts_handler._send_alerts_timer_id)
+        self.assertIsNone(
+            self.test_telegram_alerts_handler._send_alerts_timer_due_time)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "confirm_delivery")
+    @mock.patch.object(RabbitMQApi, "basic_consume")
+    @mock.patch.object(RabbitMQApi, "basic_qos")
+    @mock.patch.object(RabbitMQApi, "queue_bind")
+    @mock.patch.object(RabbitMQApi, "queue_declare")
+    @mock.patch.object(RabbitMQApi, "exchange_declare")
+    @mock.patch.object(RabbitMQApi, "connect_till_successful")
+    @mock.patch.object(RabbitMQApi, "connection")
+    def test_initialise_rabbitmq_resets_send_alerts_timer(
+            self, mock_connection, *_) -> None:
+        # The timer of the previous connection is due in the past, and it
+        # must not stop a new timer from being set on the new connection
+        self.test_telegram_alerts_handler._send_alerts_timer_id = 'timer_1'
+        self.test_telegram_alerts_handler._send_alerts_timer_due_time = \
+            datetime.now().timestamp() - 10
+
+        self.test_telegram_alerts_handler._initialise_rabbitmq()
+        self.test_telegram_alerts_handler._schedule_send_alerts(10)
+
+        mock_connection.remove_timeout.assert_not_called()
+        mock_connection.call_later.assert_called_once_with(
+            10, self.test_telegram_alerts_handler._on_send_alerts_timer)
+        self.assertEqual(
+            datetime.now().timestamp() + 10,
+            self.test_telegram_alerts_handler._send_alerts_timer_due_time)
@@ -0,0 +1,217 @@
+import unittest
+from datetime import datetime
+from queue import Queue
+from unittest import mock
+
+from freezegun import freeze_time
+from parameterized import parameterized
+
+from src.alerter.alerts.system_alerts import (
+    OpenFileDescriptorsIncreasedAboveThresholdAlert)
+from src.channels_manager.handlers.alerts_retry_scheduler import (
+    AlertsRetryScheduler)
+from src.utils.data import RequestStatus
+
+
+class TestAlertsRetryScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_alert_validity_threshold = 300
+        self.test_initial_retry_delay = 10
+        self.test_max_retry_delay = 300
+        self.test_scheduler = AlertsRetryScheduler(
+            self.test_alert_validity_threshold, self.test_initial_retry_delay,
+            self.test_max_retry_delay)
+        self.test_queue = Queue(10)
+        self.test_alert_1 = self._create_alert('system_1')
+        self.test_alert_2 = self._create_alert('system_2')
+
+    def tearDown(self) -> None:
+        self.test_scheduler = None
+        self.test_queue = None
+        self.test_alert_1 = None
+        self.test_alert_2 = None
+
+    @staticmethod
+    def _create_alert(system_name: str):
+        return OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            system_name, 50, 'WARNING', datetime.now().timestamp(), 'WARNING',
+            'parent_1234', system_name + '_id')
+
+    def _queued_alerts(self):
+        return list(self.test_queue.queue)
+
+    @parameterized.expand([
+        (1, 10,), (2, 20,), (3, 40,), (5, 160,), (6, 300,), (20, 300,),
+    ])
+    @mock.patch("src.channels_manager.handlers.alerts_retry_scheduler.random."
+                "uniform")
+    def test_get_retry_delay_doubles_delay_up_to_max_with_jitter(
+            self, failed_attempts, expected_delay, mock_uniform) -> None:
+        mock_uniform.side_effect = lambda low, high: (low, high)
+        self.assertEqual(
+            (expected_delay / 2, expected_delay),
+            self.test_scheduler.get_retry_delay(failed_attempts))
+
+    def test_send_alerts_returns_none_if_queue_is_empty(self) -> None:
+        send_alert = mock.MagicMock()
+
+        self.assertIsNone(
+            self.test_scheduler.send_alerts(self.test_queue, send_alert))
+
+        send_alert.assert_not_called()
+
+    @freeze_time("2012-01-01")
+    def test_send_alerts_sends_due_alerts_and_empties_queue(self) -> None:
+        self.test_alert_1 = self._create_alert('system_1')
+        self.test_alert_2 = self._create_alert('system_2')
+        self.test_queue.put(self.test_alert_1)
+        self.test_queue.put(self.test_alert_2)
+        send_alert = mock.MagicMock(return_value=RequestStatus.SUCCESS)
+
+        ret = self.test_scheduler.send_alerts(self.test_queue, send_alert)
+
+        self.assertIsNone(ret)
+        self.assertEqual([mock.call(self.test_alert_1),
+                          mock.call(self.test_alert_2)],
+                         send_alert.call_args_list)
+        self.assertTrue(self.test_queue.empty())
+        self.assertEqual(0, self.test_queue.unfinished_tasks)
+
+    @freeze_time("2012-01-01")
+    @mock.patch("src.channels_manager.handlers.alerts_retry_scheduler.random."
+                "uniform")
+    def test_send_alerts_sends_newer_alerts_while_failed_alert_waits(
+            self, mock_uniform) -> None:
+        mock_uniform.side_effect = lambda low, high: high
+        self.test_alert_1 = self._create_alert('system_1')
+        self.test_alert_2 = self._create_alert('system_2')
+        self.test_queue.put(self.test_alert_1)
+        self.test_queue.put(self.test_alert_2)
+        send_alert = mock.MagicMock(
+            side_effect=[RequestStatus.FAILED, RequestStatus.SUCCESS])
+
+        ret = self.test_scheduler.send_alerts(self.test_queue, send_alert)
+
+        self.assertEqual(self.test_initial_retry_delay, ret)
+        self.assertEqual([mock.call(self.test_alert_1),
+                          mock.call(self.test_alert_2)],
+                         send_alert.call_args_list)
+        self.assertEqual([self.test_alert_1], self._queued_alerts())
+        self.assertEqual({self.test_alert_1: 1},
+                         self.test_scheduler._failed_attempts)
+
+    @mock.patch("src.channels_manager.handlers.alerts_retry_scheduler.random."
+                "uniform")
+    def test_send_alerts_retries_failed_alert_only_once_it_is_due(
+            self, mock_uniform) -> None:
+        mock_uniform.side_effect = lambda low, high: high
+        with freeze_time("2012-01-01") as frozen_time:
+            self.test_alert_1 = self._create_alert('system_1')
+            self.test_queue.put(self.test_alert_1)
+            send_alert = mock.MagicMock(return_value=RequestStatus.FAILED)
+            self.test_scheduler.send_alerts(self.test_queue, send_alert)
+
+            frozen_time.tick(5)
+            ret = self.test_scheduler.send_alerts(self.test_queue, send_alert)
+            self.assertEqual(5, ret)
+            self.assertEqual(1, send_alert.call_count)
+
+            frozen_time.tick(5)
+            ret = self.test_scheduler.send_alerts(self.test_queue, send_alert)
+            self.assertEqual(2 * self.test_initial_retry_delay, ret)
+            self.assertEqual(2, send_alert.call_count)
+            self.assertEqual({self.test_alert_1: 2},
+                             self.test_scheduler._failed_attempts)
+
+            frozen_time.tick(20)
+            send_alert.return_value = RequestStatus.SUCCESS
+            ret = self.test_scheduler.send_alerts(self.test_queue, send_alert)
+            self.assertIsNone(ret)
+            self.assertEqual(3, send_alert.call_count)
+            self.assertTrue(self.test_queue.empty())
+            self.assertEqual({}, self.test_scheduler._failed_attempts)
+            self.assertEqual({}, self.test_scheduler._next_attempt_times)
+
+    @mock.patch("src.channels_manager.handlers.alerts_retry_scheduler.random."
+                "uniform")
+    def test_send_alerts_discards_alerts_failing_max_attempts_times(
+            self, mock_uniform) -> None:
+        mock_uniform.side_effect = lambda low, high: high
+        self.test_scheduler = AlertsRetryScheduler(
+            self.test_alert_validity_threshold, self.test_initial_retry_delay,
+            self.test_max_retry_delay, max_attempts=2)
+        with freeze_time("2012-01-01") as frozen_time:
+            self.test_alert_1 = self._create_alert('system_1')
+            self.test_queue.put(self.test_alert_1)
+            send_alert = mock.MagicMock(return_value=RequestStatus.FAILED)
+
+            ret = self.test_scheduler.send_alerts(self.test_queue, send_alert)
+            self.assertEqual(self.test_initial_retry_delay, ret)
+            self.assertEqual([self.test_alert_1], self._queued_alerts())
+
+            frozen_time.tick(self.test_initial_retry_delay)
+            ret = self.test_scheduler.send_alerts(self.test_queue, send_alert)
+
+            self.assertIsNone(ret)
+            self.assertEqual(2, send_alert.call_count)
+            self.assertTrue(self.test_queue.empty())
+            self.assertEqual({}, self.test_scheduler._failed_attempts)
+            self.assertEqual({}, self.test_scheduler._next_attempt_times)
+
+    def test_send_alerts_discards_alerts_older_than_validity_threshold(
+            self) -> None:
+        with freeze_time("2012-01-01") as frozen_time:
+            self.test_alert_1 = self._create_alert('system_1')
+            frozen_time.tick(self.test_alert_validity_threshold)
+            self.test_alert_2 = self._create_alert('system_2')
+            frozen_time.tick(1)
+            self.test_queue.put(self.test_alert_1)
+            self.test_queue.put(self.test_alert_2)
+            send_alert = mock.MagicMock(return_value=RequestStatus.SUCCESS)
+
+            self.test_scheduler.send_alerts(self.test_queue, send_alert)
+
+            send_alert.assert_called_once_with(self.test_alert_2)
+            self.assertTrue(self.test_queue.empty())
+
+    def test_send_alerts_sends_alerts_min_send_interval_apart(self) -> None:
+        self.test_scheduler = AlertsRetryScheduler(
+            self.test_alert_validity_threshold, min_send_interval=1)
+        with freeze_time("2012-01-01") as frozen_time:
+            self.test_alert_1 = self._create_alert('system_1')
+            self.test_alert_2 = self._create_alert('system_2')
+            self.test_queue.put(self.test_alert_1)
+            self.test_queue.put(self.test_alert_2)
+            send_alert = mock.MagicMock(return_value=RequestStatus.SUCCESS)
+
+            ret = self.test_scheduler.send_alerts(self.test_queue, send_alert)
+
+            self.assertEqual(1, ret)
+            send_alert.assert_called_once_with(self.test_alert_1)
+            self.assertEqual([self.test_alert_2], self._queued_alerts())
+
+            frozen_time.tick(1)
+            ret = self.test_scheduler.send_alerts(self.test_queue, send_alert)
+
+            self.assertIsNone(ret)
+            send_alert.assert_called_with(self.test_alert_2)
+            self.assertTrue(self.test_queue.empty())
+
+    @freeze_time("2012-01-01")
+    def test_send_alerts_forgets_alerts_no_longer_in_queue(self) -> None:
+        self.test_alert_1 = self._create_alert('system_1')
+        self.test_alert_2 = self._create_alert('system_2')
+        self.test_queue.put(self.test_alert_1)
+        send_alert = mock.MagicMock(return_value=RequestStatus.FAILED)
+        self.test_scheduler.send_alerts(self.test_queue, send_alert)
+
+        # The handler removes the oldest alert when the queue is full
+        self.test_queue.get()
+        self.test_queue.task_done()
+        self.test_queue.put(self.test_alert_2)
+        self.test_scheduler.send_alerts(self.test_queue, send_alert)
+
+        self.assertEqual({self.test_alert_2: 1},
+                         self.test_scheduler._failed_attempts)
+        self.assertEqual([self.test_alert_2],
+                         list(self.test_scheduler._next_attempt_times))
@@ -4,6 +4,8 @@ from datetime import timedelta
 from unittest import mock
 from unittest.mock import call
 
+from parameterized import parameterized
+
 from src.channels_manager.apis.email_api import EmailApi
 from src.channels_manager.apis.opsgenie_api import OpsgenieApi
 from src.channels_manager.apis.pagerduty_api import PagerDutyApi
@@ -361,7 +363,8 @@ class TestHandlerStarters(unittest.TestCase):
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.telegram_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.telegram_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            non_blocking_retries=env.CHANNEL_HANDLERS_NON_BLOCKING_RETRIES)
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_telegram_alerts_handler")
@@ -517,7 +520,8 @@ class TestHandlerStarters(unittest.TestCase):
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.slack_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.slack_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            non_blocking_retries=env.CHANNEL_HANDLERS_NON_BLOCKING_RETRIES)
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_slack_alerts_handler")
@@ -676,7 +680,8 @@ class TestHandlerStarters(unittest.TestCase):
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
             self.twilio_channel, self.call_from, self.call_to, self.twiml,
-            self.twiml_is_url)
+            self.twiml_is_url,
+            non_blocking_retries=env.CHANNEL_HANDLERS_NON_BLOCKING_RETRIES)
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_twilio_alerts_handler")
@@ -734,7 +739,8 @@ class TestHandlerStarters(unittest.TestCase):
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.pagerduty_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.pagerduty_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            non_blocking_retries=env.CHANNEL_HANDLERS_NON_BLOCKING_RETRIES)
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_pagerduty_alerts_handler")
@@ -754,15 +760,27 @@ class TestHandlerStarters(unittest.TestCase):
         mock_start_handler.assert_called_once_with(
             self.pagerduty_alerts_handler)
 
+    @parameterized.expand([(True, False,), (False, True,), (False, False,), ])
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_channel_handler_logger")
+    @mock.patch("src.channels_manager.handlers.starters.SmtpConnectionPool")
     @mock.patch("src.channels_manager.handlers.starters.EmailApi")
     @mock.patch("src.channels_manager.handlers.starters.EmailChannel")
     @mock.patch("src.channels_manager.handlers.starters.RabbitMQApi")
     @mock.patch("src.channels_manager.handlers.starters.EmailAlertsHandler")
     def test_initialise_email_alerts_handler_creates_EAH_correctly(
-            self, mock_alerts_handler, mock_rabbit, mock_email_channel,
-            mock_email_api, mock_init_logger) -> None:
+            self, connection_pooling, batch_recipients, mock_alerts_handler,
+            mock_rabbit, mock_email_channel, mock_email_api,
+            mock_connection_pool, mock_init_logger) -> None:
+        connection_pool = mock_connection_pool.return_value
+        expected_connection_pool = connection_pool if connection_pooling \
+            else None
+        for env_var, value in [
+                ('EMAIL_SMTP_CONNECTION_POOLING', connection_pooling),
+                ('EMAIL_BATCH_RECIPIENTS', batch_recipients)]:
+            env_patcher = mock.patch.object(env, env_var, value)
+            env_patcher.start()
+            self.addCleanup(env_patcher.stop)
         mock_init_logger.return_value = self.dummy_logger
         mock_email_api.return_value = self.email_api
         mock_email_channel.return_value = self.email_channel
@@ -781,19 +799,27 @@ class TestHandlerStarters(unittest.TestCase):
             self.email_channel_name)
         mock_init_logger.assert_called_once_with(handler_display_name,
                                                  EmailAlertsHandler.__name__)
+        if connection_pooling:
+            mock_connection_pool.assert_called_once_with(
+                self.smtp, self.port, self.username, self.password,
+                idle_timeout=env.EMAIL_SMTP_IDLE_TIMEOUT_SECONDS)
+        else:
+            mock_connection_pool.assert_not_called()
         mock_email_api.assert_called_once_with(self.smtp, self.call_from,
                                                self.username, self.password,
-                                               self.port)
+                                               self.port,
+                                               expected_connection_pool)
         mock_email_channel.assert_called_once_with(
             self.email_channel_name, self.email_channel_id,
             self.dummy_logger.getChild(EmailChannel.__name__), self.emails_to,
-            self.email_api)
+            self.email_api, batch_recipients)
         mock_rabbit.assert_called_once_with(
             logger=self.dummy_logger.getChild(RabbitMQApi.__name__),
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.email_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.email_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            non_blocking_retries=env.CHANNEL_HANDLERS_NON_BLOCKING_RETRIES)
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_email_alerts_handler")
@@ -849,7 +875,8 @@ class TestHandlerStarters(unittest.TestCase):
             host=env.RABBIT_IP)
         mock_alerts_handler.assert_called_once_with(
             handler_display_name, self.dummy_logger, self.rabbitmq,
-            self.opsgenie_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE)
+            self.opsgenie_channel, env.CHANNELS_MANAGER_PUBLISHING_QUEUE_SIZE,
+            non_blocking_retries=env.CHANNEL_HANDLERS_NON_BLOCKING_RETRIES)
 
     @mock.patch("src.channels_manager.handlers.starters."
                 "_initialise_opsgenie_alerts_handler")
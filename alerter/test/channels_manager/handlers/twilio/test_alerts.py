@@ -16,7 +16,8 @@ from src.alerter.alerts.system_alerts import (
     OpenFileDescriptorsIncreasedAboveThresholdAlert)
 from src.channels_manager.apis.twilio_api import TwilioApi
 from src.channels_manager.channels.twilio import TwilioChannel
-from src.channels_manager.handlers.twilio.alerts import TwilioAlertsHandler
+from src.channels_manager.handlers.twilio.alerts import (
+    PendingCall, TwilioAlertsHandler)
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.utils import env
 from src.utils.constants.rabbitmq import (
@@ -605,3 +606,131 @@ class TestTwilioAlertsHandler(unittest.TestCase):
         self.assertEqual(expected_ret, ret)
         actual_calls = mock_alert.call_args_list
         self.assertEqual(expected_calls, actual_calls)
+
+    def _create_non_blocking_handler(self) -> None:
+        self.test_twilio_alerts_handler = TwilioAlertsHandler(
+            self.test_handler_name, self.dummy_logger, self.rabbitmq,
+            self.test_channel, self.test_call_from, self.test_call_to,
+            self.test_twiml, self.test_twiml_is_url, self.test_max_attempts,
+            self.test_alert_validity_threshold, non_blocking_retries=True)
+
+    def _create_recent_alert(
+            self) -> OpenFileDescriptorsIncreasedAboveThresholdAlert:
+        return OpenFileDescriptorsIncreasedAboveThresholdAlert(
+            self.test_system_name, self.test_percentage_usage,
+            self.test_panic_severity, datetime.now().timestamp(),
+            self.test_panic_severity, self.test_parent_id, self.test_system_id
+        )
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(TwilioChannel, "alert")
+    def test_call_using_twilio_keeps_failed_calls_pending_if_non_blocking(
+            self, mock_alert, mock_connection) -> None:
+        mock_alert.side_effect = [RequestStatus.SUCCESS, RequestStatus.FAILED,
+                                  RequestStatus.SUCCESS]
+        self._create_non_blocking_handler()
+        test_alert = self._create_recent_alert()
+
+        ret = self.test_twilio_alerts_handler._call_using_twilio(test_alert)
+
+        pending_calls = list(
+            self.test_twilio_alerts_handler.pending_calls.queue)
+        self.assertEqual(RequestStatus.FAILED, ret)
+        self.assertEqual(3, mock_alert.call_count)
+        self.assertEqual(1, len(pending_calls))
+        self.assertIsInstance(pending_calls[0], PendingCall)
+        self.assertEqual(test_alert, pending_calls[0].alert)
+        self.assertEqual(self.test_call_to[1], pending_calls[0].number)
+        mock_connection.sleep.assert_not_called()
+        mock_connection.call_later.assert_called_once_with(
+            mock.ANY, self.test_twilio_alerts_handler._on_send_alerts_timer)
+
+    @freeze_time("2012-01-01")
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(TwilioChannel, "alert")
+    def test_call_using_twilio_returns_success_if_no_call_pending(
+            self, mock_alert, mock_connection) -> None:
+        mock_alert.return_value = RequestStatus.SUCCESS
+        self._create_non_blocking_handler()
+
+        ret = self.test_twilio_alerts_handler._call_using_twilio(
+            self._create_recent_alert())
+
+        self.assertEqual(RequestStatus.SUCCESS, ret)
+        self.assertEqual(len(self.test_call_to), mock_alert.call_count)
+        self.assertTrue(self.test_twilio_alerts_handler.pending_calls.empty())
+        mock_connection.call_later.assert_not_called()
+
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(TwilioChannel, "alert")
+    def test_send_alerts_retries_pending_call_until_max_attempts_reached(
+            self, mock_alert, mock_connection) -> None:
+        mock_alert.return_value = RequestStatus.FAILED
+        self._create_non_blocking_handler()
+        with freeze_time("2012-01-01") as frozen_time:
+            test_alert = self._create_recent_alert()
+            self.test_twilio_alerts_handler.pending_calls.put(
+                PendingCall(test_alert, self.test_call_to[0]))
+
+            retry_scheduler = self.test_twilio_alerts_handler.retry_scheduler
+            for attempt in range(1, self.test_max_attempts + 1):
+                self.test_twilio_alerts_handler._reset_send_alerts_timer()
+                self.test_twilio_alerts_handler._send_alerts()
+                frozen_time.tick(
+                    retry_scheduler.initial_retry_delay * 2 ** (attempt - 1))
+
+        self.assertEqual(self.test_max_attempts, mock_alert.call_count)
+        mock_alert.assert_called_with(
+            call_from=self.test_call_from, call_to=self.test_call_to[0],
+            twiml=self.test_twiml, twiml_is_url=self.test_twiml_is_url)
+        self.assertTrue(self.test_twilio_alerts_handler.pending_calls.empty())
+        self.assertEqual(self.test_max_attempts - 1,
+                         mock_connection.call_later.call_count)
+
+    @mock.patch.object(RabbitMQApi, "connection")
+    @mock.patch.object(TwilioChannel, "alert")
+    def test_send_alerts_drops_pending_call_if_validity_threshold_exceeded(
+            self, mock_alert, mock_connection) -> None:
+        self._create_non_blocking_handler()
+        with freeze_time("2012-01-01") as frozen_time:
+            self.test_twilio_alerts_handler.pending_calls.put(
+                PendingCall(self._create_recent_alert(), self.test_call_to[0]))
+            frozen_time.tick(self.test_alert_validity_threshold + 1)
+
+            self.test_twilio_alerts_handler._send_alerts()
+
+        mock_alert.assert_not_called()
+        self.assertTrue(self.test_twilio_alerts_handler.pending_calls.empty())
+        mock_connection.call_later.assert_not_called()
+
+    @parameterized.expand([(True,), (False,), ])
+    @mock.patch.object(RabbitMQApi, "exchange_declare")
+    @mock.patch.object(RabbitMQApi, "queue_declare")
+    @mock.patch.object(RabbitMQApi, "queue_bind")
+    @mock.patch.object(RabbitMQApi, "basic_qos")
+    @mock.patch.object(RabbitMQApi, "basic_consume")
+    @mock.patch.object(RabbitMQApi, "confirm_delivery")
+    @mock.patch.object(RabbitMQApi, "connect_till_successful")
+    @mock.patch.object(RabbitMQApi, "connection")
+    def test_initialise_rabbitmq_re_arms_pending_calls_timer(
+            self, calls_pending, mock_connection, mock_connect, *_) -> None:
+        self._create_non_blocking_handler()
+        self.test_twilio_alerts_handler._send_alerts_timer_id = 'old_timer'
+        self.test_twilio_alerts_handler._send_alerts_timer_due_time = \
+            datetime.now().timestamp()
+        if calls_pending:
+            self.test_twilio_alerts_handler.pending_calls.put(
+                PendingCall(self._create_recent_alert(), self.test_call_to[0]))
+
+        self.test_twilio_alerts_handler._initialise_rabbitmq()
+
+        mock_connect.assert_called_once()
+        mock_connection.remove_timeout.assert_not_called()
+        if calls_pending:
+            mock_connection.call_later.assert_called_once_with(
+                0, self.test_twilio_alerts_handler._on_send_alerts_timer)
+        else:
+            mock_connection.call_later.assert_not_called()
+            self.assertIsNone(
+                self.test_twilio_alerts_handler._send_alerts_timer_id)
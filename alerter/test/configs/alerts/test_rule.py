@@ -0,0 +1,112 @@
+import copy
+import pickle
+import unittest
+
+from parameterized import parameterized
+
+from src.configs.alerts.rule import AlertRule
+
+
+class TestAlertRule(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_config = {
+            'name': 'system_cpu_usage',
+            'parent_id': 'test_parent_id',
+            'enabled': 'true',
+            'warning_enabled': 'True',
+            'warning_threshold': '85',
+            'warning_time_window': '60',
+            'critical_enabled': 'false',
+            'critical_threshold': '95.5',
+            'critical_time_window': '120',
+            'critical_repeat_enabled': 'yes',
+            'critical_repeat': '300',
+        }
+        self.test_rule = AlertRule(self.test_config)
+
+    def tearDown(self) -> None:
+        self.test_config = None
+        self.test_rule = None
+
+    def test_init_parses_flags_thresholds_and_time_windows(self) -> None:
+        self.assertTrue(self.test_rule.enabled)
+        self.assertTrue(self.test_rule.warning_enabled)
+        self.assertEqual(85.0, self.test_rule.warning_threshold)
+        self.assertEqual(60.0, self.test_rule.warning_time_window)
+        self.assertFalse(self.test_rule.critical_enabled)
+        self.assertEqual(95.5, self.test_rule.critical_threshold)
+        self.assertEqual(120.0, self.test_rule.critical_time_window)
+        self.assertTrue(self.test_rule.critical_repeat_enabled)
+        self.assertEqual(300.0, self.test_rule.critical_repeat)
+
+    def test_rule_is_still_the_raw_config(self) -> None:
+        self.assertEqual(self.test_config, self.test_rule)
+        self.assertEqual('85', self.test_rule['warning_threshold'])
+
+    def test_rule_has_no_instance_dict(self) -> None:
+        self.assertFalse(hasattr(self.test_rule, '__dict__'))
+
+    @parameterized.expand([
+        ('warning_threshold', 'not a number',),
+        ('warning_threshold', None,),
+    ])
+    def test_init_sets_malformed_or_missing_values_to_none(
+            self, key, value) -> None:
+        self.test_config[key] = value
+        if value is None:
+            del self.test_config[key]
+
+        self.assertIsNone(getattr(AlertRule(self.test_config), key))
+
+    def test_init_sets_missing_flags_to_false(self) -> None:
+        del self.test_config['warning_enabled']
+
+        self.assertFalse(AlertRule(self.test_config).warning_enabled)
+
+    def test_setitem_recompiles_the_rule(self) -> None:
+        self.test_rule['critical_threshold'] = '99'
+        self.test_rule['critical_enabled'] = 'true'
+
+        self.assertEqual(99.0, self.test_rule.critical_threshold)
+        self.assertTrue(self.test_rule.critical_enabled)
+
+    @parameterized.expand([
+        ('update', lambda rule: rule.update(critical_threshold='99'),
+         'critical_threshold', 99.0,),
+        ('ior', lambda rule: rule.__ior__({'critical_threshold': '99'}),
+         'critical_threshold', 99.0,),
+        ('setdefault', lambda rule: (rule.pop('critical_repeat'),
+                                     rule.setdefault('critical_repeat', '60')),
+         'critical_repeat', 60.0,),
+        ('pop', lambda rule: rule.pop('warning_threshold'),
+         'warning_threshold', None,),
+        ('del', lambda rule: rule.__delitem__('warning_time_window'),
+         'warning_time_window', None,),
+        ('popitem', lambda rule: rule.popitem(), 'critical_repeat', None,),
+        ('clear', lambda rule: rule.clear(), 'enabled', False,),
+    ])
+    def test_mutators_recompile_the_rule(self, _, mutate, key,
+                                         expected_value) -> None:
+        mutate(self.test_rule)
+
+        recompiled_rule = AlertRule(dict(self.test_rule))
+        self.assertEqual(expected_value, getattr(self.test_rule, key))
+        for slot in AlertRule.__slots__:
+            self.assertEqual(getattr(recompiled_rule, slot),
+                             getattr(self.test_rule, slot))
+
+    def test_compile_returns_compiled_rule_unchanged(self) -> None:
+        self.assertIs(self.test_rule, AlertRule.compile(self.test_rule))
+
+    def test_compile_compiles_raw_config(self) -> None:
+        rule = AlertRule.compile(self.test_config)
+
+        self.assertIsInstance(rule, AlertRule)
+        self.assertEqual(85.0, rule.warning_threshold)
+
+    def test_rule_can_be_copied_and_pickled(self) -> None:
+        for rule in [copy.deepcopy(self.test_rule),
+                     pickle.loads(pickle.dumps(self.test_rule))]:
+            self.assertIsInstance(rule, AlertRule)
+            self.assertEqual(self.test_config, rule)
+            self.assertEqual(95.5, rule.critical_threshold)
@@ -3,6 +3,7 @@ import unittest
 
 from parameterized import parameterized
 
+from src.configs.alerts.rule import AlertRule
 from src.configs.alerts.system import SystemAlertsConfig
 from src.configs.factory.alerts.system_alerts import SystemAlertsConfigsFactory
 from src.utils.exceptions import ParentIdsMissMatchInAlertsConfiguration
@@ -303,3 +304,21 @@ class TestSystemAlertsConfigsFactory(unittest.TestCase):
         configs_factory._configs = state
         self.assertIsNone(configs_factory.get_chain_name(self.test_parent_id_2))
         self.assertIsNone(configs_factory.get_chain_name('bad_id'))
+
+    def test_add_new_config_compiles_metric_configs_into_alert_rules(
+            self) -> None:
+        self.received_config_example_1_system['0'].update({
+            'warning_enabled': 'True', 'warning_threshold': '85',
+            'critical_enabled': 'False', 'critical_threshold': '95',
+        })
+
+        self.system_configs_factory.add_new_config(
+            self.test_chain_name_1, self.received_config_example_1_system)
+
+        rule = self.system_configs_factory.configs[
+            self.test_chain_name_1].open_file_descriptors
+        self.assertIsInstance(rule, AlertRule)
+        self.assertTrue(rule.warning_enabled)
+        self.assertEqual(85.0, rule.warning_threshold)
+        self.assertFalse(rule.critical_enabled)
+        self.assertEqual(95.0, rule.critical_threshold)
@@ -0,0 +1,187 @@
+import logging
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from freezegun import freeze_time
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from src.data_store.mongo import MongoApi, MongoWriteBuffer
+from src.data_store.mongo.mongo_write_buffer import MAX_UPDATE_WRITE_ATTEMPTS
+
+
+class TestMongoWriteBuffer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('dummy')
+        self.dummy_logger.disabled = True
+        self.mongo = mock.MagicMock(spec=MongoApi)
+        self.batch_size = 3
+        self.flush_interval = timedelta(seconds=10)
+        self.test_buffer = MongoWriteBuffer(self.batch_size,
+                                            self.flush_interval,
+                                            self.dummy_logger)
+        self.col1 = 'collection1'
+        self.col2 = 'collection2'
+        self.query1 = {'doc_type': 'system', 'd': 1}
+        self.query2 = {'doc_type': 'system', 'd': 2}
+
+    def tearDown(self) -> None:
+        self.mongo = None
+        self.test_buffer = None
+
+    def test_update_one_merges_updates_having_the_same_query(self) -> None:
+        self.test_buffer.update_one(self.col1, self.query1, {
+            '$push': {'a': {'v': 1}},
+            '$inc': {'n_entries': 1},
+            '$min': {'first': 5},
+            '$max': {'last': 5},
+            '$set': {'s': 'x'},
+        })
+        self.test_buffer.update_one(self.col1, dict(reversed(
+            list(self.query1.items()))), {
+            '$push': {'a': {'v': 2}, 'b': {'$each': [{'v': 3}, {'v': 4}]}},
+            '$inc': {'n_entries': 2},
+            '$min': {'first': 3},
+            '$max': {'last': 3},
+            '$set': {'s': 'y'},
+        })
+
+        expected_update = {
+            '$push': {'a': {'$each': [{'v': 1}, {'v': 2}]},
+                      'b': {'$each': [{'v': 3}, {'v': 4}]}},
+            '$inc': {'n_entries': 3},
+            '$min': {'first': 3},
+            '$max': {'last': 5},
+            '$set': {'s': 'y'},
+        }
+        self.assertEqual(2, self.test_buffer.size)
+        self.assertEqual(1, len(self.test_buffer._pending_updates))
+        self.assertEqual(
+            [(self.query1, expected_update)],
+            list(self.test_buffer._pending_updates.values()))
+
+    def test_update_one_does_not_merge_updates_having_different_queries(
+            self) -> None:
+        self.test_buffer.update_one(self.col1, self.query1,
+                                    {'$inc': {'n_entries': 1}})
+        self.test_buffer.update_one(self.col1, self.query2,
+                                    {'$inc': {'n_entries': 1}})
+        self.test_buffer.update_one(self.col2, self.query1,
+                                    {'$inc': {'n_entries': 1}})
+
+        self.assertEqual(3, len(self.test_buffer._pending_updates))
+
+    @freeze_time("2012-01-01")
+    def test_is_flush_due_if_batch_is_full_or_interval_elapsed(self) -> None:
+        self.test_buffer._flush_limiter.did_task()
+        for _ in range(self.batch_size - 1):
+            self.test_buffer.update_one(self.col1, self.query1,
+                                        {'$inc': {'n_entries': 1}})
+        self.assertFalse(self.test_buffer.is_flush_due())
+
+        self.test_buffer.update_one(self.col1, self.query1,
+                                    {'$inc': {'n_entries': 1}})
+        self.assertTrue(self.test_buffer.is_flush_due())
+
+        self.test_buffer._size = 0
+        with freeze_time("2012-01-01 00:00:10"):
+            self.assertTrue(self.test_buffer.is_flush_due())
+
+    def test_flush_writes_one_bulk_write_per_collection(self) -> None:
+        self.mongo.bulk_write.return_value = mock.MagicMock()
+        self.test_buffer.update_one(self.col1, self.query1,
+                                    {'$inc': {'n_entries': 1}})
+        self.test_buffer.update_one(self.col1, self.query2,
+                                    {'$inc': {'n_entries': 1}})
+        self.test_buffer.update_one(self.col2, self.query1,
+                                    {'$inc': {'n_entries': 1}})
+
+        self.assertTrue(self.test_buffer.flush(self.mongo))
+
+        self.mongo.bulk_write.assert_has_calls([
+            mock.call(self.col1, [
+                UpdateOne(self.query1, {'$inc': {'n_entries': 1}},
+                          upsert=True),
+                UpdateOne(self.query2, {'$inc': {'n_entries': 1}},
+                          upsert=True)]),
+            mock.call(self.col2, [
+                UpdateOne(self.query1, {'$inc': {'n_entries': 1}},
+                          upsert=True)]),
+        ])
+        self.assertTrue(self.test_buffer.is_empty())
+        self.assertEqual({}, self.test_buffer._pending_updates)
+
+    def test_flush_keeps_updates_of_collections_which_were_not_written(
+            self) -> None:
+        self.mongo.bulk_write.side_effect = \
+            lambda collection, operations: \
+            None if collection == self.col2 else mock.MagicMock()
+        self.test_buffer.update_one(self.col1, self.query1,
+                                    {'$inc': {'n_entries': 1}})
+        self.test_buffer.update_one(self.col2, self.query1,
+                                    {'$inc': {'n_entries': 1}})
+
+        self.assertFalse(self.test_buffer.flush(self.mongo))
+
+        self.assertEqual(1, self.test_buffer.size)
+        self.assertEqual(
+            [(self.col2, self.query1)],
+            [(collection, query) for (collection, _), (query, _) in
+             self.test_buffer._pending_updates.items()])
+
+    def _reject_update_at(self, index: int) -> BulkWriteError:
+        return BulkWriteError({'writeErrors': [
+            {'index': index, 'code': 11000, 'errmsg': 'test error'}]})
+
+    def test_flush_keeps_only_the_updates_which_mongo_rejected(self) -> None:
+        self.mongo.bulk_write.side_effect = self._reject_update_at(1)
+        self.test_buffer.update_one(self.col1, self.query1,
+                                    {'$push': {'a': {'v': 1}}})
+        self.test_buffer.update_one(self.col1, self.query2,
+                                    {'$push': {'a': {'v': 1}}})
+        self.test_buffer.update_one(self.col1, self.query2,
+                                    {'$push': {'a': {'v': 2}}})
+
+        self.assertFalse(self.test_buffer.flush(self.mongo))
+
+        self.assertEqual(2, self.test_buffer.size)
+        self.assertEqual(
+            [(self.query2, {'$push': {'a': {'$each': [{'v': 1}, {'v': 2}]}}})],
+            list(self.test_buffer._pending_updates.values()))
+
+        self.mongo.bulk_write.side_effect = None
+        self.mongo.bulk_write.return_value = mock.MagicMock()
+        self.assertTrue(self.test_buffer.flush(self.mongo))
+
+        self.mongo.bulk_write.assert_called_with(self.col1, [
+            UpdateOne(self.query2,
+                      {'$push': {'a': {'$each': [{'v': 1}, {'v': 2}]}}},
+                      upsert=True)])
+        self.assertTrue(self.test_buffer.is_empty())
+
+    def test_flush_drops_update_which_mongo_keeps_rejecting(self) -> None:
+        self.mongo.bulk_write.side_effect = self._reject_update_at(0)
+        self.test_buffer.update_one(self.col1, self.query1,
+                                    {'$inc': {'n_entries': 1}})
+
+        for _ in range(MAX_UPDATE_WRITE_ATTEMPTS - 1):
+            self.assertFalse(self.test_buffer.flush(self.mongo))
+            self.assertEqual(1, self.test_buffer.size)
+
+        self.assertTrue(self.test_buffer.flush(self.mongo))
+        self.assertTrue(self.test_buffer.is_empty())
+        self.assertEqual({}, self.test_buffer._pending_updates)
+        self.assertEqual({}, self.test_buffer._failed_attempts)
+
+    def test_clear_discards_updates(self) -> None:
+        self.mongo.bulk_write.side_effect = self._reject_update_at(0)
+        self.test_buffer.update_one(self.col1, self.query1,
+                                    {'$inc': {'n_entries': 1}})
+        self.test_buffer.flush(self.mongo)
+
+        self.test_buffer.clear()
+
+        self.assertTrue(self.test_buffer.is_empty())
+        self.assertEqual({}, self.test_buffer._pending_updates)
+        self.assertEqual({}, self.test_buffer._failed_attempts)
@@ -137,6 +137,19 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
         self.assertEqual(self.redis.hget_unsafe(self.hash_name, self.key2),
                          self.val2_bytes)
 
+    def test_hset_multiple_hashes_unsafe_sets_fields_of_all_hashes(self):
+        other_hash_name = 'other_dummy_hash'
+        self.redis.hset_multiple_hashes_unsafe({
+            self.hash_name: {self.key1: self.val1, self.key2: None},
+            other_hash_name: {self.key1: self.val2},
+        })
+        self.assertEqual(self.redis.hget_unsafe(self.hash_name, self.key1),
+                         self.val1_bytes)
+        self.assertEqual(self.redis.hget_unsafe(self.hash_name, self.key2),
+                         None)
+        self.assertEqual(self.redis.hget_unsafe(other_hash_name, self.key1),
+                         self.val2_bytes)
+
     def test_set_for_unsafe_temporarily_sets_specified_key_value_pair(self):
         self.redis.set_for_unsafe(self.key1, self.val1, self.time)
         self.assertEqual(self.redis.get_unsafe(self.key1), self.val1_bytes)
@@ -266,6 +279,87 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
             self.redis.hget_bool_unsafe(self.hash_name, self.key1,
                                         default=self.default_bool))
 
+    def test_mget_unsafe_returns_values_in_order_of_keys(self):
+        self.redis.set_unsafe(self.key1, self.val1)
+        self.redis.set_unsafe(self.key2, 'None')
+        self.assertEqual(
+            [None, self.default_str, self.val1_bytes],
+            self.redis.mget_unsafe([self.key2, self.key3, self.key1],
+                                           default=self.default_str))
+
+    def test_mget_unsafe_returns_empty_list_for_no_keys(self):
+        self.assertEqual([], self.redis.mget_unsafe([]))
+
+    def test_hmget_unsafe_returns_values_in_order_of_keys(self):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.redis.hset_unsafe(self.hash_name, self.key2, 'None')
+        self.assertEqual(
+            [None, self.default_str, self.val1_bytes],
+            self.redis.hmget_unsafe(
+                self.hash_name, [self.key2, self.key3, self.key1],
+                default=self.default_str))
+
+    def test_mget_int_unsafe_returns_default_for_unset_and_non_int_values(
+            self):
+        self.redis.set_unsafe(self.key1, self.val1)
+        self.redis.set_unsafe(self.key3, self.val3_int)
+        self.assertEqual(
+            [self.val3_int, self.default_int, self.default_int],
+            self.redis.mget_int_unsafe([self.key3, self.key1, self.key2],
+                                       default=self.default_int))
+
+    def test_hmget_int_unsafe_returns_default_for_unset_and_non_int_values(
+            self):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.redis.hset_unsafe(self.hash_name, self.key3, self.val3_int)
+        self.assertEqual(
+            [self.val3_int, self.default_int, self.default_int],
+            self.redis.hmget_int_unsafe(
+                self.hash_name, [self.key3, self.key1, self.key2],
+                default=self.default_int))
+
+    def test_mget_bool_unsafe_returns_default_for_unset_and_non_bool_values(
+            self):
+        self.redis.set_unsafe(self.key1, self.val1)
+        self.redis.set_unsafe(self.key4, self.val4)
+        self.assertEqual(
+            [self.val4_bool, self.default_bool, self.default_bool],
+            self.redis.mget_bool_unsafe([self.key4, self.key1, self.key2],
+                                        default=self.default_bool))
+
+    def test_hmget_bool_unsafe_returns_default_for_unset_and_non_bool_values(
+            self):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.redis.hset_unsafe(self.hash_name, self.key4, self.val4)
+        self.assertEqual(
+            [self.val4_bool, self.default_bool, self.default_bool],
+            self.redis.hmget_bool_unsafe(
+                self.hash_name, [self.key4, self.key1, self.key2],
+                default=self.default_bool))
+
+    def test_get_unsafe_uses_a_single_round_trip(self):
+        self.redis.set_unsafe(self.key1, self.val1)
+        with patch.object(self.redis._redis, 'execute_command',
+                          wraps=self.redis._redis.execute_command) \
+                as mock_execute_command:
+            self.redis.get_unsafe(self.key1)
+            self.redis.hget_unsafe(self.hash_name, self.key1)
+        self.assertEqual(2, mock_execute_command.call_count)
+
+    def test_hmget_multiple_hashes_unsafe_returns_only_set_values(self):
+        other_hash_name = 'other_dummy_hash'
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.redis.hset_unsafe(self.hash_name, self.key2, 'None')
+        self.redis.hset_unsafe(other_hash_name, self.key1, self.val2)
+        self.assertEqual(
+            {self.hash_name: {self.key1: self.val1_bytes, self.key2: None},
+             other_hash_name: {self.key1: self.val2_bytes},
+             'unset_hash': {}},
+            self.redis.hmget_multiple_hashes_unsafe({
+                self.hash_name: [self.key1, self.key2, self.key3],
+                other_hash_name: [self.key1, self.key3],
+                'unset_hash': [self.key1]}))
+
     def test_exists_unsafe_returns_true_if_exists(self):
         self.redis.set_unsafe(self.key1, self.val1)
         self.assertTrue(self.redis.exists_unsafe(self.key1))
@@ -409,6 +503,15 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
         self.assertEqual(self.redis.hget(self.hash_name, self.key2),
                          self.val2_bytes)
 
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_hset_multiple_hashes_returns_none_and_nothing_set_if_redis_down(
+            self, _):
+        self.assertIsNone(self.redis.hset_multiple_hashes({
+            self.hash_name: {self.key1: self.val1, self.key2: self.val2}
+        }))
+        self.assertFalse(self.redis.hexists_unsafe(self.hash_name, self.key1))
+        self.assertFalse(self.redis.hexists_unsafe(self.hash_name, self.key2))
+
     @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
     def test_hset_multiple_returns_none_and_nothing_set_if_redis_down(self, _):
         self.assertIsNone(self.redis.hset_multiple(self.hash_name, {
@@ -577,6 +680,29 @@ class TestRedisApiWithRedisOnline(unittest.TestCase):
                                               default=self.default_bool),
                          self.default_bool)
 
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_mget_returns_defaults_if_redis_down(self, _):
+        self.redis.set_unsafe(self.key1, self.val1)
+        self.assertEqual(
+            [self.default_str, self.default_str],
+            self.redis.mget([self.key1, self.key2],
+                                    default=self.default_str))
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_hmget_returns_defaults_if_redis_down(self, _):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.assertEqual(
+            [self.default_str, self.default_str],
+            self.redis.hmget(self.hash_name, [self.key1, self.key2],
+                                     default=self.default_str))
+
+    @patch(REDIS_RECENTLY_DOWN_FUNCTION, return_value=True)
+    def test_hmget_multiple_hashes_returns_empty_dict_if_redis_down(self, _):
+        self.redis.hset_unsafe(self.hash_name, self.key1, self.val1)
+        self.assertEqual(
+            {},
+            self.redis.hmget_multiple_hashes({self.hash_name: [self.key1]}))
+
     def test_exists_returns_true_if_exists(self):
         self.redis.set(self.key1, self.val1)
         self.assertTrue(self.redis.exists(self.key1))
@@ -770,6 +896,11 @@ class TestRedisApiWithRedisOffline(unittest.TestCase):
         self.assertRaises(RedisConnectionError, self.redis.set_multiple_unsafe,
                           {self.key: self.val})
 
+    def test_hset_multiple_hashes_unsafe_throws_connection_exception(self):
+        self.assertRaises(RedisConnectionError,
+                          self.redis.hset_multiple_hashes_unsafe,
+                          {self.hash_name: {self.key: self.val}})
+
     def test_hset_multiple_unsafe_throws_connection_exception(self):
         self.assertRaises(RedisConnectionError,
                           self.redis.hset_multiple_unsafe, self.hash_name,
@@ -835,6 +966,10 @@ class TestRedisApiWithRedisOffline(unittest.TestCase):
     def test_hset_returns_none(self):
         self.assertIsNone(self.redis.hset(self.hash_name, self.key, self.val))
 
+    def test_hset_multiple_hashes_returns_none(self):
+        self.assertIsNone(self.redis.hset_multiple_hashes(
+            {self.hash_name: {self.key: self.val}}))
+
     def test_set_multiple_returns_none(self):
         self.assertIsNone(self.redis.set_multiple({self.key: self.val}))
 
@@ -896,6 +1031,30 @@ class TestRedisApiWithRedisOffline(unittest.TestCase):
             self.redis.hget_bool(self.hash_name, self.key, default=default),
             default)
 
+    def test_hmget_returns_default_for_each_key(self):
+        default = 'default'
+        self.assertEqual(
+            [default, default],
+            self.redis.hmget(self.hash_name, [self.key, self.key],
+                                     default=default))
+
+    def test_mget_int_returns_default_for_each_key(self):
+        default = 123456
+        self.assertEqual([default, default],
+                         self.redis.mget_int([self.key, self.key],
+                                             default=default))
+
+    def test_hmget_bool_returns_default_for_each_key(self):
+        default = True
+        self.assertEqual(
+            [default, default],
+            self.redis.hmget_bool(self.hash_name, [self.key, self.key],
+                                  default=default))
+
+    def test_hmget_multiple_hashes_returns_empty_dict(self):
+        self.assertEqual(
+            {}, self.redis.hmget_multiple_hashes({self.hash_name: [self.key]}))
+
     def test_exists_returns_false(self):
         self.assertFalse(self.redis.exists(self.key))
 
@@ -0,0 +1,93 @@
+import logging
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from src.data_store.redis import RedisApi, RedisWriteBuffer
+from src.utils import env
+
+
+class TestRedisWriteBuffer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('dummy')
+        self.dummy_logger.disabled = True
+        self.redis = RedisApi(self.dummy_logger, env.REDIS_DB, env.REDIS_IP,
+                              env.REDIS_PORT, '', env.UNIQUE_ALERTER_IDENTIFIER,
+                              timedelta(seconds=0))
+        self.test_buffer = RedisWriteBuffer(self.redis, True)
+        self.hash_name = 'dummy_hash'
+        self.other_hash_name = 'other_dummy_hash'
+
+    def tearDown(self) -> None:
+        self.redis = None
+        self.test_buffer = None
+
+    @mock.patch.object(RedisApi, "hset_multiple")
+    @mock.patch.object(RedisApi, "hset")
+    def test_writes_are_sent_immediately_if_not_buffered(
+            self, mock_hset, mock_hset_multiple) -> None:
+        self.test_buffer = RedisWriteBuffer(self.redis, False)
+
+        self.test_buffer.hset(self.hash_name, 'key1', 'val1')
+        self.test_buffer.hset_multiple(self.hash_name, {'key2': 'val2'})
+
+        mock_hset.assert_called_once_with(self.hash_name, 'key1', 'val1')
+        mock_hset_multiple.assert_called_once_with(self.hash_name,
+                                                   {'key2': 'val2'})
+        self.assertTrue(self.test_buffer.is_empty())
+
+    @mock.patch.object(RedisApi, "hset_multiple")
+    @mock.patch.object(RedisApi, "hset")
+    def test_writes_are_merged_per_hash_if_buffered(
+            self, mock_hset, mock_hset_multiple) -> None:
+        self.test_buffer.hset(self.hash_name, 'key1', 'val1')
+        self.test_buffer.hset_multiple(self.hash_name,
+                                       {'key1': 'val2', 'key2': 'val3'})
+        self.test_buffer.hset(self.other_hash_name, 'key1', 'val4')
+
+        mock_hset.assert_not_called()
+        mock_hset_multiple.assert_not_called()
+        self.assertEqual(3, self.test_buffer.size)
+        self.assertEqual({
+            self.hash_name: {'key1': 'val2', 'key2': 'val3'},
+            self.other_hash_name: {'key1': 'val4'},
+        }, self.test_buffer._pending_hashes)
+
+    @mock.patch.object(RedisApi, "hset_multiple_hashes")
+    def test_flush_writes_all_hashes_at_once_and_empties_buffer(
+            self, mock_hset_multiple_hashes) -> None:
+        mock_hset_multiple_hashes.return_value = [1, 1]
+        self.test_buffer.hset(self.hash_name, 'key1', 'val1')
+        self.test_buffer.hset(self.other_hash_name, 'key1', 'val2')
+
+        self.assertTrue(self.test_buffer.flush())
+
+        mock_hset_multiple_hashes.assert_called_once_with({
+            self.hash_name: {'key1': 'val1'},
+            self.other_hash_name: {'key1': 'val2'},
+        })
+        self.assertTrue(self.test_buffer.is_empty())
+
+    @mock.patch.object(RedisApi, "hset_multiple_hashes")
+    def test_flush_keeps_writes_if_they_could_not_be_sent(
+            self, mock_hset_multiple_hashes) -> None:
+        mock_hset_multiple_hashes.return_value = None
+        self.test_buffer.hset(self.hash_name, 'key1', 'val1')
+
+        self.assertFalse(self.test_buffer.flush())
+
+        self.assertEqual({self.hash_name: {'key1': 'val1'}},
+                         self.test_buffer._pending_hashes)
+
+    def test_clear_discards_writes(self) -> None:
+        self.test_buffer.hset(self.hash_name, 'key1', 'val1')
+
+        self.test_buffer.clear()
+
+        self.assertTrue(self.test_buffer.is_empty())
+
+    @mock.patch.object(RedisApi, "hset_multiple_hashes")
+    def test_flush_does_nothing_if_buffer_is_empty(
+            self, mock_hset_multiple_hashes) -> None:
+        self.assertTrue(self.test_buffer.flush())
+        mock_hset_multiple_hashes.assert_not_called()
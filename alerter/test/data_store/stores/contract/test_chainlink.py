@@ -11,6 +11,7 @@ from parameterized import parameterized
 from pika.exceptions import AMQPConnectionError, AMQPChannelError
 
 from src.data_store.mongo.mongo_api import MongoApi
+from src.data_store.mongo.mongo_write_buffer import MongoWriteBuffer
 from src.data_store.redis import RedisApi, Keys
 from src.data_store.stores.contract.chainlink import ChainlinkContractStore
 from src.message_broker.rabbitmq import RabbitMQApi
@@ -398,7 +399,8 @@ class TestChainlinkContractStore(unittest.TestCase):
         # Check that the message received is actually the HB
         _, _, body = self.test_store.rabbitmq.basic_get(
             self.test_queue_name)
-        self.assertEqual(test_hb, json.loads(body))
+        self.assertEqual(dict(test_hb, processed=1, failed=0),
+                         json.loads(body))
 
     @mock.patch.object(RabbitMQApi, "basic_consume")
     @mock.patch.object(RabbitMQApi, "start_consuming")
@@ -653,6 +655,7 @@ class TestChainlinkContractStore(unittest.TestCase):
         metrics = data['data']
 
         self.test_store._process_mongo_result_store(data)
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
 
@@ -730,7 +733,7 @@ class TestChainlinkContractStore(unittest.TestCase):
 
     @mock.patch.object(MongoApi, "insert_one")
     @mock.patch.object(MongoApi, "insert_many")
-    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoWriteBuffer, "update_one")
     @mock.patch.object(ChainlinkContractStore, "_process_mongo_result_store")
     def test_process_mongo_error_store_does_nothing(
             self, mock_result_store, mock_insert_one, mock_insert_many,
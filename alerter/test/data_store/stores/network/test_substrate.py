@@ -9,7 +9,7 @@ from freezegun import freeze_time
 from parameterized import parameterized
 from pika.exceptions import AMQPConnectionError, AMQPChannelError
 
-from src.data_store.mongo import MongoApi
+from src.data_store.mongo import MongoApi, MongoWriteBuffer
 from src.data_store.redis import RedisApi, Keys
 from src.data_store.stores.network.substrate import SubstrateNetworkStore
 from src.message_broker.rabbitmq import RabbitMQApi
@@ -352,7 +352,8 @@ class TestSubstrateNetworkStore(unittest.TestCase):
         # Check that the message received is actually the HB
         _, _, body = self.test_store.rabbitmq.basic_get(
             self.test_queue_name)
-        self.assertEqual(test_hb, json.loads(body))
+        self.assertEqual(dict(test_hb, processed=1, failed=0),
+                         json.loads(body))
 
     @mock.patch.object(RabbitMQApi, "basic_consume")
     @mock.patch.object(RabbitMQApi, "start_consuming")
@@ -603,6 +604,7 @@ class TestSubstrateNetworkStore(unittest.TestCase):
 
         self.test_store._process_mongo_websocket_result_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -621,7 +623,7 @@ class TestSubstrateNetworkStore(unittest.TestCase):
 
     @mock.patch.object(MongoApi, "insert_one")
     @mock.patch.object(MongoApi, "insert_many")
-    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoWriteBuffer, "update_one")
     def test_process_mongo_websocket_error_does_not_save(
             self, mock_update_one, mock_insert_many, mock_insert_one) -> None:
         data = self.network_data_error['websocket']['error']
@@ -328,7 +328,8 @@ class TestChainlinkNodeStore(unittest.TestCase):
         # Check that the message received is actually the HB
         _, _, body = self.test_store.rabbitmq.basic_get(
             self.test_queue_name)
-        self.assertEqual(test_hb, json.loads(body))
+        self.assertEqual(dict(test_hb, processed=1, failed=0),
+                         json.loads(body))
 
     @mock.patch.object(RabbitMQApi, "basic_consume")
     @mock.patch.object(RabbitMQApi, "start_consuming")
@@ -746,6 +747,7 @@ class TestChainlinkNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_prometheus_result_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -810,6 +812,7 @@ class TestChainlinkNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_prometheus_result_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -869,6 +872,7 @@ class TestChainlinkNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_prometheus_error_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -899,6 +903,7 @@ class TestChainlinkNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_prometheus_error_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -11,6 +11,7 @@ from parameterized import parameterized
 from pika.exceptions import AMQPConnectionError, AMQPChannelError
 
 from src.data_store.mongo.mongo_api import MongoApi
+from src.data_store.mongo.mongo_write_buffer import MongoWriteBuffer
 from src.data_store.redis import RedisApi, Keys
 from src.data_store.stores.node.cosmos import CosmosNodeStore
 from src.message_broker.rabbitmq import RabbitMQApi
@@ -374,7 +375,8 @@ class TestCosmosNodeStore(unittest.TestCase):
         # Check that the message received is actually the HB
         _, _, body = self.test_store.rabbitmq.basic_get(
             self.test_queue_name)
-        self.assertEqual(test_hb, json.loads(body))
+        self.assertEqual(dict(test_hb, processed=1, failed=0),
+                         json.loads(body))
 
     @mock.patch.object(RabbitMQApi, "basic_consume")
     @mock.patch.object(RabbitMQApi, "start_consuming")
@@ -792,6 +794,7 @@ class TestCosmosNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_prometheus_result_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -829,6 +832,7 @@ class TestCosmosNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_cosmos_rest_result_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -865,6 +869,7 @@ class TestCosmosNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_tendermint_rpc_result_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -903,6 +908,7 @@ class TestCosmosNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_prometheus_error_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -932,6 +938,7 @@ class TestCosmosNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_cosmos_rest_error_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -961,6 +968,7 @@ class TestCosmosNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_tendermint_rpc_error_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -981,7 +989,7 @@ class TestCosmosNodeStore(unittest.TestCase):
         self.assertEqual(2, len(document[node_id][0]))
         self.assertListEqual(expected, actual)
 
-    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoWriteBuffer, "update_one")
     def test_process_mongo_prometheus_error_store_stores_correctly_non_down_err(
             self, mongo_update) -> None:
         data = self.node_data_non_down_error['prometheus']['error']
@@ -990,7 +998,7 @@ class TestCosmosNodeStore(unittest.TestCase):
 
         mongo_update.assert_not_called()
 
-    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoWriteBuffer, "update_one")
     def test_process_mongo_cosmos_rest_error_store_stores_correctly_non_down_err(
             self, mongo_update) -> None:
         data = self.node_data_non_down_error['cosmos_rest']['error']
@@ -999,7 +1007,7 @@ class TestCosmosNodeStore(unittest.TestCase):
 
         mongo_update.assert_not_called()
 
-    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoWriteBuffer, "update_one")
     def test_process_mongo_tendermint_rpc_error_store_stores_correctly_non_down_err(
             self, mongo_update) -> None:
         data = self.node_data_non_down_error['tendermint_rpc']['error']
@@ -254,7 +254,8 @@ class TestEVMNodeStore(unittest.TestCase):
         # Check that the message received is actually the HB
         _, _, body = self.test_store.rabbitmq.basic_get(
             self.test_queue_name)
-        self.assertEqual(test_hb, json.loads(body))
+        self.assertEqual(dict(test_hb, processed=1, failed=0),
+                         json.loads(body))
 
     @mock.patch.object(RabbitMQApi, "basic_consume")
     @mock.patch.object(RabbitMQApi, "start_consuming")
@@ -487,6 +488,7 @@ class TestEVMNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_result_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -520,6 +522,7 @@ class TestEVMNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_error_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
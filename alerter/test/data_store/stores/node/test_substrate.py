@@ -9,7 +9,7 @@ from freezegun import freeze_time
 from parameterized import parameterized
 from pika.exceptions import AMQPConnectionError, AMQPChannelError
 
-from src.data_store.mongo import MongoApi
+from src.data_store.mongo import MongoApi, MongoWriteBuffer
 from src.data_store.redis import RedisApi, Keys
 from src.data_store.stores.node.substrate import SubstrateNodeStore
 from src.message_broker.rabbitmq import RabbitMQApi
@@ -312,7 +312,8 @@ class TestSubstrateNodeStore(unittest.TestCase):
         # Check that the message received is actually the HB
         _, _, body = self.test_store.rabbitmq.basic_get(
             self.test_queue_name)
-        self.assertEqual(test_hb, json.loads(body))
+        self.assertEqual(dict(test_hb, processed=1, failed=0),
+                         json.loads(body))
 
     @mock.patch.object(RabbitMQApi, "basic_consume")
     @mock.patch.object(RabbitMQApi, "start_consuming")
@@ -733,6 +734,7 @@ class TestSubstrateNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_websocket_result_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -792,6 +794,7 @@ class TestSubstrateNodeStore(unittest.TestCase):
 
         self.test_store._process_mongo_websocket_error_store(data)
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -811,7 +814,7 @@ class TestSubstrateNodeStore(unittest.TestCase):
         self.assertEqual(2, len(document[node_id][0]))
         self.assertListEqual(expected, actual)
 
-    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoWriteBuffer, "update_one")
     def test_process_mongo_websocket_error_store_stores_correctly_non_down_err(
             self, mongo_update) -> None:
         data = self.node_data_non_down_error['websocket']['error']
@@ -35,6 +35,7 @@ from src.utils.constants.rabbitmq import (STORE_EXCHANGE, HEALTH_CHECK_EXCHANGE,
                                           ALERT_STORE_INPUT_ROUTING_KEY, TOPIC)
 from src.utils.exceptions import (PANICException,
                                   MessageWasNotDeliveredException)
+from src.utils.partitioning import get_partition
 from test.test_utils.utils import (
     connect_to_rabbit, disconnect_from_rabbit, delete_exchange_if_exists,
     delete_queue_if_exists)
@@ -1105,6 +1106,54 @@ class TestAlertStore(unittest.TestCase):
         self.assertFalse(self.redis.hexists(chain_hash_1, metric_key_1))
         self.assertTrue(self.redis.hexists(chain_hash_2, metric_key_2))
 
+    def test_process_redis_store_cosmos_removes_cosmos_metrics_of_partition_only(
+            self) -> None:
+        # First set metrics for nodes in different partitions and check that
+        # they were set in Redis.
+        alert_data_8_2 = copy.deepcopy(self.alert_data_8)
+        alert_data_8_2['origin_id'] = self.origin_id_9
+        alert_data_8_2['metric_state_args'] = [self.origin_id_9]
+        self.assertNotEqual(get_partition(self.origin_id_8, 2),
+                            get_partition(self.origin_id_9, 2))
+
+        chain_hash = Keys.get_hash_parent(self.alert_data_8['parent_id'])
+        metric_keys = []
+        for alert_data in [self.alert_data_8, alert_data_8_2]:
+            self.test_store._process_redis_store(alert_data)
+            metric_key = eval(
+                "Keys.get_alert_{}(*alert_data['metric_state_args'])".format(
+                    alert_data['metric']))
+            self.assertTrue(self.redis.hexists(chain_hash, metric_key))
+            metric_keys.append(metric_key)
+
+        alert_internal_partition = copy.deepcopy(
+            self.alert_internal_cosmos_node)
+        alert_internal_partition['partition'] = get_partition(
+            self.origin_id_8, 2)
+        alert_internal_partition['partitions'] = 2
+        self.test_store._process_redis_store(alert_internal_partition)
+
+        self.assertFalse(self.redis.hexists(chain_hash, metric_keys[0]))
+        self.assertTrue(self.redis.hexists(chain_hash, metric_keys[1]))
+
+    @parameterized.expand([
+        ('alert_cosmos_node1_node_1', None, True,),
+        ('alert_cosmos_node1_node_1', 'node_1', True,),
+        ('alert_cosmos_node1_node_1', 'node_3', False,),
+        ('alert_substrate_node14_node_1_100', 'node_1', True,),
+        ('alert_substrate_node14_node_1_100', 'node_3', False,),
+    ])
+    def test_alert_key_in_partition_only_if_origin_in_the_partition(
+            self, alert_key, partition_key, expected_result) -> None:
+        alert = copy.deepcopy(self.alert_internal_cosmos_node)
+        if partition_key is not None:
+            alert['partition'] = get_partition(partition_key, 8)
+            alert['partitions'] = 8
+        self.assertNotEqual(get_partition('node_1', 8),
+                            get_partition('node_3', 8))
+        self.assertEqual(expected_result,
+                         AlertStore._alert_key_in_partition(alert_key, alert))
+
     def test_process_redis_store_cos_net_removes_all_cos_net_metrics_for_all_chains(
             self) -> None:
         # First set metrics for different chains and check that they were set
@@ -13,6 +13,7 @@ from freezegun import freeze_time
 from parameterized import parameterized
 
 from src.data_store.mongo.mongo_api import MongoApi
+from src.data_store.mongo.mongo_write_buffer import MongoWriteBuffer
 from src.data_store.redis import RedisApi
 from src.data_store.redis.store_keys import Keys
 from src.data_store.stores.system import SystemStore
@@ -718,7 +719,7 @@ class TestSystemStore(unittest.TestCase):
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
-    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoWriteBuffer, "update_one")
     def test_process_mongo_store_calls_update_one(self,
                                                   mock_update_one) -> None:
         self.test_store._process_mongo_result_store(
@@ -731,13 +732,192 @@ class TestSystemStore(unittest.TestCase):
                           self.test_store._process_mongo_store,
                           self.system_data_unexpected)
 
+    def _create_test_store(self, consume_batch_size: int) -> SystemStore:
+        with mock.patch.object(env, "STORE_CONSUME_BATCH_SIZE",
+                               consume_batch_size):
+            return SystemStore(self.test_store_name, self.dummy_logger,
+                               self.rabbitmq)
+
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_ack_when_stored_acks_immediately_if_nothing_is_buffered(
+            self, mock_ack) -> None:
+        self.test_store = self._create_test_store(1)
+
+        self.test_store._ack_when_stored(1)
+
+        mock_ack.assert_called_once_with(1, False)
+        self.assertEqual([], self.test_store._unacked_delivery_tags)
+
+    @mock.patch.object(MongoWriteBuffer, "is_flush_due")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_ack_when_stored_defers_ack_and_schedules_flush_if_not_due(
+            self, mock_ack, mock_is_flush_due) -> None:
+        mock_is_flush_due.return_value = False
+        self.test_store = self._create_test_store(1)
+        self.test_store.rabbitmq._connection = mock.MagicMock()
+        self.test_store._process_mongo_result_store(
+            self.system_data_1['result'])
+
+        self.test_store._ack_when_stored(1)
+        self.test_store._ack_when_stored(2)
+
+        mock_ack.assert_not_called()
+        self.assertEqual([1, 2], self.test_store._unacked_delivery_tags)
+        self.test_store.rabbitmq.connection.call_later.assert_called_once_with(
+            env.STORE_MONGO_FLUSH_INTERVAL_SECONDS,
+            self.test_store._flush_write_buffers_if_any)
+
+    @mock.patch.object(MongoApi, "bulk_write")
+    @mock.patch.object(MongoWriteBuffer, "is_flush_due")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_ack_when_stored_acks_deliveries_once_buffer_is_written(
+            self, mock_ack, mock_is_flush_due, mock_bulk_write) -> None:
+        mock_is_flush_due.return_value = False
+        mock_bulk_write.return_value = mock.MagicMock()
+        self.test_store = self._create_test_store(1)
+        self.test_store.rabbitmq._connection = mock.MagicMock()
+        self.test_store._process_mongo_result_store(
+            self.system_data_1['result'])
+        self.test_store._ack_when_stored(1)
+        self.test_store._process_mongo_result_store(
+            self.system_data_2['result'])
+        mock_is_flush_due.return_value = True
+
+        self.test_store._ack_when_stored(2)
+
+        mock_bulk_write.assert_called_once()
+        mock_ack.assert_called_once_with(2, True)
+        self.assertEqual([], self.test_store._unacked_delivery_tags)
+        self.assertTrue(self.test_store.mongo_write_buffer.is_empty())
+
+    @mock.patch.object(MongoApi, "bulk_write")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_ack_when_stored_does_not_ack_if_buffer_is_not_written(
+            self, mock_ack, mock_bulk_write) -> None:
+        mock_bulk_write.return_value = None
+        self.test_store = self._create_test_store(1)
+        self.test_store.rabbitmq._connection = mock.MagicMock()
+        self.test_store._process_mongo_result_store(
+            self.system_data_1['result'])
+
+        self.test_store._ack_when_stored(1)
+
+        mock_bulk_write.assert_called_once()
+        mock_ack.assert_not_called()
+        self.assertEqual([1], self.test_store._unacked_delivery_tags)
+        self.assertFalse(self.test_store.mongo_write_buffer.is_empty())
+        self.assertTrue(self.test_store._flush_scheduled)
+
+    @mock.patch.object(RedisApi, "hset_multiple")
+    def test_redis_writes_are_sent_immediately_if_not_batch_consuming(
+            self, mock_hset_multiple) -> None:
+        self.test_store = self._create_test_store(1)
+
+        self.test_store._process_redis_result_store(
+            self.system_data_1['result'])
+
+        mock_hset_multiple.assert_called_once()
+        self.assertTrue(self.test_store.redis_write_buffer.is_empty())
+
+    @mock.patch.object(MongoApi, "bulk_write")
+    @mock.patch.object(RedisApi, "hset_multiple_hashes")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_batch_consuming_writes_and_acks_batch_once_it_is_complete(
+            self, mock_ack, mock_hset_multiple_hashes,
+            mock_bulk_write) -> None:
+        mock_hset_multiple_hashes.return_value = []
+        mock_bulk_write.return_value = mock.MagicMock()
+        self.test_store = self._create_test_store(3)
+        self.test_store.rabbitmq._connection = mock.MagicMock()
+
+        for delivery_tag in range(1, 4):
+            self.test_store._process_redis_store(self.system_data_1)
+            self.test_store._process_mongo_store(self.system_data_1)
+            self.test_store._ack_when_stored(delivery_tag)
+            if delivery_tag < 3:
+                mock_hset_multiple_hashes.assert_not_called()
+                mock_bulk_write.assert_not_called()
+                mock_ack.assert_not_called()
+
+        mock_hset_multiple_hashes.assert_called_once()
+        mock_bulk_write.assert_called_once()
+        mock_ack.assert_called_once_with(3, True)
+        self.assertEqual([], self.test_store._unacked_delivery_tags)
+        self.test_store.rabbitmq.connection.call_later.assert_called_once_with(
+            env.STORE_CONSUME_BATCH_TIMEOUT_MS / 1000,
+            self.test_store._flush_write_buffers_if_any)
+
+    @mock.patch.object(MongoApi, "bulk_write")
+    @mock.patch.object(RedisApi, "hset_multiple_hashes")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_batch_consuming_writes_incomplete_batch_when_timer_fires(
+            self, mock_ack, mock_hset_multiple_hashes,
+            mock_bulk_write) -> None:
+        mock_hset_multiple_hashes.return_value = []
+        mock_bulk_write.return_value = mock.MagicMock()
+        self.test_store = self._create_test_store(3)
+        self.test_store.rabbitmq._connection = mock.MagicMock()
+        self.test_store._process_redis_store(self.system_data_1)
+        self.test_store._ack_when_stored(1)
+
+        self.test_store._flush_write_buffers_if_any()
+
+        mock_hset_multiple_hashes.assert_called_once()
+        mock_bulk_write.assert_not_called()
+        mock_ack.assert_called_once_with(1, True)
+        self.assertFalse(self.test_store._flush_scheduled)
+
+    @mock.patch.object(RedisApi, "hset_multiple_hashes")
+    @mock.patch.object(RabbitMQApi, "basic_ack")
+    def test_batch_consuming_retries_later_if_batch_is_not_written(
+            self, mock_ack, mock_hset_multiple_hashes) -> None:
+        mock_hset_multiple_hashes.return_value = None
+        self.test_store = self._create_test_store(3)
+        self.test_store.rabbitmq._connection = mock.MagicMock()
+        self.test_store._process_redis_store(self.system_data_1)
+        self.test_store._ack_when_stored(1)
+
+        self.test_store._flush_write_buffers_if_any()
+
+        mock_ack.assert_not_called()
+        self.assertEqual([1], self.test_store._unacked_delivery_tags)
+        self.assertFalse(self.test_store.redis_write_buffer.is_empty())
+        self.assertTrue(self.test_store._flush_scheduled)
+        self.assertEqual(
+            2, self.test_store.rabbitmq.connection.call_later.call_count)
+
+    @mock.patch.object(SystemStore, "_listen_for_data")
+    @mock.patch.object(SystemStore, "_initialise_rabbitmq")
+    @mock.patch.object(RedisApi, "hset_multiple_hashes")
+    def test_start_discards_write_batch_of_previous_channel(
+            self, mock_hset_multiple_hashes, mock_initialise_rabbitmq,
+            mock_listen_for_data) -> None:
+        mock_hset_multiple_hashes.return_value = None
+        mock_initialise_rabbitmq.return_value = None
+        mock_listen_for_data.side_effect = \
+            pika.exceptions.AMQPConnectionError('test')
+        self.test_store = self._create_test_store(3)
+        self.test_store.rabbitmq._connection = mock.MagicMock()
+        self.test_store._process_redis_store(self.system_data_1)
+        self.test_store._process_mongo_store(self.system_data_1)
+        self.test_store._ack_when_stored(1)
+        self.test_store._flush_write_buffers_if_any()
+
+        self.assertRaises(pika.exceptions.AMQPConnectionError,
+                          self.test_store.start)
+
+        self.assertEqual([], self.test_store._unacked_delivery_tags)
+        self.assertFalse(self.test_store._flush_scheduled)
+        self.assertTrue(self.test_store.redis_write_buffer.is_empty())
+        self.assertTrue(self.test_store.mongo_write_buffer.is_empty())
+
     @parameterized.expand([
         ("self.system_data_1",),
         ("self.system_data_2",),
         ("self.system_data_3",),
     ])
     @freeze_time("2012-01-01")
-    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoWriteBuffer, "update_one")
     def test_process_mongo_result_store_calls_mongo_correctly(
             self, mock_system_data, mock_update_one) -> None:
         data = eval(mock_system_data)
@@ -798,7 +978,7 @@ class TestSystemStore(unittest.TestCase):
                 autospec=True)
     @mock.patch("src.data_store.stores.system.SystemStore._process_redis_store",
                 autospec=True)
-    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoWriteBuffer, "update_one")
     def test_process_data_calls_mongo_correctly(
             self, mock_system_data, mock_update_one, mock_process_redis_store,
             mock_send_hb, mock_ack) -> None:
@@ -872,7 +1052,7 @@ class TestSystemStore(unittest.TestCase):
             self.fail("Test failed: {}".format(e))
 
     @freeze_time("2012-01-01")
-    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoWriteBuffer, "update_one")
     def test_process_mongo_error_store_calls_mongo_correctly(
             self, mock_update_one) -> None:
 
@@ -906,7 +1086,7 @@ class TestSystemStore(unittest.TestCase):
                 autospec=True)
     @mock.patch("src.data_store.stores.system.SystemStore._process_redis_store",
                 autospec=True)
-    @mock.patch.object(MongoApi, "update_one")
+    @mock.patch.object(MongoWriteBuffer, "update_one")
     def test_process_data_calls_mongo_correctly_on_error_data(
             self, mock_update_one, mock_process_redis_store,
             mock_send_hb, mock_ack) -> None:
@@ -970,6 +1150,7 @@ class TestSystemStore(unittest.TestCase):
         parent_id = meta_data['system_parent_id']
         metrics = data['result']['data']
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
@@ -1022,6 +1203,7 @@ class TestSystemStore(unittest.TestCase):
         parent_id = meta_data['system_parent_id']
         metrics = data['error']['data']
 
+        self.test_store.mongo_write_buffer.flush(self.test_store.mongo)
         documents = self.mongo.get_all(parent_id)
         document = documents[0]
         expected = [
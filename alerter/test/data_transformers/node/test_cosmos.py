@@ -1,6 +1,7 @@
 import copy
 import json
 import logging
+import tracemalloc
 import unittest
 from datetime import datetime, timedelta
 from queue import Queue
@@ -841,7 +842,8 @@ class TestCosmosNodeDataTransformer(unittest.TestCase):
         # Check that the message received is actually the HB
         _, _, body = self.test_data_transformer.rabbitmq.basic_get(
             self.test_queue_name)
-        self.assertEqual(self.test_heartbeat, json.loads(body))
+        self.assertEqual(dict(self.test_heartbeat, processed=1, failed=0),
+                         json.loads(body))
 
     def test_load_state_successful_if_node_exists_in_redis_and_redis_online(
             self) -> None:
@@ -1239,6 +1241,57 @@ class TestCosmosNodeDataTransformer(unittest.TestCase):
             expected_data_for_saving,
             self.test_data_transformer.publishing_queue.queue[1])
 
+    @parameterized.expand([
+        ('self.raw_data_example_result_all',),
+        ('self.raw_data_example_result_options_None',),
+        ('self.raw_data_example_general_error',),
+        ('self.raw_data_example_downtime_error',),
+    ])
+    def test_transform_data_does_not_modify_raw_data(self, raw_data) -> None:
+        self.test_data_transformer._state = copy.deepcopy(self.test_state)
+        data = eval(raw_data)
+        expected_data = copy.deepcopy(data)
+
+        transformed_data, data_for_alerting, data_for_saving = \
+            self.test_data_transformer._transform_data(data)
+        self.test_data_transformer._place_latest_data_on_queue(
+            data_for_alerting, data_for_saving)
+
+        self.assertEqual(expected_data, data)
+
+    def test_transform_data_allocations_per_message_are_bounded(self) -> None:
+        # A message with a large historical list is transformed and queued.
+        # Since the raw data is shared rather than copied, the memory allocated
+        # while doing so must be a small fraction of that of a single copy of
+        # the message, regardless of the size of the historical list.
+        self.test_data_transformer._state = copy.deepcopy(self.test_state)
+        data = copy.deepcopy(self.raw_data_example_result_all)
+        data['tendermint_rpc']['result']['data']['historical'] = [
+            {
+                'height': height,
+                'active_in_prev_block': False,
+                'signed_prev_block': True,
+                'slashed': False,
+                'slashed_amount': None
+            } for height in range(10000)
+        ]
+
+        tracemalloc.start()
+        try:
+            copy.deepcopy(data)
+            _, copy_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            _, data_for_alerting, data_for_saving = \
+                self.test_data_transformer._transform_data(data)
+            self.test_data_transformer._place_latest_data_on_queue(
+                data_for_alerting, data_for_saving)
+            _, transform_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(transform_peak - start, copy_peak / 20)
+
     @parameterized.expand([
         ({
              'prometheus': {
@@ -618,7 +618,8 @@ class TestSubstrateNodeDataTransformer(unittest.TestCase):
         # Check that the message received is actually the HB
         _, _, body = self.test_data_transformer.rabbitmq.basic_get(
             self.test_queue_name)
-        self.assertEqual(self.test_heartbeat, json.loads(body))
+        self.assertEqual(dict(self.test_heartbeat, processed=1, failed=0),
+                         json.loads(body))
 
     def test_load_state_successful_if_node_exists_in_redis_and_redis_online(
             self) -> None:
@@ -398,7 +398,8 @@ class TestGitHubDataTransformer(unittest.TestCase):
             # Check that the message received is actually the HB
             _, _, body = self.test_data_transformer.rabbitmq.basic_get(
                 self.test_rabbit_queue_name)
-            self.assertEqual(self.test_heartbeat, json.loads(body))
+            self.assertEqual(dict(self.test_heartbeat, processed=1, failed=0),
+                             json.loads(body))
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
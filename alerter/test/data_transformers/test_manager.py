@@ -129,6 +129,11 @@ class TestDataTransformersManager(unittest.TestCase):
     def test_manager_name_returns_manager_name(self) -> None:
         self.assertEqual(self.manager_name, self.test_manager.name)
 
+    def test_partitions_returns_partitions(self) -> None:
+        self.assertEqual(1, self.test_manager.partitions)
+        self.test_manager._partitions = 3
+        self.assertEqual(3, self.test_manager.partitions)
+
     def test_transformer_process_dict_returns_transformer_process_dict(
             self) -> None:
         self.test_manager._transformer_process_dict = \
@@ -295,6 +300,47 @@ class TestDataTransformersManager(unittest.TestCase):
 
         self.assertEqual(10, mock_start.call_count)
 
+    @parameterized.expand([
+        (SYSTEM_DATA_TRANSFORMER_NAME, start_system_data_transformer,),
+        (CL_NODE_DATA_TRANSFORMER_NAME, start_chainlink_node_data_transformer,),
+        (EVM_NODE_DATA_TRANSFORMER_NAME, start_evm_node_data_transformer,),
+        (COSMOS_NODE_DATA_TRANSFORMER_NAME,
+         start_cosmos_node_data_transformer,),
+        (SUBSTRATE_NODE_DATA_TRANSFORMER_NAME,
+         start_substrate_node_data_transformer,),
+    ])
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_start_transformers_processes_starts_a_process_per_partition(
+            self, data_trans_name, data_trans_starter, mock_start) -> None:
+        mock_start.return_value = None
+        self.test_manager._partitions = 3
+
+        self.test_manager._start_transformers_processes()
+
+        # The 5 un-partitioned transformers are started once, and the 5
+        # partitioned transformers are started once per partition
+        self.assertEqual(20, mock_start.call_count)
+        self.assertNotIn(data_trans_name,
+                         self.test_manager.transformer_process_dict)
+        for partition in range(3):
+            data_trans_process = self.test_manager.transformer_process_dict[
+                '{} (partition {})'.format(data_trans_name, partition)]
+            self.assertTrue(data_trans_process.daemon)
+            self.assertEqual((partition,), data_trans_process._args)
+            self.assertEqual(data_trans_starter, data_trans_process._target)
+
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_start_transformers_processes_does_not_partition_unpartitioned(
+            self, mock_start) -> None:
+        mock_start.return_value = None
+        self.test_manager._partitions = 3
+
+        self.test_manager._start_transformers_processes()
+
+        data_trans_process = self.test_manager.transformer_process_dict[
+            COSMOS_NETWORK_DATA_TRANSFORMER_NAME]
+        self.assertEqual(0, len(data_trans_process._args))
+
     @mock.patch.object(multiprocessing, "Process")
     @mock.patch.object(multiprocessing.Process, "is_alive")
     @mock.patch.object(multiprocessing.Process, "start")
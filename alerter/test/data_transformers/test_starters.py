@@ -323,6 +323,40 @@ class TestDataTransformersStarters(unittest.TestCase):
         self.assertEqual(eval(expected_data_transformer).__dict__,
                          actual_output.__dict__)
 
+    @parameterized.expand([
+        (None, None,),
+        (2, 2,),
+    ])
+    @mock.patch("src.data_transformers.starters._initialise_transformer_logger")
+    @mock.patch("src.data_transformers.starters._initialise_transformer_redis")
+    @mock.patch('src.data_transformers.starters.RabbitMQApi')
+    def test_initialise_data_transformer_sets_partition_of_data_transformer(
+            self, partition, expected_partition, mock_rabbit, mock_init_redis,
+            mock_init_logger) -> None:
+        mock_init_logger.return_value = self.dummy_logger
+        mock_init_redis.return_value = self.redis
+        mock_rabbit.return_value = self.rabbitmq
+        mock_rabbit.__name__ = RabbitMQApi.__name__
+
+        actual_output = _initialise_data_transformer(
+            CosmosNodeDataTransformer, self.cosmos_node_dt_name, partition)
+
+        self.assertEqual(expected_partition, actual_output.partition)
+
+    @mock.patch("src.data_transformers.starters._initialise_data_transformer")
+    @mock.patch('src.data_transformers.starters.start_transformer')
+    def test_start_cosmos_node_data_transformer_starts_partition_if_given(
+            self, mock_start_transformer, mock_initialise_dt) -> None:
+        mock_start_transformer.return_value = None
+        mock_initialise_dt.return_value = self.test_cosmos_node_dt
+
+        start_cosmos_node_data_transformer(2)
+
+        mock_start_transformer.assert_called_once_with(self.test_cosmos_node_dt)
+        mock_initialise_dt.assert_called_once_with(
+            CosmosNodeDataTransformer,
+            '{} (partition 2)'.format(COSMOS_NODE_DATA_TRANSFORMER_NAME), 2)
+
     @mock.patch("src.data_transformers.starters._initialise_data_transformer")
     @mock.patch('src.data_transformers.starters.start_transformer')
     def test_start_system_data_transformer_calls_sub_functions_correctly(
@@ -333,8 +367,8 @@ class TestDataTransformersStarters(unittest.TestCase):
         start_system_data_transformer()
 
         mock_start_transformer.assert_called_once_with(self.test_system_dt)
-        mock_initialise_dt.assert_called_once_with(SystemDataTransformer,
-                                                   SYSTEM_DATA_TRANSFORMER_NAME)
+        mock_initialise_dt.assert_called_once_with(
+            SystemDataTransformer, SYSTEM_DATA_TRANSFORMER_NAME, None)
 
     @mock.patch("src.data_transformers.starters._initialise_data_transformer")
     @mock.patch('src.data_transformers.starters.start_transformer')
@@ -360,7 +394,7 @@ class TestDataTransformersStarters(unittest.TestCase):
 
         mock_start_transformer.assert_called_once_with(self.test_cl_node_dt)
         mock_initialise_dt.assert_called_once_with(
-            ChainlinkNodeDataTransformer, CL_NODE_DATA_TRANSFORMER_NAME)
+            ChainlinkNodeDataTransformer, CL_NODE_DATA_TRANSFORMER_NAME, None)
 
     @mock.patch("src.data_transformers.starters._initialise_data_transformer")
     @mock.patch('src.data_transformers.starters.start_transformer')
@@ -373,7 +407,7 @@ class TestDataTransformersStarters(unittest.TestCase):
 
         mock_start_transformer.assert_called_once_with(self.test_evm_node_dt)
         mock_initialise_dt.assert_called_once_with(
-            EVMNodeDataTransformer, EVM_NODE_DATA_TRANSFORMER_NAME)
+            EVMNodeDataTransformer, EVM_NODE_DATA_TRANSFORMER_NAME, None)
 
     @mock.patch("src.data_transformers.starters._initialise_data_transformer")
     @mock.patch('src.data_transformers.starters.start_transformer')
@@ -401,7 +435,8 @@ class TestDataTransformersStarters(unittest.TestCase):
 
         mock_start_transformer.assert_called_once_with(self.test_cosmos_node_dt)
         mock_initialise_dt.assert_called_once_with(
-            CosmosNodeDataTransformer, COSMOS_NODE_DATA_TRANSFORMER_NAME)
+            CosmosNodeDataTransformer, COSMOS_NODE_DATA_TRANSFORMER_NAME,
+            None)
 
     @mock.patch("src.data_transformers.starters._initialise_data_transformer")
     @mock.patch('src.data_transformers.starters.start_transformer')
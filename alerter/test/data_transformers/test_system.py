@@ -26,6 +26,7 @@ from src.utils.constants.rabbitmq import (
 from src.utils.exceptions import (PANICException, SystemIsDownException,
                                   ReceivedUnexpectedDataException,
                                   MessageWasNotDeliveredException)
+from src.utils.partitioning import get_partition
 from test.test_utils.utils import save_system_to_redis
 
 
@@ -412,6 +413,11 @@ class TestSystemDataTransformer(unittest.TestCase):
         self.assertEqual(self.transformer_name,
                          self.test_data_transformer.transformer_name)
 
+    def test_partition_returns_transformer_partition(self) -> None:
+        self.assertIsNone(self.test_data_transformer.partition)
+        self.test_data_transformer._partition = 2
+        self.assertEqual(2, self.test_data_transformer.partition)
+
     def test_redis_returns_transformer_redis_instance(self) -> None:
         self.assertEqual(self.redis, self.test_data_transformer.redis)
 
@@ -436,6 +442,31 @@ class TestSystemDataTransformer(unittest.TestCase):
         self.test_data_transformer._listen_for_data()
         mock_start_consuming.assert_called_once()
 
+    @mock.patch.object(RabbitMQApi, "basic_consume")
+    @mock.patch.object(RabbitMQApi, "basic_qos")
+    @mock.patch.object(RabbitMQApi, "queue_bind")
+    @mock.patch.object(RabbitMQApi, "queue_declare")
+    @mock.patch.object(RabbitMQApi, "exchange_declare")
+    @mock.patch.object(RabbitMQApi, "confirm_delivery")
+    @mock.patch.object(RabbitMQApi, "connect_till_successful")
+    def test_initialise_rabbit_consumes_from_partition_queue_if_partitioned(
+            self, mock_connect, mock_confirm_delivery, mock_exchange_declare,
+            mock_queue_declare, mock_queue_bind, mock_basic_qos,
+            mock_basic_consume) -> None:
+        self.test_data_transformer._partition = 2
+        partition_queue_name = '{}_2'.format(SYSTEM_DT_INPUT_QUEUE_NAME)
+
+        self.test_data_transformer._initialise_rabbitmq()
+
+        mock_queue_declare.assert_called_once_with(
+            partition_queue_name, False, True, False, False)
+        mock_queue_bind.assert_called_once_with(
+            partition_queue_name, RAW_DATA_EXCHANGE,
+            '{}.2'.format(SYSTEM_RAW_DATA_ROUTING_KEY))
+        mock_basic_consume.assert_called_once_with(
+            partition_queue_name, self.test_data_transformer._process_raw_data,
+            False, False, None)
+
     @mock.patch.object(RabbitMQApi, "basic_qos")
     def test_initialise_rabbit_initializes_everything_as_expected(
             self, mock_basic_qos) -> None:
@@ -542,7 +573,8 @@ class TestSystemDataTransformer(unittest.TestCase):
             # Check that the message received is actually the HB
             _, _, body = self.test_data_transformer.rabbitmq.basic_get(
                 self.test_rabbit_queue_name)
-            self.assertEqual(self.test_heartbeat, json.loads(body))
+            self.assertEqual(dict(self.test_heartbeat, processed=1, failed=0),
+                             json.loads(body))
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
@@ -715,6 +747,43 @@ class TestSystemDataTransformer(unittest.TestCase):
         # Clean test db
         self.redis.delete_all()
 
+    def test_load_states_loads_all_systems_in_one_redis_call(self) -> None:
+        # Clean test db
+        self.redis.delete_all()
+
+        # Save the state of two systems of the same parent to Redis first
+        other_system = System('other_system', 'other_system_id',
+                              self.test_system_parent_id)
+        other_system.set_last_monitored(self.test_last_monitored + 60)
+        other_system.set_system_cpu_usage(self.test_system_cpu_usage + 1)
+        save_system_to_redis(self.redis, self.test_system)
+        save_system_to_redis(self.redis, other_system)
+
+        # Reset the systems to default values to detect the loading
+        self.test_system.reset()
+        other_system.reset()
+
+        with mock.patch.object(
+                RedisApi, 'hmget_multiple_hashes',
+                wraps=self.test_data_transformer.redis.hmget_multiple_hashes) \
+                as mock_hmget_multiple_hashes:
+            loaded_systems = self.test_data_transformer.load_states(
+                [self.test_system, other_system])
+
+        mock_hmget_multiple_hashes.assert_called_once()
+        self.assertEqual([self.test_system, other_system], loaded_systems)
+        self.assertEqual(self.test_last_monitored,
+                         loaded_systems[0].last_monitored)
+        self.assertEqual(self.test_system_cpu_usage,
+                         loaded_systems[0].system_cpu_usage)
+        self.assertEqual(self.test_last_monitored + 60,
+                         loaded_systems[1].last_monitored)
+        self.assertEqual(self.test_system_cpu_usage + 1,
+                         loaded_systems[1].system_cpu_usage)
+
+        # Clean test db
+        self.redis.delete_all()
+
     def test_update_state_raises_unexpected_data_exception_if_no_result_or_err(
             self) -> None:
         self.assertRaises(ReceivedUnexpectedDataException,
@@ -987,6 +1056,27 @@ class TestSystemDataTransformer(unittest.TestCase):
             expected_data_for_saving,
             self.test_data_transformer.publishing_queue.queue[1])
 
+    @parameterized.expand([
+        ('self.transformed_data_example_result',),
+        ('self.transformed_data_example_downtime_error',),
+    ])
+    def test_place_latest_data_on_queue_sends_data_to_alerter_partition(
+            self, data: str) -> None:
+        with mock.patch.object(env, 'ALERTER_PARTITIONS', 4):
+            self.test_data_transformer._place_latest_data_on_queue(
+                eval(data), eval(data), eval(data))
+
+        expected_routing_key = '{}.{}'.format(
+            SYSTEM_TRANSFORMED_DATA_ROUTING_KEY,
+            get_partition(self.test_system_id, 4))
+        self.assertEqual(2, self.test_data_transformer.publishing_queue.qsize())
+        self.assertEqual(
+            expected_routing_key,
+            self.test_data_transformer.publishing_queue.queue[0]['routing_key'])
+        self.assertEqual(
+            SYSTEM_TRANSFORMED_DATA_ROUTING_KEY,
+            self.test_data_transformer.publishing_queue.queue[1]['routing_key'])
+
     @parameterized.expand([({}, False,), ('self.test_state', True), ])
     @mock.patch.object(SystemDataTransformer, "_transform_data")
     @mock.patch.object(RabbitMQApi, "basic_ack")
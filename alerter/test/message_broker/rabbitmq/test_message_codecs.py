@@ -0,0 +1,78 @@
+import json
+import unittest
+
+import msgpack
+import pika
+from parameterized import parameterized
+
+from src.message_broker.rabbitmq.message_codecs import (
+    JSON_MESSAGE_CODEC, MSGPACK_MESSAGE_CODEC, JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE, get_message_codec, decode_message)
+
+
+class TestMessageCodecs(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_message = {
+            'result': {
+                'meta_data': {
+                    'node_name': 'test_node', 'node_id': 'test_node_id',
+                    'last_monitored': 1643109283.9231, 'is_validator': True,
+                },
+                'data': {
+                    'current_height': 9530000, 'went_down_at': None,
+                    'missed_heights': [9529998, 9529999],
+                },
+            }
+        }
+
+    def tearDown(self) -> None:
+        self.test_message = None
+
+    @parameterized.expand([
+        ('json', JSON_MESSAGE_CODEC, JSON_CONTENT_TYPE),
+        ('msgpack', MSGPACK_MESSAGE_CODEC, MSGPACK_CONTENT_TYPE),
+        (' MsgPack ', MSGPACK_MESSAGE_CODEC, MSGPACK_CONTENT_TYPE),
+    ])
+    def test_get_message_codec_returns_the_codec_with_the_name(
+            self, name, expected_codec, expected_content_type) -> None:
+        codec = get_message_codec(name)
+        self.assertIs(expected_codec, codec)
+        self.assertEqual(expected_content_type, codec.content_type)
+
+    def test_get_message_codec_raises_value_error_if_name_unknown(self) -> None:
+        self.assertRaises(ValueError, get_message_codec, 'protobuf')
+
+    @parameterized.expand([(JSON_MESSAGE_CODEC,), (MSGPACK_MESSAGE_CODEC,)])
+    def test_codec_decodes_the_message_it_encodes(self, codec) -> None:
+        body = codec.encode(self.test_message)
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(self.test_message, codec.decode(body))
+
+    def test_msgpack_codec_encodes_smaller_messages_than_json(self) -> None:
+        self.assertLess(len(MSGPACK_MESSAGE_CODEC.encode(self.test_message)),
+                        len(JSON_MESSAGE_CODEC.encode(self.test_message)))
+
+    def test_msgpack_codec_decodes_non_string_keys_as_json_does(self) -> None:
+        message = {'amount_map': {4500: 50.4, 4499.5: None, True: 1,
+                                  None: 2}, 'name': 'test'}
+        self.assertEqual(
+            json.loads(JSON_MESSAGE_CODEC.encode(message)),
+            MSGPACK_MESSAGE_CODEC.decode(MSGPACK_MESSAGE_CODEC.encode(message)))
+
+    def test_msgpack_codec_raises_overflow_error_if_integer_too_large(
+            self) -> None:
+        self.assertRaises(OverflowError, MSGPACK_MESSAGE_CODEC.encode,
+                          {'balance': 2 ** 70})
+
+    @parameterized.expand([
+        (pika.BasicProperties(content_type=MSGPACK_CONTENT_TYPE),
+         msgpack.packb),
+        (pika.BasicProperties(content_type=JSON_CONTENT_TYPE), json.dumps),
+        (pika.BasicProperties(), json.dumps),
+        (pika.BasicProperties(content_type='text/plain'), json.dumps),
+        (None, json.dumps),
+    ])
+    def test_decode_message_decodes_according_to_the_content_type(
+            self, properties, encode) -> None:
+        self.assertEqual(self.test_message,
+                         decode_message(properties, encode(self.test_message)))
@@ -4,10 +4,16 @@ from typing import List, Any, Optional, Union
 from unittest import TestCase, mock
 from unittest.mock import MagicMock, PropertyMock
 
+import inspect
+
+import pika.channel
 import pika.exceptions
 from parameterized import parameterized
+from pika.adapters.blocking_connection import BlockingChannel
 
 from src.message_broker.rabbitmq import RabbitMQApi
+from src.message_broker.rabbitmq.message_codecs import (
+    JSON_MESSAGE_CODEC, MSGPACK_MESSAGE_CODEC, get_message_codec)
 from src.utils import env
 from src.utils.exceptions import (
     ConnectionNotInitialisedException, BlankCredentialException,
@@ -1433,3 +1439,334 @@ class TestRabbitMQApi(TestCase):
         self.assertIsNone(self.rabbit.perform_operation_till_successful(
             test_function, [retries], -1
         ))
+
+    def _confirm_delivery_asynchronously(self) -> None:
+        # Puts a mock channel in asynchronous confirm mode, with the broker
+        # replying Confirm.SelectOk straight away.
+        self.rabbit = RabbitMQApi(
+            self.rabbit_logger, self.rabbit_ip, self.rabbit_port, self.username,
+            self.password, self.connection_check_time_interval,
+            publisher_confirm_window=3
+        )
+        self.rabbit._connection = MagicMock()
+        self.rabbit._channel = MagicMock()
+        self.rabbit._channel._impl = MagicMock(spec=pika.channel.Channel)
+        self.rabbit._channel._impl.confirm_delivery.side_effect = \
+            lambda ack_nack_callback, callback: callback(MagicMock())
+        self.rabbit.confirm_delivery()
+
+    @staticmethod
+    def _confirmation_frame(method_class: Any, delivery_tag: int,
+                            multiple: bool = False) -> pika.frame.Method:
+        return pika.frame.Method(1, method_class(delivery_tag=delivery_tag,
+                                                 multiple=multiple))
+
+    def _return_message(self, delivery_tag: int) -> None:
+        # Returns the message published with the given delivery tag as
+        # unroutable
+        self.rabbit._on_message_returned(
+            self.rabbit.channel._impl, pika.spec.Basic.Return(),
+            pika.BasicProperties(message_id=str(delivery_tag)),
+            self.TEST_BODY_TEXT.encode())
+
+    def test_publisher_confirm_window_is_1_by_default(self) -> None:
+        self.assertEqual(1, self.rabbit.publisher_confirm_window)
+
+    @mock.patch.object(RabbitMQApi, "channel", new_callable=PropertyMock)
+    @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
+    @mock.patch.object(RabbitMQApi, "_safe", autospec=True)
+    def test_confirm_delivery_confirms_asynchronously_if_window_above_1(
+            self, mock_safe: MagicMock, mock_connection_initialised: MagicMock,
+            mock_channel: PropertyMock
+    ) -> None:
+        self.rabbit._publisher_confirm_window = 2
+        mock_safe.return_value = None
+        mock_connection_initialised.return_value = True
+
+        self.assertIsNone(self.rabbit.confirm_delivery())
+
+        mock_safe.assert_called_once_with(
+            self.rabbit, self.rabbit._confirm_delivery_asynchronously_unsafe,
+            [], -1
+        )
+        mock_channel.return_value.confirm_delivery.assert_not_called()
+
+    def test_confirm_delivery_asynchronously_registers_callbacks(self) -> None:
+        self._confirm_delivery_asynchronously()
+
+        channel_impl = self.rabbit.channel._impl
+        channel_impl.add_on_return_callback.assert_called_once_with(
+            self.rabbit._on_message_returned)
+        self.assertEqual(
+            self.rabbit._on_delivery_confirmation,
+            channel_impl.confirm_delivery.call_args.kwargs['ack_nack_callback'])
+        self.rabbit.channel.confirm_delivery.assert_not_called()
+        self.assertEqual(1, self.rabbit._next_delivery_tag)
+
+    def test_pika_blocking_channel_wraps_the_asynchronous_channel(
+            self) -> None:
+        # Covers the pika internals which asynchronous confirms depend on, so
+        # that a pika upgrade which changes them is noticed
+        channel_impl = pika.channel.Channel(MagicMock(), 1, lambda *_: None)
+        self.rabbit._channel = BlockingChannel(channel_impl, MagicMock())
+
+        self.assertIs(channel_impl, self.rabbit._get_asynchronous_channel())
+        self.assertTrue({'ack_nack_callback', 'callback'}.issubset(
+            inspect.signature(channel_impl.confirm_delivery).parameters))
+        self.assertIn('callback', inspect.signature(
+            channel_impl.add_on_return_callback).parameters)
+        self.assertIn('waiters', inspect.signature(
+            BlockingChannel._flush_output).parameters)
+
+    def test_confirm_delivery_waits_for_each_publish_if_no_async_channel(
+            self) -> None:
+        self.rabbit._publisher_confirm_window = 3
+        self.rabbit._connection = MagicMock()
+        self.rabbit._channel = MagicMock(spec=BlockingChannel)
+
+        self.rabbit._confirm_delivery_asynchronously_unsafe()
+
+        self.rabbit.channel.confirm_delivery.assert_called_once_with()
+        self.assertEqual(1, self.rabbit.publisher_confirm_window)
+        self.assertFalse(self.rabbit._is_confirming_asynchronously())
+
+    def test_basic_publish_async_returns_consecutive_delivery_tags(
+            self) -> None:
+        self._confirm_delivery_asynchronously()
+
+        self.assertEqual(1, self.rabbit.basic_publish_async(
+            "TEST_EXCHANGE", self.TEST_ROUTING_KEY, {'a': 1}, True))
+        # Messages whose confirmation is not awaited are still numbered by the
+        # broker
+        self.assertIsNone(self.rabbit.basic_publish(
+            "TEST_EXCHANGE", self.TEST_ROUTING_KEY, self.TEST_BODY_TEXT))
+        self.assertEqual(3, self.rabbit.basic_publish_async(
+            "TEST_EXCHANGE", self.TEST_ROUTING_KEY, self.TEST_BODY_TEXT))
+
+        self.assertEqual({1, 3}, self.rabbit._unconfirmed_delivery_tags)
+        self.rabbit.channel.basic_publish.assert_has_calls([
+            mock.call("TEST_EXCHANGE", self.TEST_ROUTING_KEY,
+                      self.rabbit.message_codec.encode({'a': 1}),
+                      pika.BasicProperties(
+                          content_type=self.rabbit.message_codec.content_type),
+                      False),
+            mock.call("TEST_EXCHANGE", self.TEST_ROUTING_KEY,
+                      self.TEST_BODY_TEXT, None, False),
+            mock.call("TEST_EXCHANGE", self.TEST_ROUTING_KEY,
+                      self.TEST_BODY_TEXT, None, False),
+        ])
+
+    def test_on_delivery_confirmation_records_acks_nacks_and_returns(
+            self) -> None:
+        self._confirm_delivery_asynchronously()
+        for _ in range(5):
+            self.rabbit.basic_publish_async(
+                "TEST_EXCHANGE", self.TEST_ROUTING_KEY, self.TEST_BODY_TEXT)
+
+        self.rabbit._on_delivery_confirmation(
+            self._confirmation_frame(pika.spec.Basic.Ack, 2, True))
+        self.rabbit._on_delivery_confirmation(
+            self._confirmation_frame(pika.spec.Basic.Nack, 3))
+        self._return_message(4)
+        self.rabbit._on_delivery_confirmation(
+            self._confirmation_frame(pika.spec.Basic.Ack, 4))
+
+        self.assertEqual({1: True, 2: True, 3: False, 4: False},
+                         self.rabbit._delivery_confirmations)
+        self.assertEqual({5}, self.rabbit._unconfirmed_delivery_tags)
+        self.assertEqual(set(), self.rabbit._returned_delivery_tags)
+
+    def test_on_delivery_confirmation_multiple_ack_marks_returned_message(
+            self) -> None:
+        self._confirm_delivery_asynchronously()
+        for _ in range(3):
+            self.rabbit.basic_publish_async(
+                "TEST_EXCHANGE", self.TEST_ROUTING_KEY, self.TEST_BODY_TEXT,
+                mandatory=True)
+
+        self._return_message(2)
+        self.rabbit._on_delivery_confirmation(
+            self._confirmation_frame(pika.spec.Basic.Ack, 3, True))
+
+        self.assertEqual({1: True, 2: False, 3: True},
+                         self.rabbit._delivery_confirmations)
+        self.assertEqual(set(), self.rabbit._returned_delivery_tags)
+
+    def test_basic_publish_async_sets_delivery_tag_as_mandatory_message_id(
+            self) -> None:
+        self._confirm_delivery_asynchronously()
+
+        self.rabbit.basic_publish_async(
+            "TEST_EXCHANGE", self.TEST_ROUTING_KEY, self.TEST_BODY_TEXT)
+        self.rabbit.basic_publish_async(
+            "TEST_EXCHANGE", self.TEST_ROUTING_KEY, self.TEST_BODY_TEXT,
+            mandatory=True)
+
+        self.rabbit.channel.basic_publish.assert_has_calls([
+            mock.call("TEST_EXCHANGE", self.TEST_ROUTING_KEY,
+                      self.TEST_BODY_TEXT, None, False),
+            mock.call("TEST_EXCHANGE", self.TEST_ROUTING_KEY,
+                      self.TEST_BODY_TEXT, pika.BasicProperties(message_id='2'),
+                      True),
+        ])
+
+    def test_on_message_returned_ignores_messages_not_awaited(self) -> None:
+        self._confirm_delivery_asynchronously()
+
+        self._return_message(1)
+        self.rabbit._on_message_returned(
+            self.rabbit.channel._impl, pika.spec.Basic.Return(),
+            pika.BasicProperties(), self.TEST_BODY_TEXT.encode())
+
+        self.assertEqual(set(), self.rabbit._returned_delivery_tags)
+
+    def test_wait_for_delivery_confirmations_waits_for_a_confirmation(
+            self) -> None:
+        self._confirm_delivery_asynchronously()
+        for _ in range(3):
+            self.rabbit.basic_publish_async(
+                "TEST_EXCHANGE", self.TEST_ROUTING_KEY, self.TEST_BODY_TEXT)
+        confirmation_frames = [
+            self._confirmation_frame(pika.spec.Basic.Ack, 1),
+            self._confirmation_frame(pika.spec.Basic.Ack, 3),
+        ]
+        self.rabbit.channel._flush_output.side_effect = \
+            lambda is_done: self.rabbit._on_delivery_confirmation(
+                confirmation_frames.pop(0))
+
+        self.assertEqual(
+            {3: True}, self.rabbit.wait_for_delivery_confirmations([2, 3]))
+        self.assertEqual(
+            {1: True}, self.rabbit.wait_for_delivery_confirmations([1]))
+        self.assertEqual(
+            2, self.rabbit.channel._flush_output.call_count)
+
+    def test_wait_for_delivery_confirmations_returns_empty_if_unknown_tags(
+            self) -> None:
+        self._confirm_delivery_asynchronously()
+
+        self.assertEqual({}, self.rabbit.wait_for_delivery_confirmations([1]))
+        self.rabbit.channel._flush_output.assert_not_called()
+
+    @parameterized.expand([
+        (pika.spec.Basic.Ack, False, False),
+        (pika.spec.Basic.Ack, True, True),
+        (pika.spec.Basic.Nack, False, True),
+    ])
+    def test_basic_publish_confirm_waits_for_asynchronous_confirmation(
+            self, method_class: Any, returned: bool, raises: bool) -> None:
+        self._confirm_delivery_asynchronously()
+
+        def confirm(is_done):
+            if returned:
+                self._return_message(1)
+            self.rabbit._on_delivery_confirmation(
+                self._confirmation_frame(method_class, 1))
+
+        self.rabbit.channel._flush_output.side_effect = confirm
+
+        if raises:
+            self.assertRaises(
+                MessageWasNotDeliveredException,
+                self.rabbit.basic_publish_confirm, "TEST_EXCHANGE",
+                self.TEST_ROUTING_KEY, self.TEST_BODY_TEXT, mandatory=True)
+        else:
+            self.assertIsNone(self.rabbit.basic_publish_confirm(
+                "TEST_EXCHANGE", self.TEST_ROUTING_KEY, self.TEST_BODY_TEXT,
+                mandatory=True))
+        self.assertEqual({}, self.rabbit._delivery_confirmations)
+
+    def test_basic_publish_confirm_from_consumer_callback_returns(
+            self) -> None:
+        # Consumer callbacks are executed while pika dispatches the events of
+        # the connection, in which process_data_events never returns.
+        self.rabbit = RabbitMQApi(
+            self.rabbit_logger, self.rabbit_ip, self.rabbit_port, self.username,
+            self.password, self.connection_check_time_interval,
+            publisher_confirm_window=3
+        )
+        test_queue = "test_rabbitmq_api_consumer_callback_queue"
+        results = []
+
+        def callback(ch, method, properties, body) -> None:
+            results.append(self.rabbit.basic_publish_confirm(
+                '', test_queue, self.TEST_BODY_TEXT, mandatory=True))
+            self.rabbit.basic_ack(method.delivery_tag, False)
+            self.rabbit.stop_consuming()
+
+        try:
+            self.rabbit.connect()
+            self.rabbit.confirm_delivery()
+            self.rabbit.queue_declare(test_queue, False, False, False, True)
+            self.rabbit.basic_publish_confirm(
+                '', test_queue, self.TEST_BODY_TEXT, mandatory=True)
+            self.rabbit.basic_consume(test_queue, callback)
+
+            self.rabbit.start_consuming()
+
+            self.assertEqual([None], results)
+        finally:
+            self.rabbit.queue_delete(test_queue)
+            self.rabbit.disconnect()
+
+    def test_new_channel_unsafe_resets_delivery_confirmations(self) -> None:
+        self._confirm_delivery_asynchronously()
+        self.rabbit.basic_publish_async(
+            "TEST_EXCHANGE", self.TEST_ROUTING_KEY, self.TEST_BODY_TEXT)
+
+        self.rabbit.new_channel_unsafe()
+
+        self.assertIsNone(self.rabbit._next_delivery_tag)
+        self.assertEqual(set(), self.rabbit._unconfirmed_delivery_tags)
+        self.assertEqual({}, self.rabbit._delivery_confirmations)
+
+    def test_message_codec_is_the_env_codec_by_default(self) -> None:
+        self.assertIs(get_message_codec(env.RABBITMQ_MESSAGE_CODEC),
+                      self.rabbit.message_codec)
+
+    @parameterized.expand([(JSON_MESSAGE_CODEC,), (MSGPACK_MESSAGE_CODEC,)])
+    @mock.patch.object(RabbitMQApi, "channel", new_callable=PropertyMock)
+    @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
+    @mock.patch.object(RabbitMQApi, "_safe", autospec=True)
+    def test_basic_publish_encodes_dict_with_codec_and_sets_content_type(
+            self, codec: Any, mock_safe: MagicMock,
+            mock_connection_initialised: MagicMock, mock_channel: PropertyMock
+    ) -> None:
+        self.rabbit._message_codec = codec
+        mock_safe.return_value = None
+        mock_connection_initialised.return_value = True
+        body = {'current_height': 9530000, 'went_down_at': None}
+
+        self.rabbit.basic_publish(
+            "TEST_EXCHANGE", self.TEST_ROUTING_KEY, body, is_body_dict=True,
+            properties=pika.BasicProperties(delivery_mode=2), mandatory=True)
+
+        mock_safe.assert_called_once_with(
+            self.rabbit, mock_channel.return_value.basic_publish,
+            ["TEST_EXCHANGE", self.TEST_ROUTING_KEY, codec.encode(body),
+             pika.BasicProperties(delivery_mode=2,
+                                  content_type=codec.content_type), True], -1
+        )
+
+    @mock.patch.object(RabbitMQApi, "channel", new_callable=PropertyMock)
+    @mock.patch.object(RabbitMQApi, "_connection_initialised", autospec=True)
+    @mock.patch.object(RabbitMQApi, "_safe", autospec=True)
+    def test_basic_publish_falls_back_to_json_if_codec_cannot_encode(
+            self, mock_safe: MagicMock, mock_connection_initialised: MagicMock,
+            mock_channel: PropertyMock
+    ) -> None:
+        self.rabbit._message_codec = MSGPACK_MESSAGE_CODEC
+        mock_safe.return_value = None
+        mock_connection_initialised.return_value = True
+        body = {'balance': 2 ** 70}
+
+        self.rabbit.basic_publish("TEST_EXCHANGE", self.TEST_ROUTING_KEY, body,
+                                  is_body_dict=True)
+
+        mock_safe.assert_called_once_with(
+            self.rabbit, mock_channel.return_value.basic_publish,
+            ["TEST_EXCHANGE", self.TEST_ROUTING_KEY,
+             JSON_MESSAGE_CODEC.encode(body),
+             pika.BasicProperties(
+                 content_type=JSON_MESSAGE_CODEC.content_type), False], -1
+        )
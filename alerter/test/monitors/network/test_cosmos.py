@@ -887,6 +887,73 @@ class TestCosmosNetworkMonitor(unittest.TestCase):
                 self.data_sources[0])
         self.assertEqual(expected_return, actual_return)
 
+    @mock.patch.object(CosmosRestServerApiWrapper, 'get_proposals_v0_42_6')
+    def test_get_cosmos_rest_v0_42_6_indirect_data_retrieves_open_proposals(
+            self, mock_proposals) -> None:
+        """
+        We will check that after the first round only the open proposals are
+        listed, and that the proposals which are no longer open are retrieved
+        one by one while concluded proposals are not retrieved again
+        """
+        proposal_1, proposal_2, proposal_3 = [
+            page['proposals'][0] for page in retrieved_proposals_3_v1]
+        proposal_4 = {**proposal_3, 'proposal_id': '4'}
+        concluded_proposal_2 = {**proposal_2,
+                                'status': 'PROPOSAL_STATUS_PASSED'}
+        mock_proposals.side_effect = retrieved_proposals_3_v1 + [
+            {'proposals': [proposal_4], 'pagination': {'next_key': None}},
+            {'proposals': [proposal_3], 'pagination': {'next_key': None}},
+            {'proposal': concluded_proposal_2},
+        ]
+        source_url = self.data_sources[0].cosmos_rest_url
+
+        self.test_monitor._get_cosmos_rest_v0_42_6_indirect_data(
+            self.data_sources[0])
+        mock_proposals.reset_mock()
+        actual_return = \
+            self.test_monitor._get_cosmos_rest_v0_42_6_indirect_data(
+                self.data_sources[0])
+
+        self.assertEqual({'proposals': [
+            self.test_monitor._parse_proposal(proposal) for proposal in [
+                proposal_1, concluded_proposal_2, proposal_3, proposal_4]
+        ]}, actual_return)
+        self.assertEqual([
+            mock.call(source_url, None, {'proposal_status': 1}),
+            mock.call(source_url, None, {'proposal_status': 2}),
+            mock.call(source_url, '2'),
+        ], mock_proposals.call_args_list)
+
+    @mock.patch.object(CosmosRestServerApiWrapper, 'get_proposals_v0_42_6')
+    def test_get_cosmos_rest_v0_42_6_indirect_data_scans_if_proposal_deleted(
+            self, mock_proposals) -> None:
+        """
+        We will check that if a proposal which is no longer open is not found,
+        all proposals are scanned again and the deleted proposal is dropped
+        """
+        no_proposals = {'proposals': [], 'pagination': {'next_key': None}}
+        pages_without_proposal_3 = retrieved_proposals_3_v1[:2]
+        pages_without_proposal_3[1] = {
+            **pages_without_proposal_3[1],
+            'pagination': {'next_key': None, 'total': '1'}}
+        mock_proposals.side_effect = retrieved_proposals_3_v1 + [
+            no_proposals,
+            {'proposals': [retrieved_proposals_3_v1[1]['proposals'][0]],
+             'pagination': {'next_key': None}},
+            {'code': 5, 'message': 'proposal 3 doesn\'t exist'},
+        ] + pages_without_proposal_3
+
+        self.test_monitor._get_cosmos_rest_v0_42_6_indirect_data(
+            self.data_sources[0])
+        actual_return = \
+            self.test_monitor._get_cosmos_rest_v0_42_6_indirect_data(
+                self.data_sources[0])
+
+        self.assertEqual({'proposals': expected_proposals_3['proposals'][:2]},
+                         actual_return)
+        self.assertIsNone(self.test_monitor.proposals.items['3'])
+        self.assertTrue(self.test_monitor.proposals.is_final('3'))
+
     @freeze_time("2012-01-01")
     def test_process_error_returns_expected_data(self) -> None:
         expected_output = {
@@ -309,6 +309,55 @@ class TestSubstrateNetworkMonitor(unittest.TestCase):
             self.data_sources[0])
         self.assertEqual(self.retrieved_websocket_indirect_data, actual_return)
 
+    @mock.patch.object(SubstrateApiWrapper, 'get_referendum_info_of')
+    @mock.patch.object(SubstrateApiWrapper, 'get_democracy_referendums')
+    @mock.patch.object(SubstrateApiWrapper, 'get_referendum_count')
+    @mock.patch.object(SubstrateApiWrapper, 'get_democracy_proposals')
+    @mock.patch.object(SubstrateApiWrapper, 'get_public_prop_count')
+    @mock.patch.object(SubstrateApiWrapper, 'get_grandpa_stalled')
+    def test_get_websocket_indirect_data_does_not_retrieve_finished_referendums(
+            self, mock_grandpa_stalled, mock_get_props_count,
+            mock_get_proposals, mock_get_referendum_count,
+            mock_get_referendums, mock_referendum_info_of) -> None:
+        """
+        In this test we are checking that in the following monitoring rounds
+        only the info of new and ongoing referendums is retrieved
+        """
+        mock_grandpa_stalled.return_value = {
+            "result": self.retrieved_websocket_indirect_data['grandpa_stalled']
+        }
+        mock_get_props_count.return_value = {
+            "result": self.retrieved_websocket_indirect_data[
+                'public_prop_count']
+        }
+        mock_get_proposals.return_value = {
+            "result": self.retrieved_websocket_indirect_data['active_proposals']
+        }
+        mock_get_referendum_count.side_effect = [{"result": "0x2"},
+                                                 {"result": "0x3"}]
+        mock_get_referendums.return_value = {
+            "result": self.retrieved_websocket_indirect_data[
+                'active_referendums']
+        }
+        all_referendums = self.retrieved_websocket_indirect_data[
+            'all_referendums']
+        new_referendum = {"ongoing": {"end": 7358400}}
+        mock_referendum_info_of.side_effect = [
+            {"result": all_referendums[0]}, {"result": all_referendums[1]},
+            {"result": all_referendums[0]}, {"result": new_referendum},
+        ]
+        source_url = self.data_sources[0].node_ws_url
+
+        self.test_monitor._get_websocket_indirect_data(self.data_sources[0])
+        actual_return = self.test_monitor._get_websocket_indirect_data(
+            self.data_sources[0])
+
+        self.assertEqual({**all_referendums, 2: new_referendum},
+                         actual_return['all_referendums'])
+        self.assertEqual([mock.call(source_url, 0), mock.call(source_url, 1),
+                          mock.call(source_url, 0), mock.call(source_url, 2)],
+                         mock_referendum_info_of.call_args_list)
+
     @mock.patch.object(SubstrateNetworkMonitor, '_select_websocket_node')
     def test_get_websocket_data_return_if_no_indirect_source_selected(
             self, mock_select_websocket_node) -> None:
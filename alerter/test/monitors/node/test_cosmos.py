@@ -19,6 +19,7 @@ from src.api_wrappers.cosmos import (CosmosRestServerApiWrapper,
                                      TendermintRpcApiWrapper)
 from src.message_broker.rabbitmq import RabbitMQApi
 from src.monitors.node.cosmos import CosmosNodeMonitor
+from src.monitors.tendermint_block_cache import TendermintBlockCache
 from src.utils import env
 from src.utils.constants.cosmos import (
     BOND_STATUS_BONDED, BOND_STATUS_UNBONDED, BOND_STATUS_UNBONDING,
@@ -158,6 +159,7 @@ class TestCosmosNodeMonitor(unittest.TestCase):
         self.test_monitor = CosmosNodeMonitor(
             self.monitor_name, self.data_sources[2], self.dummy_logger,
             self.monitoring_period, self.rabbitmq, self.data_sources,
+            TendermintBlockCache()
         )
 
         self.received_retrieval_info_all_source_types_enabled = {
@@ -1187,13 +1189,15 @@ class TestCosmosNodeMonitor(unittest.TestCase):
         self.assertEqual(expected_return, actual_return)
 
     @mock.patch.object(TendermintRpcApiWrapper, 'get_block')
+    @mock.patch.object(TendermintRpcApiWrapper, 'get_blockchain')
     @mock.patch.object(TendermintRpcApiWrapper, 'get_validators')
     @mock.patch.object(TendermintRpcApiWrapper, 'get_block_results')
     def test_get_tendermint_rpc_archive_data_validator_return(
             self, mock_get_block_results, mock_get_validators,
-            mock_get_block) -> None:
+            mock_get_blockchain, mock_get_block) -> None:
         """
-        We will check that the return is as expected for all cases
+        We will check that the return is as expected for all cases, and that
+        the validator set is only retrieved when the validators_hash changes
         """
         test_hex_address = "7B3D01F754DFF8474ED0E358812FD437E09389DC"
         self.test_monitor._validator_consensus_address = test_hex_address
@@ -1203,7 +1207,8 @@ class TestCosmosNodeMonitor(unittest.TestCase):
                 "result": {
                     "block": {
                         "header": {
-                            "height": "52"
+                            "height": "52",
+                            "validators_hash": "test_validators_hash_2"
                         }
                     },
                 }
@@ -1211,6 +1216,9 @@ class TestCosmosNodeMonitor(unittest.TestCase):
             {
                 "result": {
                     "block": {
+                        "header": {
+                            "validators_hash": "test_validators_hash_2"
+                        },
                         "last_commit": {
                             "signatures": [
                                 {
@@ -1229,6 +1237,9 @@ class TestCosmosNodeMonitor(unittest.TestCase):
             {
                 "result": {
                     "block": {
+                        "header": {
+                            "validators_hash": "test_validators_hash_2"
+                        },
                         "last_commit": {
                             "signatures": [
                                 {
@@ -1251,6 +1262,9 @@ class TestCosmosNodeMonitor(unittest.TestCase):
             {
                 "result": {
                     "block": {
+                        "header": {
+                            "validators_hash": "test_validators_hash_2"
+                        },
                         "last_commit": {
                             "signatures": [
                                 {
@@ -1271,6 +1285,17 @@ class TestCosmosNodeMonitor(unittest.TestCase):
                 },
             },
         ]
+        mock_get_blockchain.return_value = {
+            "result": {
+                "block_metas": [
+                    {
+                        "header": {
+                            "validators_hash": "test_validators_hash_1"
+                        }
+                    }
+                ]
+            }
+        }
         mock_get_validators.side_effect = [
             {
                 "result": {
@@ -1286,13 +1311,6 @@ class TestCosmosNodeMonitor(unittest.TestCase):
                     'total': "1",
                 }
             },
-            {
-                "result": {
-                    "validators": [{"address": test_hex_address}],
-                    'count': "1",
-                    'total': "1",
-                }
-            },
         ]
         mock_get_block_results.side_effect = [
             {
@@ -1392,6 +1410,16 @@ class TestCosmosNodeMonitor(unittest.TestCase):
         self.assertEqual(self.retrieved_tendermint_archive_data, actual_return)
         self.assertEqual(52, self.test_monitor.last_height_monitored_tendermint)
 
+        # Only the header of height 49 was not seen, and heights 50 and 51
+        # share the validator set of hash test_validators_hash_2
+        mock_get_blockchain.assert_called_once_with(
+            self.data_sources[0].tendermint_rpc_url,
+            {'minHeight': 49, 'maxHeight': 49})
+        self.assertEqual(2, mock_get_validators.call_count)
+        self.assertEqual(
+            ['test_validators_hash_1', 'test_validators_hash_2'],
+            self.test_monitor.block_cache.validator_sets.validators_hashes)
+
     @parameterized.expand([
         (False,),
         ('',),
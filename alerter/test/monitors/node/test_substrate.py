@@ -508,6 +508,48 @@ class TestSubstrateNodeMonitor(unittest.TestCase):
         self.assertEqual(self.retrieved_websocket_archive_data_validator,
                          actual_return)
 
+    @mock.patch.object(SubstrateApiWrapper, 'get_is_offline')
+    @mock.patch.object(SubstrateApiWrapper, 'get_slashed_amount')
+    @mock.patch.object(SubstrateApiWrapper, 'get_block_hash')
+    @mock.patch.object(SubstrateNodeMonitor,
+                       '_determine_last_height_monitored_websocket')
+    @mock.patch.object(SubstrateApiWrapper, 'get_header')
+    @mock.patch.object(SubstrateApiWrapper, 'get_finalized_head')
+    def test_get_websocket_archive_data_validator_return_when_catching_up(
+            self, mock_get_finalized_head, mock_get_header, mock_determine_lhm,
+            mock_get_block_hash, mock_get_slashed_amount,
+            mock_get_is_offline) -> None:
+        """
+        In this test we will check that when many heights are retrieved
+        concurrently, the historical data is still ordered by height and the
+        last height monitored is updated.
+        """
+        self.test_monitor._catchup_concurrency = 4
+        mock_get_finalized_head.return_value = {"result": "0xfinalized"}
+        mock_get_header.return_value = {"result": {"number": 80}}
+        mock_determine_lhm.return_value = 49
+        mock_get_block_hash.side_effect = \
+            lambda url, height: {"result": height}
+        mock_get_slashed_amount.side_effect = \
+            lambda url, block_hash, address: {"result": block_hash % 2}
+        mock_get_is_offline.side_effect = \
+            lambda url, block_hash, address: {"result": block_hash % 3 == 0}
+        expected_historical = [
+            {
+                'height': height,
+                'slashed': height % 2 > 0,
+                'slashed_amount': height % 2,
+                'is_offline': height % 3 == 0
+            } for height in range(80, 49, -1)
+        ]
+
+        actual_return = \
+            self.test_monitor._get_websocket_archive_data_validator(
+                self.data_sources[1])
+
+        self.assertEqual({'historical': expected_historical}, actual_return)
+        self.assertEqual(80, self.test_monitor.last_height_monitored_websocket)
+
     def test_get_websocket_archive_data_non_validator_return(self) -> None:
         actual_return = \
             self.test_monitor._get_websocket_archive_data_non_validator()
@@ -0,0 +1,352 @@
+import logging
+import multiprocessing
+import queue
+import time
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+import pika.exceptions
+
+from src.configs.system import SystemConfig
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.monitors.executor import (
+    MonitorsExecutor, MonitorsWorker, PooledMonitorHandle,
+    ADD_MONITOR_COMMAND, REMOVE_MONITOR_COMMAND, start_monitors_worker)
+from src.monitors.starters import start_system_monitor
+from src.monitors.system import SystemMonitor
+from src.utils import env
+from src.utils.constants.starters import (RESTART_SLEEPING_PERIOD,
+                                          RE_INITIALISE_SLEEPING_PERIOD)
+
+
+class TestMonitorsExecutor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.executor_name = 'test_monitors_manager'
+        self.pool_size = 2
+        self.test_executor = MonitorsExecutor(
+            self.executor_name, self.pool_size, self.dummy_logger)
+        self.system_config = SystemConfig(
+            'test_system_id', 'test_parent_id', 'test_system', True,
+            'test_url')
+
+    def tearDown(self) -> None:
+        self.test_executor = None
+
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_submit_starts_worker_and_sends_add_command(
+            self, mock_start) -> None:
+        mock_start.return_value = None
+
+        handle = self.test_executor.submit(start_system_monitor,
+                                           (self.system_config,))
+
+        self.assertIsInstance(handle, PooledMonitorHandle)
+        self.assertEqual(1, mock_start.call_count)
+        worker_index = self.test_executor.task_worker[handle.task_id]
+        command = self.test_executor._commands[worker_index].get(timeout=5)
+        self.assertEqual((ADD_MONITOR_COMMAND, handle.task_id,
+                          start_system_monitor, (self.system_config,)),
+                         command)
+
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_submit_balances_monitors_across_workers(
+            self, mock_start, mock_is_alive) -> None:
+        mock_start.return_value = None
+        mock_is_alive.return_value = True
+
+        handles = [self.test_executor.submit(start_system_monitor,
+                                             (self.system_config,))
+                   for _ in range(4)]
+
+        self.assertEqual(self.pool_size, mock_start.call_count)
+        assigned_workers = [self.test_executor.task_worker[handle.task_id]
+                            for handle in handles]
+        self.assertEqual(2, assigned_workers.count(0))
+        self.assertEqual(2, assigned_workers.count(1))
+
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_submit_runs_monitors_of_same_group_on_same_worker(
+            self, mock_start, mock_is_alive) -> None:
+        mock_start.return_value = None
+        mock_is_alive.return_value = True
+
+        handles = [self.test_executor.submit(start_system_monitor,
+                                             (self.system_config,),
+                                             'test_group')
+                   for _ in range(3)]
+        other_handle = self.test_executor.submit(start_system_monitor,
+                                                 (self.system_config,))
+
+        assigned_workers = {self.test_executor.task_worker[handle.task_id]
+                            for handle in handles}
+        self.assertEqual(1, len(assigned_workers))
+        self.assertNotIn(
+            self.test_executor.task_worker[other_handle.task_id],
+            assigned_workers)
+
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_handle_is_alive_only_if_worker_is_alive(
+            self, mock_start, mock_is_alive) -> None:
+        mock_start.return_value = None
+        handle = self.test_executor.submit(start_system_monitor,
+                                           (self.system_config,))
+
+        mock_is_alive.return_value = True
+        self.assertTrue(handle.is_alive())
+        mock_is_alive.return_value = False
+        self.assertFalse(handle.is_alive())
+
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_terminate_sends_remove_command_and_marks_handle_dead(
+            self, mock_start, mock_is_alive) -> None:
+        mock_start.return_value = None
+        mock_is_alive.return_value = True
+        handle = self.test_executor.submit(start_system_monitor,
+                                           (self.system_config,))
+        worker_index = self.test_executor.task_worker[handle.task_id]
+        commands = self.test_executor._commands[worker_index]
+        commands.get(timeout=5)
+
+        handle.terminate()
+
+        self.assertFalse(handle.is_alive())
+        self.assertEqual((REMOVE_MONITOR_COMMAND, handle.task_id),
+                         commands.get(timeout=5))
+
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_join_waits_until_worker_reports_removal(
+            self, mock_start, mock_is_alive) -> None:
+        mock_start.return_value = None
+        mock_is_alive.return_value = True
+        handle = self.test_executor.submit(start_system_monitor,
+                                           (self.system_config,))
+        worker_index = self.test_executor.task_worker[handle.task_id]
+        handle.terminate()
+
+        handle.join(timeout=0.1)
+        self.assertIn(handle.task_id, self.test_executor._cancelled_tasks)
+
+        self.test_executor._removals[worker_index].put(handle.task_id)
+        handle.join()
+        self.assertNotIn(handle.task_id, self.test_executor._cancelled_tasks)
+
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_join_returns_if_worker_of_cancelled_task_died(
+            self, mock_start, mock_is_alive) -> None:
+        mock_start.return_value = None
+        mock_is_alive.return_value = True
+        handle = self.test_executor.submit(start_system_monitor,
+                                           (self.system_config,))
+        handle.terminate()
+
+        mock_is_alive.return_value = False
+        handle.join()
+
+        self.assertNotIn(handle.task_id, self.test_executor._cancelled_tasks)
+
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_is_alive_replaces_dead_worker_and_gives_it_its_monitors(
+            self, mock_start, mock_is_alive) -> None:
+        mock_start.return_value = None
+        mock_is_alive.return_value = True
+        handle = self.test_executor.submit(start_system_monitor,
+                                           (self.system_config,))
+        worker_index = self.test_executor.task_worker[handle.task_id]
+        old_commands = self.test_executor._commands[worker_index]
+
+        mock_is_alive.side_effect = [False, True, True]
+        self.assertTrue(handle.is_alive())
+
+        self.assertEqual(2, mock_start.call_count)
+        new_commands = self.test_executor._commands[worker_index]
+        self.assertIsNot(old_commands, new_commands)
+        self.assertEqual((ADD_MONITOR_COMMAND, handle.task_id,
+                          start_system_monitor, (self.system_config,)),
+                         new_commands.get(timeout=5))
+
+    @mock.patch.object(multiprocessing.Process, "is_alive")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_submit_replaces_dead_worker_and_keeps_its_monitors(
+            self, mock_start, mock_is_alive) -> None:
+        mock_start.return_value = None
+        mock_is_alive.return_value = True
+        old_handles = [self.test_executor.submit(start_system_monitor,
+                                                 (self.system_config,))
+                       for _ in range(2)]
+
+        mock_is_alive.return_value = False
+        new_handle = self.test_executor.submit(start_system_monitor,
+                                               (self.system_config,))
+
+        self.assertEqual(self.pool_size + 1, mock_start.call_count)
+        self.assertTrue(new_handle.task_id in self.test_executor.task_worker)
+        for handle in old_handles:
+            self.assertIn(handle.task_id, self.test_executor.task_worker)
+
+    @mock.patch.object(multiprocessing.Process, "join")
+    @mock.patch.object(multiprocessing.Process, "terminate")
+    @mock.patch.object(multiprocessing.Process, "start")
+    def test_shutdown_terminates_started_workers(
+            self, mock_start, mock_terminate, mock_join) -> None:
+        mock_start.return_value = None
+        mock_terminate.return_value = None
+        mock_join.return_value = None
+        self.test_executor.submit(start_system_monitor, (self.system_config,))
+
+        self.test_executor.shutdown()
+
+        mock_terminate.assert_called_once()
+        mock_join.assert_called_once()
+
+
+class TestMonitorsWorker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.connection_check_time_interval = timedelta(seconds=0)
+        self.rabbitmq = RabbitMQApi(
+            self.dummy_logger, env.RABBIT_IP,
+            connection_check_time_interval=self.connection_check_time_interval)
+        self.commands = queue.Queue()
+        self.removals = queue.Queue()
+        self.worker_name = 'test_monitors_worker'
+        self.test_worker = MonitorsWorker(
+            self.worker_name, self.dummy_logger, self.rabbitmq, self.commands,
+            self.removals)
+        self.system_config = SystemConfig(
+            'test_system_id', 'test_parent_id', 'test_system', True,
+            'test_url')
+        self.test_monitor = SystemMonitor(
+            'test_monitor', self.system_config, self.dummy_logger,
+            env.SYSTEM_MONITOR_PERIOD_SECONDS, self.rabbitmq)
+
+    def tearDown(self) -> None:
+        self.test_worker = None
+        self.test_monitor = None
+
+    def test_str_returns_worker_name(self) -> None:
+        self.assertEqual(self.worker_name, str(self.test_worker))
+
+    @mock.patch("src.monitors.executor.MONITOR_CREATORS")
+    @mock.patch.object(SystemMonitor, "_initialise_rabbitmq")
+    def test_process_commands_adds_and_removes_monitors(
+            self, mock_init_rabbit, mock_creators) -> None:
+        mock_init_rabbit.return_value = None
+        mock_creator = mock.MagicMock(return_value=self.test_monitor)
+        mock_creators.__getitem__.return_value = mock_creator
+        self.commands.put((ADD_MONITOR_COMMAND, 7, start_system_monitor,
+                           (self.system_config,)))
+
+        self.test_worker._process_commands()
+
+        mock_creator.assert_called_once_with(self.rabbitmq, self.system_config)
+        mock_init_rabbit.assert_called_once()
+        self.assertEqual({7: self.test_monitor}, self.test_worker.monitors)
+        self.assertEqual(1, len(self.test_worker.schedule))
+
+        self.commands.put((REMOVE_MONITOR_COMMAND, 7))
+        self.test_worker._process_commands()
+
+        self.assertEqual({}, self.test_worker.monitors)
+        self.assertEqual(7, self.removals.get_nowait())
+
+    @mock.patch("src.monitors.executor.MONITOR_CREATORS")
+    @mock.patch.object(SystemMonitor, "_initialise_rabbitmq")
+    def test_add_monitor_re_attempts_failed_monitor_later(
+            self, mock_init_rabbit, mock_creators) -> None:
+        mock_init_rabbit.return_value = None
+        mock_creator = mock.MagicMock(
+            side_effect=[Exception('test'), self.test_monitor])
+        mock_creators.__getitem__.return_value = mock_creator
+
+        self.test_worker._add_monitor(7, start_system_monitor,
+                                      (self.system_config,))
+
+        self.assertEqual({}, self.test_worker.monitors)
+        self.assertEqual({7: (start_system_monitor, (self.system_config,))},
+                         self.test_worker.pending_monitors)
+        next_attempt, task_id = self.test_worker.schedule[0]
+        self.assertEqual(7, task_id)
+        self.assertGreater(next_attempt, time.monotonic() +
+                           RE_INITIALISE_SLEEPING_PERIOD - 5)
+
+        self.test_worker.schedule[0] = (time.monotonic() - 1, 7)
+        self.test_worker._run_due_rounds()
+
+        self.assertEqual({7: self.test_monitor}, self.test_worker.monitors)
+        self.assertEqual({}, self.test_worker.pending_monitors)
+
+    @mock.patch.object(SystemMonitor, "monitor_round")
+    def test_run_due_rounds_runs_due_monitors_and_reschedules_them(
+            self, mock_monitor_round) -> None:
+        mock_monitor_round.return_value = None
+        self.test_worker.monitors[1] = self.test_monitor
+        self.test_worker.schedule.append((time.monotonic() - 1, 1))
+
+        self.test_worker._run_due_rounds()
+
+        mock_monitor_round.assert_called_once()
+        self.assertEqual(1, len(self.test_worker.schedule))
+        next_round, task_id = self.test_worker.schedule[0]
+        self.assertEqual(1, task_id)
+        self.assertGreater(next_round, time.monotonic() +
+                           self.test_monitor.monitor_period - 5)
+
+    @mock.patch.object(SystemMonitor, "monitor_round")
+    def test_run_due_rounds_skips_removed_monitors(
+            self, mock_monitor_round) -> None:
+        self.test_worker.schedule.append((time.monotonic() - 1, 1))
+
+        self.test_worker._run_due_rounds()
+
+        mock_monitor_round.assert_not_called()
+        self.assertEqual([], self.test_worker.schedule)
+
+    @mock.patch.object(SystemMonitor, "monitor_round")
+    def test_run_due_rounds_restarts_failing_monitor_later(
+            self, mock_monitor_round) -> None:
+        mock_monitor_round.side_effect = Exception('test')
+        self.test_worker.monitors[1] = self.test_monitor
+        self.test_worker.schedule.append((time.monotonic() - 1, 1))
+
+        self.test_worker._run_due_rounds()
+
+        next_round, _ = self.test_worker.schedule[0]
+        self.assertLessEqual(next_round,
+                             time.monotonic() + RESTART_SLEEPING_PERIOD)
+
+    @mock.patch.object(SystemMonitor, "_initialise_rabbitmq")
+    @mock.patch.object(SystemMonitor, "monitor_round")
+    def test_run_due_rounds_reinitialises_rabbit_on_connection_errors(
+            self, mock_monitor_round, mock_init_rabbit) -> None:
+        mock_monitor_round.side_effect = \
+            pika.exceptions.AMQPConnectionError('test')
+        mock_init_rabbit.return_value = None
+        self.test_worker.monitors[1] = self.test_monitor
+        self.test_worker.schedule.append((time.monotonic() - 1, 1))
+
+        self.test_worker._run_due_rounds()
+
+        mock_init_rabbit.assert_called_once()
+        self.assertEqual(1, len(self.test_worker.schedule))
+
+    @mock.patch("src.monitors.executor._initialise_monitor_logger")
+    @mock.patch("src.monitors.executor.MonitorsWorker.start")
+    def test_start_monitors_worker_creates_and_starts_worker(
+            self, mock_start, mock_initialise_logger) -> None:
+        mock_start.return_value = None
+        mock_initialise_logger.return_value = self.dummy_logger
+
+        start_monitors_worker(self.worker_name, self.commands, self.removals)
+
+        mock_start.assert_called_once()
@@ -0,0 +1,92 @@
+import json
+import logging
+import unittest
+from unittest import mock
+
+from src.data_store.redis import RedisApi, Keys
+from src.monitors.governance_cache import GovernanceCache
+from src.utils import env
+
+
+class TestGovernanceCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.test_hash_name = Keys.get_substrate_network_monitored_referendums(
+            'test_parent_id')
+        self.test_finished_referendum = {'finished': {'approved': True,
+                                                      'end': 100}}
+        self.test_ongoing_referendum = {'ongoing': {'end': 200}}
+
+        self.redis = RedisApi(self.dummy_logger, env.REDIS_DB, env.REDIS_IP,
+                              env.REDIS_PORT, '',
+                              env.UNIQUE_ALERTER_IDENTIFIER)
+        self.test_cache = GovernanceCache(
+            self.redis, self.test_hash_name,
+            lambda referendum: 'finished' in referendum, self.dummy_logger)
+
+    def tearDown(self) -> None:
+        self.dummy_logger = None
+        self.redis = None
+        self.test_cache = None
+
+    @mock.patch.object(RedisApi, 'hmget')
+    @mock.patch.object(RedisApi, 'hkeys')
+    def test_items_are_loaded_from_redis_once(self, mock_hkeys,
+                                              mock_hmget) -> None:
+        mock_hkeys.return_value = ['0', '1', '2']
+        mock_hmget.return_value = [
+            json.dumps(self.test_finished_referendum).encode(),
+            json.dumps(self.test_ongoing_referendum).encode(), b'invalid']
+
+        self.assertEqual({'0': self.test_finished_referendum,
+                          '1': self.test_ongoing_referendum},
+                         self.test_cache.items)
+        self.test_cache.items
+        mock_hkeys.assert_called_once_with(self.test_hash_name)
+        mock_hmget.assert_called_once_with(self.test_hash_name,
+                                           ['0', '1', '2'])
+
+    @mock.patch.object(RedisApi, 'hkeys')
+    def test_items_are_empty_if_redis_has_no_items(self, mock_hkeys) -> None:
+        mock_hkeys.return_value = None
+        self.assertEqual({}, self.test_cache.items)
+
+    def test_items_are_kept_in_memory_only_if_no_redis(self) -> None:
+        test_cache = GovernanceCache(
+            None, self.test_hash_name,
+            lambda referendum: 'finished' in referendum, self.dummy_logger)
+
+        test_cache.update({'0': self.test_finished_referendum})
+
+        self.assertEqual({'0': self.test_finished_referendum},
+                         test_cache.items)
+
+    @mock.patch.object(RedisApi, 'hkeys')
+    def test_is_final_returns_true_only_for_known_final_items(
+            self, mock_hkeys) -> None:
+        mock_hkeys.return_value = []
+        self.test_cache.update({'0': self.test_finished_referendum,
+                                '1': self.test_ongoing_referendum})
+
+        self.assertTrue(self.test_cache.is_final('0'))
+        self.assertFalse(self.test_cache.is_final('1'))
+        self.assertFalse(self.test_cache.is_final('2'))
+
+    @mock.patch.object(RedisApi, 'hset_multiple')
+    @mock.patch.object(RedisApi, 'hkeys')
+    def test_update_saves_only_changed_items_to_redis(
+            self, mock_hkeys, mock_hset_multiple) -> None:
+        mock_hkeys.return_value = []
+        self.test_cache.update({'0': self.test_finished_referendum,
+                                '1': self.test_ongoing_referendum})
+        mock_hset_multiple.reset_mock()
+
+        self.test_cache.update({'0': self.test_finished_referendum,
+                                '1': self.test_finished_referendum})
+        self.test_cache.update({'1': self.test_finished_referendum})
+
+        mock_hset_multiple.assert_called_once_with(
+            self.test_hash_name,
+            {'1': json.dumps(self.test_finished_referendum)})
+        self.assertTrue(self.test_cache.is_final('1'))
@@ -0,0 +1,57 @@
+import threading
+import time
+import unittest
+
+from src.monitors.monitor import Monitor, CATCHUP_MODE_MIN_HEIGHTS
+
+
+class TestMonitor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight_seen = 0
+        self.lock = threading.Lock()
+
+    def _retrieval(self, height: int) -> int:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight_seen = max(self.max_in_flight_seen,
+                                          self.in_flight)
+        # Give the other threads the chance to start retrieving
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        return height * 2
+
+    def test_retrieve_heights_retrieves_sequentially_when_not_catching_up(
+            self) -> None:
+        actual_ret = Monitor._retrieve_heights(
+            self._retrieval, 50, 50 + CATCHUP_MODE_MIN_HEIGHTS - 1, 5)
+
+        self.assertEqual([height * 2 for height in range(
+            50, 50 + CATCHUP_MODE_MIN_HEIGHTS - 1)], actual_ret)
+        self.assertEqual(1, self.max_in_flight_seen)
+
+    def test_retrieve_heights_returns_in_height_order_when_catching_up(
+            self) -> None:
+        actual_ret = Monitor._retrieve_heights(self._retrieval, 50, 100, 5)
+
+        self.assertEqual([height * 2 for height in range(50, 100)],
+                         actual_ret)
+        self.assertGreater(self.max_in_flight_seen, 1)
+        self.assertLessEqual(self.max_in_flight_seen, 5)
+
+    def test_retrieve_heights_raises_error_of_lowest_failing_height(
+            self) -> None:
+        def retrieval(height: int) -> int:
+            if height >= 70:
+                raise ValueError(height)
+            return height
+
+        with self.assertRaises(ValueError) as context:
+            Monitor._retrieve_heights(retrieval, 50, 100, 5)
+
+        self.assertEqual((70,), context.exception.args)
+
+    def test_retrieve_heights_returns_empty_list_if_no_heights(self) -> None:
+        self.assertEqual([], Monitor._retrieve_heights(self._retrieval, 50,
+                                                       50, 5))
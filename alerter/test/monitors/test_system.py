@@ -26,6 +26,7 @@ from src.utils.exceptions import (PANICException, SystemIsDownException,
                                   DataReadingException, InvalidUrlException,
                                   MetricNotFoundException,
                                   MessageWasNotDeliveredException)
+from src.utils.partitioning import get_partition
 
 
 class TestSystemMonitor(unittest.TestCase):
@@ -397,6 +398,21 @@ class TestSystemMonitor(unittest.TestCase):
         except Exception as e:
             self.fail("Test failed: {}".format(e))
 
+    @mock.patch.object(RabbitMQApi, "basic_publish_confirm")
+    def test_send_data_sends_data_to_partition_of_system_if_partitioned(
+            self, mock_basic_publish_confirm) -> None:
+        mock_basic_publish_confirm.return_value = None
+
+        with mock.patch.object(env, 'DATA_TRANSFORMER_PARTITIONS', 4):
+            self.test_monitor._send_data(self.processed_data_example)
+
+        _, kwargs = mock_basic_publish_confirm.call_args
+        self.assertEqual(RAW_DATA_EXCHANGE, kwargs['exchange'])
+        self.assertEqual('{}.{}'.format(SYSTEM_RAW_DATA_ROUTING_KEY,
+                                        get_partition(self.system_id, 4)),
+                         kwargs['routing_key'])
+        self.assertEqual(self.processed_data_example, kwargs['body'])
+
     @freeze_time("2012-01-01")
     @mock.patch.object(SystemMonitor, "_get_data")
     def test_monitor_sends_data_and_hb_if_data_retrieve_and_processing_success(
@@ -0,0 +1,142 @@
+import unittest
+from unittest import mock
+
+from src.monitors.tendermint_block_cache import (
+    TendermintBlockCache, TendermintHeightData, TendermintValidatorSetIndex,
+    get_tendermint_block_cache)
+
+
+class TestTendermintBlockCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_cache = TendermintBlockCache(max_heights=3,
+                                               subscriber_timeout=600)
+
+    def tearDown(self) -> None:
+        self.test_cache = None
+
+    @staticmethod
+    def _height_data(height: int) -> TendermintHeightData:
+        return TendermintHeightData(height, {'validator_1'}, {'validator_1'},
+                                    [])
+
+    def test_get_counts_hits_and_misses(self) -> None:
+        height_data = self._height_data(10)
+        self.test_cache.add(height_data)
+
+        self.assertEqual(height_data, self.test_cache.get(10))
+        self.assertIsNone(self.test_cache.get(11))
+        self.assertEqual(1, self.test_cache.hits)
+        self.assertEqual(1, self.test_cache.misses)
+
+    def test_add_evicts_least_recently_used_height_when_full(self) -> None:
+        for height in [10, 11, 12]:
+            self.test_cache.add(self._height_data(height))
+        self.test_cache.get(10)
+
+        self.test_cache.add(self._height_data(13))
+
+        self.assertEqual([12, 10, 13], self.test_cache.heights)
+
+    def test_set_last_height_monitored_evicts_heights_passed_by_all(
+            self) -> None:
+        self.test_cache.set_last_height_monitored('node_1', 9)
+        self.test_cache.set_last_height_monitored('node_2', 9)
+        for height in [10, 11, 12]:
+            self.test_cache.add(self._height_data(height))
+
+        self.test_cache.set_last_height_monitored('node_1', 12)
+        self.assertEqual([10, 11, 12], self.test_cache.heights)
+
+        self.test_cache.set_last_height_monitored('node_2', 11)
+        self.assertEqual([12], self.test_cache.heights)
+
+    def test_subscribers_without_a_height_do_not_hold_back_eviction(
+            self) -> None:
+        self.test_cache.subscribe('node_1')
+        self.test_cache.add(self._height_data(10))
+
+        self.test_cache.set_last_height_monitored('node_2', 10)
+
+        self.assertEqual([], self.test_cache.heights)
+
+    def test_unsubscribe_evicts_heights_held_back_by_subscriber(self) -> None:
+        for height in [10, 11]:
+            self.test_cache.add(self._height_data(height))
+        self.test_cache.set_last_height_monitored('node_1', 11)
+        self.test_cache.add(self._height_data(10))
+        self.test_cache.set_last_height_monitored('node_2', 9)
+        self.assertEqual([10], self.test_cache.heights)
+
+        self.test_cache.unsubscribe('node_2')
+
+        self.assertEqual([], self.test_cache.heights)
+        self.assertEqual(['node_1'], self.test_cache.subscribers)
+
+    @mock.patch('src.monitors.tendermint_block_cache.time.monotonic')
+    def test_stale_subscribers_do_not_hold_back_eviction(
+            self, mock_monotonic) -> None:
+        mock_monotonic.return_value = 0
+        self.test_cache.set_last_height_monitored('node_1', 5)
+        self.test_cache.add(self._height_data(10))
+
+        mock_monotonic.return_value = 601
+        self.test_cache.set_last_height_monitored('node_2', 10)
+
+        self.assertEqual([], self.test_cache.heights)
+        self.assertEqual(['node_2'], self.test_cache.subscribers)
+
+    def test_get_tendermint_block_cache_returns_one_cache_per_chain(
+            self) -> None:
+        self.assertIs(get_tendermint_block_cache('test_chain_1'),
+                      get_tendermint_block_cache('test_chain_1'))
+        self.assertIsNot(get_tendermint_block_cache('test_chain_1'),
+                         get_tendermint_block_cache('test_chain_2'))
+
+
+class TestTendermintValidatorSetIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_index = TendermintValidatorSetIndex(max_snapshots=2,
+                                                      max_heights=3)
+
+    def tearDown(self) -> None:
+        self.test_index = None
+
+    def test_add_returns_a_frozen_snapshot_of_the_validator_set(self) -> None:
+        snapshot = self.test_index.add('hash_1', ['validator_1',
+                                                  'validator_2'])
+
+        self.assertEqual(frozenset({'validator_1', 'validator_2'}), snapshot)
+        self.assertIs(snapshot, self.test_index.get('hash_1'))
+
+    def test_get_counts_hits_and_misses(self) -> None:
+        self.test_index.add('hash_1', ['validator_1'])
+
+        self.assertEqual({'validator_1'}, self.test_index.get('hash_1'))
+        self.assertIsNone(self.test_index.get('hash_2'))
+        self.assertEqual(1, self.test_index.hits)
+        self.assertEqual(1, self.test_index.misses)
+
+    def test_add_evicts_least_recently_used_snapshot_when_full(self) -> None:
+        self.test_index.add('hash_1', ['validator_1'])
+        self.test_index.add('hash_2', ['validator_2'])
+        self.test_index.get('hash_1')
+
+        self.test_index.add('hash_3', ['validator_3'])
+
+        self.assertEqual(['hash_1', 'hash_3'],
+                         self.test_index.validators_hashes)
+
+    def test_set_validators_hash_evicts_oldest_height_when_full(self) -> None:
+        for height in [10, 11, 12, 13]:
+            self.test_index.set_validators_hash(height, 'hash_1')
+
+        self.assertEqual([11, 12, 13], self.test_index.heights)
+        self.assertIsNone(self.test_index.get_validators_hash(10))
+        self.assertEqual('hash_1', self.test_index.get_validators_hash(13))
+
+    def test_block_cache_holds_one_index_per_chain(self) -> None:
+        self.assertIs(get_tendermint_block_cache('test_chain_1').validator_sets,
+                      get_tendermint_block_cache('test_chain_1').validator_sets)
+        self.assertIsNot(
+            get_tendermint_block_cache('test_chain_1').validator_sets,
+            get_tendermint_block_cache('test_chain_2').validator_sets)
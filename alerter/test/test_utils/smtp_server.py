@@ -0,0 +1,95 @@
+import socketserver
+import threading
+from typing import List, Tuple
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    def _reply(self, line: str) -> None:
+        self.wfile.write((line + '\r\n').encode())
+
+    def handle(self) -> None:
+        server = self.server
+        with server.lock:
+            server.connections += 1
+            server.open_sockets.append(self.connection)
+
+        mail_from, rcpt_tos = None, []
+        self._reply('220 localhost stand-in SMTP server')
+        while True:
+            try:
+                line = self.rfile.readline()
+            except OSError:
+                return
+            if not line:
+                return
+
+            command = line.decode().strip()
+            verb = command[:4].upper()
+            if verb in ['EHLO', 'HELO']:
+                self._reply('250 localhost')
+            elif verb == 'MAIL':
+                mail_from, rcpt_tos = command[10:].strip('<>'), []
+                self._reply('250 OK')
+            elif verb == 'RCPT':
+                rcpt_tos.append(command[8:].strip('<>'))
+                self._reply('250 OK')
+            elif verb == 'DATA':
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                for data_line in self.rfile:
+                    if data_line == b'.\r\n':
+                        break
+                    data.append(data_line)
+                with server.lock:
+                    server.messages.append(
+                        (mail_from, rcpt_tos, b''.join(data).decode()))
+                self._reply('250 OK')
+            elif verb in ['RSET', 'NOOP']:
+                self._reply('250 OK')
+            elif verb == 'QUIT':
+                self._reply('221 Bye')
+                return
+            else:
+                self._reply('502 Command not implemented')
+
+
+class LocalSmtpServer(socketserver.ThreadingTCPServer):
+    """
+    A stand-in SMTP server listening on localhost which records the
+    connections made to it and the messages it receives. It does not support
+    STARTTLS or authentication.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(('localhost', 0), _SmtpHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.open_sockets = []
+        self.messages: List[Tuple[str, List[str], str]] = []
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.drop_connections()
+        self.shutdown()
+        self.server_close()
+
+    def drop_connections(self) -> None:
+        """
+        Closes the open client connections, as a server does with idle clients
+        """
+        with self.lock:
+            open_sockets, self.open_sockets = self.open_sockets, []
+        for sock in open_sockets:
+            try:
+                sock.shutdown(2)
+            except OSError:
+                pass
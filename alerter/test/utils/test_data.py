@@ -1,10 +1,19 @@
+import json
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
 from unittest.mock import Mock
 
 from parameterized import parameterized
+from prometheus_client.parser import text_string_to_metric_families
 
-from src.utils.data import transformed_data_processing_helper
-from src.utils.exceptions import ReceivedUnexpectedDataException
+from src.utils.data import (transformed_data_processing_helper,
+                            HttpSessionPool, get_http_session_pool, get_json,
+                            get_prometheus_metrics_data,
+                            _parse_prometheus_lines)
+from src.utils.exceptions import (ReceivedUnexpectedDataException,
+                                  MetricNotFoundException)
 from test.test_utils.utils import dummy_function, dummy_none_function
 
 
@@ -62,3 +71,178 @@ class TestDataUtils(unittest.TestCase):
 
         test_result_fn.assert_called_once_with(10)
         test_error_fn.assert_called_once_with(20)
+
+
+TEST_PROMETHEUS_EXPOSITION = """\
+# HELP node_cpu_seconds_total Seconds the CPUs spent in each mode.
+# TYPE node_cpu_seconds_total counter
+node_cpu_seconds_total{cpu="0",mode="idle"} 2.59e+06
+node_cpu_seconds_total{cpu="0",mode="user"} 12345.5
+node_cpu_seconds_total{cpu="1",mode="idle"} 2.58e+06
+# HELP node_filesystem_avail_bytes Filesystem space available.
+# TYPE node_filesystem_avail_bytes gauge
+node_filesystem_avail_bytes{device="/dev/sda1",mountpoint="/"} 4.2e+10
+# HELP process_open_fds Number of open file descriptors.
+# TYPE process_open_fds gauge
+process_open_fds 12
+process_open_fds 3
+# TYPE node_label_escapes gauge
+node_label_escapes{path="C:\\\\dir",quote="say \\"hi\\"",nl="a\\nb"} 1
+# TYPE go_gc_duration_seconds summary
+go_gc_duration_seconds{quantile="0.5"} 4.1e-05
+go_gc_duration_seconds_sum 0.5
+go_gc_duration_seconds_count 1200
+# TYPE tendermint_consensus_height gauge
+tendermint_consensus_height{chain_id="test"} 1000 1625000000000
+node_load1 NaN
+node_network_up +Inf
+"""
+
+
+def _parse_with_prometheus_client(exposition: str, requested_metrics) -> dict:
+    response = {}
+    for family in text_string_to_metric_families(exposition):
+        for sample in family.samples:
+            if sample.name in requested_metrics:
+                if sample.name not in response:
+                    if sample.labels != {}:
+                        response[sample.name] = {}
+                        response[sample.name][json.dumps(sample.labels)] = \
+                            sample.value
+                    else:
+                        response[sample.name] = sample.value
+                else:
+                    if sample.labels != {}:
+                        response[sample.name][json.dumps(sample.labels)] = \
+                            sample.value
+                    else:
+                        response[sample.name] = sample.value + \
+                                                response[sample.name]
+    return response
+
+
+class TestPrometheusParsing(unittest.TestCase):
+    def setUp(self) -> None:
+        self.requested_metrics = {
+            'node_cpu_seconds_total': 'strict',
+            'node_filesystem_avail_bytes': 'strict',
+            'process_open_fds': 'strict',
+            'node_label_escapes': 'strict',
+            'go_gc_duration_seconds_count': 'strict',
+            'tendermint_consensus_height': 'strict',
+            'node_network_up': 'strict',
+        }
+        self.lines = TEST_PROMETHEUS_EXPOSITION.encode('utf-8').splitlines()
+
+    def test_parse_prometheus_lines_matches_prometheus_client(self) -> None:
+        expected_ret = _parse_with_prometheus_client(
+            TEST_PROMETHEUS_EXPOSITION, self.requested_metrics)
+
+        actual_ret = _parse_prometheus_lines(self.lines,
+                                             self.requested_metrics)
+
+        self.assertEqual(expected_ret, actual_ret)
+        self.assertEqual(list(expected_ret), list(actual_ret))
+
+    def test_parse_prometheus_lines_ignores_non_requested_metrics(
+            self) -> None:
+        actual_ret = _parse_prometheus_lines(
+            self.lines + [b'node_not_requested{broken'],
+            {'process_open_fds': 'strict'})
+
+        self.assertEqual({'process_open_fds': 15.0}, actual_ret)
+
+    @parameterized.expand([
+        (b'process_open_fds{a="b" 1',),
+        (b'process_open_fds{a="b} 1',),
+        (b'process_open_fds not_a_number',),
+    ])
+    def test_parse_prometheus_lines_raises_value_error_if_malformed(
+            self, line) -> None:
+        self.assertRaises(ValueError, _parse_prometheus_lines, [line],
+                          {'process_open_fds': 'strict'})
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        if self.path == '/metrics':
+            body = TEST_PROMETHEUS_EXPOSITION.encode('utf-8')
+        else:
+            body = b'{"result": "ok"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class TestHttpSessionPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = HTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+        self.server_thread = threading.Thread(target=self.server.serve_forever,
+                                              daemon=True)
+        self.server_thread.start()
+        self.host = '127.0.0.1:{}'.format(self.server.server_port)
+        self.test_pool = HttpSessionPool(10, 2)
+        self.dummy_logger = Mock()
+
+    def tearDown(self) -> None:
+        self.test_pool.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_requests_to_the_same_host_reuse_connections(self) -> None:
+        for _ in range(5):
+            response = self.test_pool.get('http://{}/'.format(self.host),
+                                          timeout=10)
+            self.assertEqual({'result': 'ok'}, response.json())
+
+        self.assertEqual(
+            {'http://{}'.format(self.host): {'requests': 5, 'connections': 1}},
+            self.test_pool.get_connection_reuse_metrics())
+
+    @mock.patch("src.utils.data.get_http_session_pool")
+    def test_get_json_uses_the_shared_pool(self, mock_get_pool) -> None:
+        mock_get_pool.return_value = self.test_pool
+
+        ret = get_json('http://{}/'.format(self.host), self.dummy_logger)
+
+        self.assertEqual({'result': 'ok'}, ret)
+        self.assertEqual(
+            1, self.test_pool.get_connection_reuse_metrics()[
+                'http://{}'.format(self.host)]['requests'])
+
+    @mock.patch("src.utils.data.get_http_session_pool")
+    def test_get_prometheus_metrics_data_streams_requested_metrics(
+            self, mock_get_pool) -> None:
+        mock_get_pool.return_value = self.test_pool
+        endpoint = 'http://{}/metrics'.format(self.host)
+
+        ret = get_prometheus_metrics_data(
+            endpoint, {'process_open_fds': 'strict',
+                       'node_boot_time': 'optional'}, self.dummy_logger)
+
+        self.assertEqual({'process_open_fds': 15.0, 'node_boot_time': None},
+                         ret)
+        self.assertRaises(MetricNotFoundException, get_prometheus_metrics_data,
+                          endpoint, {'node_boot_time': 'strict'},
+                          self.dummy_logger)
+        # The connection is released back to the pool after streaming
+        self.assertEqual(
+            1, self.test_pool.get_connection_reuse_metrics()[
+                'http://{}'.format(self.host)]['connections'])
+
+    @mock.patch("src.utils.data.os.getpid")
+    def test_get_http_session_pool_is_re_created_in_a_new_process(
+            self, mock_getpid) -> None:
+        mock_getpid.return_value = 1
+        pool = get_http_session_pool()
+        self.assertIs(pool, get_http_session_pool())
+
+        mock_getpid.return_value = 2
+        self.assertIsNot(pool, get_http_session_pool())
@@ -0,0 +1,164 @@
+import logging
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+import pika
+from freezegun import freeze_time
+
+from src.message_broker.rabbitmq import RabbitMQApi
+from src.utils.constants.rabbitmq import (HEALTH_CHECK_EXCHANGE,
+                                          HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY)
+from src.utils.exceptions import MessageWasNotDeliveredException
+from src.utils.heartbeat import HeartbeatBatcher
+
+
+class TestHeartbeatBatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dummy_logger = logging.getLogger('Dummy')
+        self.dummy_logger.disabled = True
+        self.rabbitmq = mock.MagicMock(spec=RabbitMQApi)
+        self.test_interval = timedelta(seconds=10)
+        self.test_batcher = HeartbeatBatcher(self.test_interval)
+        self.test_heartbeat = {
+            'component_name': 'test_component',
+            'is_alive': True,
+            'timestamp': 1000.0,
+        }
+
+    def tearDown(self) -> None:
+        self.test_batcher = None
+
+    def test_first_heartbeat_is_due_with_counts(self) -> None:
+        self.test_batcher.record_processed()
+        self.test_batcher.record_failed()
+
+        self.assertEqual(dict(self.test_heartbeat, processed=1, failed=1),
+                         self.test_batcher.get_heartbeat(self.test_heartbeat))
+
+    def test_get_heartbeat_does_not_modify_given_heartbeat(self) -> None:
+        self.test_batcher.get_heartbeat(self.test_heartbeat)
+
+        self.assertNotIn('processed', self.test_heartbeat)
+
+    @freeze_time("2012-01-01 00:00:00")
+    def test_heartbeats_are_coalesced_within_the_interval(self) -> None:
+        self.test_batcher.record_processed()
+        self.test_batcher.heartbeat_sent()
+
+        for _ in range(3):
+            self.test_batcher.record_processed()
+        self.test_batcher.record_failed()
+
+        self.assertIsNone(self.test_batcher.get_heartbeat(self.test_heartbeat))
+        self.assertEqual(3, self.test_batcher.processed)
+        self.assertEqual(1, self.test_batcher.failed)
+
+    def test_heartbeat_is_due_again_after_the_interval(self) -> None:
+        with freeze_time("2012-01-01 00:00:00"):
+            self.test_batcher.record_processed()
+            self.test_batcher.heartbeat_sent()
+            self.test_batcher.record_processed()
+
+        with freeze_time("2012-01-01 00:00:10"):
+            self.test_batcher.record_processed()
+            self.assertEqual(
+                dict(self.test_heartbeat, processed=2, failed=0),
+                self.test_batcher.get_heartbeat(self.test_heartbeat))
+
+    def test_heartbeat_sent_resets_counts(self) -> None:
+        self.test_batcher.record_processed()
+        self.test_batcher.record_failed()
+
+        self.test_batcher.heartbeat_sent()
+
+        self.assertEqual(0, self.test_batcher.processed)
+        self.assertEqual(0, self.test_batcher.failed)
+
+    def test_zero_interval_sends_every_heartbeat(self) -> None:
+        test_batcher = HeartbeatBatcher(timedelta(seconds=0))
+        for _ in range(3):
+            test_batcher.record_processed()
+            self.assertEqual(
+                dict(self.test_heartbeat, processed=1, failed=0),
+                test_batcher.get_heartbeat(self.test_heartbeat))
+            test_batcher.heartbeat_sent()
+
+    def _assert_published(self, heartbeat: dict) -> None:
+        self.rabbitmq.basic_publish_confirm.assert_called_once_with(
+            exchange=HEALTH_CHECK_EXCHANGE,
+            routing_key=HEARTBEAT_OUTPUT_WORKER_ROUTING_KEY, body=heartbeat,
+            is_body_dict=True, properties=pika.BasicProperties(delivery_mode=2),
+            mandatory=True)
+
+    def test_send_publishes_due_heartbeat(self) -> None:
+        self.test_batcher.send(self.rabbitmq, self.test_heartbeat,
+                               self.dummy_logger)
+
+        self._assert_published(dict(self.test_heartbeat, processed=1,
+                                    failed=0))
+        self.rabbitmq.connection.call_later.assert_not_called()
+        self.assertEqual(0, self.test_batcher.processed)
+
+    @freeze_time("2012-01-01 00:00:00")
+    def test_send_schedules_flush_of_held_back_heartbeat_once(self) -> None:
+        self.test_batcher.send(self.rabbitmq, self.test_heartbeat,
+                               self.dummy_logger)
+        self.rabbitmq.basic_publish_confirm.reset_mock()
+
+        self.test_batcher.send(self.rabbitmq, self.test_heartbeat,
+                               self.dummy_logger)
+        self.test_batcher.send(self.rabbitmq, self.test_heartbeat,
+                               self.dummy_logger)
+
+        self.rabbitmq.basic_publish_confirm.assert_not_called()
+        self.rabbitmq.connection.call_later.assert_called_once()
+        delay, _ = self.rabbitmq.connection.call_later.call_args[0]
+        self.assertEqual(self.test_interval.total_seconds(), delay)
+
+    def test_flush_publishes_held_back_heartbeat(self) -> None:
+        with freeze_time("2012-01-01 00:00:00"):
+            self.test_batcher.send(self.rabbitmq, self.test_heartbeat,
+                                   self.dummy_logger)
+            self.test_batcher.record_failed()
+            self.test_batcher.send(self.rabbitmq, self.test_heartbeat,
+                                   self.dummy_logger)
+            self.rabbitmq.basic_publish_confirm.reset_mock()
+
+        with freeze_time("2012-01-01 00:00:10"):
+            _, flush = self.rabbitmq.connection.call_later.call_args[0]
+            flush()
+
+        self._assert_published(dict(self.test_heartbeat, processed=1,
+                                    failed=1))
+        self.assertEqual(1, self.rabbitmq.connection.call_later.call_count)
+
+    @freeze_time("2012-01-01 00:00:00")
+    def test_flush_is_scheduled_again_on_a_new_connection(self) -> None:
+        self.test_batcher.send(self.rabbitmq, self.test_heartbeat,
+                               self.dummy_logger)
+        self.test_batcher.send(self.rabbitmq, self.test_heartbeat,
+                               self.dummy_logger)
+        old_connection = self.rabbitmq.connection
+
+        self.rabbitmq.connection = mock.MagicMock()
+        self.test_batcher.send(self.rabbitmq, self.test_heartbeat,
+                               self.dummy_logger)
+
+        old_connection.call_later.assert_called_once()
+        self.rabbitmq.connection.call_later.assert_called_once()
+
+    def test_flush_keeps_heartbeat_which_was_not_delivered(self) -> None:
+        with freeze_time("2012-01-01 00:00:00"):
+            self.test_batcher.send(self.rabbitmq, self.test_heartbeat,
+                                   self.dummy_logger)
+            self.test_batcher.send(self.rabbitmq, self.test_heartbeat,
+                                   self.dummy_logger)
+
+        self.rabbitmq.basic_publish_confirm.side_effect = \
+            MessageWasNotDeliveredException('test')
+        with freeze_time("2012-01-01 00:00:10"):
+            _, flush = self.rabbitmq.connection.call_later.call_args[0]
+            flush()
+
+        self.assertEqual(1, self.test_batcher.processed)
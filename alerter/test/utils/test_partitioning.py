@@ -0,0 +1,72 @@
+import unittest
+from collections import Counter
+
+from parameterized import parameterized
+
+from src.utils.partitioning import (
+    get_partition, get_key_partition, get_partition_routing_key,
+    get_partition_queue_name, get_partition_component_name)
+
+
+class TestPartitioning(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_keys = ['node_{}'.format(index) for index in range(2000)]
+
+    def tearDown(self) -> None:
+        self.test_keys = None
+
+    def test_get_partition_returns_the_same_partition_for_the_same_key(
+            self) -> None:
+        # The partition must not depend on the process' hash seed, so it is
+        # compared with values computed beforehand
+        self.assertEqual(
+            [6, 3, 7, 7, 5],
+            [get_partition(key, 8) for key in [
+                'test_node_id', 'test_system_id', 'node_1', 'node_2',
+                'node_3']])
+        self.assertEqual(0, get_partition('test_node_id', 1))
+
+    @parameterized.expand([(2,), (3,), (8,)])
+    def test_get_partition_spreads_keys_evenly_over_the_partitions(
+            self, partitions) -> None:
+        counts = Counter(get_partition(key, partitions)
+                         for key in self.test_keys)
+        self.assertEqual(set(range(partitions)), set(counts))
+        expected_count = len(self.test_keys) / partitions
+        for count in counts.values():
+            self.assertLess(abs(count - expected_count), 0.2 * expected_count)
+
+    def test_get_partition_only_moves_keys_to_a_new_partition(self) -> None:
+        for key in self.test_keys:
+            old_partition = get_partition(key, 4)
+            new_partition = get_partition(key, 5)
+            self.assertIn(new_partition, [old_partition, 4])
+
+    @parameterized.expand([(0,), (-1,)])
+    def test_get_partition_raises_value_error_if_partitions_not_positive(
+            self, partitions) -> None:
+        self.assertRaises(ValueError, get_partition, 'test_node_id',
+                          partitions)
+
+    @parameterized.expand([(0,), (1,)])
+    def test_get_key_partition_returns_none_if_not_partitioned(
+            self, partitions) -> None:
+        self.assertIsNone(get_key_partition('test_node_id', partitions))
+
+    def test_get_key_partition_returns_partition_if_partitioned(self) -> None:
+        self.assertEqual(get_partition('test_node_id', 4),
+                         get_key_partition('test_node_id', 4))
+
+    @parameterized.expand([
+        (get_partition_routing_key, 'node.cosmos', None, 'node.cosmos',),
+        (get_partition_routing_key, 'node.cosmos', 3, 'node.cosmos.3',),
+        (get_partition_queue_name, 'test_queue', None, 'test_queue',),
+        (get_partition_queue_name, 'test_queue', 0, 'test_queue_0',),
+        (get_partition_component_name, 'Test Component', None,
+         'Test Component',),
+        (get_partition_component_name, 'Test Component', 2,
+         'Test Component (partition 2)',),
+    ])
+    def test_partition_names_are_unchanged_only_if_not_partitioned(
+            self, get_name, name, partition, expected_name) -> None:
+        self.assertEqual(expected_name, get_name(name, partition))
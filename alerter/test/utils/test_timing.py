@@ -0,0 +1,98 @@
+import copy
+import pickle
+import unittest
+from datetime import datetime, timedelta
+
+from freezegun import freeze_time
+
+from src.utils.timing import (TimedOccurrenceTracker,
+                              OccurrencesInTimePeriodTracker)
+
+
+class TestTimedOccurrenceTracker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_datetime = datetime(2012, 1, 1)
+        self.time_interval = timedelta(seconds=60)
+        self.test_tracker = TimedOccurrenceTracker(3, self.time_interval)
+
+    def tearDown(self) -> None:
+        self.test_tracker = None
+
+    def test_too_many_occurrences_only_if_max_occurrences_within_interval(
+            self) -> None:
+        for second in range(2):
+            self.test_tracker.action_happened(
+                self.test_datetime + timedelta(seconds=second))
+        self.assertFalse(
+            self.test_tracker.too_many_occurrences(self.test_datetime))
+
+        self.test_tracker.action_happened(self.test_datetime)
+        self.assertTrue(
+            self.test_tracker.too_many_occurrences(self.test_datetime))
+        self.assertFalse(self.test_tracker.too_many_occurrences(
+            self.test_datetime + self.time_interval))
+
+    @freeze_time("2012-01-01")
+    def test_action_happened_uses_current_time_by_default(self) -> None:
+        for _ in range(3):
+            self.test_tracker.action_happened()
+
+        self.assertTrue(self.test_tracker.too_many_occurrences())
+
+    def test_reset_forgets_the_occurrences(self) -> None:
+        for _ in range(3):
+            self.test_tracker.action_happened(self.test_datetime)
+
+        self.test_tracker.reset()
+
+        self.assertFalse(
+            self.test_tracker.too_many_occurrences(self.test_datetime))
+
+
+class TestOccurrencesInTimePeriodTracker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.test_datetime = datetime(2012, 1, 1)
+        self.time_period = timedelta(seconds=60)
+        self.test_tracker = OccurrencesInTimePeriodTracker(self.time_period)
+
+    def tearDown(self) -> None:
+        self.test_tracker = None
+
+    def test_add_occurrence_keeps_occurrences_within_time_period(
+            self) -> None:
+        self.test_tracker.add_occurrence(self.test_datetime)
+        self.test_tracker.add_occurrence(
+            self.test_datetime + timedelta(seconds=30))
+        self.assertEqual(2, self.test_tracker.no_of_occurrences())
+
+        self.test_tracker.add_occurrence(
+            self.test_datetime + timedelta(seconds=61))
+        self.assertEqual(2, self.test_tracker.no_of_occurrences())
+
+        self.test_tracker.remove_old_occurrences(
+            self.test_datetime + timedelta(seconds=121))
+        self.assertEqual(1, self.test_tracker.no_of_occurrences())
+
+        self.test_tracker.reset()
+        self.assertEqual(0, self.test_tracker.no_of_occurrences())
+
+    def test_eq_compares_the_time_period_only(self) -> None:
+        other_tracker = OccurrencesInTimePeriodTracker(self.time_period)
+        self.test_tracker.add_occurrence(self.test_datetime)
+
+        self.assertEqual(other_tracker, self.test_tracker)
+        self.assertNotEqual(
+            OccurrencesInTimePeriodTracker(timedelta(seconds=10)),
+            self.test_tracker)
+        self.assertNotEqual(self.time_period, self.test_tracker)
+
+    def test_tracker_can_be_copied_and_pickled(self) -> None:
+        self.test_tracker.add_occurrence(self.test_datetime)
+
+        tracker_copy = copy.deepcopy(self.test_tracker)
+        unpickled_tracker = pickle.loads(pickle.dumps(self.test_tracker))
+        tracker_copy.add_occurrence(self.test_datetime)
+
+        self.assertEqual(2, tracker_copy.no_of_occurrences())
+        self.assertEqual(1, self.test_tracker.no_of_occurrences())
+        self.assertEqual(1, unpickled_tracker.no_of_occurrences())